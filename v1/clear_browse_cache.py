@@ -7,73 +7,54 @@ This will force regeneration of all thumbnails with the new high-quality setting
 import os
 import shutil
 import sys
-from pathlib import Path
 
-def get_cache_directory():
-    """Get the cache directory path."""
+SRC_DIR = os.path.join(os.path.dirname(__file__), 'src')
+
+
+def clear_image_cache():
+    """Clear the image cache the browse tab reads its thumbnails from."""
+    sys.path.insert(0, SRC_DIR)
+    from main_window.main_widget.image_cache import ImageCache
+
+    cache = ImageCache.shared()
+    print(f"🔍 Clearing image cache: {cache.cache_dir}")
+
+    megabytes = cache.stats().disk_bytes / (1024 * 1024)
+    cache.clear()
+    print(f"✅ Cleared {megabytes:.2f} MB of cached images")
+
+
+def get_legacy_cache_directory():
+    """Get the thumbnail directory used before the shared image cache."""
     try:
-        # Try to get the path using the same method as the app
-        sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+        sys.path.insert(0, SRC_DIR)
         from utils.path_helpers import get_user_editable_resource_path
-        cache_dir = os.path.join(get_user_editable_resource_path(""), "browse_thumbnails")
-        return cache_dir
+        return os.path.join(get_user_editable_resource_path(""), "browse_thumbnails")
     except Exception:
-        # Fallback to common locations
-        import tempfile
-        fallback_locations = [
-            os.path.join(os.environ.get('APPDATA', ''), 'browse_thumbnails'),
-            os.path.join(tempfile.gettempdir(), 'kinetic_constructor_browse_cache'),
-            os.path.join(os.path.expanduser('~'), '.kinetic_constructor', 'browse_thumbnails')
-        ]
-        
-        for location in fallback_locations:
-            if os.path.exists(location):
-                return location
-        
-        return fallback_locations[0]  # Return first as default
+        return None
+
+
+def remove_legacy_cache():
+    """Remove the old browse_thumbnails directory, which nothing reads now."""
+    legacy_dir = get_legacy_cache_directory()
+    if legacy_dir and os.path.isdir(legacy_dir):
+        shutil.rmtree(legacy_dir)
+        print(f"🗑️  Removed legacy thumbnail directory: {legacy_dir}")
+
 
 def clear_cache():
     """Clear the browse tab cache."""
-    cache_dir = get_cache_directory()
-    
-    print(f"🔍 Looking for cache directory: {cache_dir}")
-    
-    if not os.path.exists(cache_dir):
-        print("✅ No cache directory found - nothing to clear")
-        return True
-    
     try:
-        # Count files before deletion
-        cache_files = list(Path(cache_dir).glob("*.png"))
-        metadata_file = Path(cache_dir) / "cache_metadata.json"
-        
-        total_files = len(cache_files)
-        if metadata_file.exists():
-            total_files += 1
-        
-        if total_files == 0:
-            print("✅ Cache directory is already empty")
-            return True
-        
-        print(f"🗑️  Found {len(cache_files)} cached images and metadata file")
-        
-        # Remove all .png files
-        for cache_file in cache_files:
-            cache_file.unlink()
-            
-        # Remove metadata file
-        if metadata_file.exists():
-            metadata_file.unlink()
-            
-        print(f"✅ Successfully cleared {total_files} cache files")
+        clear_image_cache()
+        remove_legacy_cache()
         print("🎯 Next app launch will regenerate thumbnails with high quality settings")
-        
         return True
-        
+
     except Exception as e:
         print(f"❌ Error clearing cache: {e}")
         return False
 
+
 def main():
     """Main function."""
     print("🧹 Browse Tab Cache Cleaner")
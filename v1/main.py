@@ -276,4 +276,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen builds need this for the spawned image export workers
+    import multiprocessing
+
+    multiprocessing.freeze_support()
     main()
@@ -10,6 +10,14 @@ import shutil
 from pathlib import Path
 from PIL import Image, PngImagePlugin
 
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+from main_window.main_widget.png_metadata_reader import (  # noqa: E402
+    METADATA_KEY,
+    NotAPngError,
+    read_png_text,
+)
+
+
 def find_sequence_card_images():
     """Find all existing sequence card images."""
     project_root = Path(__file__).parent
@@ -38,6 +46,13 @@ def create_thumbnail_from_sequence_card(sequence_dir, output_dir):
     source_image = png_files[0]  # Use the first image
     
     try:
+        # Carry the sequence metadata over so the browse tab can read it.
+        # Only the text chunks are read here, not the image data.
+        try:
+            source_text = read_png_text(str(source_image), (METADATA_KEY,))
+        except NotAPngError:
+            source_text = {}
+
         # Open the source image
         with Image.open(source_image) as img:
             # Convert to RGB if necessary
@@ -60,6 +75,8 @@ def create_thumbnail_from_sequence_card(sequence_dir, output_dir):
             pnginfo = PngImagePlugin.PngInfo()
             pnginfo.add_text("sequence_name", sequence_name)
             pnginfo.add_text("variation", "0")
+            if METADATA_KEY in source_text:
+                pnginfo.add_text(METADATA_KEY, source_text[METADATA_KEY])
             
             # Save with maximum quality
             img.save(output_file, "PNG", pnginfo=pnginfo, compress_level=1, optimize=True)
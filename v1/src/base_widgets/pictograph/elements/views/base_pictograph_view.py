@@ -4,6 +4,10 @@ from PyQt6.QtCore import Qt, QEvent, QTimer
 from PyQt6.QtGui import QCursor, QAction, QKeyEvent
 
 from base_widgets.pictograph.managers.pictograph_data_copier import dictCopier
+from base_widgets.pictograph.elements.views.pictograph_raster_cache import (
+    PictographRasterizer,
+    pictograph_content_key,
+)
 
 
 if TYPE_CHECKING:
@@ -11,11 +15,20 @@ if TYPE_CHECKING:
 
 
 class BasePictographView(QGraphicsView):
+    # Views that mostly sit still (option picker, beat frame) paint a cached
+    # raster of their scene instead of re-rendering its SVG items every paint
+    uses_raster_cache = False
+
     def __init__(self, pictograph: "Pictograph") -> None:
         super().__init__(pictograph)
         if pictograph:
             self.pictograph = pictograph
             self.pictograph.elements.view = self
+        self.rasterizer = (
+            PictographRasterizer(self, pictograph_content_key)
+            if self.uses_raster_cache
+            else None
+        )
 
         # Dimension debugging
         self.debug_enabled = False
@@ -34,11 +47,30 @@ class BasePictographView(QGraphicsView):
         self.viewport().setContentsMargins(0, 0, 0, 0)
         self.setViewportMargins(0, 0, 0, 0)
 
+    def setScene(self, scene) -> None:
+        super().setScene(scene)
+        if self.rasterizer:
+            self.rasterizer.track(scene)
+
+    def is_being_edited(self) -> bool:
+        """Whether the scene is being edited and must be painted live."""
+        return False
+
     ### EVENTS ###
 
+    def paintEvent(self, event):
+        if (
+            self.rasterizer is None
+            or self.is_being_edited()
+            or not self.rasterizer.paint()
+        ):
+            super().paintEvent(event)
+
     def resizeEvent(self, event):
         """Handle resizing and maintain aspect ratio."""
         super().resizeEvent(event)
+        if self.rasterizer:
+            self.rasterizer.begin_resize()
         self.fitInView(self.sceneRect(), Qt.AspectRatioMode.KeepAspectRatio)
         # Trigger debug print if enabled
         self._trigger_debug_print()
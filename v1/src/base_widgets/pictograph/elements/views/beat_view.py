@@ -17,6 +17,7 @@ class BeatView(BasePictographView):
     is_filled = False
     is_selected = False
     beat: "Beat" = None
+    uses_raster_cache = True
 
     def __init__(self, beat_frame: "SequenceBeatFrame", number: int = None):
         super().__init__(None)
@@ -46,6 +47,10 @@ class BeatView(BasePictographView):
         self.setScene(self.beat)
         self.beat.beat_number_item.update_beat_number(number)
 
+    def is_being_edited(self) -> bool:
+        # The selected beat is the one open in the graph editor
+        return self.is_selected
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton and self.is_filled:
             self.beat_frame.selection_overlay.select_beat_view(self)
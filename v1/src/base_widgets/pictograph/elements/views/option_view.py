@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 
 
 class OptionView(BorderedPictographView):
+    uses_raster_cache = True
+
     def __init__(
         self,
         op: "OptionPicker",
@@ -0,0 +1,238 @@
+import json
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Hashable, Optional
+
+from PyQt6.QtCore import QRectF, QTimer, Qt
+from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsScene, QGraphicsTextItem, QGraphicsView
+
+if TYPE_CHECKING:
+    from base_widgets.pictograph.pictograph import Pictograph
+
+# Mirrors v2/src/presentation/components/pictograph/pictograph_raster_cache.py;
+# the two apps share no importable package and key content on different models
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+# While a view is being resized it shows its last raster scaled, and only
+# renders the scene again once no resize has arrived for this long
+RESIZE_SETTLE_MS = 150
+
+
+def scene_fingerprint(scene: QGraphicsScene) -> tuple:
+    """
+    What every item in the scene currently looks like.
+
+    Visibility settings and placement adjustments act on the items (hidden
+    glyphs, dimmed motions, moved arrows), so two scenes with the same data
+    and the same fingerprint render the same pixels.
+    """
+    items = []
+    for item in scene.items(Qt.SortOrder.AscendingOrder):
+        transform = item.transform()
+        items.append(
+            (
+                type(item).__name__,
+                item.isVisible(),
+                round(item.opacity(), 3),
+                round(item.x(), 2),
+                round(item.y(), 2),
+                round(item.rotation(), 2),
+                round(item.scale(), 3),
+                item.zValue(),
+                (transform.m11(), transform.m12(), transform.m21(), transform.m22()),
+                item.toPlainText() if isinstance(item, QGraphicsTextItem) else None,
+            )
+        )
+    return tuple(items)
+
+
+def pictograph_content_key(pictograph: "Pictograph") -> Hashable:
+    """Key for what a pictograph shows, independent of the view showing it."""
+    state = pictograph.state
+    data = json.dumps(state.pictograph_data, sort_keys=True, default=str)
+    return (
+        data,
+        str(state.prop_type_enum),
+        state.grid_mode,
+        state.is_blank,
+        scene_fingerprint(pictograph),
+    )
+
+
+class PictographRasterCache:
+    """
+    Process-wide LRU cache of rendered pictographs.
+
+    Keys are (content key, viewport size, device pixel ratio, scene source
+    rect), so a pixmap is only reused for exactly the pixels it was rendered
+    for. Entries are evicted least-recently-used first once the cached
+    pixmaps exceed the byte budget.
+    """
+
+    _instance: Optional["PictographRasterCache"] = None
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self.budget_bytes = budget_bytes
+        self._pixmaps: "OrderedDict[Hashable, QPixmap]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def instance(cls) -> "PictographRasterCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    def get(self, key: Hashable) -> Optional[QPixmap]:
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self._pixmaps.move_to_end(key)
+        self.hits += 1
+        return pixmap
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        previous = self._pixmaps.pop(key, None)
+        if previous is not None:
+            self._bytes -= self._size_of(previous)
+        self._pixmaps[key] = pixmap
+        self._bytes += self._size_of(pixmap)
+        while self._bytes > self.budget_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._bytes -= self._size_of(evicted)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._pixmaps.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> dict:
+        return {
+            "entries": len(self._pixmaps),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    @staticmethod
+    def _size_of(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+
+class PictographRasterizer:
+    """
+    Paints a view's scene from the raster cache instead of its vector items.
+
+    The view calls paint() from its paintEvent, begin_resize() from its
+    resizeEvent and track() whenever it is given a new scene. The content key
+    is recomputed only after the scene reports a change, so repaints for
+    hover borders or overlapping widgets are a single pixmap blit.
+    """
+
+    def __init__(
+        self,
+        view: QGraphicsView,
+        content_key: Callable[[QGraphicsScene], Hashable],
+        cache: Optional[PictographRasterCache] = None,
+    ) -> None:
+        self.view = view
+        self.content_key = content_key
+        if cache is None:
+            cache = PictographRasterCache.instance()
+        self.cache = cache
+        self._scene: Optional[QGraphicsScene] = None
+        self._content_key: Optional[Hashable] = None
+        self._last_pixmap: Optional[QPixmap] = None
+        self._last_source = QRectF()
+
+        self.settle_timer = QTimer(view)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(RESIZE_SETTLE_MS)
+        self.settle_timer.timeout.connect(view.viewport().update)
+        self.track(view.scene())
+
+    def invalidate(self, *_) -> None:
+        # The last raster is stale too, so a resize must not stretch it
+        self._content_key = None
+        self._last_pixmap = None
+
+    def begin_resize(self) -> None:
+        self.settle_timer.start()
+
+    def paint(self) -> bool:
+        """Paint the viewport from the cache; False if there is no scene."""
+        scene = self.view.scene()
+        if scene is None:
+            return False
+        self.track(scene)
+
+        viewport = self.view.viewport()
+        painter = QPainter(viewport)
+        if self.settle_timer.isActive() and self._last_pixmap is not None:
+            # Mid-resize: stretch the last raster to where its scene rect is now
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            target = self.view.mapFromScene(self._last_source).boundingRect()
+            painter.drawPixmap(target, self._last_pixmap)
+        else:
+            source = self.view.mapToScene(viewport.rect()).boundingRect()
+            painter.drawPixmap(0, 0, self._raster(scene, source))
+        painter.end()
+        return True
+
+    def track(self, scene: Optional[QGraphicsScene]) -> None:
+        # Must be connected as soon as the scene is set: a scene whose views
+        # only ever paint from the cache keeps ignoring item updates unless
+        # something listens to changed
+        if scene is None or scene is self._scene:
+            return
+        if self._scene is not None:
+            try:
+                self._scene.changed.disconnect(self.invalidate)
+            except (TypeError, RuntimeError):
+                pass
+        scene.changed.connect(self.invalidate)
+        self._scene = scene
+        self.invalidate()
+
+    def _raster(self, scene: QGraphicsScene, source: QRectF) -> QPixmap:
+        if self._content_key is None:
+            self._content_key = self.content_key(scene)
+        size = self.view.viewport().size()
+        dpr = self.view.devicePixelRatioF()
+        key = (
+            self._content_key,
+            size.width(),
+            size.height(),
+            dpr,
+            tuple(round(v, 2) for v in source.getRect()),
+        )
+        pixmap = self.cache.get(key)
+        if pixmap is None:
+            pixmap = self._render(scene, source, size.width(), size.height(), dpr)
+            self.cache.put(key, pixmap)
+        self._last_pixmap = pixmap
+        self._last_source = source
+        return pixmap
+
+    def _render(
+        self, scene: QGraphicsScene, source: QRectF, width, height, dpr
+    ) -> QPixmap:
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHints(self.view.renderHints())
+        scene.render(
+            painter,
+            QRectF(0, 0, width, height),
+            source,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+        )
+        painter.end()
+        return pixmap
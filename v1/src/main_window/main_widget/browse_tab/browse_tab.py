@@ -55,6 +55,7 @@ class BrowseTab(QWidget):
         self.browse_settings = settings_manager.browse_settings
         self.state = BrowseTabState(self.browse_settings)
         self.metadata_extractor = MetaDataExtractor()
+        self.metadata_extractor.warm_index()
 
         self.ui_updater = BrowseTabUIUpdater(self)
 
@@ -185,6 +185,7 @@ class BrowseTabFilterController:
         control_panel = self.browse_tab.sequence_picker.control_panel
         control_panel.currently_displaying_label.setText(f"Displaying {description}")
         control_panel.count_label.setText("")
+        self.ui_updater.thumbnail_updater.invalidate_pending_thumbnails()
         self.browse_tab.sequence_picker.scroll_widget.clear_layout()
 
     def _handle_string_filter(self, filter_name: str):
@@ -13,21 +13,22 @@ class BrowseTabGetter:
 
     def all_sequences(self) -> list[tuple[str, list[str], int]]:
         """Retrieve all sequences with their respective difficulty levels."""
-        sequences = [
-            (
-                word,
-                thumbnails,
-                max(
-                    [
-                        MetaDataExtractor().get_level(thumbnail)
-                        for thumbnail in thumbnails
-                        if MetaDataExtractor().get_level(thumbnail) is not None
-                    ],
-                    default=1,  # Default difficulty level
-                ),
+        metadata_extractor = MetaDataExtractor()
+        sequences = []
+        for word, thumbnails in self.base_words():
+            levels = [
+                metadata_extractor.get_level(thumbnail) for thumbnail in thumbnails
+            ]
+            sequences.append(
+                (
+                    word,
+                    thumbnails,
+                    max(
+                        [level for level in levels if level is not None],
+                        default=1,  # Default difficulty level
+                    ),
+                )
             )
-            for word, thumbnails in self.base_words()
-        ]
         return sequences
 
     def base_words(self) -> Generator[tuple[str, list[str]], Any, None]:
@@ -21,6 +21,7 @@ class SequencePickerSortController:
         # set overriden cursor
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         self.settings_manager.browse_settings.set_sort_method(method)
+        self.browse_tab.ui_updater.thumbnail_updater.invalidate_pending_thumbnails()
         self.sequence_picker.sorter.sort_and_display_currently_filtered_sequences_by_method(
             method
         )
@@ -1,11 +1,10 @@
 # data_manager.py
 import os
-import json
 from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass, field
 
-from PIL import Image
+from main_window.main_widget.metadata_extractor import MetaDataExtractor
 from utils.path_helpers import get_data_path
 
 
@@ -81,54 +80,29 @@ class DictionaryDataManager:
         """
         For brevity, let's just pick the first one.
         Or you might glean combined info from them all.
+
+        Reads go through the persistent metadata index, so only thumbnails that
+        changed since the last scan are opened.
         """
         if not thumbnails:
             return {}
         first_thumb = thumbnails[0]
         meta_dict = {}
         try:
-            with Image.open(first_thumb) as im:
-                info = im.info
-                metadata_json = info.get("metadata")
-                if metadata_json:
-                    metadata: dict = json.loads(metadata_json)
-                    raw = metadata.get("sequence", {})[0]
-                    # e.g. raw = {"author": "Bob", "level": 2, "date_added": "2023-12-01T10:00:00", ...}
-                    meta_dict["author"] = raw.get("author")
-                    meta_dict["grid_mode"] = raw.get("grid_mode")
-                    meta_dict["level"] = raw.get("level")
-                    meta_dict["is_favorite"] = raw.get("is_favorite")
-
-                    date_str = raw.get("date_added")
-                    if date_str:
-                        try:
-                            meta_dict["date_added"] = datetime.fromisoformat(date_str)
-                        except ValueError:
-                            meta_dict["date_added"] = None
-
-                    # Extract sequence details
-                    sequence = raw.get("sequence", [])
-                    if sequence:
-                        first_sequence = sequence[0]
-                        meta_dict["word"] = first_sequence.get("word")
-                        meta_dict["prop_type"] = first_sequence.get("prop_type")
-                        meta_dict["is_circular"] = first_sequence.get("is_circular")
-                        meta_dict["can_be_CAP"] = first_sequence.get("can_be_CAP")
-                        meta_dict["is_strict_rotational_CAP"] = first_sequence.get(
-                            "is_strict_rotational_CAP"
-                        )
-                        meta_dict["is_strict_mirrored_CAP"] = first_sequence.get(
-                            "is_strict_mirrored_CAP"
-                        )
-                        meta_dict["is_strict_swapped_CAP"] = first_sequence.get(
-                            "is_strict_swapped_CAP"
-                        )
-                        meta_dict["is_mirrored_swapped_CAP"] = first_sequence.get(
-                            "is_mirrored_swapped_CAP"
-                        )
-                        meta_dict["is_rotational_swapped_CAP"] = first_sequence.get(
-                            "is_rotational_swapped_CAP"
-                        )
+            summary = MetaDataExtractor().index.get(first_thumb)
+            if summary and summary["has_sequence"]:
+                meta_dict["author"] = summary["author"]
+                meta_dict["grid_mode"] = summary["grid_mode"]
+                meta_dict["level"] = summary["level"]
+                meta_dict["is_favorite"] = summary["is_favorite"]
+                meta_dict["word"] = summary["word"]
+
+                date_str = summary["date_added"]
+                if date_str:
+                    try:
+                        meta_dict["date_added"] = datetime.fromisoformat(date_str)
+                    except ValueError:
+                        meta_dict["date_added"] = None
         except FileNotFoundError:
             print(f"[WARNING] Thumbnail not found: {first_thumb}")
         except Exception as e:
@@ -1,10 +1,8 @@
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING
 from enums.letter.letter_type import LetterType
 from main_window.main_widget.metadata_extractor import MetaDataExtractor
 from ..browse_tab_section_header import BrowseTabSectionHeader
-from PIL import Image
 
 if TYPE_CHECKING:
     from .sequence_picker import SequencePicker
@@ -13,6 +11,7 @@ if TYPE_CHECKING:
 class SequencePickerSectionManager:
     def __init__(self, sequence_picker: "SequencePicker"):
         self.sequence_picker = sequence_picker
+        self.metadata_extractor = MetaDataExtractor()
 
     def add_header(self, row_index, num_columns, section):
         header_title = f"{section}"
@@ -91,7 +90,7 @@ class SequencePickerSectionManager:
             return "Unknown"
         elif sort_order == "level":
             for thumbnail in thumbnails:
-                level = MetaDataExtractor().get_level(thumbnail)
+                level = self.metadata_extractor.get_level(thumbnail)
                 if level != 0:
                     return str(level)
                 else:
@@ -110,22 +109,18 @@ class SequencePickerSectionManager:
         dates = []
         for thumbnail in thumbnails:
             try:
-                image = Image.open(thumbnail)
-                info = image.info
-                metadata = info.get("metadata")
-                if metadata:
-                    metadata_dict = json.loads(metadata)
-                    date_added = metadata_dict.get("date_added")
-                    if date_added:
-                        try:
-                            dates.append(datetime.fromisoformat(date_added))
-                        except ValueError:
-                            print(
-                                f"[WARNING] Could not parse date for {thumbnail}"
-                            )  # Added logging
+                summary = self.metadata_extractor.index.get(thumbnail)
+                date_added = summary.get("date_added") if summary else None
+                if date_added:
+                    try:
+                        dates.append(datetime.fromisoformat(date_added))
+                    except ValueError:
+                        print(
+                            f"[WARNING] Could not parse date for {thumbnail}"
+                        )  # Added logging
             except FileNotFoundError as e:
                 print(f"[WARNING] File not found: {thumbnail} - {e}")
-                continue 
+                continue
             except Exception as e:
                 print(f"[ERROR] An error occurred while processing {thumbnail}: {e}")
 
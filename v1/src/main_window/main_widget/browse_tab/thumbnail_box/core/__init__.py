@@ -7,6 +7,7 @@ the monolithic ThumbnailImageLabel class to follow the Single Responsibility Pri
 
 from .thumbnail_coordinator import ThumbnailCoordinator
 from .thumbnail_processor import ThumbnailProcessor
+from .thumbnail_scheduler import ThumbnailScheduler
 from .thumbnail_cache_manager import ThumbnailCacheManager
 from .thumbnail_event_handler import ThumbnailEventHandler
 from .thumbnail_size_calculator import ThumbnailSizeCalculator
@@ -14,6 +15,7 @@ from .thumbnail_size_calculator import ThumbnailSizeCalculator
 __all__ = [
     "ThumbnailCoordinator",
     "ThumbnailProcessor", 
+    "ThumbnailScheduler",
     "ThumbnailCacheManager",
     "ThumbnailEventHandler",
     "ThumbnailSizeCalculator",
@@ -7,8 +7,8 @@ architecture that follows the Single Responsibility Principle.
 
 import logging
 from typing import TYPE_CHECKING, Optional
-from PyQt6.QtCore import QSize, QTimer
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QImage, QPixmap
 
 from .thumbnail_processor import ThumbnailProcessor
 from .thumbnail_cache_manager import ThumbnailCacheManager
@@ -28,7 +28,7 @@ class ThumbnailCoordinator:
     - Cache management (disk caching with metadata)
     - Size calculations for different view modes
     - Event handling for user interactions
-    - Asynchronous loading and quality enhancement
+    - Caching thumbnails decoded by the ThumbnailScheduler
     
     Each responsibility is handled by a dedicated component following SRP.
     """
@@ -43,19 +43,6 @@ class ThumbnailCoordinator:
         self.event_handler = ThumbnailEventHandler(thumbnail_box)
         self.size_calculator = ThumbnailSizeCalculator(thumbnail_box)
         
-        # Deferred loading timer
-        self._load_timer = QTimer()
-        self._load_timer.setSingleShot(True)
-        self._load_timer.timeout.connect(self._load_pending_image)
-        self._pending_path: Optional[str] = None
-        self._pending_index: Optional[int] = None
-        
-        # Quality enhancement timer
-        self._quality_timer = QTimer()
-        self._quality_timer.setSingleShot(True)
-        self._quality_timer.timeout.connect(self._enhance_image_quality)
-        self._needs_quality_enhancement = False
-        
         self.logger.info("ThumbnailCoordinator initialized with component architecture")
     
     def process_thumbnail_sync(self, image_path: str, is_sequence_viewer: bool) -> QPixmap:
@@ -84,7 +71,9 @@ class ThumbnailCoordinator:
             
             # Cache the result
             if not processed_pixmap.isNull():
-                self.cache_manager.cache_thumbnail(image_path, processed_pixmap, target_size)
+                self.cache_manager.cache_thumbnail(
+                    image_path, processed_pixmap.toImage(), target_size
+                )
             
             return processed_pixmap
             
@@ -92,41 +81,45 @@ class ThumbnailCoordinator:
             self.logger.error(f"Error processing thumbnail {image_path}: {e}")
             return self.processor.create_error_pixmap(target_size)
     
-    def process_thumbnail_async(self, image_path: str, index: int) -> None:
+    def get_cached_thumbnail(
+        self, image_path: str, is_sequence_viewer: bool
+    ) -> Optional[QPixmap]:
         """
-        Process thumbnail asynchronously to avoid UI blocking.
+        Get the cached thumbnail for the current view size, if there is one.
         
         Args:
             image_path: Path to the image file
-            index: Index in thumbnail list
+            is_sequence_viewer: Whether in sequence viewer mode
+            
+        Returns:
+            Cached QPixmap, or None on a cache miss
         """
-        self._pending_path = image_path
-        self._pending_index = index
-        self._load_timer.start(1)  # Start with minimal delay
-    
-    def _load_pending_image(self) -> None:
-        """Load pending image with ultra quality processing."""
-        if self._pending_path and self._pending_index is not None:
-            try:
-                # Delegate to synchronous processing
-                is_sequence_viewer = self.thumbnail_box.in_sequence_viewer
-                processed_pixmap = self.process_thumbnail_sync(self._pending_path, is_sequence_viewer)
-                
-                # Notify completion (this would be handled by the main label)
-                self.logger.debug(f"Async processing completed: {self._pending_path}")
-                
-            except Exception as e:
-                self.logger.error(f"Error in async thumbnail loading: {e}")
-            finally:
-                self._pending_path = None
-                self._pending_index = None
+        target_size = self.size_calculator.calculate_target_size(is_sequence_viewer)
+        cached_pixmap = self.cache_manager.get_cached_thumbnail(image_path, target_size)
+        if cached_pixmap and not cached_pixmap.isNull():
+            return cached_pixmap
+        return None
     
-    def _enhance_image_quality(self) -> None:
-        """Enhance image quality if needed."""
-        if self._needs_quality_enhancement:
-            # This would trigger additional quality enhancement
-            self.logger.debug("Enhancing image quality")
-            self._needs_quality_enhancement = False
+    def store_thumbnail(
+        self, image_path: str, image: QImage, target_size: QSize
+    ) -> QPixmap:
+        """
+        Convert a thumbnail decoded off the GUI thread and cache it.
+        
+        Args:
+            image_path: Path to the image file
+            image: Decoded image, null if decoding failed
+            target_size: Size the image was decoded for
+            
+        Returns:
+            QPixmap ready for display
+        """
+        if image.isNull():
+            self.logger.error(f"Failed to load image: {image_path}")
+            return self.processor.create_error_pixmap(target_size)
+        
+        self.cache_manager.cache_thumbnail(image_path, image, target_size)
+        return QPixmap.fromImage(image)
     
     def handle_mouse_press(self, event) -> None:
         """Handle mouse press events."""
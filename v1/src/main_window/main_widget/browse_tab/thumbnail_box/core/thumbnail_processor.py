@@ -6,17 +6,47 @@ Extracted from ThumbnailImageLabel to follow Single Responsibility Principle.
 
 import logging
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QPixmap, QPainter, QColor
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPainter, QColor
 from typing import Optional
 
 
+def load_scaled_image(source_path: str, target_size: QSize) -> QImage:
+    """
+    Decode an image at the size it will be displayed, keeping its aspect ratio.
+
+    The reader is told the scaled size before decoding, so formats with a
+    reduced-resolution decode (JPEG) never build the full image, and PNGs are
+    reduced in a single area-averaging pass instead of several QPixmap scales.
+    Only QImage is used, so this is safe to call from worker threads.
+
+    Args:
+        source_path: Path to source image
+        target_size: Bounding size for the decoded image
+
+    Returns:
+        Decoded QImage, or a null QImage if the file cannot be read
+    """
+    reader = QImageReader(source_path)
+    reader.setAutoTransform(True)
+    original_size = reader.size()
+    if original_size.isEmpty():
+        return QImage()
+
+    scaled_size = original_size.scaled(
+        target_size, Qt.AspectRatioMode.KeepAspectRatio
+    )
+    if scaled_size != original_size:
+        reader.setScaledSize(scaled_size)
+    return reader.read()
+
+
 class ThumbnailProcessor:
     """
-    Handles thumbnail image processing with high-quality scaling.
+    Handles thumbnail image processing with reduced-size decoding.
     
     Responsibilities:
     - Load and validate images
-    - Apply multi-step scaling for quality
+    - Decode images at thumbnail size
     - Create error pixmaps when needed
     - Maintain aspect ratios
     """
@@ -26,123 +56,26 @@ class ThumbnailProcessor:
     
     def process_image(self, source_path: str, target_size: QSize) -> QPixmap:
         """
-        Process image using Qt SmoothTransformation for consistent quality.
+        Process image by decoding it straight to the thumbnail size.
         
         Args:
             source_path: Path to source image
             target_size: Target size for thumbnail
             
         Returns:
-            High-quality QPixmap using SmoothTransformation
+            QPixmap scaled to fit target_size, or an error pixmap
         """
         try:
-            # Load original image
-            original_pixmap = QPixmap(source_path)
-            if original_pixmap.isNull():
+            image = load_scaled_image(source_path, target_size)
+            if image.isNull():
                 self.logger.error(f"Failed to load image: {source_path}")
                 return self.create_error_pixmap(target_size)
-            
-            # Calculate target dimensions maintaining aspect ratio
-            original_size = original_pixmap.size()
-            aspect_ratio = original_size.width() / original_size.height()
-            
-            if target_size.width() / target_size.height() > aspect_ratio:
-                new_h = target_size.height()
-                new_w = int(target_size.height() * aspect_ratio)
-            else:
-                new_w = target_size.width()
-                new_h = int(target_size.width() / aspect_ratio)
-            
-            target_w, target_h = new_w, new_h
-            scale_factor = min(
-                target_w / original_size.width(), target_h / original_size.height()
-            )
-            
-            # Enhanced multi-step scaling with Qt
-            if scale_factor < 0.6:  # Lower threshold for better quality
-                return self._multi_step_scaling(original_pixmap, target_w, target_h, scale_factor)
-            else:
-                # Single-step high-quality scaling
-                return original_pixmap.scaled(
-                    target_w,
-                    target_h,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                
+            return QPixmap.fromImage(image)
+
         except Exception as e:
             self.logger.error(f"Image processing failed for {source_path}: {e}")
             return self.create_error_pixmap(target_size)
     
-    def _multi_step_scaling(self, original_pixmap: QPixmap, target_w: int, target_h: int, scale_factor: float) -> QPixmap:
-        """
-        Apply multi-step scaling for better quality on aggressive downscaling.
-        
-        Args:
-            original_pixmap: Original QPixmap
-            target_w: Target width
-            target_h: Target height
-            scale_factor: Overall scale factor
-            
-        Returns:
-            Multi-step scaled QPixmap
-        """
-        original_size = original_pixmap.size()
-        
-        if scale_factor < 0.4:
-            # Very aggressive downscaling - use 3 stages
-            intermediate_factor1 = 0.7
-            intermediate_factor2 = 0.5
-            
-            # Stage 1
-            intermediate_w1 = int(original_size.width() * intermediate_factor1)
-            intermediate_h1 = int(original_size.height() * intermediate_factor1)
-            stage1_pixmap = original_pixmap.scaled(
-                intermediate_w1,
-                intermediate_h1,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            
-            # Stage 2
-            intermediate_w2 = int(original_size.width() * intermediate_factor2)
-            intermediate_h2 = int(original_size.height() * intermediate_factor2)
-            stage2_pixmap = stage1_pixmap.scaled(
-                intermediate_w2,
-                intermediate_h2,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            
-            # Final stage
-            return stage2_pixmap.scaled(
-                target_w,
-                target_h,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-        else:
-            # Moderate downscaling - use 2 stages
-            intermediate_factor = 0.75
-            intermediate_w = int(original_size.width() * intermediate_factor)
-            intermediate_h = int(original_size.height() * intermediate_factor)
-            
-            # Step 1: Scale to intermediate size
-            intermediate_pixmap = original_pixmap.scaled(
-                intermediate_w,
-                intermediate_h,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            
-            # Step 2: Scale to final size
-            return intermediate_pixmap.scaled(
-                target_w,
-                target_h,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-    
     def create_error_pixmap(self, size: QSize) -> QPixmap:
         """
         Create error pixmap when image processing fails.
@@ -0,0 +1,196 @@
+"""
+Thumbnail Scheduler - Decodes browse thumbnails on a bounded worker pool.
+
+Requests wait in a priority heap ordered by distance from the viewport and
+are handed to the pool only as workers free up, so visible thumbnails are
+decoded before off-screen ones and requests that scroll out of range can
+still be dropped before any work is done for them.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, NamedTuple, Optional
+
+from PyQt6.QtCore import QObject, QSize, pyqtSignal
+from PyQt6.QtGui import QImage
+
+from .thumbnail_processor import load_scaled_image
+
+
+def viewport_offset(
+    item_top: int, item_height: int, view_top: int, view_bottom: int
+) -> int:
+    """
+    Signed distance in pixels from the viewport to an item.
+
+    Returns 0 for items intersecting the viewport, a negative distance for
+    items above it and a positive distance for items below it.
+    """
+    item_bottom = item_top + item_height
+    if item_bottom <= view_top:
+        return item_bottom - view_top
+    if item_top >= view_bottom:
+        return item_top - view_bottom
+    return 0
+
+
+class ThumbnailRequest(NamedTuple):
+    key: Hashable
+    path: str
+    target_size: QSize
+    distance: int
+    generation: int
+
+
+class ThumbnailScheduler(QObject):
+    """
+    Schedules thumbnail decodes by priority on a bounded thread pool.
+
+    Responsibilities:
+    - Keep at most one pending request per key, ordered by distance
+    - Submit work only while fewer than max_workers decodes are running
+    - Drop results of a previous generation after invalidate()
+    - Deliver decoded images on the GUI thread via thumbnail_ready
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+
+    thumbnail_ready = pyqtSignal(object, QImage)  # ThumbnailRequest, image
+    _decoded = pyqtSignal(object, object)
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        decoder: Callable[[str, QSize], QImage] = load_scaled_image,
+    ):
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers or min(
+            self.DEFAULT_MAX_WORKERS, os.cpu_count() or 1
+        )
+        self._decoder = decoder
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="thumbnail-decode"
+        )
+        self._generation = 0
+        self._pending: dict[Hashable, ThumbnailRequest] = {}
+        self._heap: list[tuple[int, int, Hashable]] = []
+        self._heap_entries: dict[Hashable, int] = {}
+        self._counter = itertools.count()
+        self._in_flight: dict[Hashable, ThumbnailRequest] = {}
+        self._running = 0
+
+        self._decoded.connect(self._on_decoded)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def request(
+        self, key: Hashable, path: str, target_size: QSize, distance: int
+    ) -> None:
+        """
+        Queue or re-prioritize the thumbnail for key.
+
+        A newer request for the same key replaces the pending one. Requests
+        identical to a decode that is already running are ignored.
+
+        Args:
+            key: Identifies the consumer, e.g. the thumbnail box word
+            path: Path to the source image
+            target_size: Bounding size to decode at
+            distance: Pixels from the viewport; lower is decoded sooner
+        """
+        running = self._in_flight.get(key)
+        if running and (running.path, running.target_size) == (path, target_size):
+            self.cancel(key)
+            return
+
+        pending = self._pending.get(key)
+        if pending and (pending.path, pending.target_size, pending.distance) == (
+            path,
+            target_size,
+            distance,
+        ):
+            return
+
+        self._pending[key] = ThumbnailRequest(
+            key, path, target_size, distance, self._generation
+        )
+        entry = next(self._counter)
+        self._heap_entries[key] = entry
+        heapq.heappush(self._heap, (distance, entry, key))
+        if len(self._heap) > 2 * len(self._pending) + self.max_workers:
+            self._compact_heap()
+        self._dispatch()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop the pending request for key. Running decodes are not affected."""
+        self._heap_entries.pop(key, None)
+        return self._pending.pop(key, None) is not None
+
+    def invalidate(self) -> int:
+        """
+        Start a new generation, e.g. after the filter or sort order changed.
+
+        Pending requests are dropped and decodes that are still running will
+        have their results discarded.
+
+        Returns:
+            The new generation token
+        """
+        self._generation += 1
+        self._pending.clear()
+        self._heap.clear()
+        self._heap_entries.clear()
+        self._in_flight.clear()
+        return self._generation
+
+    def shutdown(self) -> None:
+        """Drop all work and stop the worker threads."""
+        self.invalidate()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _compact_heap(self) -> None:
+        """Drop heap entries left behind by re-prioritized or cancelled keys."""
+        self._heap = [
+            item for item in self._heap if self._heap_entries.get(item[2]) == item[1]
+        ]
+        heapq.heapify(self._heap)
+
+    def _dispatch(self) -> None:
+        while self._running < self.max_workers and self._heap:
+            _, entry, key = heapq.heappop(self._heap)
+            if self._heap_entries.get(key) != entry:
+                continue
+            del self._heap_entries[key]
+            request = self._pending.pop(key)
+            self._in_flight[key] = request
+            self._running += 1
+            self._executor.submit(self._decode, request)
+
+    def _decode(self, request: ThumbnailRequest) -> None:
+        """Runs on a worker thread."""
+        image = None
+        if request.generation == self._generation:
+            try:
+                image = self._decoder(request.path, request.target_size)
+            except Exception as e:
+                self.logger.error(f"Error decoding thumbnail {request.path}: {e}")
+                image = QImage()
+        self._decoded.emit(request, image)
+
+    def _on_decoded(self, request: ThumbnailRequest, image: Optional[QImage]) -> None:
+        self._running -= 1
+        if self._in_flight.get(request.key) is request:
+            del self._in_flight[request.key]
+        if image is not None and request.generation == self._generation:
+            self.thumbnail_ready.emit(request, image)
+        self._dispatch()
@@ -1,5 +1,11 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QImage
+from .core.thumbnail_scheduler import (
+    ThumbnailRequest,
+    ThumbnailScheduler,
+    viewport_offset,
+)
 from .thumbnail_box import ThumbnailBox
 
 if TYPE_CHECKING:
@@ -9,51 +15,122 @@ if TYPE_CHECKING:
 class ThumbnailBoxUIUpdater:
     """Handles updating and styling of thumbnails."""
 
+    # Thumbnails up to this many screenfuls ahead of the scroll direction
+    # are decoded before they come into view
+    PREFETCH_SCREENS = 1
+    SCROLL_SETTLE_MS = 30
+
     def __init__(self, browse_tab: "BrowseTab"):
         self.browse_tab = browse_tab
         self.font_color_updater = self._get_font_color_updater()
-        self._pending_updates = []
-        self._update_timer = QTimer()
-        self._update_timer.setSingleShot(True)
-        self._update_timer.timeout.connect(self._process_pending_updates)
+        self.scheduler = ThumbnailScheduler()
+        self.scheduler.thumbnail_ready.connect(self._on_thumbnail_ready)
+        self._waiting: dict[str, "ThumbnailBox"] = {}
+        self._scroll_bar = None
+        self._last_scroll_value = 0
+        self._schedule_timer = QTimer()
+        self._schedule_timer.setSingleShot(True)
+        self._schedule_timer.timeout.connect(self.schedule_visible_thumbnails)
 
     def update_thumbnail_image(self, thumbnail_box: "ThumbnailBox"):
         """Updates the thumbnail image of a given thumbnail box (synchronous)."""
         thumbnail_box.image_label.update_thumbnail(thumbnail_box.state.current_index)
 
     def update_thumbnail_image_async(self, thumbnail_box: "ThumbnailBox"):
-        """Updates the thumbnail image asynchronously to prevent UI blocking."""
-        # Add to pending updates queue
-        self._pending_updates.append((thumbnail_box, thumbnail_box.state.current_index))
+        """
+        Updates the thumbnail image without blocking the UI.
 
-        # Start timer to process updates in batches (prevents overwhelming the UI)
-        if not self._update_timer.isActive():
-            self._update_timer.start(10)  # Process every 10ms
+        Cached thumbnails are shown immediately; the rest wait until they are
+        near the viewport and are then decoded by the thumbnail scheduler.
+        """
+        if not thumbnail_box.state.thumbnails:
+            return
 
-    def _process_pending_updates(self):
-        """Process a batch of pending thumbnail updates with cache integration."""
-        if not self._pending_updates:
+        word = thumbnail_box.word
+        if thumbnail_box.image_label.show_cached_thumbnail(
+            thumbnail_box.state.current_index
+        ):
+            self._waiting.pop(word, None)
+            self.scheduler.cancel(word)
             return
 
-        # Process up to 3 thumbnails per batch to maintain responsiveness
-        batch_size = min(3, len(self._pending_updates))
+        self._waiting[word] = thumbnail_box
+        self._request_schedule()
 
-        for _ in range(batch_size):
-            if self._pending_updates:
-                thumbnail_box, index = self._pending_updates.pop(0)
+    def invalidate_pending_thumbnails(self):
+        """Drops queued and running thumbnail decodes, e.g. on filter or sort change."""
+        self._waiting.clear()
+        self._last_scroll_value = 0
+        self.scheduler.invalidate()
 
-                # Set word and variation for cache key generation
-                if hasattr(thumbnail_box.image_label, "set_word_and_variation"):
-                    thumbnail_box.image_label.set_word_and_variation(
-                        thumbnail_box.word, index
-                    )
+    def _request_schedule(self):
+        self._connect_scroll_bar()
+        if not self._schedule_timer.isActive():
+            self._schedule_timer.start(self.SCROLL_SETTLE_MS)
+
+    def _connect_scroll_bar(self):
+        if self._scroll_bar is not None:
+            return
+        scroll_area = self.browse_tab.sequence_picker.scroll_widget.scroll_area
+        self._scroll_bar = scroll_area.verticalScrollBar()
+        self._scroll_bar.valueChanged.connect(lambda _: self._request_schedule())
+
+    def schedule_visible_thumbnails(self):
+        """
+        Requests waiting thumbnails by distance from the viewport.
+
+        Visible thumbnails come first, then the next screenful in the scroll
+        direction. Thumbnails further away, or that have been scrolled past,
+        are withdrawn from the scheduler until they come back into range.
+        """
+        if not self._waiting:
+            return
 
-                # Update thumbnail asynchronously
-                thumbnail_box.image_label.update_thumbnail_async(index)
+        scroll_widget = self.browse_tab.sequence_picker.scroll_widget
+        scroll_widget.grid_layout.activate()
+        viewport_height = scroll_widget.scroll_area.viewport().height()
+        view_top = scroll_widget.scroll_area.verticalScrollBar().value()
+        direction = -1 if view_top < self._last_scroll_value else 1
+        self._last_scroll_value = view_top
+        prefetch_distance = viewport_height * self.PREFETCH_SCREENS
+
+        for word, thumbnail_box in list(self._waiting.items()):
+            if thumbnail_box.parentWidget() is not scroll_widget.scroll_content:
+                del self._waiting[word]
+                self.scheduler.cancel(word)
+                continue
+
+            offset = viewport_offset(
+                thumbnail_box.y(),
+                thumbnail_box.height(),
+                view_top,
+                view_top + viewport_height,
+            )
+            distance = offset * direction
+            if distance < 0 or distance > prefetch_distance:
+                self.scheduler.cancel(word)
+                continue
+
+            state = thumbnail_box.state
+            self.scheduler.request(
+                word,
+                state.thumbnails[state.current_index],
+                thumbnail_box.image_label.target_size(),
+                distance,
+            )
+
+    def _on_thumbnail_ready(self, request: ThumbnailRequest, image: QImage):
+        thumbnail_box = self._waiting.pop(request.key, None)
+        if thumbnail_box is None:
+            return
 
-        # If more updates pending, schedule next batch
-        if self._pending_updates:
-            self._update_timer.start(10)
+        state = thumbnail_box.state
+        if state.thumbnails[state.current_index] != request.path:
+            # The box moved to another variation and loaded it synchronously
+            return
+        thumbnail_box.image_label.set_thumbnail_image(
+            request.path, image, request.target_size
+        )
 
     def apply_thumbnail_styling(self, background_type):
         """Applies styling (font color, star icon) to all thumbnails."""
@@ -22,10 +22,6 @@ class ThumbnailImageLabel(QLabel):
     BORDER_WIDTH_RATIO: Final = 0.01
     SEQUENCE_VIEWER_BORDER_SCALE: Final = 0.8
 
-    # Cache configuration
-    CACHE_DIR = Path("browse_thumbnails")
-    CACHE_METADATA_FILE = "cache_metadata.json"
-
     def __init__(self, thumbnail_box: "ThumbnailBox"):
         super().__init__()
         # Instance attributes
@@ -75,8 +71,6 @@ class ThumbnailImageLabel(QLabel):
 
         path = thumbnails[index]
         if path != self.current_path:
-            self.current_path = path
-            self._original_pixmap = QPixmap(path)
             self._cached_available_size = None
 
         # Use coordinator for processing
@@ -85,42 +79,51 @@ class ThumbnailImageLabel(QLabel):
         )
 
         if not processed_pixmap.isNull():
-            self.setPixmap(processed_pixmap)
-            self._update_size_from_pixmap(processed_pixmap)
+            self._display(path, processed_pixmap)
 
     def update_thumbnail_async(self, index: int) -> None:
-        """Update the displayed image asynchronously with ultra quality processing."""
-        thumbnails = self.thumbnail_box.state.thumbnails
-        if not thumbnails or not (0 <= index < len(thumbnails)):
+        """
+        Update the displayed image without blocking the UI.
+
+        Browse thumbnails are queued on the browse tab's thumbnail scheduler,
+        which decodes them in order of distance from the viewport.
+        """
+        if self.is_in_sequence_viewer:
+            self.update_thumbnail(index)
             return
+        thumbnail_updater = self.thumbnail_box.browse_tab.ui_updater.thumbnail_updater
+        thumbnail_updater.update_thumbnail_image_async(self.thumbnail_box)
 
-        path = thumbnails[index]
-        if path != self.current_path:
-            self.current_path = path
-            # Use coordinator for async processing
-            self.coordinator.process_thumbnail_async(path, index)
-            # Set up a timer to update the display when processing completes
-            QTimer.singleShot(10, lambda: self._update_display_from_coordinator())
-        else:
-            # Use coordinator for processing
-            processed_pixmap = self.coordinator.process_thumbnail_sync(
-                path, self.is_in_sequence_viewer
-            )
-
-            if not processed_pixmap.isNull():
-                self.setPixmap(processed_pixmap)
-                self._update_size_from_pixmap(processed_pixmap)
+    def target_size(self) -> QSize:
+        """Size thumbnails are decoded at for the current view mode."""
+        return self.coordinator.size_calculator.calculate_target_size(
+            self.is_in_sequence_viewer
+        )
 
-    def _update_display_from_coordinator(self) -> None:
-        """Update display after coordinator processing."""
-        if self.current_path:
-            processed_pixmap = self.coordinator.process_thumbnail_sync(
-                self.current_path, self.is_in_sequence_viewer
-            )
+    def show_cached_thumbnail(self, index: int) -> bool:
+        """Display the thumbnail at index if it is cached. Returns True if shown."""
+        thumbnails = self.thumbnail_box.state.thumbnails
+        if not thumbnails or not (0 <= index < len(thumbnails)):
+            return False
 
-            if not processed_pixmap.isNull():
-                self.setPixmap(processed_pixmap)
-                self._update_size_from_pixmap(processed_pixmap)
+        path = thumbnails[index]
+        cached_pixmap = self.coordinator.get_cached_thumbnail(
+            path, self.is_in_sequence_viewer
+        )
+        if cached_pixmap is None:
+            return False
+        self._display(path, cached_pixmap)
+        return True
+
+    def set_thumbnail_image(self, path: str, image: QImage, target_size: QSize) -> None:
+        """Display a thumbnail decoded by the scheduler and cache it."""
+        self._display(path, self.coordinator.store_thumbnail(path, image, target_size))
+
+    def _display(self, path: str, pixmap: QPixmap) -> None:
+        self.current_path = path
+        self._original_pixmap = pixmap
+        self.setPixmap(pixmap)
+        self._update_size_from_pixmap(pixmap)
 
     def _update_size_from_pixmap(self, pixmap: QPixmap) -> None:
         """Update widget size based on pixmap."""
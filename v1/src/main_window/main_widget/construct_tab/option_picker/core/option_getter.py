@@ -9,9 +9,9 @@ from data.constants import (
     RED,
     RED_ATTRS,
     START_ORI,
-    START_POS,
 )
 from interfaces.json_manager_interface import IJsonManager
+from main_window.main_widget.pictograph_dataset_index import PictographDatasetIndex
 
 
 class OptionGetter:
@@ -21,6 +21,7 @@ class OptionGetter:
         json_manager: IJsonManager,
     ) -> None:
         self.pictograph_dataset = pictograph_dataset
+        self.dataset_index = PictographDatasetIndex.for_dataset(pictograph_dataset)
         self.ori_calculator = json_manager.ori_calculator
         self.ori_validation_engine = json_manager.ori_validation_engine
 
@@ -54,14 +55,16 @@ class OptionGetter:
     def _load_all_next_option_dicts(
         self, sequence: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        next_opts: list[dict[str, Any]] = []
         last = sequence[-1] if not sequence[-1].get("is_placeholder") else sequence[-2]
         start = last.get(END_POS)
-        if start:
-            for group in self.pictograph_dataset.values():
-                for item in group:
-                    if item.get(START_POS) == start:
-                        next_opts.append(item)
+        next_opts = (
+            [
+                self.dataset_index.make_option(record)
+                for record in self.dataset_index.get_options(start)
+            ]
+            if start
+            else []
+        )
         for o in next_opts:
             for color in (BLUE, RED):
                 o[f"{color}_attributes"][START_ORI] = last[f"{color}_attributes"][
@@ -0,0 +1,440 @@
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import queue
+from collections import Counter
+from concurrent.futures import CancelledError, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+from PIL import Image, PngImagePlugin
+
+from main_window.main_widget.png_metadata_reader import read_image_metadata
+
+logger = logging.getLogger(__name__)
+
+REGENERATED = "regenerated"
+SKIPPED = "skipped"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Sequence card images show every piece of metadata
+EXPORT_OPTIONS = {
+    "add_word": True,
+    "add_user_info": True,
+    "add_difficulty_level": True,
+    "add_date": True,
+    "add_note": True,
+    "add_beat_numbers": True,
+    "add_reversal_symbols": True,
+    "combined_grids": False,
+    "include_start_position": True,
+}
+PNG_COMPRESSION = 1
+MAX_IMAGE_DIMENSION = 3000
+# Bump when rendering changes so every exported image is regenerated
+RENDERER_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ExportJob:
+    word: str
+    source_path: str
+    output_path: str
+
+
+@dataclass(frozen=True)
+class ExportProgress:
+    job: ExportJob
+    status: str
+    completed: int
+    total: int
+    error: Optional[str] = None
+
+
+@dataclass
+class ExportSummary:
+    total: int = 0
+    regenerated: int = 0
+    skipped: int = 0
+    failed: int = 0
+    cancelled: bool = False
+
+    def record(self, status: str) -> None:
+        if status == REGENERATED:
+            self.regenerated += 1
+        elif status == SKIPPED:
+            self.skipped += 1
+        elif status == FAILED:
+            self.failed += 1
+
+
+def build_export_jobs(dictionary_path: str, export_path: str) -> list[ExportJob]:
+    """
+    List every dictionary image once, in a stable order, paired with the
+    sequence card image it is exported to.
+    """
+    jobs = []
+    with os.scandir(dictionary_path) as words:
+        word_entries = sorted(
+            (e for e in words if e.is_dir() and not e.name.startswith("__")),
+            key=lambda e: e.name,
+        )
+    for word_entry in word_entries:
+        with os.scandir(word_entry.path) as files:
+            names = sorted(
+                e.name
+                for e in files
+                if e.name.endswith(".png") and not e.name.startswith("__")
+            )
+        for name in names:
+            jobs.append(
+                ExportJob(
+                    word_entry.name,
+                    os.path.join(word_entry.path, name),
+                    os.path.join(export_path, word_entry.name, name),
+                )
+            )
+    return jobs
+
+
+class StaleExport(NamedTuple):
+    job: ExportJob
+    reason: str
+
+
+def _hash_json(value: Any) -> str:
+    normalized = json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def sequence_hash(sequence: list[dict]) -> str:
+    """Hash a sequence independently of key order and JSON formatting."""
+    return _hash_json(sequence)
+
+
+def options_hash(options: dict = EXPORT_OPTIONS) -> str:
+    return _hash_json(options)
+
+
+def manifest_entry(source_path: str, sequence: list[dict]) -> dict:
+    """Describe what an exported image was rendered from."""
+    stat = os.stat(source_path)
+    return {
+        "source_mtime_ns": stat.st_mtime_ns,
+        "source_size": stat.st_size,
+        "sequence_hash": sequence_hash(sequence),
+        "options_hash": options_hash(),
+        "renderer_version": RENDERER_VERSION,
+    }
+
+
+class ExportManifest:
+    """
+    Records, for every exported image, the source file stat and the hashes of
+    the sequence, export options and renderer version it was rendered from.
+
+    An image is current while its recorded options and renderer version match
+    and its source is unchanged, which usually takes a single stat. The source
+    metadata is only read when the source file itself was touched.
+    """
+
+    VERSION = 1
+    FILENAME = "export_manifest.json"
+    TEMP_SUFFIX = ".tmp"
+
+    def __init__(self, path: str, entries: Optional[dict[str, dict]] = None):
+        self.path = path
+        self.entries: dict[str, dict] = entries or {}
+        self.dirty = False
+        self._options_hash = options_hash()
+
+    @classmethod
+    def load(cls, export_path: str) -> "ExportManifest":
+        path = os.path.join(export_path, cls.FILENAME)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable export manifest {path}: {e}")
+            return cls(path)
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return cls(path)
+        return cls(path, data.get("entries", {}))
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        temp_path = self.path + self.TEMP_SUFFIX
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": self.VERSION, "entries": self.entries},
+                    f,
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            os.replace(temp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write export manifest {self.path}: {e}")
+
+    @staticmethod
+    def key(job: ExportJob) -> str:
+        return f"{job.word}/{os.path.basename(job.output_path)}"
+
+    def record(self, job: ExportJob, entry: dict) -> None:
+        self.entries[self.key(job)] = entry
+        self.dirty = True
+
+    def stale_reason(self, job: ExportJob) -> Optional[str]:
+        """Return why an image needs regenerating, or None if it is current."""
+        if not os.path.exists(job.output_path):
+            return "Output file does not exist"
+        entry = self.entries.get(self.key(job))
+        if entry is None:
+            return self._adopt(job)
+        if entry.get("renderer_version") != RENDERER_VERSION:
+            return "Renderer version changed"
+        if entry.get("options_hash") != self._options_hash:
+            return "Export options changed"
+
+        try:
+            stat = os.stat(job.source_path)
+            if (entry.get("source_mtime_ns"), entry.get("source_size")) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            ):
+                return None
+            source_metadata = read_image_metadata(job.source_path)
+        except Exception as e:
+            return f"Error during check: {e}"
+        if not source_metadata or "sequence" not in source_metadata:
+            return "Source file has invalid or missing metadata"
+        if sequence_hash(source_metadata["sequence"]) != entry.get("sequence_hash"):
+            return "Sequence data has changed"
+        # Touched but unchanged
+        self.record(job, manifest_entry(job.source_path, source_metadata["sequence"]))
+        return None
+
+    def _adopt(self, job: ExportJob) -> Optional[str]:
+        """
+        Add an image exported before the manifest existed if its embedded
+        metadata shows it was rendered from the current sequence and options.
+        """
+        try:
+            output_metadata = read_image_metadata(job.output_path)
+            source_metadata = read_image_metadata(job.source_path)
+        except Exception as e:
+            return f"Error during check: {e}"
+        if not source_metadata or "sequence" not in source_metadata:
+            return "Source file has invalid or missing metadata"
+        if not output_metadata or "sequence" not in output_metadata:
+            return "Output file has invalid or missing metadata"
+        if source_metadata["sequence"] != output_metadata["sequence"]:
+            return "Sequence data has changed"
+        exported_options = output_metadata.get("export_options") or {}
+        if any(exported_options.get(k) != v for k, v in EXPORT_OPTIONS.items()):
+            return "Export options changed"
+        self.record(job, manifest_entry(job.source_path, source_metadata["sequence"]))
+        return None
+
+
+def qimage_to_pil(qimage, max_dimension: int = MAX_IMAGE_DIMENSION) -> Image.Image:
+    """Convert a rendered QImage to an RGBA PIL image, downscaling huge ones."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QImage
+
+    if qimage.width() > max_dimension or qimage.height() > max_dimension:
+        qimage = qimage.scaled(
+            max_dimension,
+            max_dimension,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+    qimage = qimage.convertToFormat(QImage.Format.Format_ARGB32)
+    width, height = qimage.width(), qimage.height()
+    ptr = qimage.bits()
+    ptr.setsize(height * width * 4)
+    # ARGB32 is stored as BGRA bytes
+    arr = np.array(ptr, copy=True).reshape((height, width, 4))
+    return Image.fromarray(arr[..., [2, 1, 0, 3]], "RGBA")
+
+
+# Per-process worker state. The renderer is created on first use, so a pass
+# where every image is current never starts Qt in the workers.
+_cancel_event = None
+_renderer = None
+
+
+def _init_worker(cancel_event) -> None:
+    global _cancel_event
+    _cancel_event = cancel_event
+
+
+def _get_renderer():
+    global _renderer
+    if _renderer is None:
+        from main_window.main_widget.headless_sequence_renderer import (
+            HeadlessSequenceRenderer,
+            initialize_headless_context,
+        )
+
+        initialize_headless_context()
+        _renderer = HeadlessSequenceRenderer()
+    return _renderer
+
+
+def export_sequence_image(job: ExportJob) -> tuple[str, Optional[str], Optional[dict]]:
+    """
+    Render and save one sequence card image; runs in a worker process.
+    Returns the status, an error message and the image's manifest entry.
+    """
+    if _cancel_event is not None and _cancel_event.is_set():
+        return CANCELLED, None, None
+
+    metadata = read_image_metadata(job.source_path)
+    if not metadata or "sequence" not in metadata:
+        return FAILED, "No sequence metadata", None
+
+    try:
+        entry = manifest_entry(job.source_path, metadata["sequence"])
+        qimage, options = _get_renderer().render(
+            metadata["sequence"], EXPORT_OPTIONS
+        )
+        pil_image = qimage_to_pil(qimage)
+        metadata["export_options"] = options
+        metadata["export_date"] = datetime.now().isoformat()
+        info = PngImagePlugin.PngInfo()
+        info.add_text("metadata", json.dumps(metadata))
+
+        os.makedirs(os.path.dirname(job.output_path), exist_ok=True)
+        temp_path = job.output_path + ".tmp"
+        pil_image.save(
+            temp_path, "PNG", compress_level=PNG_COMPRESSION, pnginfo=info
+        )
+        os.replace(temp_path, job.output_path)
+    except Exception as e:
+        return FAILED, str(e), None
+    return REGENERATED, None, entry
+
+
+class DictionaryImageRegenerator:
+    """
+    Regenerates the sequence card images for the whole dictionary on a pool
+    of worker processes.
+
+    The dictionary is listed once up front and checked against the export
+    manifest, so only missing or stale images reach the pool. Each worker
+    renders images headlessly from their metadata, so the work scales with
+    the number of cores and the GUI thread only has to read progress off a
+    queue. Setting the cancel event (see cancel()) stops workers from
+    starting new images.
+    """
+
+    def __init__(
+        self,
+        dictionary_path: str,
+        export_path: str,
+        max_workers: Optional[int] = None,
+    ):
+        self.dictionary_path = dictionary_path
+        self.export_path = export_path
+        # Leave a core for the GUI
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        # Spawned workers avoid forking a process that has a QApplication
+        self._mp_context = multiprocessing.get_context("spawn")
+        self.cancel_event = self._mp_context.Event()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+    def plan(
+        self, manifest: Optional[ExportManifest] = None
+    ) -> tuple[list[ExportJob], list[StaleExport]]:
+        """List every export job and the ones that need regenerating."""
+        if manifest is None:
+            manifest = ExportManifest.load(self.export_path)
+        jobs = build_export_jobs(self.dictionary_path, self.export_path)
+        stale = []
+        for job in jobs:
+            reason = manifest.stale_reason(job)
+            if reason is not None:
+                stale.append(StaleExport(job, reason))
+        return jobs, stale
+
+    def dry_run(self) -> str:
+        """Describe what run() would regenerate and why, without exporting."""
+        jobs, stale = self.plan()
+        lines = [
+            f"{len(stale)} of {len(jobs)} sequence card images would be regenerated"
+        ]
+        for reason, count in Counter(s.reason for s in stale).most_common():
+            lines.append(f"  {count:>6}  {reason}")
+        for job, reason in stale:
+            lines.append(f"{job.word}/{os.path.basename(job.output_path)}: {reason}")
+        return "\n".join(lines)
+
+    def run(self, progress_queue: Optional[queue.Queue] = None) -> ExportSummary:
+        """
+        Export every dictionary image that is missing or out of date, putting
+        an ExportProgress on progress_queue as each one finishes.
+        """
+        os.makedirs(self.export_path, exist_ok=True)
+        manifest = ExportManifest.load(self.export_path)
+        jobs, stale = self.plan(manifest)
+        summary = ExportSummary(total=len(jobs), skipped=len(jobs) - len(stale))
+        try:
+            if stale:
+                self._export(stale, manifest, summary, progress_queue)
+        finally:
+            manifest.save()
+        return summary
+
+    def _export(
+        self,
+        stale: list[StaleExport],
+        manifest: ExportManifest,
+        summary: ExportSummary,
+        progress_queue: Optional[queue.Queue],
+    ) -> None:
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(stale)),
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self.cancel_event,),
+        ) as executor:
+            futures = {
+                executor.submit(export_sequence_image, job): job for job, _ in stale
+            }
+            completions = enumerate(as_completed(futures), summary.skipped + 1)
+            for completed, future in completions:
+                job = futures[future]
+                try:
+                    status, error, entry = future.result()
+                except CancelledError:
+                    status, error, entry = CANCELLED, None, None
+                except Exception as e:
+                    status, error, entry = FAILED, str(e), None
+                if error:
+                    logger.warning(f"Failed to export {job.source_path}: {error}")
+                if entry is not None:
+                    manifest.record(job, entry)
+
+                summary.record(status)
+                if progress_queue is not None:
+                    progress_queue.put(
+                        ExportProgress(job, status, completed, summary.total, error)
+                    )
+                if self.cancel_event.is_set() and not summary.cancelled:
+                    summary.cancelled = True
+                    for pending in futures:
+                        pending.cancel()
@@ -0,0 +1,226 @@
+import atexit
+import json
+import logging
+import os
+import threading
+from typing import Any, Iterable, Optional
+
+from data.constants import DIAMOND, END_POS, GRID_MODE, SEQUENCE_START_POSITION
+from main_window.main_widget.png_metadata_reader import (
+    iter_image_metadata,
+    read_image_metadata,
+)
+
+logger = logging.getLogger(__name__)
+
+MetadataSummary = dict[str, Any]
+
+
+class DictionaryMetadataIndex:
+    """
+    Persistent index of the metadata stored in dictionary thumbnails.
+
+    Each PNG carries its sequence as a JSON text chunk, and the browse tab
+    filters and sorts on a handful of fields from it. Opening every image to
+    read those fields costs seconds of I/O, so the index keeps a compact
+    summary per thumbnail in a JSON file keyed by path and validated against
+    the file's mtime and size. Only files whose stat has changed are read
+    again; everything else is answered from memory.
+
+    One index exists per index file path, shared by every MetaDataExtractor.
+    Changes are written atomically on flush(), at window close and at exit.
+    """
+
+    VERSION = 1
+    TEMP_SUFFIX = ".tmp"
+
+    _indexes: dict[str, "DictionaryMetadataIndex"] = {}
+    _indexes_lock = threading.Lock()
+
+    def __init__(self, index_path: str) -> None:
+        self.index_path = index_path
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.read_count = 0
+
+    @classmethod
+    def for_path(cls, index_path: str) -> "DictionaryMetadataIndex":
+        key = os.path.abspath(index_path)
+        with cls._indexes_lock:
+            index = cls._indexes.get(key)
+            if index is None:
+                index = cls(key)
+                cls._indexes[key] = index
+            return index
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._indexes_lock:
+            indexes = list(cls._indexes.values())
+        for index in indexes:
+            index.flush()
+
+    # Queries
+
+    def get(self, file_path: str) -> Optional[MetadataSummary]:
+        """
+        Return the metadata summary for a thumbnail, or None if it has no
+        sequence metadata. Raises OSError if the file cannot be read.
+        """
+        key = os.path.abspath(file_path)
+        stat = os.stat(key)
+        entry = self._current_entry(key, stat)
+        if entry is not None:
+            return entry["summary"]
+        return self._store(key, stat, read_image_metadata(key))
+
+    def refresh(
+        self, file_paths: Iterable[str], max_workers: Optional[int] = None
+    ) -> int:
+        """
+        Bring the given thumbnails up to date, reading the changed ones in
+        parallel, and return how many were re-read.
+        """
+        stale: dict[str, os.stat_result] = {}
+        for file_path in file_paths:
+            key = os.path.abspath(file_path)
+            try:
+                stat = os.stat(key)
+            except OSError as e:
+                logger.warning(f"Could not index {file_path}: {e}")
+                continue
+            if self._current_entry(key, stat) is None:
+                stale[key] = stat
+
+        refreshed = 0
+        for result in iter_image_metadata(stale, max_workers):
+            if result.error is not None:
+                logger.warning(f"Could not index {result.path}: {result.error}")
+                continue
+            self._store(result.path, stale[result.path], result.metadata)
+            refreshed += 1
+        return refreshed
+
+    def discard(self, file_path: str) -> None:
+        """Forget a thumbnail so its next lookup re-reads the file."""
+        with self._lock:
+            if self._load().pop(os.path.abspath(file_path), None) is not None:
+                self._dirty = True
+
+    @staticmethod
+    def summarize(metadata: Optional[dict]) -> Optional[MetadataSummary]:
+        """Reduce a thumbnail's metadata to the fields the browse tab queries."""
+        if not metadata:
+            return None
+        summary: MetadataSummary = {
+            "tags": metadata.get("tags", []),
+            "is_favorite": metadata.get("is_favorite", False),
+            "date_added": metadata.get("date_added"),
+            "has_sequence": "sequence" in metadata,
+        }
+        if not summary["has_sequence"]:
+            return summary
+
+        sequence = metadata["sequence"]
+        header = sequence[0] if sequence else {}
+        summary.update(
+            {
+                "word": header.get("word"),
+                "author": header.get("author"),
+                "level": header.get("level"),
+                "grid_mode": header.get(GRID_MODE, DIAMOND),
+                "length": len(sequence) - 2,
+                "start_pos": DictionaryMetadataIndex._start_pos(sequence),
+            }
+        )
+        return summary
+
+    @staticmethod
+    def _start_pos(sequence: list[dict]) -> Optional[str]:
+        if len(sequence) < 2:
+            return None
+        start_pos_entry = sequence[1]
+        if SEQUENCE_START_POSITION in start_pos_entry:
+            return start_pos_entry[SEQUENCE_START_POSITION]
+        end_pos = start_pos_entry.get(END_POS)
+        if end_pos:
+            for position_type in ("alpha", "beta", "gamma"):
+                if end_pos.startswith(position_type):
+                    return position_type
+        return None
+
+    def _current_entry(
+        self, key: str, stat: os.stat_result
+    ) -> Optional[dict[str, Any]]:
+        with self._lock:
+            entry = self._load().get(key)
+        if (
+            entry is not None
+            and entry["mtime_ns"] == stat.st_mtime_ns
+            and entry["size"] == stat.st_size
+        ):
+            return entry
+        return None
+
+    def _store(
+        self, key: str, stat: os.stat_result, metadata: Optional[dict]
+    ) -> Optional[MetadataSummary]:
+        summary = self.summarize(metadata)
+        with self._lock:
+            self._load()[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "summary": summary,
+            }
+            self._dirty = True
+            self.read_count += 1
+        return summary
+
+    # Persistence
+
+    def flush(self) -> None:
+        """Write the index to disk if it changed, dropping deleted files."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            for key in [key for key in self._entries if not os.path.exists(key)]:
+                del self._entries[key]
+            try:
+                self._atomic_write(
+                    {"version": self.VERSION, "entries": self._entries}
+                )
+            except OSError as e:
+                logger.error(f"Failed to write {self.index_path}: {e}")
+                return
+            self._dirty = False
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._read_index()
+        return self._entries
+
+    def _read_index(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _atomic_write(self, data: dict) -> None:
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.index_path + self.TEMP_SUFFIX
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.index_path)
+
+
+atexit.register(DictionaryMetadataIndex.flush_all)
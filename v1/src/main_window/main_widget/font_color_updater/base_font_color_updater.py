@@ -1,5 +1,12 @@
+import re
+
 from PyQt6.QtWidgets import QWidget, QCheckBox
 
+from styles.stylesheet_compiler import StyleSheetCompiler
+
+# The color declaration a previous update appended to a widget's own sheet
+_APPENDED_COLOR = re.compile(r"\s*(?<![-\w])color:[^;{}]*;\s*$")
+
 
 class BaseFontColorUpdater:
     def __init__(self, font_color: str):
@@ -10,9 +17,22 @@ class BaseFontColorUpdater:
 
     def _apply_font_color(self, widget: QWidget) -> None:
         """Apply self.font_color to a single widget, with special handling for QCheckBox."""
+        compiler = StyleSheetCompiler.instance()
         if isinstance(widget, QCheckBox):
-            widget.setStyleSheet(
-                f"""
+            sheet = compiler.compile(
+                (QCheckBox, self.font_color), self._checkbox_style_sheet
+            )
+            compiler.apply(widget, sheet)
+        else:
+            if widget:
+                # Replace the color appended last time instead of appending
+                # another one on every background change
+                existing_style = _APPENDED_COLOR.sub("", widget.styleSheet() or "")
+                new_style = f"{existing_style} color: {self.font_color};"
+                compiler.apply(widget, new_style)
+
+    def _checkbox_style_sheet(self) -> str:
+        return f"""
                 QCheckBox {{
                     color: {self.font_color};
                 }}
@@ -27,12 +47,6 @@ class BaseFontColorUpdater:
                     background-color: white;
                 }}
                 """
-            )
-        else:
-            if widget:
-                existing_style = widget.styleSheet() or ""
-                new_style = f"{existing_style} color: {self.font_color};"
-                widget.setStyleSheet(new_style)
 
     def _apply_font_colors(self, widgets: list[QWidget]) -> None:
         """Apply font color to a list of widgets."""
@@ -8,6 +8,7 @@ from .construct_tab_font_color_updater import ConstructTabFontColorUpdater
 from .generate_tab_font_color_updater import GenerateTabFontColorUpdater
 from .browse_tab_font_color_updater import BrowseTabFontColorUpdater
 from .learn_tab_font_color_updater import LearnTabFontColorUpdater
+from styles.stylesheet_compiler import StyleSheetCompiler
 
 
 if TYPE_CHECKING:
@@ -29,6 +30,7 @@ class FontColorUpdater:
         ]
 
     def update_main_widget_font_colors(self, bg_type: str):
+        StyleSheetCompiler.instance().begin_action("background_change")
         self.font_color = self.get_font_color(bg_type)
         self._apply_main_widget_colors()
 
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 from data.quartered_CAPs import quartered_CAPs
 from data.halved_CAPs import halved_CAPs
 from data.positions_maps import mirrored_positions
+from main_window.main_widget.pictograph_dataset_index import PictographDatasetIndex
 from data.constants import (
     BEAT,
     BLUE,
@@ -184,17 +185,14 @@ class StrictRotatedCAPExecutor(CAPExecutor):
             )
             current_end_pos = sequence[-1][END_POS]
             #  use the letters data stored in the main widget to find a letter that can get you from the current end pos to the new end pos
-            pictograph_dataset = (
+            dataset_index = PictographDatasetIndex.for_dataset(
                 self.circular_sequence_generator.main_widget.pictograph_dataset
             )
-            possible_last_beats: list[dict] = []
-            for letter in pictograph_dataset:
-                for pictograph_data in pictograph_dataset[letter]:
-                    if (
-                        pictograph_data.get(START_POS) == current_end_pos
-                        and pictograph_data.get(END_POS) == new_end_pos
-                    ):
-                        possible_last_beats.append(pictograph_data)
+            possible_last_beats = [
+                pictograph_data
+                for pictograph_data in dataset_index.get_options(current_end_pos)
+                if pictograph_data.get(END_POS) == new_end_pos
+            ]
             if len(possible_last_beats) == 0:
                 raise ValueError(
                     f"Could not find a pictograph that goes from {current_end_pos} to {new_end_pos}"
@@ -203,7 +201,9 @@ class StrictRotatedCAPExecutor(CAPExecutor):
                 # randomize the selection of the last beat
                 import random
 
-                new_entry = random.choice(possible_last_beats)
+                new_entry = dataset_index.make_option(
+                    random.choice(possible_last_beats)
+                )
                 new_entry[BLUE_ATTRS][TURNS] = previous_matching_beat[BLUE_ATTRS][TURNS]
                 new_entry[RED_ATTRS][TURNS] = previous_matching_beat[RED_ATTRS][TURNS]
                 new_entry[BEAT] = beat_number
@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import QApplication
 import random
-from copy import deepcopy
 from PyQt6.QtCore import Qt
 from data.constants import (
     BLUE_ATTRS,
@@ -163,18 +162,14 @@ class CircularSequenceBuilder(BaseSequenceBuilder):
         try:
             construct_tab = self.main_widget.tab_manager.get_tab_widget("construct")
             if construct_tab:
-                options = deepcopy(
-                    construct_tab.option_picker.option_getter._load_all_next_option_dicts(
-                        self.sequence
-                    )
+                options = construct_tab.option_picker.option_getter._load_all_next_option_dicts(
+                    self.sequence
                 )
             else:
                 # Fallback: try direct access for backward compatibility
                 if hasattr(self.main_widget, "construct_tab"):
-                    options = deepcopy(
-                        self.main_widget.construct_tab.option_picker.option_getter._load_all_next_option_dicts(
-                            self.sequence
-                        )
+                    options = self.main_widget.construct_tab.option_picker.option_getter._load_all_next_option_dicts(
+                        self.sequence
                     )
                 else:
                     import logging
@@ -187,10 +182,8 @@ class CircularSequenceBuilder(BaseSequenceBuilder):
         except AttributeError:
             # Fallback: try direct access for backward compatibility
             if hasattr(self.main_widget, "construct_tab"):
-                options = deepcopy(
-                    self.main_widget.construct_tab.option_picker.option_getter._load_all_next_option_dicts(
-                        self.sequence
-                    )
+                options = self.main_widget.construct_tab.option_picker.option_getter._load_all_next_option_dicts(
+                    self.sequence
                 )
             else:
                 import logging
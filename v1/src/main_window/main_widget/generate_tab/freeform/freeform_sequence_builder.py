@@ -1,7 +1,6 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import QApplication
 import random
-from copy import deepcopy
 from PyQt6.QtCore import Qt
 from data.constants import CLOCKWISE, COUNTER_CLOCKWISE, LETTER
 from ..base_sequence_builder import BaseSequenceBuilder
@@ -70,7 +69,6 @@ class FreeFormSequenceBuilder(BaseSequenceBuilder):
     ):
 
         option_dicts = self._get_option_dicts()
-        option_dicts = [deepcopy(option) for option in option_dicts]
 
         option_dicts = self._filter_options_by_letter_type(option_dicts)
 
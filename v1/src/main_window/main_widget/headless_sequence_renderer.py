@@ -0,0 +1,260 @@
+import os
+from datetime import datetime
+from typing import Optional
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QImage, QPainter
+from PyQt6.QtWidgets import QApplication
+
+from data.beat_frame_layouts import sequence_workbench_BEAT_FRAME_LAYOUTS
+from data.constants import LETTER, SEQUENCE_START_POSITION
+from main_window.main_widget.sequence_level_evaluator import SequenceLevelEvaluator
+from main_window.main_widget.sequence_workbench.sequence_beat_frame.beat import Beat
+from main_window.main_widget.sequence_workbench.sequence_beat_frame.image_export_manager.image_creator.height_determiner import (
+    HeightDeterminer,
+)
+from main_window.main_widget.sequence_workbench.sequence_beat_frame.image_export_manager.image_creator.image_export_difficulty_level_drawer import (
+    ImageExportDifficultyLevelDrawer,
+)
+from main_window.main_widget.sequence_workbench.sequence_beat_frame.image_export_manager.image_creator.user_info_drawer import (
+    UserInfoDrawer,
+)
+from main_window.main_widget.sequence_workbench.sequence_beat_frame.image_export_manager.image_creator.word_drawer import (
+    WordDrawer,
+)
+from main_window.main_widget.sequence_workbench.sequence_beat_frame.start_pos_beat import (
+    StartPositionBeat,
+)
+from src.settings_manager.global_settings.app_context import AppContext
+from utils.reversal_detector import ReversalDetector
+from utils.word_simplifier import WordSimplifier
+
+_app: Optional[QApplication] = None
+
+
+def initialize_headless_context() -> None:
+    """
+    Prepare a worker process to build pictographs: an offscreen QApplication
+    plus the services AppContext hands to pictograph managers, set up the
+    same way main.py does for the GUI process.
+    """
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if QApplication.instance() is None:
+        _app = QApplication([])
+
+    from src.core.application_context import create_application_context
+    from src.core.dependency_container import configure_dependencies
+    from src.core.migration_adapters import setup_legacy_compatibility
+    from main_window.main_widget.json_manager.special_placement_saver import (
+        SpecialPlacementSaver,
+    )
+    from main_window.main_widget.special_placement_loader import (
+        SpecialPlacementLoader,
+    )
+
+    app_context = create_application_context(configure_dependencies())
+    setup_legacy_compatibility(app_context)
+    AppContext.init(
+        settings_manager=app_context.settings_manager,
+        json_manager=app_context.json_manager,
+        special_placement_handler=SpecialPlacementSaver(),
+        special_placement_loader=SpecialPlacementLoader(),
+    )
+
+
+def calculate_image_layout(
+    filled_beat_count: int, include_start_pos: bool
+) -> tuple[int, int]:
+    """
+    Return the (columns, rows) grid of a sequence image, matching
+    ImageExportLayoutHandler for the temp beat frame's layouts.
+    """
+    rows, columns = sequence_workbench_BEAT_FRAME_LAYOUTS.get(
+        filled_beat_count, (1, filled_beat_count)
+    )
+    if include_start_pos:
+        return (columns + 1, rows) if filled_beat_count > 0 else (1, 1)
+    return (columns, rows)
+
+
+class HeadlessSequenceRenderer:
+    """
+    Renders sequence images from sequence metadata without widgets.
+
+    Each beat is built as a pictograph scene and painted straight into the
+    QImage, so no BeatView, beat frame or main widget is ever created. The
+    output matches ImageCreator.create_sequence_image for the same options.
+    """
+
+    BEAT_SIZE = 950
+
+    def __init__(self):
+        self.beat_scale = 1
+        self.settings_manager = AppContext.settings_manager()
+        self.word_drawer = WordDrawer(self)
+        self.user_info_drawer = UserInfoDrawer(self)
+        self.difficulty_level_drawer = ImageExportDifficultyLevelDrawer()
+        self.level_evaluator = SequenceLevelEvaluator()
+
+    def render(self, sequence: list[dict], options: dict) -> tuple[QImage, dict]:
+        """
+        Render a sequence to an image.
+
+        Returns the image and a copy of options completed with the values
+        used for drawing (heights, user name and export date), the way
+        ImageCreator completes them. The caller's options are not changed.
+        """
+        beat_entries = [
+            entry
+            for entry in sequence[2:]
+            if not entry.get("is_placeholder")
+            and not entry.get(SEQUENCE_START_POSITION)
+        ]
+        beats = self._build_beats(beat_entries)
+        num_filled_beats = len(beats)
+
+        options = dict(options)
+        options["user_name"] = self.settings_manager.users.get_current_user()
+        options["export_date"] = datetime.now().strftime("%m-%d-%Y")
+        options["additional_height_top"], options["additional_height_bottom"] = (
+            HeightDeterminer.determine_additional_heights(
+                options, num_filled_beats, self.beat_scale
+            )
+        )
+        if options["add_reversal_symbols"]:
+            self._apply_reversals(beat_entries, beats)
+
+        include_start_pos = options["include_start_position"]
+        column_count, row_count = calculate_image_layout(
+            num_filled_beats, include_start_pos
+        )
+        beat_size = int(self.BEAT_SIZE * self.beat_scale)
+        image = QImage(
+            column_count * beat_size,
+            row_count * beat_size
+            + options["additional_height_top"]
+            + options["additional_height_bottom"],
+            QImage.Format.Format_ARGB32,
+        )
+        image.fill(Qt.GlobalColor.white)
+
+        start_pos = self._build_start_position(sequence) if include_start_pos else None
+        self._draw_beats(
+            image,
+            beats,
+            start_pos,
+            column_count,
+            options["additional_height_top"],
+            options["add_beat_numbers"],
+        )
+        self._draw_additional_info(image, sequence, beats, options)
+        return image, options
+
+    def _build_beats(self, beat_entries: list[dict]) -> list[Beat]:
+        beats = []
+        beat_number = 1
+        for entry in beat_entries:
+            beat = Beat(None, entry.get("duration", 1))
+            beat.state.pictograph_data = entry
+            beat.managers.updater.update_pictograph(entry)
+            beat.beat_number = beat_number
+            beat.beat_number_item.update_beat_number(beat_number)
+            beats.append(beat)
+            beat_number += beat.duration
+        self._apply_visibility_settings(beats)
+        return beats
+
+    def _build_start_position(self, sequence: list[dict]) -> Optional[Beat]:
+        entry = next(
+            (e for e in sequence if e.get(SEQUENCE_START_POSITION)), None
+        )
+        if entry is None:
+            return None
+        start_pos = StartPositionBeat(None)
+        start_pos.managers.updater.update_pictograph(entry)
+        start_pos.start_text_item.add_start_text()
+        return start_pos
+
+    def _apply_visibility_settings(self, beats: list[Beat]) -> None:
+        visibility = self.settings_manager.visibility
+        visible = {
+            color: visibility.get_motion_visibility(color) for color in ("red", "blue")
+        }
+        for beat in beats:
+            for items in (beat.elements.props, beat.elements.arrows):
+                for color, item in items.items():
+                    if color in visible:
+                        item.setVisible(visible[color])
+
+    def _apply_reversals(self, beat_entries: list[dict], beats: list[Beat]) -> None:
+        """Mark reversals the way BeatReversalProcessor does for beat views."""
+        sequence_so_far = []
+        for entry, beat in zip(beat_entries, beats):
+            reversal_info = ReversalDetector.detect_reversal(sequence_so_far, entry)
+            beat.state.blue_reversal = reversal_info.get("blue_reversal", False)
+            beat.state.red_reversal = reversal_info.get("red_reversal", False)
+            beat.elements.reversal_glyph.update_reversal_symbols()
+            sequence_so_far.append(entry)
+
+    def _draw_beats(
+        self,
+        image: QImage,
+        beats: list[Beat],
+        start_pos: Optional[Beat],
+        column_count: int,
+        additional_height_top: int,
+        add_beat_numbers: bool,
+    ) -> None:
+        beat_size = int(self.BEAT_SIZE * self.beat_scale)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        start_col = 0
+        if start_pos is not None:
+            painter.drawPixmap(
+                0, additional_height_top, self._grab(start_pos, beat_size)
+            )
+            start_col = 1
+
+        columns = column_count - start_col
+        for index, beat in enumerate(beats):
+            beat.beat_number_item.setVisible(add_beat_numbers)
+            row, col = divmod(index, columns)
+            painter.drawPixmap(
+                (start_col + col) * beat_size,
+                row * beat_size + additional_height_top,
+                self._grab(beat, beat_size),
+            )
+        painter.end()
+
+    @staticmethod
+    def _grab(beat: Beat, size: int):
+        return beat.grabber.grab().scaled(
+            size,
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    def _draw_additional_info(
+        self, image: QImage, sequence: list[dict], beats: list[Beat], options: dict
+    ) -> None:
+        num_filled_beats = len(beats)
+        if options["add_user_info"]:
+            self.user_info_drawer.draw_user_info(image, options, num_filled_beats)
+
+        if options["add_word"]:
+            word = WordSimplifier.simplify_repeated_word(
+                "".join(beat.state.pictograph_data.get(LETTER, "") for beat in beats)
+            )
+            self.word_drawer.draw_word(
+                image, word, num_filled_beats, options["additional_height_top"]
+            )
+
+        if options["add_difficulty_level"]:
+            self.difficulty_level_drawer.draw_difficulty_level(
+                image,
+                self.level_evaluator.get_sequence_difficulty_level(sequence),
+                options["additional_height_top"],
+            )
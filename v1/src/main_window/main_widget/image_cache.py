@@ -0,0 +1,315 @@
+import atexit
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from PyQt6.QtGui import QImage
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRNAME = "image_cache"
+
+
+@dataclass(frozen=True)
+class ImageCacheStats:
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    memory_bytes: int
+    memory_budget: int
+    disk_bytes: int
+    disk_budget: int
+    memory_evictions: int
+    disk_evictions: int
+    pending_writes: int
+
+    @property
+    def lookups(self) -> int:
+        return self.memory_hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        if not self.lookups:
+            return 0.0
+        return (self.memory_hits + self.disk_hits) / self.lookups
+
+
+class ImageCache:
+    """
+    Two-tier cache of decoded images shared by the browse and sequence card
+    tabs.
+
+    The memory tier is an LRU of QImages bounded by their byte cost. Images
+    put with persist=True also go to a disk tier of PNG files, itself an LRU
+    bounded by file size and tracked in an index file. Disk writes are
+    queued and written in batches, so scrolling through thumbnails does not
+    write a file and rewrite the index per image.
+
+    Keys are opaque strings; source_key() builds one that changes whenever
+    the source file does, so stale entries are never returned and simply age
+    out of the LRU. One cache exists per directory. Pending writes are
+    flushed when a batch fills, at window close and at exit.
+    """
+
+    VERSION = 1
+    INDEX_FILENAME = "cache_index.json"
+    TEMP_SUFFIX = ".tmp"
+    DEFAULT_MEMORY_BUDGET = 128 * 1024 * 1024
+    DEFAULT_DISK_BUDGET = 512 * 1024 * 1024
+    WRITE_BATCH_SIZE = 16
+
+    _caches: dict[str, "ImageCache"] = {}
+    _caches_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_dir: str,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        disk_budget: int = DEFAULT_DISK_BUDGET,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, self.INDEX_FILENAME)
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+        self._lock = threading.RLock()
+        self._memory: OrderedDict[str, QImage] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: Optional[OrderedDict[str, int]] = None
+        self._disk_bytes = 0
+        self._pending: dict[str, QImage] = {}
+        self._dirty = False
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._memory_evictions = 0
+        self._disk_evictions = 0
+
+    @classmethod
+    def for_directory(cls, cache_dir: str, **budgets: int) -> "ImageCache":
+        """Return the cache for cache_dir; budgets only apply when creating it."""
+        key = os.path.abspath(cache_dir)
+        with cls._caches_lock:
+            cache = cls._caches.get(key)
+            if cache is None:
+                cache = cls(key, **budgets)
+                cls._caches[key] = cache
+            return cache
+
+    @classmethod
+    def shared(cls) -> "ImageCache":
+        """The application's image cache, in the user-editable resources."""
+        from utils.path_helpers import get_user_editable_resource_path
+
+        return cls.for_directory(get_user_editable_resource_path(CACHE_DIRNAME))
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._caches_lock:
+            caches = list(cls._caches.values())
+        for cache in caches:
+            cache.flush()
+
+    @staticmethod
+    def source_key(source_path: str, *variant: Any) -> str:
+        """
+        Key for an image derived from source_path, e.g. a thumbnail size.
+        Includes the file's mtime and size so edits produce a new key.
+        """
+        path = os.path.abspath(source_path)
+        try:
+            stat = os.stat(path)
+            parts = [path, str(stat.st_mtime_ns), str(stat.st_size)]
+        except OSError:
+            parts = [path]
+        parts.extend(str(part) for part in variant)
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+    # Lookups
+
+    def get(self, key: str) -> Optional[QImage]:
+        """Return the cached image for key, loading it from disk if needed."""
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return image
+
+            image = self._pending.get(key)
+            if image is not None:
+                # Evicted from memory before its batch was written
+                self._memory_hits += 1
+            else:
+                image = self._read_from_disk(key)
+                if image is None:
+                    self._misses += 1
+                    return None
+                self._disk_hits += 1
+
+            self._remember(key, image)
+            return image
+
+    def put(self, key: str, image: QImage, persist: bool = False) -> None:
+        """
+        Cache image under key. With persist=True it is also queued for the
+        disk tier and written with the next batch.
+        """
+        if image.isNull():
+            return
+        with self._lock:
+            self._remember(key, image)
+            if persist:
+                self._pending[key] = image
+                if len(self._pending) >= self.WRITE_BATCH_SIZE:
+                    self.flush()
+
+    def discard(self, keys: Iterable[str]) -> None:
+        """Drop keys from the memory tier and any pending disk writes."""
+        with self._lock:
+            for key in keys:
+                image = self._memory.pop(key, None)
+                if image is not None:
+                    self._memory_bytes -= image.sizeInBytes()
+                self._pending.pop(key, None)
+
+    def clear(self) -> None:
+        """Empty both tiers and delete the cached files."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            self._pending.clear()
+            for key in list(self._load_disk()):
+                self._remove_file(key)
+            self._disk.clear()
+            self._disk_bytes = 0
+            self._dirty = True
+            self.flush()
+
+    def stats(self) -> ImageCacheStats:
+        with self._lock:
+            self._load_disk()
+            return ImageCacheStats(
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                memory_bytes=self._memory_bytes,
+                memory_budget=self.memory_budget,
+                disk_bytes=self._disk_bytes,
+                disk_budget=self.disk_budget,
+                memory_evictions=self._memory_evictions,
+                disk_evictions=self._disk_evictions,
+                pending_writes=len(self._pending),
+            )
+
+    # Memory tier
+
+    def _remember(self, key: str, image: QImage) -> None:
+        cost = image.sizeInBytes()
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.sizeInBytes()
+        if cost > self.memory_budget:
+            return
+        self._memory[key] = image
+        self._memory_bytes += cost
+        while self._memory_bytes > self.memory_budget:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.sizeInBytes()
+            self._memory_evictions += 1
+
+    # Disk tier
+
+    def flush(self) -> None:
+        """Write pending images, evict past the disk budget and save the index."""
+        with self._lock:
+            disk = self._load_disk()
+            if not self._pending and not self._dirty:
+                return
+            if self._pending:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            for key, image in self._pending.items():
+                path = self._file_path(key)
+                if not image.save(path, "PNG"):
+                    logger.warning(f"Failed to write cached image: {path}")
+                    continue
+                self._disk_bytes -= disk.pop(key, 0)
+                disk[key] = os.path.getsize(path)
+                self._disk_bytes += disk[key]
+            self._pending.clear()
+
+            while self._disk_bytes > self.disk_budget and disk:
+                key, size = disk.popitem(last=False)
+                self._disk_bytes -= size
+                self._disk_evictions += 1
+                self._remove_file(key)
+
+            try:
+                self._atomic_write(
+                    {"version": self.VERSION, "entries": list(disk.items())}
+                )
+            except OSError as e:
+                logger.error(f"Failed to write {self.index_path}: {e}")
+                return
+            self._dirty = False
+
+    def _read_from_disk(self, key: str) -> Optional[QImage]:
+        disk = self._load_disk()
+        if key not in disk:
+            return None
+        image = QImage(self._file_path(key))
+        if image.isNull():
+            self._disk_bytes -= disk.pop(key)
+        else:
+            disk.move_to_end(key)
+        self._dirty = True
+        return None if image.isNull() else image
+
+    def _load_disk(self) -> "OrderedDict[str, int]":
+        if self._disk is None:
+            self._disk = OrderedDict(self._read_index())
+            self._disk_bytes = sum(self._disk.values())
+        return self._disk
+
+    def _read_index(self) -> list[tuple[str, int]]:
+        """Entries from least to most recently used."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return []
+        if not isinstance(data, dict) or data.get("version") != self.VERSION:
+            return []
+        return [
+            (key, size)
+            for key, size in data.get("entries", [])
+            if os.path.exists(self._file_path(key))
+        ]
+
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.png")
+
+    def _remove_file(self, key: str) -> None:
+        try:
+            os.remove(self._file_path(key))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove cached image {key}: {e}")
+
+    def _atomic_write(self, data: dict) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        temp_path = self.index_path + self.TEMP_SUFFIX
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, separators=(",", ":"))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.index_path)
+
+
+atexit.register(ImageCache.flush_all)
@@ -0,0 +1,188 @@
+import atexit
+import copy
+import json
+import logging
+import os
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CurrentSequenceStore:
+    """
+    Authoritative in-memory copy of current_sequence.json.
+
+    Reads are served from memory; writes replace the in-memory sequence and
+    schedule a debounced write-behind to disk. The file is written atomically
+    (temp file + rename) so a crash mid-write never leaves a truncated file,
+    and a leftover temp file from an interrupted write is recovered on load.
+
+    One store exists per file path so that every JsonManager instance handed
+    out by the dependency container shares the same state.
+    """
+
+    DEFAULT_DEBOUNCE_SECONDS = 0.25
+    TEMP_SUFFIX = ".tmp"
+
+    _stores: dict[str, "CurrentSequenceStore"] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: str,
+        default_factory: Callable[[], list[dict]],
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+    ) -> None:
+        self.path = path
+        self.default_factory = default_factory
+        self.debounce_seconds = debounce_seconds
+
+        self._sequence: Optional[list[dict]] = None
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self.write_count = 0
+
+    @classmethod
+    def for_path(
+        cls,
+        path: str,
+        default_factory: Callable[[], list[dict]],
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+    ) -> "CurrentSequenceStore":
+        key = os.path.abspath(path)
+        with cls._stores_lock:
+            store = cls._stores.get(key)
+            if store is None:
+                store = cls(key, default_factory, debounce_seconds)
+                cls._stores[key] = store
+            return store
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._stores_lock:
+            stores = list(cls._stores.values())
+        for store in stores:
+            store.flush()
+
+    # Reads
+
+    def peek(self) -> list[dict]:
+        """Return the authoritative sequence without copying. Do not mutate."""
+        with self._lock:
+            if self._sequence is None:
+                self._sequence = self._load_from_disk()
+            return self._sequence
+
+    def get(self) -> list[dict]:
+        """Return a private deep copy that callers are free to mutate."""
+        return copy.deepcopy(self.peek())
+
+    # Writes
+
+    def set(self, sequence: list[dict]) -> None:
+        """Replace the authoritative sequence and schedule a write-behind."""
+        snapshot = copy.deepcopy(sequence)
+        with self._lock:
+            self._sequence = snapshot
+            self._dirty = True
+            self._schedule_write()
+
+    def flush(self) -> None:
+        """Write any pending changes synchronously."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._write_pending()
+
+    def _schedule_write(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.debounce_seconds <= 0:
+            self._timer = None
+            self._write_pending()
+            return
+        self._timer = threading.Timer(self.debounce_seconds, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._write_pending()
+
+    def _write_pending(self) -> None:
+        if not self._dirty or self._sequence is None:
+            return
+        try:
+            self._atomic_write(self._sequence)
+        except OSError as e:
+            logger.error(f"Failed to write {self.path}: {e}")
+            return
+        self._dirty = False
+        self.write_count += 1
+
+    def _atomic_write(self, sequence: list[dict]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + self.TEMP_SUFFIX
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(sequence, file, indent=4, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+    # Loading and recovery
+
+    def _load_from_disk(self) -> list[dict]:
+        temp_path = self.path + self.TEMP_SUFFIX
+        sequence = self._read_sequence(self.path)
+        recovered = self._read_sequence(temp_path)
+
+        if recovered is not None and (
+            sequence is None
+            or os.path.getmtime(temp_path) > os.path.getmtime(self.path)
+        ):
+            logger.warning(f"Recovering {self.path} from interrupted write")
+            try:
+                os.replace(temp_path, self.path)
+            except OSError:
+                pass
+            return recovered
+
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+        if sequence is None:
+            sequence = self.default_factory()
+            try:
+                self._atomic_write(sequence)
+            except OSError:
+                pass
+        return sequence
+
+    @staticmethod
+    def _read_sequence(path: str) -> Optional[list[dict]]:
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                content = file.read().strip()
+        except OSError:
+            return None
+        if not content:
+            return None
+        try:
+            sequence = json.loads(content)
+        except json.JSONDecodeError:
+            return None
+        if not sequence or not isinstance(sequence, list):
+            return None
+        return sequence
+
+
+atexit.register(CurrentSequenceStore.flush_all)
@@ -33,6 +33,10 @@ class JsonManager:  # IJsonManager is a Protocol, no need to inherit
         self.ori_validation_engine = JsonOriValidationEngine(self)
         self.act_saver = JsonActSaver()
 
+    def flush(self) -> None:
+        """Flush the write-behind sequence store to disk."""
+        self.loader_saver.flush()
+
     def save_act(self, act_data: dict):
         """Save the act using the JsonActSaver."""
         self.act_saver.save_act(act_data)
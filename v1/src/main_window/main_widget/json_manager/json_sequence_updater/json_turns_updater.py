@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 from data.constants import (
     CLOCKWISE,
@@ -29,6 +29,7 @@ class JsonTurnsUpdater:
     def __init__(self, json_updater: "JsonSequenceUpdater"):
         self.json_updater = json_updater
         self.json_manager = json_updater.json_manager
+        self._sequence_properties_manager: Optional[SequencePropertiesManager] = None
 
     def update_turns_in_json(
         self,
@@ -74,7 +75,15 @@ class JsonTurnsUpdater:
                 motion_data[PROP_ROT_DIR] = prop_rot_dir
 
         self.json_manager.loader_saver.save_current_sequence(sequence)
-        SequencePropertiesManager().update_sequence_properties()
+        self._get_sequence_properties_manager().update_sequence_properties()
+
+    def _get_sequence_properties_manager(self) -> SequencePropertiesManager:
+        # Reused so its tracker only reprocesses the beats a turns change touched;
+        # rebuilt until the json manager it needs is available
+        manager = self._sequence_properties_manager
+        if manager is None or manager.json_manager is None:
+            manager = self._sequence_properties_manager = SequencePropertiesManager()
+        return manager
 
     def _get_sequence_beat_frame(self):
         """Get the sequence beat frame using graceful fallbacks for the MainWidgetCoordinator refactoring."""
@@ -1,4 +1,4 @@
-import json
+import copy
 from typing import TYPE_CHECKING, Optional
 from data.constants import (
     BEAT,
@@ -14,11 +14,11 @@ from data.constants import (
     RED_ATTRS,
     SEQUENCE_START_POSITION,
 )
-from main_window.main_widget.sequence_level_evaluator import SequenceLevelEvaluator
 from main_window.main_widget.sequence_properties_manager.sequence_properties_manager_factory import (
     SequencePropertiesManagerFactory,
 )
 from src.settings_manager.global_settings.app_context import AppContext
+from .current_sequence_store import CurrentSequenceStore
 from utils.path_helpers import get_user_editable_resource_path
 from utils.word_simplifier import WordSimplifier
 
@@ -60,6 +60,12 @@ class SequenceDataLoaderSaver:
                 "current_sequence.json"
             )
 
+        self.store = CurrentSequenceStore.for_path(
+            self.current_sequence_json, self.get_default_sequence
+        )
+        self._word = ""
+        self._simplified = ""
+
         # Create sequence properties manager with dependency injection
         if app_context:
             self.sequence_properties_manager = SequencePropertiesManagerFactory.create(
@@ -71,36 +77,12 @@ class SequenceDataLoaderSaver:
             )
 
     def load_current_sequence(self) -> list[dict]:
-        try:
-            with open(self.current_sequence_json, "r", encoding="utf-8") as file:
-                content = file.read().strip()
-                if not content:
-                    return self.get_default_sequence()
-
-                sequence = json.loads(content)
-                if not sequence or not isinstance(sequence, list):
-                    return self.get_default_sequence()
-
-            return sequence
-
-        except (FileNotFoundError, json.JSONDecodeError):
-            # Create the file with default data if it doesn't exist
-            default_sequence = self.get_default_sequence()
-            try:
-                # Ensure the directory exists before creating the file
-                import os
-
-                directory = os.path.dirname(self.current_sequence_json)
-                if directory:
-                    os.makedirs(directory, exist_ok=True)
-
-                # Create the file directly to avoid circular dependencies during initialization
-                with open(self.current_sequence_json, "w", encoding="utf-8") as file:
-                    json.dump(default_sequence, file, indent=4, ensure_ascii=False)
-            except Exception:
-                # If we can't create the file, just return the default sequence
-                pass
-            return default_sequence
+        """Return a mutable copy of the current sequence from the in-memory store."""
+        return self.store.get()
+
+    def flush(self) -> None:
+        """Write any pending sequence changes to disk immediately."""
+        self.store.flush()
 
     def get_default_sequence(self) -> list[dict]:
         """Return a default sequence if JSON is missing, empty, or invalid."""
@@ -140,7 +122,14 @@ class SequenceDataLoaderSaver:
         if not sequence:
             sequence = self.get_default_sequence()
         else:
-            sequence[0]["word"] = WordSimplifier.simplify_repeated_word(
+            # Add beat numbers to each beat at the beginning
+            beat_number = 0
+            for index, beat in enumerate(sequence):
+                if LETTER in beat or SEQUENCE_START_POSITION in beat:
+                    sequence[index] = {BEAT: beat_number, **beat}
+                    beat_number += 1
+
+            sequence[0]["word"] = self._simplified_word(
                 self.sequence_properties_manager.calculate_word(sequence)
             )
             if "author" not in sequence[0]:
@@ -148,9 +137,11 @@ class SequenceDataLoaderSaver:
                     "author"
                 ] = AppContext.settings_manager().users.get_current_user()
             if "level" not in sequence[0]:
-                sequence[0]["level"] = (
-                    SequenceLevelEvaluator.get_sequence_difficulty_level(sequence)
-                )
+                # calculate_word() returns before syncing a sequence without
+                # beats, which would leave the level of the previous one
+                tracker = self.sequence_properties_manager.tracker
+                tracker.sync(sequence[1:])
+                sequence[0]["level"] = tracker.level
             if "prop_type" not in sequence[0]:
                 sequence[0]["prop_type"] = (
                     AppContext.settings_manager()
@@ -162,41 +153,37 @@ class SequenceDataLoaderSaver:
             if "can_be_CAP" not in sequence[0]:
                 sequence[0]["can_be_CAP"] = False
 
-        # Add beat numbers to each beat at the beginning
-        beat_number = 0
-        for beat in sequence:
-            if LETTER in beat or SEQUENCE_START_POSITION in beat:
-                beat_data_with_beat_number = {BEAT: beat_number}
-                beat_data_with_beat_number.update(beat)
-                sequence[sequence.index(beat)] = beat_data_with_beat_number
-                beat_number += 1
+        self.store.set(sequence)
 
-        with open(self.current_sequence_json, "w", encoding="utf-8") as file:
-            json.dump(sequence, file, indent=4, ensure_ascii=False)
+    def _simplified_word(self, word: str) -> str:
+        if word != self._word:
+            self._word = word
+            self._simplified = WordSimplifier.simplify_repeated_word(word)
+        return self._simplified
 
     def clear_current_sequence_file(self):
         self.save_current_sequence([])
 
     def get_json_prop_rot_dir(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self.store.peek()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(PROP_ROT_DIR, 0)
         return 0
 
     def get_json_motion_type(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self.store.peek()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(MOTION_TYPE, 0)
         return 0
 
     def get_json_prefloat_prop_rot_dir(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self.store.peek()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(PREFLOAT_PROP_ROT_DIR, "")
         return 0
 
     def get_json_prefloat_motion_type(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self.store.peek()
         if sequence:
             return sequence[index][f"{color}_attributes"].get(
                 PREFLOAT_MOTION_TYPE,
@@ -227,13 +214,13 @@ class SequenceDataLoaderSaver:
         return 0
 
     def load_last_beat_data(self) -> dict:
-        sequence = self.load_current_sequence()
+        sequence = self.store.peek()
         if sequence:
-            return sequence[-1]
+            return copy.deepcopy(sequence[-1])
         return {}
 
     def get_json_turns(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence()
+        sequence = self.store.peek()
         if sequence:
             return sequence[index][f"{color}_attributes"].get("turns", 0)
         return 0
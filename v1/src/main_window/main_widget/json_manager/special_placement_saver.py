@@ -1,5 +1,6 @@
 import json
 import logging
+import os
 import re
 from typing import TYPE_CHECKING
 
@@ -9,13 +10,21 @@ from main_window.main_widget.sequence_workbench.graph_editor.hotkey_graph_adjust
 
 
 class SpecialPlacementSaver:
+    TEMP_SUFFIX = ".tmp"
 
-    def save_json_data(self, data, file_path) -> None:
-        """Write JSON data to a file with specific formatting."""
+    def save_json_data(self, data, file_path) -> bool:
+        """
+        Write JSON data to a file with specific formatting.
+
+        Returns False, after logging the error, if the file was not written.
+        """
         data = PlacementDataCleaner.clean_placement_data(data)
 
+        # Written to a temp file and renamed over the original, so a crash
+        # mid-write never leaves a truncated placements file
+        temp_path = file_path + self.TEMP_SUFFIX
         try:
-            with open(file_path, "w", encoding="utf-8") as file:
+            with open(temp_path, "w", encoding="utf-8") as file:
                 formatted_json_str = json.dumps(data, indent=2, ensure_ascii=False)
                 formatted_json_str = re.sub(
                     r"\[\s+(-?\d+(?:\.\d+)?),\s+(-?\d+(?:\.\d+)?)\s+\]",
@@ -23,5 +32,12 @@ class SpecialPlacementSaver:
                     formatted_json_str,
                 )
                 file.write(formatted_json_str)
-        except IOError as e:
+            os.replace(temp_path, file_path)
+        except OSError as e:
             logging.error(f"Failed to write to {file_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return False
+        return True
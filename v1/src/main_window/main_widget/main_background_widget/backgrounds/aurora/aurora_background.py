@@ -32,7 +32,7 @@ class AuroraBackground(BaseBackground):
 
         self.update_required.emit()
 
-    def paint_background(self, widget: QWidget, painter: QPainter) -> None:
+    def paint_dynamic_layer(self, widget: QWidget, painter: QPainter) -> None:
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw a wavy gradient background
@@ -1,63 +1,55 @@
+from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtCore import Qt, QRectF
 
-import random
-from PyQt6.QtGui import QPainter, QColor, QPainterPath
-from PyQt6.QtCore import Qt
+from ...particles import ParticleField, uniform
 
 
 class BlobManager:
     def __init__(self, num_blobs=3):
         self.blobs = self.create_blobs(num_blobs)
 
-    def create_blobs(self, num_blobs):
+    def create_blobs(self, num_blobs) -> ParticleField:
         """Create initial blobs with random positions and properties."""
-        return [
+        return ParticleField(
+            num_blobs,
             {
-                "x": random.uniform(0.1, 0.9),
-                "y": random.uniform(0.1, 0.9),
-                "size": random.uniform(100, 200),
-                "opacity": random.uniform(0.2, 0.5),
-                "dx": random.uniform(-0.0005, 0.0005),
-                "dy": random.uniform(-0.0005, 0.0005),
-                "dsize": random.uniform(-0.1, 0.1),
-                "dopacity": random.uniform(-0.001, 0.001),
-            }
-            for _ in range(num_blobs)
-        ]
+                "x": uniform(0.1, 0.9),
+                "y": uniform(0.1, 0.9),
+                "size": uniform(100, 200),
+                "opacity": uniform(0.2, 0.5),
+                "dx": uniform(-0.0005, 0.0005),
+                "dy": uniform(-0.0005, 0.0005),
+                "dsize": uniform(-0.1, 0.1),
+                "dopacity": uniform(-0.001, 0.001),
+            },
+        )
 
     def animate(self):
         """Animate blobs by updating their position, size, and opacity."""
-        for blob in self.blobs:
-            blob["x"] += blob["dx"]
-            blob["y"] += blob["dy"]
-            blob["size"] += blob["dsize"]
-            blob["opacity"] += blob["dopacity"]
-
-            # Keep within bounds and reverse direction if necessary
-            if blob["x"] < 0 or blob["x"] > 1:
-                blob["dx"] *= -1
-            if blob["y"] < 0 or blob["y"] > 1:
-                blob["dy"] *= -1
-            if blob["size"] < 50 or blob["size"] > 250:
-                blob["dsize"] *= -1
-            if blob["opacity"] < 0.1 or blob["opacity"] > 0.5:
-                blob["dopacity"] *= -1
+        blobs = self.blobs
+        blobs.x += blobs.dx
+        blobs.y += blobs.dy
+        blobs.size += blobs.dsize
+        blobs.opacity += blobs.dopacity
+
+        # Keep within bounds and reverse direction if necessary
+        blobs.bounce("x", "dx", 0, 1)
+        blobs.bounce("y", "dy", 0, 1)
+        blobs.bounce("size", "dsize", 50, 250)
+        blobs.bounce("opacity", "dopacity", 0.1, 0.5)
 
     def draw(self, widget, painter: QPainter):
         """Draw blobs on the widget using the painter."""
-        for blob in self.blobs:
-            blob_path = QPainterPath()
-            blob_x = blob["x"] * widget.width()
-            blob_y = blob["y"] * widget.height()
-            blob_size = blob["size"]
-            opacity = blob["opacity"]
-
-            blob_path.addEllipse(blob_x, blob_y, blob_size, blob_size)
-
+        blobs = self.blobs
+        painter.setPen(Qt.PenStyle.NoPen)
+        for x, y, size, opacity in zip(
+            (blobs.x * widget.width()).tolist(),
+            (blobs.y * widget.height()).tolist(),
+            blobs.size.tolist(),
+            blobs.opacity.tolist(),
+        ):
             painter.setOpacity(opacity)
             painter.setBrush(QColor(255, 255, 255, int(opacity * 255)))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawPath(blob_path)
+            painter.drawEllipse(QRectF(x, y, size, size))
 
         painter.setOpacity(1.0)  # Reset opacity
-        
-
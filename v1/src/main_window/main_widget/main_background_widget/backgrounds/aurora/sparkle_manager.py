@@ -1,45 +1,55 @@
 # sparkle_manager.py
 
-import random
+import numpy as np
 from PyQt6.QtGui import QPainter, QColor
 from PyQt6.QtCore import Qt
 
+from ...particles import ParticleField, SpriteAtlas, uniform
+
+SPRITE_SIZE = 8
+
+
+def _draw_sparkle(painter: QPainter, size: int):
+    painter.setBrush(QColor(255, 255, 255))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawEllipse(0, 0, size, size)
+
 
 class SparkleManager:
     def __init__(self, num_sparkles=50):
         self.sparkles = self.create_sparkles(num_sparkles)
+        self.atlas = SpriteAtlas(SPRITE_SIZE, [_draw_sparkle])
 
-    def create_sparkles(self, num_sparkles):
+    def create_sparkles(self, num_sparkles) -> ParticleField:
         """Create initial sparkles with random positions and properties."""
-        return [
+        return ParticleField(
+            num_sparkles,
             {
-                "x": random.uniform(0, 1),
-                "y": random.uniform(0, 1),
-                "size": random.uniform(2, 4),
-                "opacity": random.uniform(0.5, 1.0),
-                "pulse_speed": random.uniform(0.005, 0.015),
-            }
-            for _ in range(num_sparkles)
-        ]
+                "x": uniform(0, 1),
+                "y": uniform(0, 1),
+                "size": uniform(2, 4),
+                "opacity": uniform(0.5, 1.0),
+                "pulse_speed": uniform(0.005, 0.015),
+            },
+        )
 
     def animate(self):
         """Animate sparkles by updating their opacity."""
-        for sparkle in self.sparkles:
-            sparkle["opacity"] += sparkle["pulse_speed"]
-            if sparkle["opacity"] > 1.0 or sparkle["opacity"] < 0.5:
-                sparkle["pulse_speed"] *= -1  # Reverse the pulse direction
+        sparkles = self.sparkles
+        sparkles.opacity += sparkles.pulse_speed
+        # Reverse the pulse direction
+        sparkles.bounce("opacity", "pulse_speed", 0.5, 1.0)
 
     def draw(self, widget, painter: QPainter):
         """Draw sparkles on the widget using the painter."""
-        for sparkle in self.sparkles:
-            x = int(sparkle["x"] * widget.width())
-            y = int(sparkle["y"] * widget.height())
-            size = int(sparkle["size"])
-            opacity = sparkle["opacity"]
-
-            painter.setOpacity(opacity)
-            painter.setBrush(QColor(255, 255, 255, int(opacity * 255)))
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawEllipse(x, y, size, size)
-
-        painter.setOpacity(1.0)  # Reset opacity
+        sparkles = self.sparkles
+        size = np.floor(sparkles.size)
+        self.atlas.draw(
+            painter,
+            np.floor(sparkles.x * widget.width()) + size / 2,
+            np.floor(sparkles.y * widget.height()) + size / 2,
+            np.zeros(sparkles.count),
+            size,
+            # Painter opacity times brush alpha, as each was set to opacity
+            sparkles.opacity**2,
+        )
@@ -18,7 +18,7 @@ class AuroraBorealisBackground(BaseBackground):
         self.light_waves = [x + 0.01 for x in self.light_waves]
         self.update_required.emit()
 
-    def paint_background(self, widget: QWidget, painter: QPainter):
+    def paint_dynamic_layer(self, widget: QWidget, painter: QPainter):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         gradient = QLinearGradient(0, 0, widget.width(), widget.height())
         colors = [(0, 25, 50, 100), (0, 50, 100, 50), (0, 100, 150, 25)]
@@ -3,7 +3,19 @@ from typing import TYPE_CHECKING
 
 
 class BaseBackground(QObject):
+    """
+    A main window background.
+
+    Backgrounds paint in two layers. The static layer (gradients, stars that
+    do not move) is cached by MainBackgroundWidget and only repainted on
+    resize; the dynamic layer is painted over it every animation frame.
+    paint_background() paints both, for widgets that do not cache.
+    """
+
     update_required = pyqtSignal()
+    # Whether animate_background() changes anything; static backgrounds are
+    # painted once and never ticked
+    is_animated = True
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -14,4 +26,11 @@ class BaseBackground(QObject):
         self.update_required.emit()
 
     def paint_background(self, widget, painter):
+        self.paint_static_layer(widget, painter)
+        self.paint_dynamic_layer(widget, painter)
+
+    def paint_static_layer(self, widget, painter):
+        pass
+
+    def paint_dynamic_layer(self, widget, painter):
         pass
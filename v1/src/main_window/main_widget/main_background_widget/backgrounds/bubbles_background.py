@@ -1,5 +1,6 @@
 import random
 
+import numpy as np
 from PyQt6.QtGui import (
     QColor,
     QPainter,
@@ -15,6 +16,28 @@ from main_window.main_widget.main_background_widget.backgrounds.base_background
     BaseBackground,
 )
 
+from ..particles import ParticleField, SpriteAtlas, uniform
+
+BUBBLE_SPRITE_SIZE = 32
+BODY_SPRITE, HIGHLIGHT_SPRITE = 0, 1
+
+
+def _draw_bubble_body(painter: QPainter, size: int):
+    painter.setBrush(QColor(255, 255, 255))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawEllipse(0, 0, size, size)
+
+
+def _draw_bubble_highlight(painter: QPainter, size: int):
+    """Reflection highlight on the top of the bubble to simulate lighting."""
+    radius = size / 2
+    gradient = QRadialGradient(QPointF(radius, radius), radius)
+    gradient.setColorAt(0, QColor(255, 255, 255, 180))  # Bright reflection
+    gradient.setColorAt(1, QColor(255, 255, 255, 0))  # Soft fade out
+    painter.setBrush(gradient)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawEllipse(QPointF(radius, radius), radius, radius)
+
 
 class BubblesBackground(BaseBackground):
     # Class variable to hold cached images
@@ -25,6 +48,8 @@ class BubblesBackground(BaseBackground):
 
         # Check if the fish images are already cached
         if BubblesBackground._cached_fish_images is None:
+            from utils.path_helpers import get_image_path
+
             # Define the backgrounds folder path
             backgrounds_folder = get_image_path("backgrounds/")
 
@@ -48,17 +73,20 @@ class BubblesBackground(BaseBackground):
 
     def _initialize_bubbles(self):
         # Create bubbles floating upward with additional reflection properties
-        self.bubbles = [
+        self.bubbles = ParticleField(
+            100,
             {
-                "x": random.uniform(0, 1),
-                "y": random.uniform(0, 1),
-                "size": random.uniform(5, 15),
-                "speed": random.uniform(0.0005, 0.002),
-                "opacity": random.uniform(0.4, 0.8),
-                "highlight_factor": random.uniform(0.7, 1.0),  # Highlight brightness
-            }
-            for _ in range(100)
-        ]
+                "x": uniform(0, 1),
+                "y": uniform(0, 1),
+                "size": uniform(5, 15),
+                "speed": uniform(0.0005, 0.002),
+                "opacity": uniform(0.4, 0.8),
+                "highlight_factor": uniform(0.7, 1.0),  # Highlight brightness
+            },
+        )
+        self.bubble_atlas = SpriteAtlas(
+            BUBBLE_SPRITE_SIZE, [_draw_bubble_body, _draw_bubble_highlight]
+        )
 
     def _initialize_fish(self):
         # Initialize fish that occasionally swim across the screen
@@ -68,13 +96,10 @@ class BubblesBackground(BaseBackground):
 
     def animate_background(self):
         # Move the bubbles upwards
-        for bubble in self.bubbles:
-            bubble["y"] -= bubble["speed"]
-            if bubble["y"] < 0:
-                bubble["y"] = 1  # Reset bubble position to the bottom
-                bubble["x"] = random.uniform(0, 1)
-                bubble["size"] = random.uniform(5, 15)
-                bubble["highlight_factor"] = random.uniform(0.7, 1.0)  # Reset highlight
+        bubbles = self.bubbles
+        bubbles.y -= bubbles.speed
+        # Reset bubbles that float off the top to the bottom
+        bubbles.respawn(bubbles.y < 0, keep=("speed", "opacity"), y=1.0)
 
         # Handle fish movement
         self.animate_fish()
@@ -131,79 +156,72 @@ class BubblesBackground(BaseBackground):
                 "image": random.choice(self.fish_images),  # Use cached images
             }
         )
+        fish = self.fish[-1]
+        fish["pixmap"] = self._render_fish(fish["image"], int(fish["size"]), dx < 0)
+
+    def _render_fish(self, image: QPixmap, size: int, facing_left: bool) -> QPixmap:
+        """Scale a fish image once at spawn rather than every frame."""
+        # Scale the fish image to its size using SmoothTransformation
+        fish_image = image.scaled(
+            size,
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
 
-    def paint_background(self, widget: QWidget, painter: QPainter):
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Flip the fish image if it is moving left (dx < 0)
+        if facing_left:
+            transform = QTransform().scale(-1, 1)  # Mirror horizontally
+            fish_image = fish_image.transformed(
+                transform, Qt.TransformationMode.SmoothTransformation
+            )
+        return fish_image
 
+    def paint_static_layer(self, widget: QWidget, painter: QPainter):
         # Create an underwater gradient (light blue at top, deep blue at bottom)
         gradient = QLinearGradient(0, 0, 0, widget.height())
         gradient.setColorAt(0, QColor(100, 150, 255))  # Light blue
         gradient.setColorAt(1, QColor(0, 30, 90))  # Deep blue
         painter.fillRect(widget.rect(), gradient)
 
-        # Draw bubbles
-        for bubble in self.bubbles:
-            x = int(bubble["x"] * widget.width())
-            y = int(bubble["y"] * widget.height())
-            size = int(bubble["size"])
-
-            # Set bubble opacity and fill
-            painter.setOpacity(bubble["opacity"])
-            painter.setBrush(QColor(255, 255, 255, int(bubble["opacity"] * 255)))
-            painter.setPen(Qt.PenStyle.NoPen)
-
-            # Draw the main bubble
-            painter.drawEllipse(x, y, size, size)
-
-            # Add a reflection highlight to the bubble for realism
-            self.draw_bubble_reflection(
-                painter,
-                QPointF(x + size / 4, y + size / 4),
-                size,
-                bubble["highlight_factor"],
-            )
+    def paint_dynamic_layer(self, widget: QWidget, painter: QPainter):
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Draw bubbles: the body at painter opacity times brush alpha, as
+        # each was set to the bubble's opacity, then the highlight
+        bubbles = self.bubbles
+        size = np.floor(bubbles.size)
+        left = np.floor(bubbles.x * widget.width())
+        top = np.floor(bubbles.y * widget.height())
+        self.bubble_atlas.draw(
+            painter,
+            left + size / 2,
+            top + size / 2,
+            np.full(bubbles.count, BODY_SPRITE),
+            size,
+            bubbles.opacity**2,
+        )
+        self.bubble_atlas.draw(
+            painter,
+            left + size / 4,
+            top + size / 4,
+            np.full(bubbles.count, HIGHLIGHT_SPRITE),
+            size * 0.8 * bubbles.highlight_factor,
+            bubbles.opacity,
+        )
 
         # Draw fish if any are swimming
         self.draw_fish(painter, widget)
 
         painter.setOpacity(1.0)  # Reset opacity after drawing
 
-    def draw_bubble_reflection(
-        self, painter: QPainter, center: QPointF, size: int, highlight_factor: float
-    ):
-        """Draws a reflection highlight on the top of the bubble to simulate lighting."""
-        highlight_radius = size * 0.4 * highlight_factor
-        gradient = QRadialGradient(center, highlight_radius)
-        gradient.setColorAt(0, QColor(255, 255, 255, 180))  # Bright reflection
-        gradient.setColorAt(1, QColor(255, 255, 255, 0))  # Soft fade out
-
-        painter.setBrush(gradient)
-        painter.drawEllipse(center, highlight_radius, highlight_radius)
-
     def draw_fish(self, painter: QPainter, widget: QWidget):
         """Draw fish swimming across the screen using the provided fish images."""
+        # Ensure full opacity for the fish
+        painter.setOpacity(1.0)
         for fish in self.fish:
             x = int(fish["x"] * widget.width())
             y = int(fish["y"] * widget.height())
-            size = int(fish["size"])
-
-            # Ensure full opacity for the fish
-            painter.setOpacity(1.0)
-
-            # Scale the fish image to its size using SmoothTransformation
-            fish_image = fish["image"].scaled(
-                size,
-                size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-
-            # Flip the fish image if it is moving left (dx < 0)
-            if fish["dx"] < 0:
-                transform = QTransform().scale(-1, 1)  # Mirror horizontally
-                fish_image = fish_image.transformed(
-                    transform, Qt.TransformationMode.SmoothTransformation
-                )
 
             # Draw the fish at the correct position with no blending
-            painter.drawPixmap(x, y, fish_image)
+            painter.drawPixmap(x, y, fish["pixmap"])
@@ -53,7 +53,7 @@ class SnowfallBackground(QWidget):
         gradient.setColorAt(1, QColor(50, 80, 120))
         painter.fillRect(self.main_widget.rect(), gradient)
 
-    @pyqtSlot(list)
+    @pyqtSlot(object)
     def _update_snowflakes_from_worker(self, snowflakes):
         """Slot to receive updated snowflake positions from the worker."""
         self.snowflakes = snowflakes
@@ -1,12 +1,16 @@
-from PyQt6.QtCore import QObject, pyqtSignal
-import random
+from typing import Optional
 
-from PyQt6.QtCore import QObject, pyqtSignal
-import time
+import numpy as np
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from ....particles import ParticleField, uniform
+
+FRAME_INTERVAL_MS = 16  # Approximately 60 FPS
 
 
 class SnowflakeWorker(QObject):
-    update_snowflakes = pyqtSignal(list)
+    # Emits {"x", "y", "size", "image_index"} arrays, copied for the receiver
+    update_snowflakes = pyqtSignal(object)
 
     def __init__(self, snowflake_count, width, height, image_count):
         super().__init__()
@@ -14,49 +18,63 @@ class SnowflakeWorker(QObject):
         self.width = width
         self.height = height
         self.image_count = image_count
-        self.snowflakes = []
+        self.snowflakes: Optional[ParticleField] = None
         self.running = False
+        self._timer: Optional[QTimer] = None
         self._initialize_snowflakes()
 
     def _initialize_snowflakes(self):
         """Initialize snowflake positions and properties."""
-        self.snowflakes = [
+        self.snowflakes = ParticleField(
+            self.snowflake_count,
             {
-                "x": random.randint(0, self.width),
-                "y": random.randint(-self.height, 0),
-                "size": random.randint(2, 6),
-                "speed": random.uniform(0.5, 2.0),
-                "image_index": random.randint(0, self.image_count - 1),
-            }
-            for _ in range(self.snowflake_count)
-        ]
+                "x": lambda rng, n: rng.integers(0, self.width, n, endpoint=True),
+                "y": lambda rng, n: rng.integers(-self.height, 0, n, endpoint=True),
+                "size": lambda rng, n: rng.integers(2, 6, n, endpoint=True),
+                "speed": uniform(0.5, 2.0),
+                "image_index": lambda rng, n: rng.integers(0, self.image_count, n),
+            },
+        )
 
     def start(self):
         """Start the worker loop."""
-        self.running = True
         self.process()
 
     def stop(self):
         """Stop the worker loop."""
         self.running = False
+        if self._timer is not None:
+            self._timer.stop()
 
     def process(self):
-        """Main loop for updating snowflakes."""
-        while self.running:
-            self._update_snowflakes()
-            self.update_snowflakes.emit(self.snowflakes)
-            time.sleep(0.016)  # Yield CPU (approximately 60 FPS)
+        """Update snowflakes on a timer in the worker's thread."""
+        self.running = True
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.timeout.connect(self.step)
+        self._timer.start(FRAME_INTERVAL_MS)
+
+    def step(self):
+        """Advance one frame and publish the new positions."""
+        self._update_snowflakes()
+        flakes = self.snowflakes
+        self.update_snowflakes.emit(
+            {
+                "x": flakes.x.copy(),
+                "y": flakes.y.copy(),
+                "size": flakes.size.copy(),
+                "image_index": flakes.image_index.astype(np.intp),
+            }
+        )
 
     def _update_snowflakes(self):
         """Update snowflake positions and reset out-of-bounds snowflakes."""
-        for snowflake in self.snowflakes:
-            snowflake["y"] += snowflake["speed"]
-            if snowflake["y"] > self.height:
-                snowflake["y"] = random.randint(-20, 0)
-                snowflake["x"] = random.randint(0, self.width)
-                snowflake["size"] = random.randint(2, 6)
-                snowflake["speed"] = random.uniform(0.5, 2.0)
-                snowflake["image_index"] = random.randint(0, self.image_count - 1)
+        flakes = self.snowflakes
+        flakes.y += flakes.speed
+        flakes.respawn(
+            flakes.y > self.height,
+            y=lambda rng, n: rng.integers(-20, 0, n, endpoint=True),
+        )
 
     def update_bounds(self, width, height):
         """Update the worker's bounds for snowflake generation."""
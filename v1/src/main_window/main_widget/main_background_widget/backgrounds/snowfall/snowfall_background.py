@@ -9,11 +9,13 @@ if TYPE_CHECKING:
     from main_window.main_widget.write_tab.write_tab import WriteTab
 
 class SnowfallBackground(BaseBackground):
+    is_animated = False
+
     def __init__(self, widget: Union["BrowseTab", "LearnTab", "WriteTab"]):
         super().__init__(widget)
         self.widget = widget
 
-    def paint_background(self, widget: QWidget, painter: QPainter):
+    def paint_static_layer(self, widget: QWidget, painter: QPainter):
         # Draw a static gradient
         gradient = QLinearGradient(0, 0, 0, widget.height())
         gradient.setColorAt(0, QColor("#0b1d2a"))
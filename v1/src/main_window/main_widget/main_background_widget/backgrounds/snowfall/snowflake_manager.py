@@ -1,59 +1,76 @@
 import random
 import math
+import numpy as np
 from PyQt6.QtGui import QColor, QPainter, QPainterPath
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt
 
+from ...particles import ParticleField, SpriteAtlas, choice, uniform
+
+SPRITE_SIZE = 16
+# Sprites: a plain flake, the three special shapes, then more variant shapes
+ROUND_SPRITE = 0
+VARIANT_POINTS = (9, 10, 11, 12)
+
+
+def _flake_size(rng: np.random.Generator, n: int) -> np.ndarray:
+    # More frequent special flakes
+    return rng.uniform(2, 5, n) * np.where(rng.random(n) < 0.2, 2, 1)
+
+
+def _is_special(probability: float):
+    return lambda rng, n: rng.random(n) < probability
+
 
 class SnowflakeManager:
-    def __init__(self):
-        self.snowflakes = [
+    def __init__(self, count: int = 200):
+        self.snowflakes = ParticleField(
+            count,
             {
-                "x": random.uniform(0, 1),
-                "y": random.uniform(0, 1),
-                "speed": random.uniform(0.001, 0.005),
-                "size": random.uniform(2, 5)
-                * (2 if random.random() < 0.2 else 1),  # More frequent special flakes
-                "sway": random.uniform(-0.001, 0.001),
-                "opacity": random.uniform(0.6, 1.0),
-                "twinkle_factor": random.uniform(0.98, 1.02),
-                "is_special": random.random() < 0.7,  # Increased chance for special flakes
-                "snowflake_type": random.choice(
-                    [1, 2, 3]
-                ),
-            }
-            for _ in range(200)
-        ]
+                "x": uniform(0, 1),
+                "y": uniform(0, 1),
+                "speed": uniform(0.001, 0.005),
+                "size": _flake_size,
+                "sway": uniform(-0.001, 0.001),
+                "opacity": uniform(0.6, 1.0),
+                "twinkle_factor": uniform(0.98, 1.02),
+                # Increased chance for special flakes
+                "is_special": _is_special(0.7),
+                "snowflake_type": choice([1, 2, 3]),
+                # Which of the VARIANT_POINTS shapes a type 3 flake uses
+                "variant": choice(range(len(VARIANT_POINTS))),
+            },
+        )
         self.wind = 0.0002
         self.wind_direction_change = 0.00001
+        self.atlas = SpriteAtlas(
+            SPRITE_SIZE,
+            [
+                self._drawer(lambda p, x, y, size: p.drawEllipse(0, 0, size, size)),
+                self._drawer(self.draw_star_snowflake),
+                self._drawer(self.draw_spiky_snowflake),
+                *(
+                    self._drawer(self._variant_drawer(points))
+                    for points in VARIANT_POINTS
+                ),
+            ],
+        )
 
     def animate_snowflakes(self):
-        for flake in self.snowflakes:
-            flake["y"] += flake["speed"]
-            flake["x"] += flake["sway"] + self.wind
-
-            # Add twinkle effect
-            flake["opacity"] *= flake["twinkle_factor"]
-            flake["opacity"] = max(0.6, min(flake["opacity"], 1.0))
-
-            # Reset snowflake if it goes off the bottom
-            if flake["y"] > 1:
-                flake.update(
-                    {
-                        "y": 0,
-                        "x": random.uniform(0, 1),
-                        "speed": random.uniform(0.001, 0.005),
-                        "size": random.uniform(2, 5)
-                        * (2 if random.random() < 0.2 else 1),
-                        "sway": random.uniform(-0.001, 0.001),
-                        "opacity": random.uniform(0.6, 1.0),
-                        "is_special": random.random() < 0.5,
-                        "snowflake_type": random.choice([1, 2, 3]),
-                    }
-                )
-
-            # Wrap around horizontally
-            flake["x"] = flake["x"] % 1.0
+        flakes = self.snowflakes
+        flakes.y += flakes.speed
+        flakes.x += flakes.sway + self.wind
+
+        # Add twinkle effect
+        flakes.opacity = np.clip(flakes.opacity * flakes.twinkle_factor, 0.6, 1.0)
+
+        # Reset snowflakes that go off the bottom
+        flakes.respawn(
+            flakes.y > 1, keep=("twinkle_factor",), y=0.0, is_special=_is_special(0.5)
+        )
+
+        # Wrap around horizontally
+        flakes.x %= 1.0
 
         self.wind += random.uniform(
             -self.wind_direction_change, self.wind_direction_change
@@ -61,31 +78,41 @@ class SnowflakeManager:
         self.wind = max(-0.002, min(self.wind, 0.002))
 
     def draw_snowflakes(self, painter: QPainter, widget: QWidget):
-        painter.save()
-        try:
-            for flake in self.snowflakes:
-                x = int(flake["x"] * widget.width())
-                y = int(flake["y"] * widget.height())
-                size = int(flake["size"])
-
-                painter.setOpacity(flake["opacity"])
-                painter.setBrush(QColor(255, 255, 255, int(flake["opacity"] * 255)))
-                painter.setPen(Qt.PenStyle.NoPen)
-
-                if flake["is_special"]:
-                    # Draw special snowflake shapes
-                    if flake["snowflake_type"] == 1:
-                        self.draw_star_snowflake(painter, x, y, size)
-                    elif flake["snowflake_type"] == 2:
-                        self.draw_spiky_snowflake(painter, x, y, size)
-                    elif flake["snowflake_type"] == 3:
-                        self.draw_spiky_snowflake_variant(painter, x, y, size)
-                else:
-                    painter.drawEllipse(x, y, size, size)
-
-            painter.setOpacity(1.0)
-        finally:
-            painter.restore()
+        flakes = self.snowflakes
+        size = np.floor(flakes.size)
+        special = flakes.is_special.astype(bool)
+        sprite = np.where(
+            special,
+            np.where(
+                flakes.snowflake_type < 3,
+                flakes.snowflake_type,
+                3 + flakes.variant,
+            ),
+            ROUND_SPRITE,
+        )
+        self.atlas.draw(
+            painter,
+            np.floor(flakes.x * widget.width()) + size / 2,
+            np.floor(flakes.y * widget.height()) + size / 2,
+            sprite,
+            size,
+            # Plain flakes were filled at painter opacity times brush alpha
+            np.where(special, flakes.opacity, flakes.opacity**2),
+        )
+
+    def _drawer(self, draw_shape):
+        def draw(painter: QPainter, size: int):
+            painter.setBrush(QColor(255, 255, 255))
+            painter.setPen(Qt.PenStyle.NoPen)
+            draw_shape(painter, size / 2, size / 2, size)
+
+        return draw
+
+    def _variant_drawer(self, num_points: int):
+        return lambda painter, x, y, size: self.draw_spiky_snowflake_variant(
+            painter, x, y, size, num_points
+        )
+
     def draw_star_snowflake(self, painter, x, y, size):
         """Draws an even spikier star-like snowflake."""
         path = QPainterPath()
@@ -125,10 +152,11 @@ class SnowflakeManager:
         painter.setPen(QColor(255, 255, 255))
         painter.drawPath(path)
 
-    def draw_spiky_snowflake_variant(self, painter: QPainter, x, y, size):
+    def draw_spiky_snowflake_variant(
+        self, painter: QPainter, x, y, size, num_points: int = 9
+    ):
         """Draws an even spikier variant snowflake."""
         path = QPainterPath()
-        num_points = random.randint(9, 12)  # Increased number of spikes
         radius = size / 2
         small_radius = radius * 0.2  # Smaller inner radius for longer spikes
         angle_step = 2 * math.pi / (num_points * 2)
@@ -1,8 +1,15 @@
 import random
+from typing import Optional
+
+import numpy as np
 from PyQt6.QtGui import QColor, QPainter
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QWidget
 
+from ...particles import SpriteAtlas
+
+TAIL_SPRITE_SIZE = 24
+
 
 class CometManager:
     def __init__(self):
@@ -23,6 +30,8 @@ class CometManager:
         }
         self.comet_timer = 5
         self.max_tail_length = 35  # Tail length limit
+        self._tail_color: Optional[int] = None
+        self._tail_sprite: Optional[SpriteAtlas] = None
 
     def activate_comet(self):
         """Activate the comet by setting its initial position and properties."""
@@ -112,29 +121,35 @@ class CometManager:
         painter.setPen(Qt.PenStyle.NoPen)
 
         if len(comet["tail"]) > 1:
-            tail_length = len(comet["tail"])
-            for i, (tx, ty, size) in enumerate(reversed(comet["tail"])):
-                # Smooth gradient effect
-                opacity = (
-                    tail_length - i
-                ) / tail_length  # Decreases as we move down the tail
-                tail_x = int(tx * widget.width())
-                tail_y = int(ty * widget.height())
-
-                # Apply gradient-like fading with opacity
-                fading_color = QColor(
-                    comet["color"].red(),
-                    comet["color"].green(),
-                    comet["color"].blue(),
-                    int(255 * opacity),  # Adjust alpha based on opacity
-                )
-                painter.setBrush(fading_color)
-                painter.setOpacity(opacity)
-                painter.drawEllipse(
-                    tail_x, tail_y, int(size * opacity), int(size * opacity)
-                )
+            # Newest point first; opacity decreases as we move down the tail
+            tail = np.array(comet["tail"][::-1], dtype=np.float64)
+            tail_length = len(tail)
+            opacity = (tail_length - np.arange(tail_length)) / tail_length
+            size = np.floor(tail[:, 2] * opacity)
+            self._tail_atlas(comet["color"]).draw(
+                painter,
+                np.floor(tail[:, 0] * widget.width()) + size / 2,
+                np.floor(tail[:, 1] * widget.height()) + size / 2,
+                np.zeros(tail_length),
+                size,
+                # Gradient-like fading: painter opacity times brush alpha
+                opacity**2,
+            )
 
         # Draw the comet itself (brighter at the head of the tail)
         painter.setOpacity(1.0)
         painter.setBrush(comet["color"])
         painter.drawEllipse(comet_x, comet_y, int(comet["size"]), int(comet["size"]))
+
+    def _tail_atlas(self, color: QColor) -> SpriteAtlas:
+        """Tail sprite in the current comet's color, rasterized once per comet."""
+        if self._tail_sprite is None or self._tail_color != color.rgb():
+
+            def draw(painter: QPainter, size: int):
+                painter.setBrush(color)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.drawEllipse(0, 0, size, size)
+
+            self._tail_color = color.rgb()
+            self._tail_sprite = SpriteAtlas(TAIL_SPRITE_SIZE, [draw])
+        return self._tail_sprite
@@ -1,45 +1,84 @@
-import random
 import math
+import numpy as np
 from PyQt6.QtGui import QColor, QPainter, QPainterPath
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt
 
+from ...particles import ParticleField, SpriteAtlas, choice, uniform
+
+STAR_COLORS = [QColor(255, 255, 255), QColor(255, 255, 0)]
+ROUND, STAR_SHAPE, SPIKY = 0, 1, 2
+# Stars are rasterized once at this size and scaled to their 1-4.5px size
+SPRITE_SIZE = 8
+TWINKLE_THRESHOLD = 0.95
+TWINKLE_SCALE = 1.5
+
 
 # StarManager: Manages stars, including different shapes and twinkling behavior
 class StarManager:
-    def __init__(self):
-        self.stars = [
+    def __init__(self, count: int = 100):
+        self.stars = ParticleField(
+            count,
             {
-                "x": random.random(),
-                "y": random.random(),
-                "size": random.random() * 2 + 1,
-                "color": random.choice([QColor(255, 255, 255), QColor(255, 255, 0)]),
-                "spikiness": random.choice(
-                    [0, 1, 2]
-                ),  # 0: round, 1: star shape, 2: spiky
-            }
-            for _ in range(100)
-        ]
-        self.twinkle_state = [random.uniform(0.8, 1.0) for _ in range(100)]  # Twinkle
+                "x": uniform(0, 1),
+                "y": uniform(0, 1),
+                "size": uniform(1, 3),
+                "color": choice(range(len(STAR_COLORS))),
+                # 0: round, 1: star shape, 2: spiky
+                "spikiness": choice([ROUND, STAR_SHAPE, SPIKY]),
+            },
+        )
+        self.twinkle_state = self.stars.rng.uniform(0.8, 1.0, count)
+        # One sprite per (shape, color), indexed by shape * colors + color
+        self.atlas = SpriteAtlas(
+            SPRITE_SIZE,
+            [
+                self._sprite_drawer(shape, color)
+                for shape in (ROUND, STAR_SHAPE, SPIKY)
+                for color in STAR_COLORS
+            ],
+        )
 
     def animate_stars(self):
         # Update twinkle state
-        self.twinkle_state = [random.uniform(0.8, 1.0) for _ in range(len(self.stars))]
+        self.twinkle_state = self.stars.rng.uniform(0.8, 1.0, self.stars.count)
 
     def draw_stars(self, painter: QPainter, widget: QWidget):
-        for i, star in enumerate(self.stars):
-            x = int(star["x"] * widget.width())
-            y = int(star["y"] * widget.height())
-            size = int(star["size"] * (1 if self.twinkle_state[i] < 0.95 else 1.5))
+        self.draw_static_stars(painter, widget)
+        self.draw_twinkling_stars(painter, widget)
+
+    def draw_static_stars(self, painter: QPainter, widget: QWidget):
+        """Draw every star at its resting size, for the cached static layer."""
+        self._draw(painter, widget, np.ones(self.stars.count, dtype=bool), 1.0)
+
+    def draw_twinkling_stars(self, painter: QPainter, widget: QWidget):
+        """Draw the stars that are currently twinkling, enlarged."""
+        twinkling = self.twinkle_state >= TWINKLE_THRESHOLD
+        self._draw(painter, widget, twinkling, TWINKLE_SCALE)
 
-            painter.setBrush(star["color"])
+    def _draw(self, painter: QPainter, widget: QWidget, mask: np.ndarray, scale):
+        stars = self.stars
+        size = np.floor(stars.size[mask] * scale)
+        self.atlas.draw(
+            painter,
+            np.floor(stars.x[mask] * widget.width()) + size / 2,
+            np.floor(stars.y[mask] * widget.height()) + size / 2,
+            stars.spikiness[mask] * len(STAR_COLORS) + stars.color[mask],
+            size,
+        )
+
+    def _sprite_drawer(self, shape: int, color: QColor):
+        def draw(painter: QPainter, size: int):
+            painter.setBrush(color)
             painter.setPen(Qt.PenStyle.NoPen)
-            if star["spikiness"] == 0:  # Round stars
-                painter.drawEllipse(x, y, size, size)
-            elif star["spikiness"] == 1:  # Star-shaped stars
-                self.draw_star_shape(painter, x, y, size)
-            else:  # Spiky stars
-                self.draw_spiky_star(painter, x, y, size)
+            if shape == ROUND:
+                painter.drawEllipse(0, 0, size, size)
+            elif shape == STAR_SHAPE:
+                self.draw_star_shape(painter, size / 2, size / 2, size)
+            else:
+                self.draw_spiky_star(painter, size / 2, size / 2, size)
+
+        return draw
 
     def draw_star_shape(self, painter, x, y, size):
         path = QPainterPath()
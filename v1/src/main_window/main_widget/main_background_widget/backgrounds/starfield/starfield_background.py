@@ -31,16 +31,20 @@ class StarfieldBackground(BaseBackground):
 
         self.update_required.emit()
 
-    def paint_background(self, widget: QWidget, painter: QPainter):
+    def paint_static_layer(self, widget: QWidget, painter: QPainter):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Paint black background
+        # Paint black background, resting stars and the moon
         painter.fillRect(widget.rect(), QColor(0, 0, 0))
+        self.star_manager.draw_static_stars(painter, widget)
+        self.moon_manager.draw_moon(painter, widget)
+
+    def paint_dynamic_layer(self, widget: QWidget, painter: QPainter):
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         cursor_position = widget.mapFromGlobal(widget.cursor().pos())
 
-        # Paint stars, comet, and moon
-        self.star_manager.draw_stars(painter, widget)
+        # Paint twinkling stars, comet and UFO
+        self.star_manager.draw_twinkling_stars(painter, widget)
         self.comet_manager.draw_comet(painter, widget)
-        self.moon_manager.draw_moon(painter, widget)
         self.ufo_manager.draw_ufo(painter, widget, cursor_position)
@@ -9,6 +9,7 @@ from .backgrounds.base_background import BaseBackground
 from .backgrounds.bubbles_background import BubblesBackground
 from .backgrounds.snowfall.snowfall_background import SnowfallBackground
 from .backgrounds.starfield.starfield_background import StarfieldBackground
+from .particles import FrameRateGovernor
 
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
@@ -30,6 +31,17 @@ def use_painter(paint_device):
 
 
 class MainBackgroundWidget(QWidget):
+    """
+    Paints the selected background behind the main widget.
+
+    The background's static layer is rendered once into a cached pixmap
+    (until resize or background change). Animation is off by default: the
+    widget sits behind the whole window, so every frame also repaints the
+    widgets overlapping it. With the global/animate_background setting on,
+    animated backgrounds are stepped on each FrameRateGovernor tick and only
+    their dynamic layer is repainted on top of the cached one.
+    """
+
     background: Optional[BaseBackground] = None
 
     def __init__(self, main_widget: "MainWidget", settings_manager: ISettingsManager):
@@ -40,9 +52,12 @@ class MainBackgroundWidget(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self.setGeometry(main_widget.rect())
         self.setFixedSize(main_widget.size())
-        self.apply_background()
 
         self._cached_background_pixmap: Optional[QPixmap] = None
+        self._animating = False
+        self.frame_governor = FrameRateGovernor(self)
+        self.frame_governor.tick.connect(self._on_frame)
+        self.apply_background()
 
     def paintEvent(self, event):
         if getattr(self, "_painting_active", False):  # Prevent recursion
@@ -56,6 +71,7 @@ class MainBackgroundWidget(QWidget):
                 return
 
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            background = self.main_widget.background
 
             painter.save()
             try:
@@ -64,22 +80,33 @@ class MainBackgroundWidget(QWidget):
                     self._cached_background_pixmap.fill(Qt.GlobalColor.transparent)
 
                     cache_painter = QPainter(self._cached_background_pixmap)
-                    if cache_painter.isActive() and self.main_widget.background:
+                    if cache_painter.isActive() and background:
                         cache_painter.save()
                         try:
-                            self.main_widget.background.paint_background(
-                                self, cache_painter
-                            )
+                            if self._animating:
+                                background.paint_static_layer(self, cache_painter)
+                            else:
+                                background.paint_background(self, cache_painter)
                         finally:
                             cache_painter.restore()
                     cache_painter.end()
 
                 painter.drawPixmap(0, 0, self._cached_background_pixmap)
+                if self._animating and background:
+                    background.paint_dynamic_layer(self, painter)
             finally:
                 painter.restore()  # Always restore before leaving
         finally:
             self._painting_active = False  # Unlock painting
 
+    def _on_frame(self):
+        background = self.main_widget.background
+        if not self._is_animating(background):
+            self.frame_governor.stop()
+            return
+        background.animate_background()
+        self.update()
+
     def _setup_background(self):
         bg_type = self.settings_manager.get_global_settings().get_background_type()
         self.background = self._get_background(bg_type)
@@ -89,6 +116,19 @@ class MainBackgroundWidget(QWidget):
         self._setup_background()
 
         self._cached_background_pixmap = None
+        self._animating = self._is_animating(self.background)
+        if self._animating:
+            self.frame_governor.start()
+        else:
+            self.frame_governor.stop()
+        self.update()
+
+    def _is_animating(self, background: Optional[BaseBackground]) -> bool:
+        return (
+            background is not None
+            and background.is_animated
+            and self.settings_manager.get_global_settings().get_animate_background()
+        )
 
     def _get_background(self, bg_type: str) -> Optional[BaseBackground]:
         background_map = {
@@ -0,0 +1,19 @@
+"""
+Shared particle engine for the animated main backgrounds.
+
+Backgrounds keep their particles in a ParticleField (NumPy structure of
+arrays) and draw them from a SpriteAtlas of pre-rasterized shapes. The
+FrameRateGovernor decides how often they are animated.
+"""
+
+from .frame_rate_governor import FrameRateGovernor
+from .particle_field import ParticleField, choice, uniform
+from .sprite_atlas import SpriteAtlas
+
+__all__ = [
+    "FrameRateGovernor",
+    "ParticleField",
+    "SpriteAtlas",
+    "choice",
+    "uniform",
+]
@@ -0,0 +1,128 @@
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QPoint, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QCursor, QGuiApplication
+from PyQt6.QtWidgets import QWidget
+
+
+def _application_is_active() -> bool:
+    return (
+        QGuiApplication.applicationState() == Qt.ApplicationState.ApplicationActive
+    )
+
+
+class FrameRateGovernor(QObject):
+    """
+    Drives background animation at a frame rate that follows the window.
+
+    Ticks at ACTIVE_FPS while the user is interacting and drops to IDLE_FPS
+    once the cursor has not moved for IDLE_AFTER_SECONDS. While the window is
+    hidden, minimized or not exposed (fully covered) it stops ticking and
+    polls at PAUSED_POLL_MS to notice when it comes back. While another
+    application is active the timer is stopped outright and restarted when
+    this application becomes active again.
+    """
+
+    ACTIVE = "active"
+    IDLE = "idle"
+    PAUSED = "paused"
+
+    ACTIVE_FPS = 60
+    IDLE_FPS = 10
+    IDLE_AFTER_SECONDS = 5.0
+    PAUSED_POLL_MS = 500
+
+    tick = pyqtSignal()
+    mode_changed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        widget: QWidget,
+        clock: Callable[[], float] = time.monotonic,
+        cursor_position: Callable[[], QPoint] = QCursor.pos,
+        application_active: Callable[[], bool] = _application_is_active,
+    ) -> None:
+        super().__init__(widget)
+        self.widget = widget
+        self._clock = clock
+        self._cursor_position = cursor_position
+        self._application_active = application_active
+        self._started = False
+        self._last_cursor: Optional[QPoint] = None
+        self._last_activity = clock()
+        self.mode = self.ACTIVE
+
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.on_timeout)
+
+        application = QGuiApplication.instance()
+        if application is not None:
+            application.applicationStateChanged.connect(
+                self.on_application_state_changed
+            )
+
+    @property
+    def is_running(self) -> bool:
+        return self.timer.isActive()
+
+    def start(self) -> None:
+        self._started = True
+        self.mark_activity()
+        self._set_mode(self.ACTIVE)
+        self.timer.start(self.interval_for(self.ACTIVE))
+
+    def stop(self) -> None:
+        self._started = False
+        self.timer.stop()
+
+    def on_application_state_changed(self, *_) -> None:
+        if self._started and not self.timer.isActive() and self._application_active():
+            self.start()
+
+    def mark_activity(self) -> None:
+        """Record user activity, e.g. from a key press the cursor check misses."""
+        self._last_activity = self._clock()
+
+    def interval_for(self, mode: str) -> int:
+        if mode == self.PAUSED:
+            return self.PAUSED_POLL_MS
+        fps = self.ACTIVE_FPS if mode == self.ACTIVE else self.IDLE_FPS
+        return max(1, round(1000 / fps))
+
+    def on_timeout(self) -> None:
+        if not self._application_active():
+            self._set_mode(self.PAUSED)
+            self.timer.stop()
+            return
+        mode = self._current_mode()
+        if mode != self.mode:
+            self._set_mode(mode)
+            self.timer.setInterval(self.interval_for(mode))
+        if mode != self.PAUSED:
+            self.tick.emit()
+
+    def _current_mode(self) -> str:
+        if not self._is_visible():
+            return self.PAUSED
+
+        cursor = self._cursor_position()
+        if cursor != self._last_cursor:
+            self._last_cursor = cursor
+            self.mark_activity()
+
+        recently_used = self._clock() - self._last_activity < self.IDLE_AFTER_SECONDS
+        return self.ACTIVE if recently_used else self.IDLE
+
+    def _is_visible(self) -> bool:
+        window = self.widget.window()
+        if not self.widget.isVisible() or window.isMinimized():
+            return False
+        handle = window.windowHandle()
+        return handle is None or handle.isExposed()
+
+    def _set_mode(self, mode: str) -> None:
+        if mode != self.mode:
+            self.mode = mode
+            self.mode_changed.emit(mode)
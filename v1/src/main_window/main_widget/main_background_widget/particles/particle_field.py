@@ -0,0 +1,89 @@
+from typing import Callable, Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+# Builds n values for a column: spawner(rng, n) -> array of length n
+Spawner = Callable[[np.random.Generator, int], np.ndarray]
+
+
+def uniform(low: float, high: float) -> Spawner:
+    """Spawner drawing values uniformly from [low, high)."""
+    return lambda rng, n: rng.uniform(low, high, n)
+
+
+def choice(options, p=None) -> Spawner:
+    """Spawner drawing values from options, optionally weighted by p."""
+    options = np.asarray(options, dtype=np.float64)
+    return lambda rng, n: rng.choice(options, n, p=p)
+
+
+class ParticleField:
+    """
+    Particles stored as a structure of arrays.
+
+    Each property ("x", "y", "speed", ...) is one NumPy column with a value
+    per particle, so a background animates every particle with a handful of
+    array operations per frame instead of a Python loop over dicts. The
+    spawners given for each column are used for the initial particles and
+    again by respawn() when particles leave the screen.
+
+    Columns are read and written as attributes, e.g. field.y += field.speed.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        spawners: Mapping[str, Spawner],
+        rng: Optional[np.random.Generator] = None,
+    ) -> None:
+        self.count = count
+        self.rng = rng or np.random.default_rng()
+        self._spawners = dict(spawners)
+        self.columns: dict[str, np.ndarray] = {
+            name: np.empty(count, dtype=np.float64) for name in self._spawners
+        }
+        self.respawn()
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        columns = self.__dict__.get("columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name: str, value) -> None:
+        columns = self.__dict__.get("columns", {})
+        if name in columns:
+            columns[name][...] = value
+        else:
+            super().__setattr__(name, value)
+
+    def respawn(
+        self,
+        mask: Optional[np.ndarray] = None,
+        keep: Iterable[str] = (),
+        **overrides: Union[float, Spawner],
+    ) -> int:
+        """
+        Give the particles selected by mask (all if None) fresh values.
+
+        Columns named in keep are left as they are. Overrides replace a
+        column's spawner for this call, either with a constant (e.g. y=0.0
+        to restart at the top) or another spawner. Returns the number of
+        particles respawned.
+        """
+        index = slice(None) if mask is None else np.flatnonzero(mask)
+        n = self.count if mask is None else len(index)
+        if n == 0:
+            return 0
+        for name, column in self.columns.items():
+            if name in keep:
+                continue
+            spawner = overrides.get(name, self._spawners[name])
+            column[index] = spawner(self.rng, n) if callable(spawner) else spawner
+        return n
+
+    def bounce(self, name: str, velocity: str, low: float, high: float) -> None:
+        """Reverse velocity for particles whose column has left [low, high]."""
+        values = self.columns[name]
+        outside = (values < low) | (values > high)
+        self.columns[velocity][outside] *= -1
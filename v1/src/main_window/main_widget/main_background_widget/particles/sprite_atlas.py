@@ -0,0 +1,108 @@
+import math
+from typing import Callable, Optional, Sequence
+
+import numpy as np
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QPainter, QPixmap
+
+# Draws one sprite into a size x size square: draw(painter, size)
+SpriteDrawer = Callable[[QPainter, int], None]
+
+# Transparent gap between sprites so smooth scaling does not bleed neighbours
+PADDING = 2
+
+
+class SpriteAtlas:
+    """
+    Pre-rasterized sprites packed into one pixmap.
+
+    Particle backgrounds draw the same few shapes hundreds of times a frame.
+    Rasterizing each shape once and drawing every particle as a fragment of
+    the atlas in a single QPainter.drawPixmapFragments call replaces the
+    per-particle setBrush/setOpacity/drawPath calls.
+
+    Sprites are rasterized on first draw, so an atlas can be created before
+    the QApplication exists.
+    """
+
+    def __init__(self, sprite_size: int, drawers: Sequence[SpriteDrawer]) -> None:
+        self.sprite_size = sprite_size
+        self._drawers = list(drawers)
+        self._pixmap: Optional[QPixmap] = None
+        self._source_rects: list[QRectF] = []
+
+    def __len__(self) -> int:
+        return len(self._drawers)
+
+    @property
+    def pixmap(self) -> QPixmap:
+        if self._pixmap is None:
+            self._rasterize()
+        return self._pixmap
+
+    def draw(
+        self,
+        painter: QPainter,
+        x: np.ndarray,
+        y: np.ndarray,
+        sprite: np.ndarray,
+        size: Optional[np.ndarray] = None,
+        opacity: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        Draw one sprite per particle, centred on (x, y) in widget pixels.
+
+        Args:
+            painter: Active painter
+            x, y: Sprite centres
+            sprite: Index of the sprite to draw per particle
+            size: Drawn size in pixels per particle (sprite_size if None)
+            opacity: Opacity per particle (1.0 if None)
+        """
+        count = len(x)
+        if count == 0:
+            return
+        pixmap = self.pixmap
+        scale = (
+            np.ones(count)
+            if size is None
+            else np.asarray(size, dtype=np.float64) / self.sprite_size
+        )
+        if opacity is None:
+            opacity = np.ones(count)
+        rects = self._source_rects
+        create = QPainter.PixmapFragment.create
+        fragments = [
+            create(QPointF(px, py), rects[index], s, s, 0.0, alpha)
+            for px, py, index, s, alpha in zip(
+                np.asarray(x, dtype=np.float64).tolist(),
+                np.asarray(y, dtype=np.float64).tolist(),
+                np.asarray(sprite, dtype=np.intp).tolist(),
+                scale.tolist(),
+                np.asarray(opacity, dtype=np.float64).tolist(),
+            )
+        ]
+        painter.drawPixmapFragments(fragments, pixmap)
+
+    def _rasterize(self) -> None:
+        cell = self.sprite_size + 2 * PADDING
+        columns = max(1, math.ceil(math.sqrt(len(self._drawers))))
+        rows = max(1, math.ceil(len(self._drawers) / columns))
+        pixmap = QPixmap(columns * cell, rows * cell)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._source_rects = []
+        for i, draw in enumerate(self._drawers):
+            left = (i % columns) * cell + PADDING
+            top = (i // columns) * cell + PADDING
+            painter.save()
+            painter.translate(left, top)
+            draw(painter, self.sprite_size)
+            painter.restore()
+            self._source_rects.append(
+                QRectF(left, top, self.sprite_size, self.sprite_size)
+            )
+        painter.end()
+        self._pixmap = pixmap
@@ -1,6 +1,7 @@
 import os
 import logging
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Optional
 from PIL import Image, PngImagePlugin
 from PyQt6.QtWidgets import QMessageBox
 import json
@@ -12,20 +13,44 @@ from data.constants import (
     DIAMOND,
     BOX,  # Import grid mode constants
 )
+from main_window.main_widget.dictionary_metadata_index import DictionaryMetadataIndex
+from main_window.main_widget.png_metadata_reader import (
+    iter_image_metadata,
+    read_image_metadata,
+)
 from main_window.main_widget.sequence_level_evaluator import SequenceLevelEvaluator
 from main_window.main_widget.thumbnail_finder import ThumbnailFinder
-from utils.path_helpers import get_data_path
+from utils.path_helpers import get_data_path, get_user_editable_resource_path
+
+METADATA_INDEX_FILENAME = "dictionary_metadata_index.json"
 
 
 class MetaDataExtractor:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self.index = DictionaryMetadataIndex.for_path(
+            get_user_editable_resource_path(METADATA_INDEX_FILENAME)
+        )
+
+    def get_summary(self, file_path: str) -> Optional[dict]:
+        """Return the indexed metadata summary, re-reading the file only if it changed."""
+        if not file_path:
+            return None
+        try:
+            return self.index.get(file_path)
+        except Exception as e:
+            QMessageBox.critical(
+                None,
+                "Error",
+                f"Error loading sequence from thumbnail: {e}",
+            )
+        return None
 
     def get_tags(self, file_path: str) -> list[str]:
         """Retrieve the list of tags from the metadata."""
-        metadata = self.extract_metadata_from_file(file_path)
-        if metadata:
-            return metadata.get("tags", [])  # Default to an empty list if no tags exist
+        summary = self.get_summary(file_path)
+        if summary:
+            return list(summary["tags"])
         return []
 
     def set_tags(self, file_path: str, tags: list[str]):
@@ -45,6 +70,7 @@ class MetaDataExtractor:
                 "Error",
                 f"Error saving tags to thumbnail: {e}",
             )
+        self.index.discard(file_path)
 
     def extract_metadata_from_file(self, file_path):
         # Check if a file exists at the path we're passing as "file_path"
@@ -52,16 +78,16 @@ class MetaDataExtractor:
             return None
 
         try:
-            with Image.open(file_path) as img:
-                metadata = img.info.get("metadata")
-                if metadata:
-                    return json.loads(metadata)
-                else:
-                    # Silent logging instead of annoying popup
-                    self.logger.debug(
-                        f"No sequence metadata found in thumbnail: {file_path}"
-                    )
-                    return None
+            # Reads the PNG text chunk directly; image data is never decoded
+            metadata = read_image_metadata(file_path)
+            if metadata:
+                return metadata
+            else:
+                # Silent logging instead of annoying popup
+                self.logger.debug(
+                    f"No sequence metadata found in thumbnail: {file_path}"
+                )
+                return None
         except Exception as e:
             # Keep critical errors as popups since these indicate real issues
             QMessageBox.critical(
@@ -72,9 +98,9 @@ class MetaDataExtractor:
         return None
 
     def get_favorite_status(self, file_path: str) -> bool:
-        metadata = self.extract_metadata_from_file(file_path)
-        if metadata:
-            return metadata.get("is_favorite", False)
+        summary = self.get_summary(file_path)
+        if summary:
+            return summary["is_favorite"]
         return False
 
     def set_favorite_status(self, file_path: str, is_favorite: bool):
@@ -98,14 +124,22 @@ class MetaDataExtractor:
                 "Error",
                 f"Error saving favorite status to thumbnail: {e}",
             )
+        self.index.discard(file_path)
 
     def get_author(self, file_path):
-        metadata = self.extract_metadata_from_file(file_path)
-        if metadata and "sequence" in metadata:
-            return metadata["sequence"][0]["author"]
+        summary = self.get_summary(file_path)
+        if summary and summary["has_sequence"]:
+            return summary["author"]
         return
 
     def get_level(self, file_path):
+        summary = self.get_summary(file_path)
+        if not summary or not summary["has_sequence"] or summary["level"] is None:
+            return
+        if summary["level"] != 0:
+            return summary["level"]
+
+        # Unrated sequence: evaluate it once and store the level in the image.
         metadata = self.extract_metadata_from_file(file_path)
         if metadata and "sequence" in metadata:
             if "level" in metadata["sequence"][0]:
@@ -131,58 +165,78 @@ class MetaDataExtractor:
                             "Error",
                             f"Error saving level to thumbnail: {e}",
                         )
+                    self.index.discard(file_path)
                     return level
         return
 
     def get_length(self, file_path):
-        metadata = self.extract_metadata_from_file(file_path)
-        if metadata and "sequence" in metadata:
-            return len(metadata["sequence"]) - 2
+        summary = self.get_summary(file_path)
+        if summary and summary["has_sequence"]:
+            return summary["length"]
         return 0  # Default to 0 if no valid sequence length is found
 
+    def get_date_added(self, file_path) -> Optional[str]:
+        summary = self.get_summary(file_path)
+        if summary:
+            return summary["date_added"]
+        return None
+
     def get_start_pos(self, file_path):
         """
         Get the start position type (alpha, beta, gamma) from the metadata.
 
         If the sequence_start_position field is missing, it attempts to derive it from the end_pos field of the start position entry.
         """
-        metadata = self.extract_metadata_from_file(file_path)
-        if metadata and "sequence" in metadata and len(metadata["sequence"]) > 1:
-            start_pos_entry = metadata["sequence"][1]
-
-            # First try to get the sequence_start_position directly
-            if SEQUENCE_START_POSITION in start_pos_entry:
-                return start_pos_entry[SEQUENCE_START_POSITION]
-
-            # If not available, try to derive it from the end_pos
-            if END_POS in start_pos_entry:
-                end_pos = start_pos_entry[END_POS]
-                if end_pos.startswith("alpha"):
-                    return "alpha"
-                elif end_pos.startswith("beta"):
-                    return "beta"
-                elif end_pos.startswith("gamma"):
-                    return "gamma"
-
+        summary = self.get_summary(file_path)
+        if summary and summary["has_sequence"]:
+            return summary["start_pos"]
         return None
 
     def get_metadata_and_thumbnail_dict(self) -> list[dict[str, str]]:
         """Collect all sequences and their metadata along with the associated thumbnail paths."""
         dictionary_dir = get_data_path("dictionary")
-        metadata_and_thumbnail_dict = []
+        all_thumbnails = []
 
         for word in os.listdir(dictionary_dir):
             word_dir = os.path.join(dictionary_dir, word)
             if os.path.isdir(word_dir) and "__pycache__" not in word:
-                thumbnails = ThumbnailFinder().find_thumbnails(word_dir)
-                for thumbnail in thumbnails:
-                    metadata = self.extract_metadata_from_file(thumbnail)
-                    if metadata:
-                        metadata_and_thumbnail_dict.append(
-                            {"metadata": metadata, "thumbnail": thumbnail}
-                        )
+                all_thumbnails.extend(ThumbnailFinder().find_thumbnails(word_dir))
+
+        # Read in parallel, then restore directory order for callers
+        metadata_by_thumbnail = {}
+        for result in iter_image_metadata(all_thumbnails):
+            if result.error is not None:
+                self.logger.warning(
+                    f"Error loading metadata from {result.path}: {result.error}"
+                )
+            elif result.metadata:
+                metadata_by_thumbnail[result.path] = result.metadata
+
+        return [
+            {"metadata": metadata_by_thumbnail[thumbnail], "thumbnail": thumbnail}
+            for thumbnail in all_thumbnails
+            if thumbnail in metadata_by_thumbnail
+        ]
+
+    def warm_index(self, thumbnails: Optional[list[str]] = None) -> None:
+        """
+        Index thumbnails on a background thread so later queries are served
+        from memory. Defaults to every thumbnail in the dictionary.
+        """
+
+        def warm():
+            paths = thumbnails
+            if paths is None:
+                paths = [
+                    thumbnail
+                    for word_thumbnails in ThumbnailFinder()
+                    .get_all_thumbnails()
+                    .values()
+                    for thumbnail in word_thumbnails
+                ]
+            self.index.refresh(paths)
 
-        return metadata_and_thumbnail_dict
+        threading.Thread(target=warm, name="metadata-index-warmup", daemon=True).start()
 
     def get_grid_mode(self, file_path):
         """
@@ -190,14 +244,10 @@ class MetaDataExtractor:
 
         If the grid_mode field is missing, it defaults to 'diamond'.
         """
-        metadata = self.extract_metadata_from_file(file_path)
-        if metadata and "sequence" in metadata:
-            # Check if grid_mode exists in the metadata
-            if GRID_MODE in metadata["sequence"][0]:
-                return metadata["sequence"][0][GRID_MODE]
-            else:
-                # Default to 'diamond' if grid_mode is not specified
-                return DIAMOND
+        summary = self.get_summary(file_path)
+        if summary and summary["has_sequence"]:
+            # The index defaults grid_mode to 'diamond' if it is not specified
+            return summary["grid_mode"]
         return DIAMOND  # Default to 'diamond' if no metadata is found
 
     def get_full_metadata(self, file_path: str) -> dict:
@@ -265,6 +315,7 @@ class MetaDataExtractor:
                     pnginfo = PngImagePlugin.PngInfo()
                     pnginfo.add_text("metadata", json.dumps(metadata_dict))
                     img.save(file_path, pnginfo=pnginfo)
+                    self.index.discard(file_path)
                     return True
 
                 return False
@@ -0,0 +1,201 @@
+import hashlib
+import logging
+import os
+import pickle
+from typing import Any, Iterable, Optional
+
+import pandas as pd
+
+from data.constants import (
+    BLUE,
+    BLUE_ATTRS,
+    END_LOC,
+    END_POS,
+    IN,
+    LETTER,
+    MOTION_TYPE,
+    PROP_ROT_DIR,
+    RED,
+    RED_ATTRS,
+    START_LOC,
+    START_ORI,
+    START_POS,
+    TURNS,
+)
+
+logger = logging.getLogger(__name__)
+
+LetterRecords = dict[str, list[dict[str, Any]]]
+
+# Categories are listed in lexical order so sorting a categorical column
+# orders rows exactly as sorting the raw strings would.
+POSITIONS = sorted(
+    [f"alpha{i}" for i in range(1, 9)]
+    + [f"beta{i}" for i in range(1, 9)]
+    + [f"gamma{i}" for i in range(1, 17)]
+)
+LOCATIONS = sorted(["n", "e", "s", "w", "ne", "se", "sw", "nw"])
+MOTION_TYPES = sorted(["pro", "anti", "float", "dash", "static"])
+PROP_ROT_DIRS = sorted(["cw", "ccw", "no_rot"])
+
+CSV_DTYPES: dict[str, Any] = {
+    LETTER: "category",
+    START_POS: pd.CategoricalDtype(POSITIONS),
+    END_POS: pd.CategoricalDtype(POSITIONS),
+    "timing": pd.CategoricalDtype(sorted(["none", "quarter", "split", "tog"])),
+    "direction": pd.CategoricalDtype(sorted(["none", "opp", "same"])),
+    **{
+        f"{color}_{column}": pd.CategoricalDtype(categories)
+        for color in (BLUE, RED)
+        for column, categories in (
+            (MOTION_TYPE, MOTION_TYPES),
+            (PROP_ROT_DIR, PROP_ROT_DIRS),
+            (START_LOC, LOCATIONS),
+            (END_LOC, LOCATIONS),
+        )
+    },
+}
+
+MOTION_COLUMNS = [
+    f"{color}_{column}"
+    for color in (BLUE, RED)
+    for column in (MOTION_TYPE, PROP_ROT_DIR, START_LOC, END_LOC)
+]
+
+
+def read_pictograph_csv(csv_path: str) -> pd.DataFrame:
+    """
+    Read a pictograph CSV with explicit categorical dtypes.
+
+    A value outside a column's known categories would silently become NaN,
+    so it is reported as a ValueError instead.
+    """
+    raw = pd.read_csv(csv_path, dtype=str)
+    dtypes = {c: t for c, t in CSV_DTYPES.items() if c in raw.columns}
+    for column, dtype in dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            unknown = raw[column].notna() & ~raw[column].isin(dtype.categories)
+            if unknown.any():
+                values = sorted(raw.loc[unknown, column].unique())
+                raise ValueError(f"Unknown {column} values in {csv_path}: {values}")
+    return raw.astype(dtypes)
+
+
+def build_letter_records(df: pd.DataFrame) -> LetterRecords:
+    """
+    Build the nested per-letter pictograph records from a dataset frame.
+
+    Rows are sorted by letter, start and end position. Every record starts
+    with zero turns and in orientations, and carries its motion columns
+    nested under blue_attributes and red_attributes.
+    """
+    df = df.sort_values(by=[LETTER, START_POS, END_POS])
+    columns = {column: df[column].tolist() for column in df.columns}
+    flat_columns = [c for c in df.columns if c not in MOTION_COLUMNS]
+    zeros = [0] * len(df)
+
+    def nest_attributes(color: str) -> list[dict[str, Any]]:
+        return [
+            {
+                MOTION_TYPE: motion_type,
+                START_ORI: IN,
+                PROP_ROT_DIR: prop_rot_dir,
+                START_LOC: start_loc,
+                END_LOC: end_loc,
+                TURNS: turns,
+            }
+            for motion_type, prop_rot_dir, start_loc, end_loc, turns in zip(
+                columns[f"{color}_{MOTION_TYPE}"],
+                columns[f"{color}_{PROP_ROT_DIR}"],
+                columns[f"{color}_{START_LOC}"],
+                columns[f"{color}_{END_LOC}"],
+                zeros,
+            )
+        ]
+
+    records = [
+        dict(zip(flat_columns, values))
+        for values in zip(*(columns[c] for c in flat_columns))
+    ]
+    letters: LetterRecords = {}
+    for record, blue_attrs, red_attrs in zip(
+        records, nest_attributes(BLUE), nest_attributes(RED)
+    ):
+        record[BLUE_ATTRS] = blue_attrs
+        record[RED_ATTRS] = red_attrs
+        letters.setdefault(record[LETTER], []).append(record)
+    return letters
+
+
+class PictographCsvIngestion:
+    """
+    Loads the pictograph CSVs into per-letter records, cached on disk.
+
+    The CSVs are read with categorical dtypes and turned into records in
+    bulk. The records are pickled together with a hash of the CSV contents,
+    so later startups load the pickle and skip CSV parsing entirely; the
+    cache is rebuilt whenever a CSV changes.
+    """
+
+    VERSION = 1
+    TEMP_SUFFIX = ".tmp"
+
+    def __init__(self, csv_paths: Iterable[str], cache_path: Optional[str] = None):
+        self.csv_paths = list(csv_paths)
+        self.cache_path = cache_path
+
+    def source_fingerprint(self) -> str:
+        digest = hashlib.sha256(str(self.VERSION).encode())
+        for csv_path in self.csv_paths:
+            with open(csv_path, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def load(self) -> LetterRecords:
+        """Return the per-letter records, from the cache when it is current."""
+        source_hash = self.source_fingerprint()
+        letters = self._load_cache(source_hash)
+        if letters is None:
+            df = pd.concat(
+                [read_pictograph_csv(path) for path in self.csv_paths],
+                ignore_index=True,
+            )
+            letters = build_letter_records(df)
+            self._save_cache(source_hash, letters)
+        return letters
+
+    def _load_cache(self, source_hash: str) -> Optional[LetterRecords]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable pictograph cache: {e}")
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get("version") != self.VERSION
+            or cached.get("source_hash") != source_hash
+        ):
+            return None
+        return cached["letters"]
+
+    def _save_cache(self, source_hash: str, letters: LetterRecords) -> None:
+        if not self.cache_path:
+            return
+        temp_path = self.cache_path + self.TEMP_SUFFIX
+        try:
+            with open(temp_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "version": self.VERSION,
+                        "source_hash": source_hash,
+                        "letters": letters,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write pictograph cache: {e}")
@@ -1,11 +1,9 @@
 from copy import deepcopy
 import os
 from typing import TYPE_CHECKING, Optional
-import pandas as pd
 from enums.letter.letter import Letter
 
 from data.constants import (
-    BLUE,
     BLUE_ATTRS,
     END_LOC,
     END_POS,
@@ -13,18 +11,20 @@ from data.constants import (
     LETTER,
     MOTION_TYPE,
     PROP_ROT_DIR,
-    RED,
     RED_ATTRS,
     START_LOC,
     START_ORI,
     START_POS,
     TURNS,
 )
-from utils.path_helpers import get_data_path
+from main_window.main_widget.pictograph_csv_ingestion import PictographCsvIngestion
+from utils.path_helpers import get_data_path, get_user_editable_resource_path
 
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
 
+DATASET_CACHE_FILENAME = "pictograph_dataset_cache.pkl"
+
 
 class PictographDataLoader:
     def __init__(self, main_widget: "MainWidget") -> None:
@@ -58,81 +58,23 @@ class PictographDataLoader:
                 return self._create_sample_pictograph_data()
 
             try:
-                # Try to read the CSV files
-                diamond_df = pd.read_csv(diamond_csv_path)
-                box_df = pd.read_csv(box_csv_path)
+                letter_records = PictographCsvIngestion(
+                    [diamond_csv_path, box_csv_path],
+                    cache_path=get_user_editable_resource_path(DATASET_CACHE_FILENAME),
+                ).load()
             except Exception as e:
                 # If there's an error reading the files, create sample data
                 return self._create_sample_pictograph_data()
 
-            # Process the dataframes
-            combined_df = pd.concat([diamond_df, box_df], ignore_index=True)
-            combined_df = combined_df.sort_values(by=[LETTER, START_POS, END_POS])
-            combined_df = self.add_turns_and_ori_to_pictograph_data(combined_df)
-            combined_df = self.restructure_dataframe_for_new_json_format(combined_df)
-
-            # Convert to dictionary
-            letters = {
-                self.get_letter_enum_by_value(letter_str): combined_df[
-                    combined_df[LETTER] == letter_str
-                ].to_dict(orient="records")
-                for letter_str in combined_df[LETTER].unique()
+            return {
+                self.get_letter_enum_by_value(letter_str): records
+                for letter_str, records in letter_records.items()
             }
-            self._convert_turns_str_to_int_or_float(letters)
-            return letters
 
         except Exception:
             # If any error occurs, create sample data without logging the error
             return self._create_sample_pictograph_data()
 
-    def _convert_turns_str_to_int_or_float(self, letters):
-        for letter in letters:
-            for motion in letters[letter]:
-                motion[BLUE_ATTRS][TURNS] = int(motion[BLUE_ATTRS][TURNS])
-                motion[RED_ATTRS][TURNS] = int(motion[RED_ATTRS][TURNS])
-
-    def add_turns_and_ori_to_pictograph_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        for index in df.index:
-            df.at[index, "blue_turns"] = 0
-            df.at[index, "red_turns"] = 0
-            df.at[index, "blue_start_ori"] = IN
-            df.at[index, "red_start_ori"] = IN
-        return df
-
-    def restructure_dataframe_for_new_json_format(
-        self, df: pd.DataFrame
-    ) -> pd.DataFrame:
-        def nest_attributes(row, color_prefix):
-            return {
-                MOTION_TYPE: row[f"{color_prefix}_motion_type"],
-                START_ORI: row[f"{color_prefix}_start_ori"],
-                PROP_ROT_DIR: row[f"{color_prefix}_prop_rot_dir"],
-                START_LOC: row[f"{color_prefix}_start_loc"],
-                END_LOC: row[f"{color_prefix}_end_loc"],
-                TURNS: row[f"{color_prefix}_turns"],
-            }
-
-        df[BLUE_ATTRS] = df.apply(lambda row: nest_attributes(row, BLUE), axis=1)
-        df[RED_ATTRS] = df.apply(lambda row: nest_attributes(row, RED), axis=1)
-        blue_columns = [
-            "blue_motion_type",
-            "blue_prop_rot_dir",
-            "blue_start_loc",
-            "blue_end_loc",
-            "blue_turns",
-            "blue_start_ori",
-        ]
-        red_columns = [
-            "red_motion_type",
-            "red_prop_rot_dir",
-            "red_start_loc",
-            "red_end_loc",
-            "red_turns",
-            "red_start_ori",
-        ]
-        df = df.drop(columns=blue_columns + red_columns)
-        return df
-
     @staticmethod
     def get_letter_enum_by_value(letter_value: str) -> Letter:
         for letter in Letter.__members__.values():
@@ -0,0 +1,163 @@
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from data.constants import (
+    BLUE_ATTRS,
+    BOX,
+    DIAMOND,
+    LETTER,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+    START_POS,
+)
+from data.positions_maps import box_positions
+from enums.letter.letter import Letter
+from enums.letter.letter_type import LetterType
+
+_BOX_POSITIONS = frozenset(box_positions)
+
+IndexKey = tuple[str, str]
+BaseRecord = Mapping[str, Any]
+
+
+class PictographDatasetIndex:
+    """
+    Read-only lookup tables over the pictograph dataset.
+
+    The primary index maps (grid_mode, start_pos) to every pictograph that can
+    follow that position, so finding the next options for a beat is a single
+    dictionary lookup instead of a scan over every letter. Secondary indexes
+    narrow the same key by letter, letter type, or (blue, red) prop_rot_dir.
+
+    Buckets are tuples and the tables are wrapped in MappingProxyType, so the
+    index itself cannot be modified once built. Records keep the order they
+    have in the dataset and are stored as read-only base records; callers that
+    need to set orientations, turns or a beat number take an overlay with
+    make_option() instead of writing into the shared dataset.
+    """
+
+    _shared: Optional[tuple[Any, "PictographDatasetIndex"]] = None
+
+    def __init__(self, pictograph_dataset: Mapping[Any, list[dict]]) -> None:
+        by_start: dict[IndexKey, list[BaseRecord]] = {}
+        by_letter: dict[tuple[str, str, str], list[BaseRecord]] = {}
+        by_letter_type: dict[tuple[str, str, LetterType], list[BaseRecord]] = {}
+        by_rot_dirs: dict[tuple[str, str, str, str], list[BaseRecord]] = {}
+        grid_modes: dict[str, str] = {}
+
+        for letter_key, group in pictograph_dataset.items():
+            letter_str = self._letter_str(letter_key)
+            letter_type = self._letter_type(letter_str)
+            for record in group:
+                start_pos = record.get(START_POS)
+                if not start_pos:
+                    continue
+                record = self._freeze_record(record)
+                grid_mode = self.grid_mode_for_position(start_pos)
+                grid_modes[start_pos] = grid_mode
+                key = (grid_mode, start_pos)
+                letter_value = record.get(LETTER, letter_str)
+
+                by_start.setdefault(key, []).append(record)
+                by_letter.setdefault(key + (letter_value,), []).append(record)
+                if letter_type is not None:
+                    by_letter_type.setdefault(key + (letter_type,), []).append(record)
+                rot_dirs = (
+                    record.get(BLUE_ATTRS, {}).get(PROP_ROT_DIR),
+                    record.get(RED_ATTRS, {}).get(PROP_ROT_DIR),
+                )
+                by_rot_dirs.setdefault(key + rot_dirs, []).append(record)
+
+        self._by_start = self._freeze(by_start)
+        self._by_letter = self._freeze(by_letter)
+        self._by_letter_type = self._freeze(by_letter_type)
+        self._by_rot_dirs = self._freeze(by_rot_dirs)
+        self._grid_modes = MappingProxyType(grid_modes)
+
+    @classmethod
+    def for_dataset(
+        cls, pictograph_dataset: Mapping[Any, list[dict]]
+    ) -> "PictographDatasetIndex":
+        """Return the index shared by every consumer of this dataset object."""
+        shared = cls._shared
+        if shared is None or shared[0] is not pictograph_dataset:
+            shared = (pictograph_dataset, cls(pictograph_dataset))
+            cls._shared = shared
+        return shared[1]
+
+    @staticmethod
+    def grid_mode_for_position(position: str) -> str:
+        return BOX if position in _BOX_POSITIONS else DIAMOND
+
+    @staticmethod
+    def make_option(record: BaseRecord) -> dict:
+        """
+        Return a mutable option built on a base record. Only the top level and
+        the nested attribute dicts are copied; their values are shared scalars,
+        so this is equivalent to a deepcopy at a fraction of the cost.
+        """
+        return {
+            key: dict(value) if isinstance(value, Mapping) else value
+            for key, value in record.items()
+        }
+
+    def get_options(
+        self,
+        start_pos: str,
+        grid_mode: Optional[str] = None,
+        letter: Optional[str] = None,
+        letter_type: Optional[LetterType] = None,
+        prop_rot_dirs: Optional[tuple[str, str]] = None,
+    ) -> tuple[BaseRecord, ...]:
+        """
+        Return every pictograph starting at start_pos, optionally narrowed by
+        a single secondary key. grid_mode defaults to the grid of start_pos.
+        """
+        if grid_mode is None:
+            grid_mode = self._grid_modes.get(start_pos)
+            if grid_mode is None:
+                return ()
+        key = (grid_mode, start_pos)
+        if letter is not None:
+            return self._by_letter.get(key + (self._letter_str(letter),), ())
+        if letter_type is not None:
+            return self._by_letter_type.get(key + (letter_type,), ())
+        if prop_rot_dirs is not None:
+            return self._by_rot_dirs.get(key + tuple(prop_rot_dirs), ())
+        return self._by_start.get(key, ())
+
+    def start_positions(self, grid_mode: Optional[str] = None) -> list[str]:
+        return sorted(
+            pos
+            for pos, mode in self._grid_modes.items()
+            if grid_mode is None or mode == grid_mode
+        )
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._by_start.values())
+
+    @staticmethod
+    def _freeze_record(record: Mapping[str, Any]) -> BaseRecord:
+        return MappingProxyType(
+            {
+                key: MappingProxyType(dict(value)) if isinstance(value, dict) else value
+                for key, value in record.items()
+            }
+        )
+
+    @staticmethod
+    def _freeze(
+        table: dict[tuple, list[BaseRecord]],
+    ) -> Mapping[tuple, tuple[BaseRecord, ...]]:
+        return MappingProxyType({key: tuple(bucket) for key, bucket in table.items()})
+
+    @staticmethod
+    def _letter_str(letter: Any) -> str:
+        return letter.value if isinstance(letter, Letter) else str(letter)
+
+    @staticmethod
+    def _letter_type(letter_str: str) -> Optional[LetterType]:
+        for letter_type in LetterType:
+            if letter_str in letter_type.letters:
+                return letter_type
+        return None
@@ -0,0 +1,118 @@
+import json
+import os
+import struct
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from PIL import Image
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+METADATA_KEY = "metadata"
+
+_CHUNK_HEADER = struct.Struct(">I4s")
+_TEXT_CHUNKS = (b"tEXt", b"zTXt", b"iTXt")
+
+
+class NotAPngError(ValueError):
+    """Raised when a file does not start with the PNG signature."""
+
+
+class MetadataResult(NamedTuple):
+    path: str
+    metadata: Optional[dict]
+    error: Optional[Exception] = None
+
+
+def read_png_text(
+    file_path: str, keys: Optional[Iterable[str]] = None
+) -> dict[str, str]:
+    """
+    Read the text chunks of a PNG without decoding any image data.
+
+    Only chunk headers are read for non-text chunks; their payload is skipped
+    with a seek. If keys is given, reading stops as soon as all of them have
+    been found, which for images written by PIL is before the first IDAT.
+    """
+    wanted = set(keys) if keys is not None else None
+    text: dict[str, str] = {}
+    with open(file_path, "rb") as file:
+        if file.read(len(PNG_SIGNATURE)) != PNG_SIGNATURE:
+            raise NotAPngError(f"Not a PNG file: {file_path}")
+        while True:
+            header = file.read(_CHUNK_HEADER.size)
+            if len(header) < _CHUNK_HEADER.size:
+                break
+            length, chunk_type = _CHUNK_HEADER.unpack(header)
+            if chunk_type == b"IEND":
+                break
+            if chunk_type not in _TEXT_CHUNKS:
+                file.seek(length + 4, os.SEEK_CUR)
+                continue
+            data = file.read(length)
+            if len(data) < length:
+                raise ValueError(f"Truncated {chunk_type.decode()} chunk: {file_path}")
+            file.seek(4, os.SEEK_CUR)
+            key, value = _decode_text_chunk(chunk_type, data)
+            if wanted is not None and key not in wanted:
+                continue
+            text[key] = value
+            if wanted is not None and wanted.issubset(text):
+                break
+    return text
+
+
+def _decode_text_chunk(chunk_type: bytes, data: bytes) -> tuple[str, str]:
+    keyword, _, rest = data.partition(b"\0")
+    key = keyword.decode("latin-1")
+    if chunk_type == b"tEXt":
+        return key, rest.decode("latin-1")
+    if chunk_type == b"zTXt":
+        return key, zlib.decompress(rest[1:]).decode("latin-1")
+    compressed = rest[0] == 1
+    _language, _, rest = rest[2:].partition(b"\0")
+    _translated, _, value = rest.partition(b"\0")
+    if compressed:
+        value = zlib.decompress(value)
+    return key, value.decode("utf-8")
+
+
+def read_image_metadata(file_path: str) -> Optional[dict]:
+    """
+    Return the JSON-decoded "metadata" text of a thumbnail, or None if it has
+    none. PNGs are read at the chunk level; other formats fall back to PIL.
+    """
+    try:
+        metadata = read_png_text(file_path, (METADATA_KEY,)).get(METADATA_KEY)
+    except NotAPngError:
+        with Image.open(file_path) as img:
+            metadata = img.info.get(METADATA_KEY)
+    return json.loads(metadata) if metadata else None
+
+
+def iter_image_metadata(
+    file_paths: Iterable[str], max_workers: Optional[int] = None
+) -> Iterator[MetadataResult]:
+    """
+    Read the metadata of many thumbnails on a thread pool and yield each
+    result as soon as it is ready, in completion order. Errors are returned in
+    the result instead of being raised. Closing the iterator early cancels the
+    reads that have not started yet.
+    """
+    paths = list(file_paths)
+    if not paths:
+        return
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers or min(32, (os.cpu_count() or 1) + 4),
+        thread_name_prefix="metadata-reader",
+    )
+    try:
+        futures = {executor.submit(read_image_metadata, path): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                yield MetadataResult(path, future.result())
+            except Exception as e:
+                yield MetadataResult(path, None, e)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
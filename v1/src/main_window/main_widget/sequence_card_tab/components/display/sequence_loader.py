@@ -37,7 +37,9 @@ class SequenceLoader:
             )
             return sequences
 
-        # Process each word folder
+        # Collect every image first so that the metadata of files changed
+        # since the last scan can be read in parallel in one batch
+        image_files = []
         for word in os.listdir(images_path):
             word_path = os.path.join(images_path, word)
 
@@ -45,34 +47,37 @@ class SequenceLoader:
             if not os.path.isdir(word_path) or word.startswith("__"):
                 continue
 
-            # Process each image file
             for file in os.listdir(word_path):
                 if file.endswith(".png") and not file.startswith("__"):
-                    file_path = os.path.join(word_path, file)
-
-                    # Extract sequence length using the metadata extractor
-                    try:
-                        # Get the sequence length from the metadata
-                        sequence_length = self.metadata_extractor.get_length(file_path)
-
-                        # If we couldn't get the length from metadata, default to 0
-                        if sequence_length is None:
-                            sequence_length = 0
-
-                    except Exception as e:
-                        print(f"Error extracting metadata from {file_path}: {e}")
-                        sequence_length = 0
-
-                    sequences.append(
-                        {
-                            "path": file_path,
-                            "word": word,
-                            "metadata": {
-                                "sequence_length": sequence_length,
-                                "sequence": word,
-                            },
-                        }
-                    )
+                    image_files.append((word, os.path.join(word_path, file)))
+
+        self.metadata_extractor.index.refresh(path for _, path in image_files)
+
+        # Process each image file
+        for word, file_path in image_files:
+            # Extract sequence length using the metadata extractor
+            try:
+                # Get the sequence length from the metadata
+                sequence_length = self.metadata_extractor.get_length(file_path)
+
+                # If we couldn't get the length from metadata, default to 0
+                if sequence_length is None:
+                    sequence_length = 0
+
+            except Exception as e:
+                print(f"Error extracting metadata from {file_path}: {e}")
+                sequence_length = 0
+
+            sequences.append(
+                {
+                    "path": file_path,
+                    "word": word,
+                    "metadata": {
+                        "sequence_length": sequence_length,
+                        "sequence": word,
+                    },
+                }
+            )
 
         return sequences
         
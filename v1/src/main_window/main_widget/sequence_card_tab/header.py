@@ -124,11 +124,16 @@ class SequenceCardHeader(QFrame):
         self.regenerate_button = self._create_action_button(
             "Regenerate Images", self.sequence_car_tab.regenerate_all_images
         )
+        self.cancel_button = self._create_action_button(
+            "Cancel", self.sequence_car_tab.image_exporter._on_cancel_requested
+        )
+        self.cancel_button.hide()
 
         button_layout.addStretch()
         button_layout.addWidget(self.export_button)
         button_layout.addWidget(self.refresh_button)
         button_layout.addWidget(self.regenerate_button)
+        button_layout.addWidget(self.cancel_button)
         button_layout.addStretch()
 
         return button_layout
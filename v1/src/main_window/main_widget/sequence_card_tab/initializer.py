@@ -27,8 +27,10 @@ class SequenceCardInitializer:
                 )
                 QApplication.processEvents()
 
-                if hasattr(self.parent.image_exporter, "export_all_images"):
-                    self.parent.image_exporter.export_all_images()
+                # Shows the cards once the images exist
+                self.parent.image_exporter.export_all_images(
+                    lambda summary: self.parent.load_sequences()
+                )
 
             self._apply_saved_settings()
 
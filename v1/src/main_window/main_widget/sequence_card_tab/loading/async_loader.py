@@ -6,6 +6,8 @@ from typing import Dict, List, Optional
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 
+from main_window.main_widget.image_cache import ImageCache
+
 from ..core.models import ImageLoadRequest
 
 
@@ -29,12 +31,13 @@ class AsyncImageLoader(QObject):
     # Signal emitted when an error occurs
     error_occurred = pyqtSignal(str, str)  # path, error message
 
-    def __init__(self, max_threads: int = 2):
+    def __init__(self, max_threads: int = 2, image_cache: Optional[ImageCache] = None):
         """
         Initialize the async image loader.
 
         Args:
             max_threads: Maximum number of worker threads (default: 2)
+            image_cache: Cache for loaded images (default: the shared ImageCache)
         """
         super().__init__()
 
@@ -51,8 +54,10 @@ class AsyncImageLoader(QObject):
         self.threads: List[threading.Thread] = []
         self.max_threads = max_threads
 
-        # Cache of loaded images
-        self.cache: Dict[str, QPixmap] = {}
+        # Loaded images are kept in the memory tier of the shared image cache,
+        # which evicts them once its byte budget is exceeded
+        self.image_cache = image_cache or ImageCache.shared()
+        self._cache_keys: Dict[str, str] = {}
 
         # Lock for thread safety
         self.lock = threading.Lock()
@@ -132,9 +137,10 @@ class AsyncImageLoader(QObject):
                     break
 
     def clear_cache(self):
-        """Clear the image cache."""
+        """Remove the images this loader cached."""
         with self.lock:
-            self.cache.clear()
+            self.image_cache.discard(self._cache_keys.values())
+            self._cache_keys.clear()
 
     def get_cached_image(self, path: str) -> Optional[QPixmap]:
         """
@@ -146,8 +152,14 @@ class AsyncImageLoader(QObject):
         Returns:
             QPixmap or None if not in cache
         """
+        image = self.image_cache.get(self._cache_key(path))
+        return QPixmap.fromImage(image) if image is not None else None
+
+    def _cache_key(self, path: str) -> str:
+        key = ImageCache.source_key(path, "sequence_card")
         with self.lock:
-            return self.cache.get(path)
+            self._cache_keys[path] = key
+        return key
 
     def _worker(self):
         """Worker thread function."""
@@ -211,8 +223,7 @@ class AsyncImageLoader(QObject):
             pixmap = QPixmap.fromImage(image)
 
             # Add to cache
-            with self.lock:
-                self.cache[request.path] = pixmap
+            self.image_cache.put(self._cache_key(request.path), image)
 
             # Emit the signal
             self.image_loaded.emit(request.path, pixmap)
@@ -151,33 +151,45 @@ class SequenceCardTab(QWidget):
             pass
 
     def regenerate_all_images(self):
-        self.setCursor(Qt.CursorShape.WaitCursor)
         original_text = self.header.description_label.text()
-        self.header.description_label.setText("Regenerating images... Please wait")
-        QApplication.processEvents()
 
-        try:
-            if hasattr(self.image_exporter, "export_all_images"):
-                self.image_exporter.export_all_images()
+        def on_finished(summary):
+            if summary is None:
+                self.header.description_label.setText("Error regenerating images")
+                QTimer.singleShot(
+                    5000, lambda: self.header.description_label.setText(original_text)
+                )
+                return
 
-            selected_length = self.nav_sidebar.selected_length
+            try:
+                selected_length = self.nav_sidebar.selected_length
 
-            if USE_PRINTABLE_LAYOUT and hasattr(self, "printable_displayer"):
-                self.printable_displayer.display_sequences(selected_length)
-                self._sync_pages_from_displayer()
+                if USE_PRINTABLE_LAYOUT and hasattr(self, "printable_displayer"):
+                    self.printable_displayer.display_sequences(selected_length)
+                    self._sync_pages_from_displayer()
 
-            self.header.description_label.setText("Images regenerated successfully!")
-            QTimer.singleShot(
-                3000, lambda: self.header.description_label.setText(original_text)
-            )
+                self.header.description_label.setText(
+                    "Image regeneration cancelled"
+                    if summary.cancelled
+                    else "Images regenerated successfully!"
+                )
+                QTimer.singleShot(
+                    3000, lambda: self.header.description_label.setText(original_text)
+                )
 
+            except Exception as e:
+                self.header.description_label.setText(f"Error regenerating: {str(e)}")
+                QTimer.singleShot(
+                    5000, lambda: self.header.description_label.setText(original_text)
+                )
+
+        try:
+            if self.image_exporter.export_all_images(on_finished):
+                self.header.description_label.setText(
+                    "Regenerating images... Please wait"
+                )
         except Exception as e:
             self.header.description_label.setText(f"Error regenerating: {str(e)}")
-            QTimer.singleShot(
-                5000, lambda: self.header.description_label.setText(original_text)
-            )
-        finally:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
 
     def _sync_pages_from_displayer(self):
         if USE_PRINTABLE_LAYOUT and hasattr(self, "printable_displayer"):
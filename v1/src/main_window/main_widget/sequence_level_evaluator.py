@@ -5,20 +5,17 @@ class SequenceLevelEvaluator:
     def get_sequence_difficulty_level(self, sequence: list[dict]) -> int:
         if len(sequence) < 3:
             return ""
-        has_non_radial_orientation = False
-        has_turns = False
-
+        level = 1
         for entry in sequence[1:]:  # Skip the first entry with metadata
             if entry.get("is_placeholder", False):
                 continue
-            if self._has_non_radial_orientation(entry):
-                has_non_radial_orientation = True
-            if self._has_turns(entry):
-                has_turns = True
+            level = max(level, self.get_beat_difficulty_level(entry))
+        return level
 
-        if has_non_radial_orientation:
+    def get_beat_difficulty_level(self, entry: dict) -> int:
+        if self._has_non_radial_orientation(entry):
             return 3  # Level 3: Contains non-radial orientations
-        elif has_turns:
+        elif self._has_turns(entry):
             return 2  # Level 2: Contains turns
         else:
             return 1  # Level 1: No turns, only radial orientations
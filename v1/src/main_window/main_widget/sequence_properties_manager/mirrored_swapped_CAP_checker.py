@@ -1,7 +1,6 @@
-from tkinter import HORIZONTAL
 from typing import TYPE_CHECKING
 from data.constants import BLUE_ATTRS, END_POS, RED_ATTRS, VERTICAL
-from data.positions_maps import mirrored_positions
+from data.positions_maps import mirrored_swapped_positions
 
 if TYPE_CHECKING:
     from main_window.main_widget.sequence_properties_manager.sequence_properties_manager import (
@@ -33,17 +32,9 @@ class MirroredSwappedCAPChecker:
         return True
 
     def _is_mirrored_and_swapped(self, first_entry, second_entry) -> bool:
-        mirrored_vertical = self._get_mirrored_and_swapped_position(
+        return second_entry[END_POS] == self._get_mirrored_and_swapped_position(
             first_entry[END_POS], VERTICAL
         )
-        mirrored_horizontal = self._get_mirrored_and_swapped_position(
-            first_entry[END_POS], HORIZONTAL
-        )
-
-        return second_entry[END_POS] in [
-            mirrored_vertical,
-            mirrored_horizontal,
-        ]
 
     def _is_swapped(self, first_entry, second_entry) -> bool:
         return (
@@ -52,4 +43,4 @@ class MirroredSwappedCAPChecker:
         )
 
     def _get_mirrored_and_swapped_position(self, position, direction):
-        return mirrored_positions[direction][position]
+        return mirrored_swapped_positions[direction][position]
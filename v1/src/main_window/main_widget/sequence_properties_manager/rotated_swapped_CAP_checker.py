@@ -29,7 +29,7 @@ class RotatedSwappedCAPChecker:
                     GAMMA1: GAMMA11,
                     GAMMA3: GAMMA13,
                     GAMMA5: GAMMA15,
-                    GAMMA7: GAMMA11,
+                    GAMMA7: GAMMA9,
                     GAMMA9: GAMMA7,
                     GAMMA11: GAMMA1,
                     GAMMA13: GAMMA3,
@@ -108,7 +108,10 @@ class RotatedSwappedCAPChecker:
         if repetitions == 2:
             return self._check_two_repetitions(sequence, beats_per_repetition)
         elif repetitions == 4:
-            return self._check_four_repetitions(sequence, beats_per_repetition)
+            # A word that repeats itself also reads as four repetitions
+            return self._check_four_repetitions(
+                sequence, beats_per_repetition
+            ) or self._check_two_repetitions(sequence, 2 * beats_per_repetition)
 
         return False
 
@@ -116,8 +119,8 @@ class RotatedSwappedCAPChecker:
         sequence = [entry for entry in sequence if "is_placeholder" not in entry]
         length = len(sequence)
 
-        # Extract the word pattern
-        word_pattern = "".join([entry[LETTER] for entry in sequence])
+        # Extract the word pattern, one item per beat so dash letters count once
+        word_pattern = [entry[LETTER] for entry in sequence]
         expected_word_pattern = word_pattern[
             : length // 4
         ]  # Expecting 4 repetitions of the pattern
@@ -1,3 +1,5 @@
+import logging
+import os
 from typing import TYPE_CHECKING, Optional
 
 from data.constants import DIAMOND, END_POS, GRID_MODE, LETTER
@@ -19,17 +21,39 @@ from .rotated_swapped_CAP_checker import (
     RotatedSwappedCAPChecker,
 )
 from .strict_rotated_CAP_checker import StrictRotatedCAPChecker
+from .sequence_properties_tracker import (
+    CAP_PROPERTIES,
+    SequencePropertiesTracker,
+    evaluate_cap_flags,
+)
+
+logger = logging.getLogger(__name__)
+
+# Set to 1 to cross-check incremental properties against a full recomputation
+ENV_VERIFY_SEQUENCE_PROPERTIES = "KINETIC_VERIFY_SEQUENCE_PROPERTIES"
 
 
 class SequencePropertiesManager:
-    def __init__(self, app_context: Optional["ApplicationContext"] = None):
+    def __init__(
+        self,
+        app_context: Optional["ApplicationContext"] = None,
+        verify: Optional[bool] = None,
+    ):
         """
         Initialize the SequencePropertiesManager with dependency injection.
 
         Args:
             app_context: Application context with dependencies. If None, uses legacy adapter.
+            verify: Recompute every property from scratch after each update and
+                report any difference from the incremental result. Defaults to
+                the KINETIC_VERIFY_SEQUENCE_PROPERTIES environment variable.
         """
         self.sequence: list[dict] = []
+        self.tracker = SequencePropertiesTracker()
+        if verify is None:
+            verify = os.environ.get(ENV_VERIFY_SEQUENCE_PROPERTIES) == "1"
+        self.verify = verify
+        self.verification_failures = 0
 
         # Set up dependencies
         if app_context:
@@ -72,7 +96,10 @@ class SequencePropertiesManager:
         }
 
     def instantiate_sequence(self, sequence):
-        self.sequence = sequence[1:]
+        # Duration placeholders carry no pictograph
+        self.sequence = [
+            entry for entry in sequence[1:] if not entry.get("is_placeholder", False)
+        ]
 
     def update_sequence_properties(self):
         if not self.json_manager:
@@ -97,65 +124,65 @@ class SequencePropertiesManager:
         if len(sequence) < 2:
             return ""
 
-        word = "".join(
-            entry.get(LETTER, "") for entry in sequence[2:] if LETTER in entry
-        )
-        return word
+        self.tracker.sync(sequence[1:])
+        return self.tracker.word
 
     def check_all_properties(self):
         if not self.sequence:
             return self._default_properties()
 
-        # Check basic properties
-        self.properties["ends_at_start_pos"] = self._check_ends_at_start_pos()
-        self.properties["can_be_CAP"] = self._check_can_be_CAP()
-
-        # Check for CAPs, starting with strict rotated
-        self.properties["is_strict_rotated_CAP"] = self.checkers[
-            "is_strict_rotated_CAP"
-        ].check()
-
-        if not self.properties["is_strict_rotated_CAP"]:
-            # Cascade checks if not rotated
-            for key in [
-                "is_strict_mirrored_CAP",
-                "is_strict_swapped_CAP",
-                "is_mirrored_swapped_CAP",
-                "is_rotated_swapped_CAP",
-            ]:
-                self.properties[key] = self.checkers[key].check()
-
-                # Stop further checks if a property is set to True
-                if self.properties[key]:
-                    break
-
-        return self._gather_properties()
-
-    def _gather_properties(self):
-        # Get current sequence for word calculation
-        current_sequence = None
-        if self.json_manager:
-            current_sequence = self.json_manager.loader_saver.load_current_sequence()
+        self.tracker.sync(self.sequence)
+        properties = self.tracker.properties()
+        if self.verify:
+            properties = self._verify_properties(properties)
 
-        # Get current user
-        current_user = ""
-        if self.settings_manager:
-            current_user = self.settings_manager.users.get_current_user()
+        self.properties["ends_at_start_pos"] = properties["is_circular"]
+        self.properties["can_be_CAP"] = properties["can_be_CAP"]
+        for key in CAP_PROPERTIES:
+            self.properties[key] = properties[key]
+
+        return self._gather_properties(properties)
 
+    def recalculate_properties(self) -> dict:
+        """Compute every property from scratch with the CAP checkers."""
         return {
-            "word": self.calculate_word(current_sequence),
-            "author": current_user,
+            "word": "".join(
+                entry[LETTER] for entry in self.sequence[1:] if LETTER in entry
+            ),
             "level": SequenceLevelEvaluator().get_sequence_difficulty_level(
                 self.sequence
             ),
-            "is_circular": self.properties["ends_at_start_pos"],
-            "can_be_CAP": self.properties["can_be_CAP"],
-            **{
-                key: self.properties[key]
-                for key in self.properties
-                if key.startswith("is_")
-            },
+            "is_circular": self._check_ends_at_start_pos(),
+            "can_be_CAP": self._check_can_be_CAP(),
+            **evaluate_cap_flags(
+                {key: self.checkers[key].check for key in CAP_PROPERTIES}
+            ),
+        }
+
+    def _verify_properties(self, properties: dict) -> dict:
+        expected = self.recalculate_properties()
+        if properties == expected:
+            return properties
+
+        self.verification_failures += 1
+        differences = {
+            key: (properties[key], expected[key])
+            for key in expected
+            if properties[key] != expected[key]
         }
+        logger.error(
+            f"Incremental sequence properties differ from a full recalculation "
+            f"(incremental, full): {differences}"
+        )
+        return expected
+
+    def _gather_properties(self, properties: dict):
+        # Get current user
+        current_user = ""
+        if self.settings_manager:
+            current_user = self.settings_manager.users.get_current_user()
+
+        return {"word": properties["word"], "author": current_user, **properties}
 
     def _default_properties(self):
         # Get current user safely
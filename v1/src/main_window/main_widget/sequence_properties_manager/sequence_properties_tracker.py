@@ -0,0 +1,347 @@
+import copy
+from typing import Callable, Mapping, Optional, Union
+
+from data.constants import (
+    BLUE_ATTRS,
+    END_ORI,
+    END_POS,
+    HORIZONTAL,
+    LETTER,
+    MOTION_TYPE,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+    START_ORI,
+    VERTICAL,
+)
+from data.positions_maps import (
+    half_position_map,
+    mirrored_positions,
+    mirrored_swapped_positions,
+)
+from main_window.main_widget.sequence_level_evaluator import SequenceLevelEvaluator
+
+from .rotated_swapped_CAP_checker import RotatedSwappedCAPChecker
+
+# Checked in this order; the first CAP that matches is the only one reported
+CAP_PROPERTIES = (
+    "is_strict_rotated_CAP",
+    "is_strict_mirrored_CAP",
+    "is_strict_swapped_CAP",
+    "is_mirrored_swapped_CAP",
+    "is_rotated_swapped_CAP",
+)
+
+CAPFlag = Union[bool, str]
+
+
+def evaluate_cap_flags(checks: Mapping[str, Callable[[], CAPFlag]]) -> dict:
+    """Run the CAP checks in order, stopping at the first that matches."""
+    flags = dict.fromkeys(CAP_PROPERTIES, False)
+    for key in CAP_PROPERTIES:
+        flags[key] = checks[key]()
+        if flags[key]:
+            break
+    return flags
+
+
+# A beat half a sequence on from a mirrored beat may be mirrored about either
+# axis. Mirroring about both is a half turn, which pairs positions up, so the
+# smaller of each pair names the pair and a membership test becomes a key.
+_MIRROR_CLASSES = {
+    position: min(position, mirrored_positions[HORIZONTAL][mirrored])
+    for position, mirrored in mirrored_positions[VERTICAL].items()
+}
+
+_ROTATION_MAPS = RotatedSwappedCAPChecker(None).rotation_maps
+
+# Hash streams, one key per beat each. A CAP holds when the target keys of one
+# part of the sequence equal the plain keys of another part.
+(
+    _ROTATED,
+    _ROTATED_TARGET,
+    _MIRRORED,
+    _MIRRORED_TARGET,
+    _SWAPPED,
+    _SWAPPED_TARGET,
+    _POSITION,
+    _MIRRORED_SWAPPED_TARGET,
+    _LETTER,
+    _ROTATED_SWAPPED_HALF_TARGET,
+    _ROTATED_SWAPPED_FOURTH_TARGET,
+    _ROTATED_SWAPPED_THIRD_TARGET,
+    _ROTATED_SWAPPED_SECOND_TARGET,
+) = range(13)
+_STREAM_COUNT = 13
+
+_MODULUS = (1 << 61) - 1
+_BASE = 1_000_003
+
+
+def _motion(attributes: dict) -> tuple:
+    return tuple(
+        sorted(
+            (key, value)
+            for key, value in attributes.items()
+            if key not in (START_ORI, END_ORI)
+        )
+    )
+
+
+def _beat_keys(beat: dict) -> tuple[int, ...]:
+    end_pos = beat.get(END_POS)
+    blue = beat.get(BLUE_ATTRS, {})
+    red = beat.get(RED_ATTRS, {})
+    rot_dirs = (
+        blue.get(MOTION_TYPE),
+        blue.get(PROP_ROT_DIR),
+        red.get(MOTION_TYPE),
+        red.get(PROP_ROT_DIR),
+    )
+    blue_motion = _motion(blue)
+    red_motion = _motion(red)
+    four_repetitions = _ROTATION_MAPS["4_repetitions"]
+    keys = (
+        (beat[LETTER], end_pos, rot_dirs),
+        (beat[LETTER], half_position_map.get(end_pos), rot_dirs),
+        _MIRROR_CLASSES.get(end_pos),
+        _MIRROR_CLASSES.get(mirrored_positions[VERTICAL].get(end_pos)),
+        (blue_motion, red_motion),
+        (red_motion, blue_motion),
+        end_pos,
+        mirrored_swapped_positions[VERTICAL].get(end_pos),
+        beat[LETTER],
+        _ROTATION_MAPS["2_repetitions"]["1st-2nd"].get(end_pos),
+        four_repetitions["1st-4th"].get(end_pos),
+        four_repetitions["1st-3rd"].get(end_pos),
+        four_repetitions["1st-2nd"].get(end_pos),
+    )
+    return tuple(hash(key) % _MODULUS for key in keys)
+
+
+class SequencePropertiesTracker:
+    """
+    Word, level and CAP flags of a sequence, kept up to date beat by beat.
+
+    Each beat is reduced once to its letter, its difficulty level and a set
+    of hashed keys. The level is a count of beats per level, and every CAP
+    check compares a transformed part of the sequence with another part
+    through prefix hashes of those keys, so append() costs O(1) and
+    replace() only rehashes the beats after the one replaced.
+
+    sync() brings the tracker in line with a whole sequence. It still
+    compares every incoming beat with the one it has seen, so it is O(n),
+    but only the beats that differ are copied, evaluated and hashed again.
+    The CAP checkers remain the reference; SequencePropertiesManager can
+    cross-check the two.
+    """
+
+    def __init__(self) -> None:
+        self._beats: list[dict] = []
+        self._letters: list[str] = []
+        self._levels: list[int] = []
+        self._keys: list[tuple[int, ...]] = []
+        self._level_counts = {1: 0, 2: 0, 3: 0}
+        self._prefixes = [[0] for _ in range(_STREAM_COUNT)]
+        self._powers = [1]
+        self._start_end_pos: Optional[str] = None
+        self._word: Optional[str] = None
+        self._level_evaluator = SequenceLevelEvaluator()
+        self.processed_beats = 0
+
+    def __len__(self) -> int:
+        return len(self._beats)
+
+    # Updates
+
+    def sync(self, sequence: list[dict]) -> None:
+        """
+        Track a sequence given as its start position followed by its beats.
+
+        Entries without a letter, such as duration placeholders, are skipped.
+        """
+        self._start_end_pos = sequence[0].get(END_POS) if sequence else None
+        beats = [entry for entry in sequence[1:] if LETTER in entry]
+        common = min(len(beats), len(self._beats))
+
+        first_changed = 0
+        while (
+            first_changed < common
+            and beats[first_changed] == self._beats[first_changed]
+        ):
+            first_changed += 1
+        if first_changed == len(beats) == len(self._beats):
+            return
+
+        for index in range(first_changed, common):
+            if beats[index] != self._beats[index]:
+                self._store(index, beats[index])
+        self._truncate(len(beats))
+        for index in range(common, len(beats)):
+            self._store(index, beats[index])
+        self._rehash_from(first_changed)
+
+    def append(self, beat: dict) -> None:
+        self._store(len(self._beats), beat)
+        self._rehash_from(len(self._beats) - 1)
+
+    def replace(self, index: int, beat: dict) -> None:
+        self._store(index, beat)
+        self._rehash_from(index)
+
+    def truncate(self, length: int) -> None:
+        self._truncate(length)
+        self._rehash_from(length)
+
+    def _store(self, index: int, beat: dict) -> None:
+        level = self._level_evaluator.get_beat_difficulty_level(beat)
+        record = (copy.deepcopy(beat), beat[LETTER], level, _beat_keys(beat))
+        if index == len(self._beats):
+            for column, value in zip(self._columns(), record):
+                column.append(value)
+        else:
+            self._level_counts[self._levels[index]] -= 1
+            for column, value in zip(self._columns(), record):
+                column[index] = value
+        self._level_counts[level] += 1
+        self._word = None
+        self.processed_beats += 1
+
+    def _truncate(self, length: int) -> None:
+        if length >= len(self._beats):
+            return
+        for level in self._levels[length:]:
+            self._level_counts[level] -= 1
+        for column in self._columns():
+            del column[length:]
+        self._word = None
+
+    def _columns(self) -> tuple[list, ...]:
+        return self._beats, self._letters, self._levels, self._keys
+
+    def _rehash_from(self, index: int) -> None:
+        for stream, prefix in enumerate(self._prefixes):
+            del prefix[index + 1 :]
+            value = prefix[-1]
+            for keys in self._keys[index:]:
+                value = (value * _BASE + keys[stream]) % _MODULUS
+                prefix.append(value)
+        while len(self._powers) <= len(self._keys):
+            self._powers.append(self._powers[-1] * _BASE % _MODULUS)
+
+    # Properties
+
+    @property
+    def word(self) -> str:
+        if self._word is None:
+            self._word = "".join(self._letters)
+        return self._word
+
+    @property
+    def level(self) -> Union[int, str]:
+        if len(self._beats) < 2:
+            return ""
+        for level in (3, 2):
+            if self._level_counts[level]:
+                return level
+        return 1
+
+    def ends_at_start_pos(self) -> bool:
+        return self._last_end_pos() == self._start_end_pos
+
+    def can_be_CAP(self) -> bool:
+        return self._last_end_pos().rstrip("0123456789") == (
+            self._start_end_pos.rstrip("0123456789")
+        )
+
+    def properties(self) -> dict:
+        return {
+            "word": self.word,
+            "level": self.level,
+            "is_circular": self.ends_at_start_pos(),
+            "can_be_CAP": self.can_be_CAP(),
+            **evaluate_cap_flags(
+                {
+                    "is_strict_rotated_CAP": self.is_strict_rotated_CAP,
+                    "is_strict_mirrored_CAP": self.is_strict_mirrored_CAP,
+                    "is_strict_swapped_CAP": self.is_strict_swapped_CAP,
+                    "is_mirrored_swapped_CAP": self.is_mirrored_swapped_CAP,
+                    "is_rotated_swapped_CAP": self.is_rotated_swapped_CAP,
+                }
+            ),
+        }
+
+    def is_strict_rotated_CAP(self) -> bool:
+        length = len(self._beats)
+        return (
+            length >= 2
+            and length % 2 == 0
+            and self._halves_match(_ROTATED_TARGET, _ROTATED)
+        )
+
+    def is_strict_mirrored_CAP(self) -> bool:
+        length = len(self._beats)
+        return (
+            length >= 4
+            and length % 2 == 0
+            and self._halves_match(_MIRRORED_TARGET, _MIRRORED)
+        )
+
+    def is_strict_swapped_CAP(self) -> bool:
+        return len(self._beats) % 2 == 0 and self._halves_match(
+            _SWAPPED_TARGET, _SWAPPED
+        )
+
+    def is_mirrored_swapped_CAP(self) -> bool:
+        length = len(self._beats)
+        return (
+            length >= 4
+            and length % 2 == 0
+            and self._halves_match(_MIRRORED_SWAPPED_TARGET, _POSITION)
+        )
+
+    def is_rotated_swapped_CAP(self) -> CAPFlag:
+        # Mirrors RotatedSwappedCAPChecker: the word must repeat four or two
+        # times, and the first repetition is compared with the later ones
+        length = len(self._beats)
+        quarter = length // 4
+        if quarter and length % 4 == 0 and self._has_period(quarter):
+            for target, repetition, match in (
+                (_ROTATED_SWAPPED_FOURTH_TARGET, 3, "First-Fourth Match"),
+                (_ROTATED_SWAPPED_THIRD_TARGET, 2, "First-Third Match"),
+                (_ROTATED_SWAPPED_SECOND_TARGET, 1, "First-Second Match"),
+            ):
+                if self._matches(target, _POSITION, repetition * quarter, quarter):
+                    return match
+        elif not (length and length % 2 == 0 and self._has_period(length // 2)):
+            return False
+
+        if self._halves_match(_ROTATED_SWAPPED_HALF_TARGET, _POSITION):
+            return "First-Second Match"
+        return False
+
+    # Prefix hashes
+
+    def _last_end_pos(self) -> Optional[str]:
+        if self._beats:
+            return self._beats[-1].get(END_POS)
+        return self._start_end_pos
+
+    def _segment(self, stream: int, start: int, end: int) -> int:
+        prefix = self._prefixes[stream]
+        return (prefix[end] - prefix[start] * self._powers[end - start]) % _MODULUS
+
+    def _matches(self, target: int, stream: int, offset: int, length: int) -> bool:
+        """Whether the first length beats, as targets, equal the beats at offset."""
+        return self._segment(target, 0, length) == self._segment(
+            stream, offset, offset + length
+        )
+
+    def _halves_match(self, target: int, stream: int) -> bool:
+        half = len(self._beats) // 2
+        return self._matches(target, stream, half, half)
+
+    def _has_period(self, period: int) -> bool:
+        length = len(self._beats)
+        return self._segment(_LETTER, period, length) == self._segment(
+            _LETTER, 0, length - period
+        )
@@ -1,6 +1,5 @@
-from tkinter import HORIZONTAL
 from typing import TYPE_CHECKING
-from data.constants import END_POS, VERTICAL
+from data.constants import END_POS, HORIZONTAL, VERTICAL
 from data.positions_maps import mirrored_positions
 
 if TYPE_CHECKING:
@@ -27,7 +26,7 @@ class StrictMirroredCAPChecker:
 
         for i in range(half_length):
             first_entry = first_half[i]
-            second_entry = second_half[half_length - i - 2]
+            second_entry = second_half[i]
 
             if not self._is_mirrored(first_entry, second_entry):
                 return False
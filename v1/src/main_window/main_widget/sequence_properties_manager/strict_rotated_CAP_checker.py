@@ -1,6 +1,14 @@
 from typing import TYPE_CHECKING
 
-from data.constants import BLUE_ATTRS, RED_ATTRS, LETTER, MOTION_TYPE, PROP_ROT_DIR
+from data.constants import (
+    BLUE_ATTRS,
+    END_POS,
+    LETTER,
+    MOTION_TYPE,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+)
+from data.positions_maps import half_position_map
 
 
 if TYPE_CHECKING:
@@ -12,22 +20,23 @@ class StrictRotatedCAPChecker:
         self.manager = manager
 
     def check(self) -> bool:
-        sequence = self.manager.sequence
-        letter_sequence = [entry[LETTER] for entry in sequence[1:] if LETTER in entry]
-        unique_letters = set(letter_sequence)
-        for letter in unique_letters:
-            occurrences = [i for i, x in enumerate(letter_sequence) if x == letter]
-            if len(occurrences) > 1:
-                for i in range(1, len(occurrences)):
-                    prev = sequence[occurrences[i - 1]]
-                    curr = sequence[occurrences[i]]
-                    if not self._is_strict_rotated_CAP(prev, curr):
-                        return False
+        # Halved and quartered rotations both repeat the first half turned 180°
+        beats = [entry for entry in self.manager.sequence[1:] if LETTER in entry]
+        length = len(beats)
+        if length < 2 or length % 2 != 0:
+            return False
+
+        half_length = length // 2
+        for i in range(half_length):
+            if not self._is_strict_rotated_CAP(beats[i], beats[i + half_length]):
+                return False
         return True
 
     def _is_strict_rotated_CAP(self, prev, curr) -> bool:
         return (
-            prev[BLUE_ATTRS][MOTION_TYPE] == curr[BLUE_ATTRS][MOTION_TYPE]
+            prev[LETTER] == curr[LETTER]
+            and half_position_map.get(prev[END_POS]) == curr[END_POS]
+            and prev[BLUE_ATTRS][MOTION_TYPE] == curr[BLUE_ATTRS][MOTION_TYPE]
             and prev[BLUE_ATTRS][PROP_ROT_DIR] == curr[BLUE_ATTRS][PROP_ROT_DIR]
             and prev[RED_ATTRS][MOTION_TYPE] == curr[RED_ATTRS][MOTION_TYPE]
             and prev[RED_ATTRS][PROP_ROT_DIR] == curr[RED_ATTRS][PROP_ROT_DIR]
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from data.constants import BLUE_ATTRS, RED_ATTRS
+from data.constants import BLUE_ATTRS, END_ORI, RED_ATTRS, START_ORI
 
 
 if TYPE_CHECKING:
@@ -33,8 +33,17 @@ class StrictSwappedCAPChecker:
         return True
 
     def _is_swapped(self, first_entry, second_entry) -> bool:
-        # strict checks if the roles are swapped without any mirroring
-        return (
-            first_entry[BLUE_ATTRS] == second_entry[RED_ATTRS]
-            and first_entry[RED_ATTRS] == second_entry[BLUE_ATTRS]
+        # strict checks if the roles are swapped without any mirroring.
+        # Orientations carry over from the beat before, so they can differ.
+        return self._motion(first_entry[BLUE_ATTRS]) == self._motion(
+            second_entry[RED_ATTRS]
+        ) and self._motion(first_entry[RED_ATTRS]) == self._motion(
+            second_entry[BLUE_ATTRS]
         )
+
+    def _motion(self, attributes: dict) -> dict:
+        return {
+            key: value
+            for key, value in attributes.items()
+            if key not in (START_ORI, END_ORI)
+        }
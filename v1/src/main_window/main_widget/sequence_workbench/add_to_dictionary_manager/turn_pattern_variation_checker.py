@@ -1,8 +1,10 @@
-import json
 import os
-from PIL import Image
 
 from data.constants import BLUE_ATTRS, RED_ATTRS, TURNS, START_ORI, END_ORI
+from main_window.main_widget.png_metadata_reader import (
+    iter_image_metadata,
+    read_image_metadata,
+)
 from utils.path_helpers import get_data_path
 
 
@@ -11,25 +13,31 @@ class TurnPatternVariationChecker:
         self.directory = get_data_path("dictionary")
 
     def check_for_turn_pattern_variation(self, sequence):
-        # Iterate recursively through all files in the directory and subdirectories
-        for root, dirs, files in os.walk(self.directory):
-            for file_name in files:
-                if file_name.lower().endswith((".png", ".jpg", ".jpeg")):
-                    file_path = os.path.join(root, file_name)
-                    if self.are_turns_patterns_identical(sequence, file_path):
-                        return True
+        # Collect all images in the directory and subdirectories
+        image_paths = [
+            os.path.join(root, file_name)
+            for root, dirs, files in os.walk(self.directory)
+            for file_name in files
+            if file_name.lower().endswith((".png", ".jpg", ".jpeg"))
+        ]
+        # Read their metadata in parallel and stop at the first match
+        results = iter_image_metadata(image_paths)
+        try:
+            for result in results:
+                if result.error is not None:
+                    raise result.error
+                if result.metadata and self.compare_turns_patterns(
+                    sequence, result.metadata
+                ):
+                    return True
+        finally:
+            results.close()
         return False
 
     def are_turns_patterns_identical(self, seq1, image_path):
-        try:
-            with Image.open(image_path) as img:
-                metadata = img.info.get("metadata")
-                if metadata:
-                    seq2 = json.loads(metadata)
-                    return self.compare_turns_patterns(seq1, seq2)
-        except IOError as e:
-            # raise an error
-            raise e
+        seq2 = read_image_metadata(image_path)
+        if seq2:
+            return self.compare_turns_patterns(seq1, seq2)
         return False
 
     def compare_turns_patterns(self, seq1, seq2):
@@ -6,6 +6,7 @@ from .prop_rot_dir_button_manager.prop_rot_dir_button_manager import (
 from .turns_box_header import TurnsBoxHeader
 from .turns_widget.turns_widget import TurnsWidget
 from PyQt6.QtWidgets import QFrame, QVBoxLayout
+from utils.layout_scheduler import record_stylesheet_rebuild
 
 if TYPE_CHECKING:
     from ..beat_adjustment_panel import BeatAdjustmentPanel
@@ -31,6 +32,7 @@ class TurnsBox(QFrame):
             COUNTER_CLOCKWISE: False,
         }
         self.setObjectName(self.__class__.__name__)
+        self._styled_border_width = None
 
         self._setup_widgets()
         self._setup_layout()
@@ -49,6 +51,14 @@ class TurnsBox(QFrame):
 
     def resizeEvent(self, event):
         border_width = self.graph_editor.sequence_workbench.width() // 200
+        if border_width != self._styled_border_width:
+            self._styled_border_width = border_width
+            self._apply_border_style(border_width)
+        self.turns_widget.resizeEvent(event)
+        self.header.resizeEvent(event)
+        super().resizeEvent(event)
+
+    def _apply_border_style(self, border_width: int) -> None:
         # Convert named colors to hex
         color_hex = (
             HEX_RED
@@ -70,6 +80,4 @@ class TurnsBox(QFrame):
             f"#{self.__class__.__name__} {{ border: {border_width}px solid "
             f"{color_hex}; background-color: {whitened_color};}}"
         )
-        self.turns_widget.resizeEvent(event)
-        self.header.resizeEvent(event)
-        super().resizeEvent(event)
+        record_stylesheet_rebuild()
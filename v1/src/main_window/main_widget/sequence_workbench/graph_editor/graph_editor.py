@@ -7,6 +7,7 @@ from PyQt6.QtWidgets import (
     QStackedLayout,
 )
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QResizeEvent
 
 from main_window.main_widget.sequence_workbench.graph_editor.graph_editor_animator import (
     GraphEditorAnimator,
@@ -14,6 +15,9 @@ from main_window.main_widget.sequence_workbench.graph_editor.graph_editor_animat
 from main_window.main_widget.sequence_workbench.graph_editor.graph_editor_toggle_tab import (
     GraphEditorToggleTab,
 )
+from main_window.main_widget.sequence_workbench.workbench_layout import (
+    graph_editor_size,
+)
 from settings_manager.settings_manager import pyqtSignal
 
 from .arrow_selection_manager import ArrowSelectionManager
@@ -58,20 +62,24 @@ class GraphEditor(QFrame):
         self.animator = GraphEditorAnimator(self)
 
     def get_graph_editor_height(self):
-        return min(int(self.main_widget.height() // 3.5), self.width() // 4)
+        return graph_editor_size(self.main_widget)[1]
 
     def resizeEvent(self, event) -> None:
-        self.graph_editor_height = self.get_graph_editor_height()
-        width = self.main_widget.left_stack.width()
-        self.setFixedSize(width, self.graph_editor_height)
+        super().resizeEvent(event)
+        self.toggle_tab.reposition_toggle_tab()
+
+    def apply_layout(self, width: int, height: int) -> None:
+        """Size the editor and its panels; called by the workbench layout pass."""
+        self.graph_editor_height = height
+        self.setFixedSize(width, height)
         self.raise_()
+        event = QResizeEvent(self.size(), self.size())
         self.pictograph_container.GE_view.resizeEvent(event)
         for turns_box in self.adjustment_panel.turns_boxes:
             turns_box.resizeEvent(event)
         for ori_picker_box in self.adjustment_panel.ori_picker_boxes:
             ori_picker_box.resizeEvent(event)
         self.position_graph_editor()
-        super().resizeEvent(event)
         self.toggle_tab.reposition_toggle_tab()
 
     def update_graph_editor(self) -> None:
@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import QApplication
 from main_window.main_widget.turns_tuple_generator.turns_tuple_generator import (
     TurnsTupleGenerator,
 )
+from src.settings_manager.global_settings.app_context import AppContext
 
 
 if TYPE_CHECKING:
@@ -35,14 +36,19 @@ class ArrowMovementManager:
 
         adjustment = self.get_adjustment(key, adjustment_increment)
         turns_tuple = TurnsTupleGenerator().generate_turns_tuple(self.ge_pictograph)
-        self.data_updater.update_arrow_adjustments_in_json(adjustment, turns_tuple)
-        self.data_updater.mirrored_entry_manager.update_mirrored_entry_in_json()
+        with AppContext.special_placement_loader().track_changes() as changed:
+            self.data_updater.update_arrow_adjustments_in_json(adjustment, turns_tuple)
+            self.data_updater.mirrored_entry_manager.update_mirrored_entry_in_json()
+
+        # Only pictographs showing an edited letter in the edited grid mode move
+        affected = {(grid_mode, letter) for grid_mode, _, letter in changed}
         for (
             pictograph
         ) in (
             self.ge_pictograph.main_widget.pictograph_collector.collect_all_pictographs()
         ):
-            if pictograph.state.letter == self.ge_pictograph.state.letter:
+            letter = pictograph.state.letter
+            if letter and (pictograph.state.grid_mode, letter.value) in affected:
                 pictograph.managers.updater.placement_updater.update()
 
         QApplication.processEvents()
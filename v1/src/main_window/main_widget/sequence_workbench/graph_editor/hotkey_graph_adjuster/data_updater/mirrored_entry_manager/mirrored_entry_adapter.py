@@ -38,8 +38,6 @@ class MirroredEntryAdapter:
                 self._create_new_entry(selected_arrow)
             else:
                 self._update_existing_entry(selected_arrow)
-
-            AppContext.special_placement_loader().reload()
         except Exception as e:
             logger.error(
                 f"Failed to update mirrored entry in JSON: {str(e)}", exc_info=True
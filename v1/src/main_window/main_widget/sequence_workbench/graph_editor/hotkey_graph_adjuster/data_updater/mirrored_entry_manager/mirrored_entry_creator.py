@@ -70,12 +70,10 @@ class MirroredEntryCreator:
     def _fetch_letter_data_and_original_turn_data(
         self, ori_key, letter: Letter, arrow: Arrow
     ) -> tuple[dict, dict]:
-        letter_data: dict = (
-            AppContext.special_placement_loader()
-            .load_special_placements_fresh()
-            .get(self.special_placement_data_updater.getter.grid_mode(), {})
-            .get(ori_key, {})
-            .get(letter.value, {})
+        letter_data: dict = AppContext.special_placement_loader().get_letter_data(
+            self.special_placement_data_updater.getter.grid_mode(),
+            ori_key,
+            letter.value,
         )
         original_turns_tuple = self.turns_tuple_generator.generate_turns_tuple(
             arrow.pictograph
@@ -85,7 +83,6 @@ class MirroredEntryCreator:
     def _get_keys_for_mixed_start_ori(
         self, letter: Letter, ori_key
     ) -> tuple[str, dict]:
-        AppContext.special_placement_loader().reload()
         other_ori_key = self.special_placement_data_updater.get_other_layer3_ori_key(
             ori_key
         )
@@ -15,7 +15,6 @@ class MirroredEntryDataPrep:
 
     def is_new_entry_needed(self, arrow: Arrow) -> bool:
         """Determines if a new mirrored entry is needed for the given arrow."""
-        AppContext.special_placement_loader().reload()
         ori_key = self._get_ori_key(arrow.motion)
         return (
             arrow.pictograph.state.letter
@@ -50,7 +50,6 @@ class MirroredEntryFactory:
             data_updater = arrow.pictograph.managers.arrow_placement_manager.data_updater
             service = MirroredEntryFactory.create_service(data_updater)
             service.update_mirrored_entry(arrow)
-            AppContext.special_placement_loader().reload()
             return True
         except Exception as e:
             logger.error(f"Failed to update mirrored entry: {str(e)}", exc_info=True)
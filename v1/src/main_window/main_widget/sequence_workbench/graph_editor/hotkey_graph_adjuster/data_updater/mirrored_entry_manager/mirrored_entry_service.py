@@ -57,8 +57,6 @@ class MirroredEntryService:
                     arrow, letter, ori_key, letter_data
                 )
 
-            AppContext.special_placement_loader().reload()
-
         except Exception as e:
             logger.error(f"Failed to update mirrored entry: {str(e)}", exc_info=True)
             raise
@@ -29,8 +29,6 @@ class MirroredEntryUtils:
             True if a new mirrored entry is needed, False otherwise
         """
         try:
-            AppContext.special_placement_loader().reload()
-            
             # Get the orientation key
             data_updater = arrow.pictograph.managers.arrow_placement_manager.data_updater
             ori_key = data_updater.ori_key_generator.generate_ori_key_from_motion(arrow.motion)
@@ -134,10 +132,6 @@ class MirroredEntryUtils:
         Returns:
             The letter data
         """
-        return (
-            AppContext.special_placement_loader()
-            .load_or_return_special_placements()
-            .get(grid_mode, {})
-            .get(ori_key, {})
-            .get(letter.value, {})
+        return AppContext.special_placement_loader().get_letter_data(
+            grid_mode, ori_key, letter.value
         )
@@ -1,9 +1,7 @@
-import os
 import logging
 from typing import TYPE_CHECKING
 
 from enums.letter.letter import Letter
-from utils.path_helpers import get_data_path
 
 from .mirrored_entry_manager.mirrored_entry_manager import MirroredEntryManager
 from .ori_key_generator import OriKeyGenerator
@@ -58,16 +56,10 @@ class SpecialPlacementDataUpdater:
         self.mirrored_entry_manager = MirroredEntryManager(self)
 
     def _get_letter_data(self, letter: Letter, ori_key: str) -> dict:
-        letter_data = (
-            AppContext.special_placement_loader()
-            .load_special_placements_fresh()
-            .get(self.state.grid_mode, {})
-            .get(ori_key, {})
-            .get(letter.value, {})
+        return AppContext.special_placement_loader().get_letter_data(
+            self.state.grid_mode, ori_key, letter.value
         )
 
-        return letter_data
-
     def _update_or_create_turn_data(
         self,
         letter_data: dict,
@@ -94,24 +86,12 @@ class SpecialPlacementDataUpdater:
     def _update_placement_json_data(
         self, letter: Letter, letter_data: dict, ori_key: str, grid_mode: str
     ) -> None:
-        # Time to get surgical with our JSON updates! 🔪
-        file_path = get_data_path(
-            os.path.join(
-                "arrow_placement",
-                grid_mode,
-                "special",
-                ori_key,
-                f"{letter.value}_placements.json",
-            )
+        # Updated in memory; the loader writes the letter's JSON file once
+        # the edits stop coming in
+        AppContext.special_placement_loader().update_letter_data(
+            grid_mode, ori_key, letter.value, letter_data
         )
 
-        placement_data = (
-            AppContext.special_placement_loader().load_json_data(file_path) or {}
-        )
-
-        placement_data[letter.value] = letter_data
-        AppContext.special_placement_saver().save_json_data(placement_data, file_path)
-
     def update_arrow_adjustments_in_json(
         self, adjustment: tuple[int, int] | QPoint, turns_tuple: str
     ) -> None:
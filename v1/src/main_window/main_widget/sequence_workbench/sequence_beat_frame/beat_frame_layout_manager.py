@@ -104,6 +104,8 @@ class BeatFrameLayoutManager:
         selected_beat = self.selection_manager.selected_beat
         if selected_beat:
             self.selection_manager.update_overlay_position()
+        # The column count changed, so the beat size needs recomputing
+        self.beat_frame.sequence_workbench.workbench_layout.schedule()
 
     def adjust_layout_to_sequence_length(self):
         last_filled_index = self.beat_frame.get.next_available_beat()
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from PyQt6.QtWidgets import QWidget  # Import QWidget
 from utils.ui_utils import ensure_positive_size
 
@@ -20,11 +20,19 @@ class BeatFrameResizer:
 
     def resize_beat_frame(self) -> None:
         width, height = self.calculate_dimensions()
-        beat_size = self.calculate_beat_size(width, height)
+        self.apply_beat_size(self.calculate_beat_size(width, height))
+
+    def apply_beat_size(self, beat_size: int) -> None:
         self.resize_beats(beat_size)
         self.update_views(beat_size)
 
-    def calculate_dimensions(self) -> tuple[int, int]:
+    def calculate_dimensions(
+        self, graph_editor_height: Optional[int] = None
+    ) -> tuple[int, int]:
+        if graph_editor_height is None:
+            graph_editor_height = (
+                self.sequence_workbench.graph_editor.get_graph_editor_height()
+            )
         scrollbar_width = self.scroll_area.verticalScrollBar().width()
 
         available_width = (
@@ -33,10 +41,7 @@ class BeatFrameResizer:
             - scrollbar_width
         )
         width = int(available_width * 0.8)
-        available_height = (
-            self.sequence_workbench.height()
-            - self.sequence_workbench.graph_editor.get_graph_editor_height() * 0.8
-        )
+        available_height = self.sequence_workbench.height() - graph_editor_height * 0.8
 
         return width, available_height
 
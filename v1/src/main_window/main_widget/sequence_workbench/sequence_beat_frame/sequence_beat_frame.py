@@ -82,7 +82,7 @@ class SequenceBeatFrame(BaseBeatFrame):
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        self.resizer.resize_beat_frame()
+        self.sequence_workbench.workbench_layout.schedule()
 
     def emit_update_image_export_preview(self):
         """Emit the sequenceUpdated signal to notify other components."""
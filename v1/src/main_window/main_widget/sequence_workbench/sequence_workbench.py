@@ -36,6 +36,7 @@ from .labels.current_word_label import CurrentWordLabel
 from .graph_editor.graph_editor import GraphEditor
 from .sequence_workbench_button_panel import SequenceWorkbenchButtonPanel
 from .sequence_workbench_scroll_area import SequenceWorkbenchScrollArea
+from .workbench_layout import WorkbenchLayout
 
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
@@ -53,6 +54,8 @@ class SequenceWorkbench(QWidget):
         self.main_widget = main_widget
         self.main_widget.splash_screen.updater.update_progress("SequenceWorkbench")
         self.setObjectName("SequenceWorkbench")
+        # Sections schedule a shared layout pass from their resizeEvents
+        self.workbench_layout = WorkbenchLayout(self)
 
         # Initialize UI components
         self.scroll_area = SequenceWorkbenchScrollArea(self)
@@ -85,7 +88,8 @@ class SequenceWorkbench(QWidget):
         # Layout
         self.layout_manager = SequenceWorkbenchLayoutManager(self)
         self.beat_deleter = BeatDeleter(self)
+        self.workbench_layout.activate()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self.graph_editor.resizeEvent(event)
+        self.workbench_layout.schedule()
@@ -242,10 +242,10 @@ class SequenceWorkbenchButtonPanel(QFrame):
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
-        self.resize_button_panel()
+        self.sequence_workbench.workbench_layout.schedule()
 
-    def resize_button_panel(self):
-        button_size = self.sequence_workbench.main_widget.height() // 20
+    def apply_layout(self, button_size: int, spacing: int, spacer_size: int) -> None:
+        """Size the buttons and spacers; called by the workbench layout pass."""
         # Resize all buttons
         for button_name, button in self.buttons.items():
             # Special handling for emoji button text size during resize
@@ -260,11 +260,8 @@ class SequenceWorkbenchButtonPanel(QFrame):
             # Update size for all buttons
             button.update_size(button_size)
 
-        self.layout.setSpacing(
-            self.sequence_workbench.beat_frame.main_widget.height() // 120
-        )
+        self.layout.setSpacing(spacing)
 
-        spacer_size = self.sequence_workbench.beat_frame.main_widget.height() // 20
         # Update all tracked spacers
         if hasattr(self, "spacers"):  # Check if spacers list exists
             for spacer in self.spacers:
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from utils.layout_scheduler import LayoutScheduler
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+
+    from .sequence_workbench import SequenceWorkbench
+
+
+def graph_editor_size(main_widget: "MainWidget") -> tuple[int, int]:
+    """Width and height of the graph editor, which spans the left stack."""
+    width = main_widget.left_stack.width()
+    return width, min(int(main_widget.height() // 3.5), width // 4)
+
+
+@dataclass(frozen=True)
+class WorkbenchDimensions:
+    workbench_width: int
+    workbench_height: int
+    beat_size: int
+    button_size: int
+    button_spacing: int
+    spacer_size: int
+    graph_editor_width: int
+    graph_editor_height: int
+
+
+class WorkbenchLayout:
+    """
+    Sizes the beat frame, button panel and graph editor in one pass.
+
+    Resizing the window used to cascade through each section's resizeEvent,
+    with every section recomputing its size from the others. Sections now
+    call schedule() from their resizeEvent; the scheduler runs one pass per
+    event-loop tick, which computes every dimension from the main widget and
+    the beat frame layout and pushes them down, skipping sections whose
+    dimensions did not change.
+    """
+
+    def __init__(self, sequence_workbench: "SequenceWorkbench") -> None:
+        self.sequence_workbench = sequence_workbench
+        self.scheduler = LayoutScheduler(
+            self.compute_dimensions, self.apply, parent=sequence_workbench
+        )
+        self.dimensions: Optional[WorkbenchDimensions] = None
+        # Sections resize while the workbench is still being built; passes
+        # only start once every section exists
+        self.active = False
+
+    def activate(self) -> None:
+        self.active = True
+        self.invalidate()
+
+    def schedule(self) -> None:
+        if self.active:
+            self.scheduler.schedule()
+
+    def invalidate(self) -> None:
+        """Push every dimension on the next pass, changed or not."""
+        self.dimensions = None
+        if self.active:
+            self.scheduler.invalidate()
+
+    def compute_dimensions(self) -> WorkbenchDimensions:
+        workbench = self.sequence_workbench
+        main_widget = workbench.main_widget
+        main_height = main_widget.height()
+
+        graph_editor_width, graph_editor_height = graph_editor_size(main_widget)
+
+        resizer = workbench.beat_frame.resizer
+        width, height = resizer.calculate_dimensions(graph_editor_height)
+
+        return WorkbenchDimensions(
+            workbench_width=workbench.width(),
+            workbench_height=workbench.height(),
+            beat_size=resizer.calculate_beat_size(width, height),
+            button_size=main_height // 20,
+            button_spacing=main_height // 120,
+            spacer_size=main_height // 20,
+            graph_editor_width=graph_editor_width,
+            graph_editor_height=graph_editor_height,
+        )
+
+    def apply(self, dimensions: WorkbenchDimensions) -> None:
+        previous, self.dimensions = self.dimensions, dimensions
+        workbench = self.sequence_workbench
+
+        def changed(*names: str) -> bool:
+            return previous is None or any(
+                getattr(previous, name) != getattr(dimensions, name) for name in names
+            )
+
+        if changed(
+            "workbench_width",
+            "workbench_height",
+            "graph_editor_width",
+            "graph_editor_height",
+        ):
+            workbench.graph_editor.apply_layout(
+                dimensions.graph_editor_width, dimensions.graph_editor_height
+            )
+        if changed("button_size", "button_spacing", "spacer_size"):
+            workbench.button_panel.apply_layout(
+                dimensions.button_size,
+                dimensions.button_spacing,
+                dimensions.spacer_size,
+            )
+        if changed("beat_size"):
+            workbench.beat_frame.resizer.apply_beat_size(dimensions.beat_size)
@@ -59,6 +59,9 @@ class SettingsStateManager(QObject):
                     "global/background_type": global_settings.get_background_type(),
                     "global/grow_sequence": global_settings.get_grow_sequence(),
                     "global/enable_fades": global_settings.get_enable_fades(),
+                    "global/animate_background": (
+                        global_settings.get_animate_background()
+                    ),
                 }
             )
 
@@ -233,6 +236,7 @@ class SettingsStateManager(QObject):
             "background_type": global_settings.set_background_type,
             "grow_sequence": global_settings.set_grow_sequence,
             "enable_fades": global_settings.set_enable_fades,
+            "animate_background": global_settings.set_animate_background,
         }
 
         if setting_name in setting_map:
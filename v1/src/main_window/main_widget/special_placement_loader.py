@@ -5,6 +5,11 @@ from typing import TYPE_CHECKING, Any
 from data.constants import BOX, DIAMOND
 from utils.path_helpers import get_data_path
 
+from main_window.main_widget.special_placement_store import (
+    ChangeListener,
+    SpecialPlacementStore,
+)
+
 
 class SpecialPlacementLoader:
     """Loads special placements for the arrow placement manager."""
@@ -18,9 +23,17 @@ class SpecialPlacementLoader:
     SUPPORTED_MODES = [DIAMOND, BOX]
 
     def __init__(self) -> None:
-        self.special_placements: dict[str, dict[str, dict]] = {}
+        self.store = SpecialPlacementStore(
+            get_data_path("arrow_placement"), self.SUPPORTED_MODES, self.SUBFOLDERS
+        )
+
+    @property
+    def special_placements(self) -> dict[str, dict[str, dict]]:
+        return self.store.placements()
 
     def load_json_data(self, file_path) -> dict[str, dict[dict[str, Any]]]:
+        # Edits still waiting for write-back must land before the file is read
+        self.store.flush_path(file_path)
         try:
             if os.path.exists(file_path):
                 with open(file_path, "r", encoding="utf-8") as file:
@@ -31,31 +44,27 @@ class SpecialPlacementLoader:
             return {}
 
     def load_or_return_special_placements(self) -> dict[str, dict[str, dict]]:
-        if self.special_placements:
-            return self.special_placements
-        else:
-            return self.load_special_placements_fresh()
+        return self.store.placements()
 
     def load_special_placements_fresh(self):
-        for mode in self.SUPPORTED_MODES:
-            self.special_placements[mode] = self._load_mode_subfolders(mode)
-        return self.special_placements
+        """Re-read every placements file; edits are served from memory without this."""
+        self.store.invalidate()
+        return self.store.placements()
 
     def reload(self) -> None:
-        """Manually clear the cache so that special placements are reloaded on next call."""
-        self.special_placements = {}
-
-    def _load_mode_subfolders(self, mode: str) -> dict[str, dict]:
-        mode_data: dict[str, dict] = {}
-        for subfolder in self.SUBFOLDERS:
-            mode_data[subfolder] = {}
-            directory = get_data_path(f"arrow_placement/{mode}/special/{subfolder}")
-            if not os.path.isdir(directory):
-                continue
-            for file_name in os.listdir(directory):
-                if file_name.endswith("_placements.json"):
-                    path = os.path.join(directory, file_name)
-                    with open(path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        mode_data[subfolder].update(data)
-        return mode_data
+        """Re-read special placements on next call, after a direct file write."""
+        self.store.invalidate()
+
+    def get_letter_data(self, grid_mode: str, ori_key: str, letter: str) -> dict:
+        return self.store.letter_data(grid_mode, ori_key, letter)
+
+    def update_letter_data(
+        self, grid_mode: str, ori_key: str, letter: str, letter_data: dict
+    ) -> None:
+        self.store.set_letter_data(grid_mode, ori_key, letter, letter_data)
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        self.store.add_listener(listener)
+
+    def track_changes(self):
+        return self.store.track_changes()
@@ -0,0 +1,224 @@
+import atexit
+import copy
+import json
+import logging
+import os
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from main_window.main_widget.json_manager.special_placement_saver import (
+    SpecialPlacementSaver,
+)
+
+logger = logging.getLogger(__name__)
+
+# (grid_mode, ori_key, letter) of a letter whose placements changed
+ChangeListener = Callable[[str, str, str], None]
+
+
+class SpecialPlacementStore:
+    """
+    Authoritative in-memory tree of the special placement JSON files.
+
+    The tree is {grid_mode: {ori_key: {letter: letter_data}}}, read from
+    arrow_placement/<grid_mode>/special/<ori_key>/<letter>_placements.json
+    once. Edits replace one letter in memory, notify listeners and schedule a
+    debounced write-behind of only that letter's file, written atomically
+    (temp file + rename). Holding a nudge key in the graph editor therefore
+    touches memory on every step and the disk once it is released.
+
+    Reloading refills the same dict in place, so callers holding a reference
+    to the tree keep seeing current data.
+    """
+
+    DEFAULT_DEBOUNCE_SECONDS = 0.5
+
+    # Weak, so stores that are dropped are not flushed at exit or kept alive;
+    # a store with a write scheduled is held by its timer until it fires
+    _stores: "weakref.WeakSet[SpecialPlacementStore]" = weakref.WeakSet()
+    _stores_lock = threading.Lock()
+
+    def __init__(
+        self,
+        root_dir: str,
+        modes: list[str],
+        subfolders: list[str],
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        saver: Optional[SpecialPlacementSaver] = None,
+    ) -> None:
+        self.root_dir = root_dir
+        self.modes = modes
+        self.subfolders = subfolders
+        self.debounce_seconds = debounce_seconds
+        self.saver = saver or SpecialPlacementSaver()
+
+        self._placements: dict[str, dict[str, dict]] = {}
+        self._loaded = False
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        # file path -> (letter, snapshot of its data) awaiting write-back
+        self._pending: dict[str, tuple[str, dict]] = {}
+        self._listeners: list[ChangeListener] = []
+        self.load_count = 0
+        self.write_count = 0
+
+        with self._stores_lock:
+            self._stores.add(self)
+
+    @classmethod
+    def flush_all(cls) -> None:
+        with cls._stores_lock:
+            stores = list(cls._stores)
+        for store in stores:
+            store.flush()
+
+    # Reads
+
+    def placements(self) -> dict[str, dict[str, dict]]:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            return self._placements
+
+    def letter_data(self, grid_mode: str, ori_key: str, letter: str) -> dict:
+        """A copy of a letter's data to edit and pass to set_letter_data()."""
+        with self._lock:
+            letter_data = (
+                self.placements().get(grid_mode, {}).get(ori_key, {}).get(letter, {})
+            )
+            return copy.deepcopy(letter_data)
+
+    def file_path(self, grid_mode: str, ori_key: str, letter: str) -> str:
+        return os.path.join(
+            self.root_dir, grid_mode, "special", ori_key, f"{letter}_placements.json"
+        )
+
+    # Writes
+
+    def set_letter_data(
+        self, grid_mode: str, ori_key: str, letter: str, letter_data: dict
+    ) -> None:
+        """Replace a letter's data and schedule writing its file."""
+        with self._lock:
+            placements = self.placements()
+            placements.setdefault(grid_mode, {}).setdefault(ori_key, {})[
+                letter
+            ] = copy.deepcopy(letter_data)
+            path = os.path.abspath(self.file_path(grid_mode, ori_key, letter))
+            self._pending[path] = (letter, copy.deepcopy(letter_data))
+            self._schedule_write()
+        for listener in list(self._listeners):
+            listener(grid_mode, ori_key, letter)
+
+    def flush(self) -> None:
+        """Write every pending letter synchronously."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            for path in list(self._pending):
+                self._write_pending(path)
+
+    def flush_path(self, file_path: str) -> None:
+        """Write the pending letter for one file, before it is read directly."""
+        with self._lock:
+            self._write_pending(os.path.abspath(file_path))
+
+    def invalidate(self) -> None:
+        """Re-read the files on next access, after writing pending edits."""
+        with self._lock:
+            self.flush()
+            self._loaded = False
+
+    # Change notification
+
+    def add_listener(self, listener: ChangeListener) -> None:
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: ChangeListener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    @contextmanager
+    def track_changes(self) -> Iterator[set[tuple[str, str, str]]]:
+        """Collect the (grid_mode, ori_key, letter) of every edit in the block."""
+        changed: set[tuple[str, str, str]] = set()
+        listener = lambda *key: changed.add(key)
+        self.add_listener(listener)
+        try:
+            yield changed
+        finally:
+            self.remove_listener(listener)
+
+    # Loading and write-back
+
+    def _load(self) -> None:
+        placements: dict[str, dict[str, dict]] = {}
+        for mode in self.modes:
+            placements[mode] = {}
+            for subfolder in self.subfolders:
+                placements[mode][subfolder] = self._load_subfolder(mode, subfolder)
+        self._placements.clear()
+        self._placements.update(placements)
+        self._loaded = True
+        self.load_count += 1
+
+    def _load_subfolder(self, mode: str, subfolder: str) -> dict:
+        subfolder_data: dict = {}
+        directory = os.path.join(self.root_dir, mode, "special", subfolder)
+        if not os.path.isdir(directory):
+            return subfolder_data
+        for file_name in os.listdir(directory):
+            if file_name.endswith("_placements.json"):
+                path = os.path.join(directory, file_name)
+                with open(path, "r", encoding="utf-8") as f:
+                    subfolder_data.update(json.load(f))
+        return subfolder_data
+
+    def _schedule_write(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.debounce_seconds <= 0:
+            self._timer = None
+            self.flush()
+            return
+        self._timer = threading.Timer(self.debounce_seconds, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            for path in list(self._pending):
+                self._write_pending(path)
+
+    def _write_pending(self, path: str) -> None:
+        pending = self._pending.get(path)
+        if pending is None:
+            return
+        letter, letter_data = pending
+        try:
+            file_data = self._read_file(path)
+            file_data[letter] = letter_data
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            written = self.saver.save_json_data(file_data, path)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to write special placements to {path}: {e}")
+            written = False
+        if not written:
+            # Left pending, so the next flush retries it
+            return
+        del self._pending[path]
+        self.write_count += 1
+
+    @staticmethod
+    def _read_file(path: str) -> dict:
+        if not os.path.exists(path):
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+atexit.register(SpecialPlacementStore.flush_all)
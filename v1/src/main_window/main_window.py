@@ -7,6 +7,8 @@ import logging
 from main_window.palette_manager import PaletteManager
 from main_window.main_window_geometry_manager import MainWindowGeometryManager
 from main_window.main_widget.core.main_widget_coordinator import MainWidgetFactory
+from styles.stylesheet_compiler import StyleSheetCompiler
+from utils.layout_scheduler import layout_counters
 
 if TYPE_CHECKING:
     from profiler import Profiler
@@ -84,6 +86,42 @@ class MainWindow(QMainWindow):
         self.profiler.write_profiling_stats_to_file("profiling_output.txt", "v1/src/")
         return result
 
+    def resizeEvent(self, event):
+        # Layout passes and stylesheet rebuilds are counted per window resize
+        layout_counters.begin_window_resize()
+        StyleSheetCompiler.instance().begin_action("window_resize")
+        super().resizeEvent(event)
+
     def closeEvent(self, event):
+        try:
+            from main_window.main_widget.json_manager.current_sequence_store import (
+                CurrentSequenceStore,
+            )
+
+            CurrentSequenceStore.flush_all()
+        except Exception as e:
+            logger.warning(f"Failed to flush current sequence on close: {e}")
+        try:
+            from main_window.main_widget.dictionary_metadata_index import (
+                DictionaryMetadataIndex,
+            )
+
+            DictionaryMetadataIndex.flush_all()
+        except Exception as e:
+            logger.warning(f"Failed to flush dictionary metadata index on close: {e}")
+        try:
+            from main_window.main_widget.image_cache import ImageCache
+
+            ImageCache.flush_all()
+        except Exception as e:
+            logger.warning(f"Failed to flush image cache on close: {e}")
+        try:
+            from main_window.main_widget.special_placement_store import (
+                SpecialPlacementStore,
+            )
+
+            SpecialPlacementStore.flush_all()
+        except Exception as e:
+            logger.warning(f"Failed to flush special placements on close: {e}")
         super().closeEvent(event)
         QApplication.instance().installEventFilter(self)
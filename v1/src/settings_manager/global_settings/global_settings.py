@@ -63,6 +63,9 @@ class GlobalSettings:
     def get_enable_fades(self) -> bool:
         return self.settings.value("global/enable_fades", True, type=bool)
 
+    def get_animate_background(self) -> bool:
+        return self.settings.value("global/animate_background", False, type=bool)
+
     def get_current_font_color(self) -> str:
         return self._font_color
 
@@ -97,3 +100,6 @@ class GlobalSettings:
 
     def set_enable_fades(self, enable: bool) -> None:
         self.settings.setValue("global/enable_fades", enable)
+
+    def set_animate_background(self, animate: bool) -> None:
+        self.settings.setValue("global/animate_background", animate)
@@ -10,6 +10,7 @@ from PyQt6.QtCore import (
 )
 from styles.button_state import ButtonState
 from styles.metallic_blue_button_theme import MetallicBlueButtonTheme
+from styles.stylesheet_compiler import StyleSheetCompiler
 from enum import Enum
 
 
@@ -123,10 +124,21 @@ class StyledButton(QPushButton):
             # Get context-specific properties safely
             padding, border_radius = self._get_safe_context_properties()
 
-            # Get beautiful modern styling with glass-morphism
-            styles = self._get_beautiful_context_styles(padding, border_radius)
+            # The sheet only depends on context and size; the state is a
+            # dynamic property it selects on, so toggling a button never
+            # recompiles or re-applies it
+            compiler = StyleSheetCompiler.instance()
+            styles = compiler.compile(
+                (StyledButton, self._context, padding, border_radius),
+                lambda: self._get_beautiful_context_styles(padding, border_radius),
+            )
+            active = self._state == ButtonState.ACTIVE
+            state_changed = self.property("active") != active
+            self.setProperty("active", active)
 
-            self.setStyleSheet(styles)
+            if not compiler.apply(self, styles) and state_changed:
+                self.style().unpolish(self)
+                self.style().polish(self)
         except Exception as e:
             # Ultimate fallback
             import logging
@@ -152,15 +164,12 @@ class StyledButton(QPushButton):
 
     def _get_beautiful_context_styles(self, padding: str, border_radius: str) -> str:
         """Get beautiful glass-morphism styling based on context."""
-        # Simple but beautiful glass-morphism effect
-        if self._state == ButtonState.ACTIVE:
-            # Active state - Beautiful blue glow
-            background = "rgba(64, 150, 255, 0.8)"
-            border_color = "rgba(255, 255, 255, 0.6)"
-        else:
-            # Normal state - Glass-morphism transparency
-            background = "rgba(255, 255, 255, 0.1)"
-            border_color = "rgba(255, 255, 255, 0.3)"
+        # Normal state - Glass-morphism transparency
+        background = "rgba(255, 255, 255, 0.1)"
+        border_color = "rgba(255, 255, 255, 0.3)"
+        # Active state - Beautiful blue glow
+        active_background = "rgba(64, 150, 255, 0.8)"
+        active_border_color = "rgba(255, 255, 255, 0.6)"
 
         # Context-specific adjustments
         if self._context == ButtonContext.COMPACT:
@@ -183,6 +192,10 @@ class StyledButton(QPushButton):
                 margin: {margin};
                 font-weight: 500;
             }}
+            QPushButton[active="true"] {{
+                background: {active_background};
+                border: {border_width} solid {active_border_color};
+            }}
             QPushButton:hover {{
                 background: rgba(120, 180, 255, 0.6);
                 border: {border_width} solid rgba(255, 255, 255, 0.8);
@@ -0,0 +1,84 @@
+from typing import Callable, Hashable, Optional
+
+from PyQt6.QtWidgets import QWidget
+
+from utils.layout_scheduler import record_stylesheet_rebuild
+
+
+class StyleSheetCompiler:
+    """
+    Process-wide cache of compiled stylesheets.
+
+    Widgets build their sheets through compile(key, build), so each distinct
+    (theme, context, state, size) combination is formatted once and shared as
+    the same string. apply() only calls setStyleSheet when the widget's sheet
+    actually changes, which is what makes Qt re-parse the CSS and re-polish.
+
+    begin_action() starts counting for a user action (a window resize, a
+    background change); action_counts() reports how many sheets each action
+    compiled, applied and skipped.
+    """
+
+    _instance: Optional["StyleSheetCompiler"] = None
+
+    def __init__(self) -> None:
+        self._sheets: dict[Hashable, str] = {}
+        self.compiled = 0
+        self.reused = 0
+        self.applied = 0
+        self.skipped = 0
+        self.current_action: Optional[str] = None
+        self._actions: dict[str, dict[str, int]] = {}
+
+    @classmethod
+    def instance(cls) -> "StyleSheetCompiler":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def compile(self, key: Hashable, build: Callable[[], str]) -> str:
+        sheet = self._sheets.get(key)
+        if sheet is None:
+            sheet = self._sheets[key] = build()
+            self.compiled += 1
+            self._count("compiled")
+        else:
+            self.reused += 1
+        return sheet
+
+    def apply(self, widget: QWidget, sheet: str) -> bool:
+        """Set the widget's sheet unless it already has it; returns whether it did."""
+        if widget.styleSheet() == sheet:
+            self.skipped += 1
+            self._count("skipped")
+            return False
+        widget.setStyleSheet(sheet)
+        self.applied += 1
+        self._count("applied")
+        record_stylesheet_rebuild()
+        return True
+
+    def begin_action(self, name: str) -> None:
+        self.current_action = name
+        self._actions[name] = {"compiled": 0, "applied": 0, "skipped": 0}
+
+    def action_counts(self, name: Optional[str] = None) -> dict[str, int]:
+        """Counts for the most recent run of the action (default: the current one)."""
+        return dict(self._actions.get(name or self.current_action, {}))
+
+    def clear(self) -> None:
+        self._sheets.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "sheets": len(self._sheets),
+            "compiled": self.compiled,
+            "reused": self.reused,
+            "applied": self.applied,
+            "skipped": self.skipped,
+            "actions": {name: dict(c) for name, c in self._actions.items()},
+        }
+
+    def _count(self, name: str) -> None:
+        if self.current_action is not None:
+            self._actions[self.current_action][name] += 1
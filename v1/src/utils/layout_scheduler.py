@@ -0,0 +1,106 @@
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+_COUNTS = ("requests", "passes", "skipped_passes", "stylesheet_rebuilds")
+
+
+@dataclass
+class LayoutCounters:
+    """
+    How much layout work the UI is doing.
+
+    begin_window_resize() marks the start of a window resize, so
+    since_window_resize() reports the passes and stylesheet rebuilds that one
+    resize caused, separately from the running totals.
+    """
+
+    requests: int = 0
+    passes: int = 0
+    skipped_passes: int = 0
+    stylesheet_rebuilds: int = 0
+    window_resizes: int = 0
+    _resize_start: dict = field(default_factory=dict, repr=False, compare=False)
+
+    def snapshot(self) -> dict[str, int]:
+        return {name: getattr(self, name) for name in _COUNTS}
+
+    def begin_window_resize(self) -> None:
+        self.window_resizes += 1
+        self._resize_start = self.snapshot()
+
+    def since_window_resize(self) -> dict[str, int]:
+        return {
+            name: value - self._resize_start.get(name, 0)
+            for name, value in self.snapshot().items()
+        }
+
+    def reset(self) -> None:
+        for name in _COUNTS:
+            setattr(self, name, 0)
+        self.window_resizes = 0
+        self._resize_start = {}
+
+
+layout_counters = LayoutCounters()
+
+
+def record_stylesheet_rebuild() -> None:
+    """Count a setStyleSheet call made because a widget was resized or restyled."""
+    layout_counters.stylesheet_rebuilds += 1
+
+
+class LayoutScheduler(QObject):
+    """
+    Coalesces layout requests into one pass per event-loop tick.
+
+    Any number of schedule() calls before control returns to the event loop
+    (a window resize cascading through nested resizeEvents) produce a single
+    pass. A pass computes the dimensions once and only applies them if they
+    differ from the last applied ones, so the resizes caused by applying a
+    layout settle into a skipped pass instead of another cascade.
+    """
+
+    def __init__(
+        self,
+        compute: Callable[[], Any],
+        apply: Callable[[Any], None],
+        parent: Optional[QObject] = None,
+        counters: LayoutCounters = layout_counters,
+    ) -> None:
+        super().__init__(parent)
+        self.compute = compute
+        self.apply = apply
+        self.counters = counters
+        self.applied: Any = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.flush)
+
+    @property
+    def is_pending(self) -> bool:
+        return self._timer.isActive()
+
+    def schedule(self) -> None:
+        self.counters.requests += 1
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def invalidate(self) -> None:
+        """Apply the next pass even if the dimensions have not changed."""
+        self.applied = None
+        self.schedule()
+
+    def flush(self) -> bool:
+        """Run a pending pass now; returns whether anything was applied."""
+        self._timer.stop()
+        self.counters.passes += 1
+        dimensions = self.compute()
+        if dimensions == self.applied:
+            self.counters.skipped_passes += 1
+            return False
+        self.applied = dimensions
+        self.apply(dimensions)
+        return True
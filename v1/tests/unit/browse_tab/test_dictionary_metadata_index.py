@@ -0,0 +1,87 @@
+import json
+import os
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from main_window.main_widget.dictionary_metadata_index import DictionaryMetadataIndex
+
+
+def _write_thumbnail(path, metadata):
+    pnginfo = PngImagePlugin.PngInfo()
+    pnginfo.add_text("metadata", json.dumps(metadata))
+    Image.new("RGB", (4, 4)).save(path, pnginfo=pnginfo)
+
+
+def _metadata(author="Austen", level=2, beats=3):
+    sequence = [{"word": "AB", "author": author, "level": level}]
+    sequence.append({"beat": 0, "end_pos": "beta5"})
+    sequence.extend({"beat": i + 1} for i in range(beats))
+    return {"sequence": sequence, "date_added": "2024-01-02T03:04:05", "tags": ["x"]}
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "index.json")
+
+
+@pytest.fixture
+def thumbnail(tmp_path):
+    path = str(tmp_path / "AB_ver1.png")
+    _write_thumbnail(path, _metadata())
+    return path
+
+
+def test_summary_fields(index_path, thumbnail):
+    summary = DictionaryMetadataIndex(index_path).get(thumbnail)
+
+    assert summary["author"] == "Austen"
+    assert summary["level"] == 2
+    assert summary["length"] == 3
+    assert summary["start_pos"] == "beta"
+    assert summary["grid_mode"] == "diamond"
+    assert summary["tags"] == ["x"]
+    assert summary["date_added"] == "2024-01-02T03:04:05"
+    assert summary["is_favorite"] is False
+
+
+def test_unchanged_files_are_not_reread(index_path, thumbnail):
+    index = DictionaryMetadataIndex(index_path)
+    index.get(thumbnail)
+    index.get(thumbnail)
+    assert index.read_count == 1
+
+    index.flush()
+    reloaded = DictionaryMetadataIndex(index_path)
+    assert reloaded.get(thumbnail)["author"] == "Austen"
+    assert reloaded.read_count == 0
+
+
+def test_changed_files_are_reindexed(index_path, thumbnail):
+    index = DictionaryMetadataIndex(index_path)
+    index.get(thumbnail)
+
+    _write_thumbnail(thumbnail, _metadata(author="Someone else", beats=5))
+    stat = os.stat(thumbnail)
+    os.utime(thumbnail, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert index.refresh([thumbnail]) == 1
+    assert index.get(thumbnail)["author"] == "Someone else"
+    assert index.get(thumbnail)["length"] == 5
+
+
+def test_flush_drops_deleted_files(index_path, thumbnail):
+    index = DictionaryMetadataIndex(index_path)
+    index.get(thumbnail)
+    os.remove(thumbnail)
+    index.flush()
+
+    with open(index_path, encoding="utf-8") as file:
+        assert json.load(file)["entries"] == {}
+
+
+def test_image_without_metadata(index_path, tmp_path):
+    path = str(tmp_path / "plain.png")
+    Image.new("RGB", (4, 4)).save(path)
+
+    assert DictionaryMetadataIndex(index_path).get(path) is None
@@ -0,0 +1,120 @@
+import json
+import os
+
+import pytest
+from PyQt6.QtGui import QColor, QImage
+
+from main_window.main_widget.image_cache import ImageCache
+
+# A 16x16 ARGB32 image costs 1 KiB
+IMAGE_BYTES = 16 * 16 * 4
+
+
+def _image(color="red"):
+    image = QImage(16, 16, QImage.Format.Format_ARGB32)
+    image.fill(QColor(color))
+    return image
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+def test_memory_tier_evicts_least_recently_used(cache_dir):
+    cache = ImageCache(cache_dir, memory_budget=2 * IMAGE_BYTES)
+    cache.put("a", _image())
+    cache.put("b", _image())
+    assert cache.get("a") is not None
+
+    cache.put("c", _image())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    stats = cache.stats()
+    assert stats.memory_bytes == 2 * IMAGE_BYTES
+    assert stats.memory_evictions == 1
+    assert (stats.memory_hits, stats.misses) == (3, 1)
+    assert stats.hit_rate == 0.75
+    assert not os.path.exists(cache_dir)
+
+
+def test_disk_writes_are_batched(cache_dir, monkeypatch):
+    monkeypatch.setattr(ImageCache, "WRITE_BATCH_SIZE", 3)
+    cache = ImageCache(cache_dir)
+
+    cache.put("a", _image(), persist=True)
+    cache.put("b", _image(), persist=True)
+    assert not os.path.exists(cache_dir)
+    assert cache.stats().pending_writes == 2
+
+    cache.put("c", _image(), persist=True)
+
+    assert sorted(os.listdir(cache_dir)) == [
+        "a.png",
+        "b.png",
+        "c.png",
+        ImageCache.INDEX_FILENAME,
+    ]
+    assert cache.stats().pending_writes == 0
+
+
+def test_disk_tier_survives_restart(cache_dir):
+    cache = ImageCache(cache_dir)
+    cache.put("a", _image("blue"), persist=True)
+    cache.flush()
+
+    reloaded = ImageCache(cache_dir)
+    image = reloaded.get("a")
+
+    assert image.pixelColor(0, 0) == QColor("blue")
+    stats = reloaded.stats()
+    assert (stats.disk_hits, stats.memory_bytes) == (1, image.sizeInBytes())
+    assert stats.disk_bytes == os.path.getsize(os.path.join(cache_dir, "a.png"))
+    assert reloaded.get("a") is not None
+    assert reloaded.stats().memory_hits == 1
+
+
+def test_disk_tier_evicts_least_recently_used(cache_dir):
+    cache = ImageCache(cache_dir)
+    for key in "abc":
+        cache.put(key, _image(), persist=True)
+    cache.flush()
+    file_size = os.path.getsize(os.path.join(cache_dir, "a.png"))
+
+    limited = ImageCache(cache_dir, memory_budget=0, disk_budget=3 * file_size)
+    assert limited.get("a") is not None
+    limited.put("d", _image(), persist=True)
+    limited.flush()
+
+    assert not os.path.exists(os.path.join(cache_dir, "b.png"))
+    with open(os.path.join(cache_dir, ImageCache.INDEX_FILENAME)) as file:
+        assert [key for key, _ in json.load(file)["entries"]] == ["c", "a", "d"]
+    stats = limited.stats()
+    assert stats.disk_evictions == 1
+    assert stats.disk_bytes <= stats.disk_budget
+
+
+def test_source_key_changes_with_the_source(tmp_path):
+    path = tmp_path / "AB_ver1.png"
+    _image().save(str(path))
+    key = ImageCache.source_key(str(path), "200x200")
+    assert key == ImageCache.source_key(str(path), "200x200")
+    assert key != ImageCache.source_key(str(path), "150x150")
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert key != ImageCache.source_key(str(path), "200x200")
+
+
+def test_clear_removes_both_tiers(cache_dir):
+    cache = ImageCache(cache_dir)
+    cache.put("a", _image(), persist=True)
+    cache.flush()
+    cache.put("b", _image())
+
+    cache.clear()
+
+    assert cache.get("a") is None and cache.get("b") is None
+    assert os.listdir(cache_dir) == [ImageCache.INDEX_FILENAME]
@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from main_window.main_widget.png_metadata_reader import (
+    NotAPngError,
+    iter_image_metadata,
+    read_image_metadata,
+    read_png_text,
+)
+
+
+def _write_png(path, metadata=None, **extra_text):
+    pnginfo = PngImagePlugin.PngInfo()
+    if metadata is not None:
+        pnginfo.add_text("metadata", json.dumps(metadata))
+    for key, value in extra_text.items():
+        pnginfo.add_text(key, value)
+    Image.new("RGB", (64, 64), "red").save(path, pnginfo=pnginfo)
+    return str(path)
+
+
+def test_reads_all_text_chunk_types(tmp_path):
+    path = str(tmp_path / "chunks.png")
+    pnginfo = PngImagePlugin.PngInfo()
+    pnginfo.add_text("plain", "value")
+    pnginfo.add_text("compressed", "zipped " * 50, zip=True)
+    pnginfo.add_itxt("international", "ünïcode", zip=True)
+    Image.new("RGB", (8, 8)).save(path, pnginfo=pnginfo)
+
+    text = read_png_text(path)
+
+    with Image.open(path) as img:
+        expected = {k: v for k, v in img.info.items() if isinstance(v, str)}
+    assert text == expected
+    assert text["international"] == "ünïcode"
+
+
+def test_stops_at_requested_keys(tmp_path):
+    path = _write_png(tmp_path / "a.png", {"sequence": [1, 2]}, other="x")
+
+    assert read_png_text(path, ("other",)) == {"other": "x"}
+    assert read_image_metadata(path) == {"sequence": [1, 2]}
+
+
+def test_missing_metadata_and_non_png(tmp_path):
+    assert read_image_metadata(_write_png(tmp_path / "none.png")) is None
+
+    jpg = str(tmp_path / "photo.jpg")
+    Image.new("RGB", (8, 8)).save(jpg)
+    with pytest.raises(NotAPngError):
+        read_png_text(jpg)
+    assert read_image_metadata(jpg) is None
+
+
+def test_batch_streams_every_result(tmp_path):
+    paths = [
+        _write_png(tmp_path / f"{i}.png", {"sequence": [i]}) for i in range(20)
+    ]
+    broken = str(tmp_path / "broken.png")
+    with open(broken, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\x10tEXt")
+
+    results = {
+        result.path: result for result in iter_image_metadata(paths + [broken])
+    }
+
+    assert {path: results[path].metadata for path in paths} == {
+        path: {"sequence": [i]} for i, path in enumerate(paths)
+    }
+    assert results[broken].metadata is None
+    assert results[broken].error is not None
@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+
+import pytest
+from PIL import Image
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from main_window.main_widget.browse_tab.thumbnail_box.core.thumbnail_processor import (
+    load_scaled_image,
+)
+from main_window.main_widget.browse_tab.thumbnail_box.core.thumbnail_scheduler import (
+    ThumbnailScheduler,
+    viewport_offset,
+)
+
+SIZE = QSize(200, 200)
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class GatedDecoder:
+    """Records decode order; the first decode blocks until released."""
+
+    def __init__(self):
+        self.decoded = []
+        self.release = threading.Event()
+
+    def __call__(self, path, target_size):
+        if not self.decoded:
+            self.release.wait(5)
+        self.decoded.append(path)
+        return QImage(4, 4, QImage.Format.Format_ARGB32)
+
+
+@pytest.fixture
+def decoder():
+    return GatedDecoder()
+
+
+@pytest.fixture
+def scheduler(app, decoder):
+    scheduler = ThumbnailScheduler(max_workers=1, decoder=decoder)
+    ready = []
+    scheduler.thumbnail_ready.connect(lambda request, image: ready.append(request))
+    scheduler.ready = ready
+    yield scheduler
+    decoder.release.set()
+    scheduler.shutdown()
+
+
+def _wait_until(app, condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for thumbnails"
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def test_viewport_offset_is_signed_distance():
+    assert viewport_offset(0, 100, 500, 900) == -400
+    assert viewport_offset(450, 100, 500, 900) == 0
+    assert viewport_offset(880, 100, 500, 900) == 0
+    assert viewport_offset(1000, 100, 500, 900) == 100
+
+
+def test_load_scaled_image_decodes_at_target_size(tmp_path):
+    path = str(tmp_path / "wide.png")
+    Image.new("RGB", (900, 300), "white").save(path)
+
+    image = load_scaled_image(path, SIZE)
+
+    assert image.width() == 200
+    assert image.height() in (66, 67)
+    assert load_scaled_image(str(tmp_path / "missing.png"), SIZE).isNull()
+
+
+def test_requests_are_decoded_nearest_first(app, scheduler, decoder):
+    scheduler.request("A", "a.png", SIZE, 500)
+    scheduler.request("B", "b.png", SIZE, 300)
+    scheduler.request("C", "c.png", SIZE, 0)
+    scheduler.request("D", "d.png", SIZE, 100)
+    scheduler.request("B", "b.png", SIZE, 50)
+    assert scheduler.pending_count == 3
+
+    decoder.release.set()
+    _wait_until(app, lambda: len(scheduler.ready) == 4)
+
+    assert decoder.decoded == ["a.png", "c.png", "b.png", "d.png"]
+    assert [request.key for request in scheduler.ready] == ["A", "C", "B", "D"]
+
+
+def test_newer_request_replaces_pending_one(app, scheduler, decoder):
+    scheduler.request("A", "a.png", SIZE, 0)
+    scheduler.request("B", "b_ver1.png", SIZE, 10)
+    scheduler.request("B", "b_ver2.png", SIZE, 10)
+    scheduler.request("A", "a.png", SIZE, 0)
+    assert scheduler.cancel("C") is False
+
+    decoder.release.set()
+    _wait_until(app, lambda: len(scheduler.ready) == 2)
+
+    assert decoder.decoded == ["a.png", "b_ver2.png"]
+
+
+def test_cancelled_requests_are_never_decoded(app, scheduler, decoder):
+    scheduler.request("A", "a.png", SIZE, 0)
+    scheduler.request("B", "b.png", SIZE, 10)
+    scheduler.request("C", "c.png", SIZE, 20)
+    assert scheduler.cancel("B") is True
+
+    decoder.release.set()
+    _wait_until(app, lambda: len(scheduler.ready) == 2)
+
+    assert decoder.decoded == ["a.png", "c.png"]
+
+
+def test_invalidate_drops_pending_and_running_work(app, scheduler, decoder):
+    scheduler.request("A", "a.png", SIZE, 0)
+    scheduler.request("B", "b.png", SIZE, 10)
+
+    assert scheduler.invalidate() == 1
+    assert scheduler.pending_count == 0
+    scheduler.request("C", "c.png", SIZE, 0)
+
+    decoder.release.set()
+    _wait_until(app, lambda: len(scheduler.ready) == 1)
+
+    assert decoder.decoded == ["a.png", "c.png"]
+    assert [(r.key, r.generation) for r in scheduler.ready] == [("C", 1)]
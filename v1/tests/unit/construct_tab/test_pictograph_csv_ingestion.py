@@ -0,0 +1,119 @@
+import os
+
+import pandas as pd
+import pytest
+
+from data.constants import (
+    BLUE_ATTRS,
+    END_LOC,
+    IN,
+    LETTER,
+    MOTION_TYPE,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+    START_LOC,
+    START_ORI,
+    TURNS,
+)
+from main_window.main_widget.pictograph_csv_ingestion import (
+    PictographCsvIngestion,
+    read_pictograph_csv,
+)
+
+HEADER = (
+    "letter,start_pos,end_pos,timing,direction,"
+    "blue_motion_type,blue_prop_rot_dir,blue_start_loc,blue_end_loc,"
+    "red_motion_type,red_prop_rot_dir,red_start_loc,red_end_loc\n"
+)
+DIAMOND_ROWS = (
+    "B,alpha3,alpha5,split,same,anti,cw,w,n,anti,cw,e,s\n"
+    "A,beta5,alpha3,split,same,pro,cw,w,n,pro,cw,e,s\n"
+    "A,alpha5,alpha7,split,same,pro,ccw,n,e,pro,ccw,s,w\n"
+)
+BOX_ROWS = "A,alpha2,alpha4,split,same,pro,cw,nw,ne,pro,cw,se,sw\n"
+
+
+@pytest.fixture
+def csv_paths(tmp_path):
+    diamond = tmp_path / "DiamondPictographDataframe.csv"
+    box = tmp_path / "BoxPictographDataframe.csv"
+    diamond.write_text(HEADER + DIAMOND_ROWS, encoding="utf-8")
+    box.write_text(HEADER + BOX_ROWS, encoding="utf-8")
+    return [str(diamond), str(box)]
+
+
+def test_records_are_sorted_nested_and_grouped_by_letter(csv_paths):
+    letters = PictographCsvIngestion(csv_paths).load()
+
+    assert list(letters) == ["A", "B"]
+    assert [(r["start_pos"], r["end_pos"]) for r in letters["A"]] == [
+        ("alpha2", "alpha4"),
+        ("alpha5", "alpha7"),
+        ("beta5", "alpha3"),
+    ]
+    record = letters["A"][1]
+    assert list(record) == [
+        LETTER,
+        "start_pos",
+        "end_pos",
+        "timing",
+        "direction",
+        BLUE_ATTRS,
+        RED_ATTRS,
+    ]
+    assert record[BLUE_ATTRS] == {
+        MOTION_TYPE: "pro",
+        START_ORI: IN,
+        PROP_ROT_DIR: "ccw",
+        START_LOC: "n",
+        END_LOC: "e",
+        TURNS: 0,
+    }
+    assert type(record[RED_ATTRS][TURNS]) is int
+    assert type(record[LETTER]) is str
+
+
+def test_csv_is_read_with_categorical_dtypes(csv_paths):
+    df = read_pictograph_csv(csv_paths[0])
+
+    assert isinstance(df["blue_motion_type"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["start_pos"].dtype, pd.CategoricalDtype)
+    assert df["start_pos"].dtype == read_pictograph_csv(csv_paths[1])["start_pos"].dtype
+
+
+def test_unknown_category_value_is_an_error(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text(
+        HEADER + "A,alpha3,alpha5,split,same,spin,cw,w,n,pro,cw,e,s\n",
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ValueError, match="blue_motion_type"):
+        read_pictograph_csv(str(path))
+
+
+def test_cache_skips_csv_parsing_until_a_csv_changes(csv_paths, tmp_path, monkeypatch):
+    cache_path = str(tmp_path / "pictograph_dataset_cache.pkl")
+    letters = PictographCsvIngestion(csv_paths, cache_path).load()
+    assert os.path.exists(cache_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("CSV parsed despite a current cache")
+
+    monkeypatch.setattr(pd, "read_csv", fail)
+    assert PictographCsvIngestion(csv_paths, cache_path).load() == letters
+    monkeypatch.undo()
+
+    with open(csv_paths[1], "a", encoding="utf-8") as f:
+        f.write("C,alpha4,alpha6,split,same,pro,cw,ne,se,pro,cw,sw,nw\n")
+    reloaded = PictographCsvIngestion(csv_paths, cache_path).load()
+    assert list(reloaded) == ["A", "B", "C"]
+
+
+def test_unreadable_cache_is_rebuilt(csv_paths, tmp_path):
+    cache_path = tmp_path / "pictograph_dataset_cache.pkl"
+    cache_path.write_bytes(b"not a pickle")
+
+    letters = PictographCsvIngestion(csv_paths, str(cache_path)).load()
+    assert list(letters) == ["A", "B"]
+    assert PictographCsvIngestion(csv_paths, str(cache_path)).load() == letters
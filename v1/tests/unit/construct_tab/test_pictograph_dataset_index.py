@@ -0,0 +1,125 @@
+import time
+
+import pytest
+
+from data.constants import (
+    BLUE_ATTRS,
+    BOX,
+    DIAMOND,
+    LETTER,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+    START_ORI,
+)
+from enums.letter.letter import Letter
+from enums.letter.letter_type import LetterType
+from main_window.main_widget.pictograph_dataset_index import PictographDatasetIndex
+
+POSITIONS = [f"alpha{i}" for i in range(1, 9)] + [f"beta{i}" for i in range(1, 9)]
+LETTERS = [Letter.A, Letter.B, Letter.W, Letter.Φ]
+ROT_DIRS = ["cw", "ccw", "no_rot"]
+
+
+def _dataset(copies: int = 1) -> dict[Letter, list[dict]]:
+    dataset = {letter: [] for letter in LETTERS}
+    for copy in range(copies):
+        for i, start_pos in enumerate(POSITIONS):
+            for j, letter in enumerate(LETTERS):
+                dataset[letter].append(
+                    {
+                        LETTER: letter.value,
+                        "start_pos": start_pos,
+                        "end_pos": POSITIONS[(i + j + copy) % len(POSITIONS)],
+                        BLUE_ATTRS: {PROP_ROT_DIR: ROT_DIRS[j % 3]},
+                        RED_ATTRS: {PROP_ROT_DIR: ROT_DIRS[i % 3]},
+                    }
+                )
+    return dataset
+
+
+def _scan(dataset, start_pos):
+    return [
+        item
+        for group in dataset.values()
+        for item in group
+        if item.get("start_pos") == start_pos
+    ]
+
+
+def test_options_match_full_scan():
+    dataset = _dataset()
+    index = PictographDatasetIndex(dataset)
+
+    for start_pos in POSITIONS:
+        assert list(index.get_options(start_pos)) == _scan(dataset, start_pos)
+    assert index.get_options("gamma3") == ()
+
+
+def test_secondary_keys():
+    index = PictographDatasetIndex(_dataset())
+
+    assert [o[LETTER] for o in index.get_options("alpha1", letter=Letter.W)] == ["W"]
+    assert {
+        o[LETTER] for o in index.get_options("alpha1", letter_type=LetterType.Type1)
+    } == {"A", "B"}
+    for option in index.get_options("alpha1", prop_rot_dirs=("cw", "cw")):
+        assert option[BLUE_ATTRS][PROP_ROT_DIR] == "cw"
+        assert option[RED_ATTRS][PROP_ROT_DIR] == "cw"
+
+
+def test_grid_mode_is_part_of_the_key():
+    index = PictographDatasetIndex(_dataset())
+
+    assert index.get_options("alpha2")
+    assert index.get_options("alpha2", grid_mode=DIAMOND) == ()
+    assert "alpha2" in index.start_positions(BOX)
+
+
+def test_index_is_shared_per_dataset():
+    dataset = _dataset()
+
+    assert PictographDatasetIndex.for_dataset(
+        dataset
+    ) is PictographDatasetIndex.for_dataset(dataset)
+
+
+def test_base_records_are_read_only_and_detached_from_dataset():
+    dataset = _dataset()
+    index = PictographDatasetIndex(dataset)
+    record = index.get_options("alpha1")[0]
+
+    with pytest.raises(TypeError):
+        record[BLUE_ATTRS][START_ORI] = "out"
+    dataset[Letter.A][0][BLUE_ATTRS][PROP_ROT_DIR] = "changed"
+    assert record[BLUE_ATTRS][PROP_ROT_DIR] == "cw"
+
+
+def test_make_option_returns_independent_overlay():
+    index = PictographDatasetIndex(_dataset())
+    record = index.get_options("alpha1")[0]
+
+    first = index.make_option(record)
+    second = index.make_option(record)
+    first[BLUE_ATTRS][START_ORI] = "out"
+    first["beat"] = 3
+
+    assert first == {**record, BLUE_ATTRS: first[BLUE_ATTRS], "beat": 3}
+    assert START_ORI not in second[BLUE_ATTRS]
+    assert START_ORI not in record[BLUE_ATTRS]
+    assert type(second[RED_ATTRS]) is dict
+
+
+def test_lookup_cost_independent_of_dataset_size():
+    small = PictographDatasetIndex(_dataset(copies=1))
+    large = PictographDatasetIndex(_dataset(copies=200))
+
+    def timed(index):
+        start = time.perf_counter()
+        for i in range(20000):
+            index.get_options(POSITIONS[i % len(POSITIONS)])
+        return time.perf_counter() - start
+
+    small_time = min(timed(small) for _ in range(3))
+    large_time = min(timed(large) for _ in range(3))
+    # A linear scan would be ~200x slower on the large dataset.
+    assert large_time < small_time * 5
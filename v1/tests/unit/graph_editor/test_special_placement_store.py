@@ -0,0 +1,152 @@
+import gc
+import json
+import os
+
+import pytest
+
+from main_window.main_widget.special_placement_store import SpecialPlacementStore
+
+SUBFOLDERS = ["from_layer1", "from_layer2"]
+
+
+def _write(root, mode, subfolder, letter, data):
+    directory = os.path.join(root, mode, "special", subfolder)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{letter}_placements.json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({letter: data}, file)
+    return path
+
+
+@pytest.fixture
+def root(tmp_path):
+    root = str(tmp_path / "arrow_placement")
+    _write(root, "diamond", "from_layer1", "A", {"(0, 0)": {"blue": [5, 5]}})
+    _write(root, "diamond", "from_layer1", "B", {"(1, 0)": {"red": [1, 2]}})
+    return root
+
+
+def _store(root, debounce_seconds=60):
+    return SpecialPlacementStore(
+        root, ["diamond", "box"], SUBFOLDERS, debounce_seconds=debounce_seconds
+    )
+
+
+def test_placements_are_loaded_once(root):
+    store = _store(root)
+
+    for _ in range(100):
+        store.letter_data("diamond", "from_layer1", "A")
+
+    assert store.load_count == 1
+    assert store.placements()["diamond"]["from_layer1"]["B"] == {
+        "(1, 0)": {"red": [1, 2]}
+    }
+
+
+def test_edits_are_served_from_memory_and_written_once(root):
+    store = _store(root)
+    placements = store.placements()
+
+    for step in range(50):
+        letter_data = store.letter_data("diamond", "from_layer1", "A")
+        letter_data["(0, 0)"]["blue"][0] += 5
+        store.set_letter_data("diamond", "from_layer1", "A", letter_data)
+
+    assert placements["diamond"]["from_layer1"]["A"]["(0, 0)"]["blue"] == [255, 5]
+    assert store.write_count == 0
+
+    store.flush()
+    path = store.file_path("diamond", "from_layer1", "A")
+    with open(path, encoding="utf-8") as file:
+        assert json.load(file) == {"A": {"(0, 0)": {"blue": [255, 5]}}}
+    assert store.write_count == 1
+    assert store.load_count == 1
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_only_the_edited_letter_is_written(root):
+    store = _store(root)
+    other_path = store.file_path("diamond", "from_layer1", "B")
+    before = os.path.getmtime(other_path)
+    os.utime(other_path, (before - 10, before - 10))
+
+    store.set_letter_data("box", "from_layer2", "C", {"(0, 0)": {"red": [3, 4]}})
+    store.flush()
+
+    assert os.path.getmtime(other_path) == before - 10
+    with open(store.file_path("box", "from_layer2", "C"), encoding="utf-8") as file:
+        assert json.load(file) == {"C": {"(0, 0)": {"red": [3, 4]}}}
+
+
+def test_returned_letter_data_is_a_copy(root):
+    store = _store(root)
+
+    store.letter_data("diamond", "from_layer1", "A")["(0, 0)"]["blue"] = [0, 0]
+
+    assert store.letter_data("diamond", "from_layer1", "A") == {
+        "(0, 0)": {"blue": [5, 5]}
+    }
+
+
+def test_listeners_hear_which_letter_changed(root):
+    store = _store(root)
+
+    with store.track_changes() as changed:
+        store.set_letter_data("diamond", "from_layer1", "A", {})
+        store.set_letter_data("diamond", "from_layer2", "A", {})
+    store.set_letter_data("box", "from_layer1", "B", {})
+
+    assert changed == {
+        ("diamond", "from_layer1", "A"),
+        ("diamond", "from_layer2", "A"),
+    }
+
+
+def test_invalidate_writes_pending_edits_and_reloads_in_place(root):
+    store = _store(root)
+    placements = store.placements()
+    store.set_letter_data("diamond", "from_layer1", "A", {"(0, 0)": {"blue": [9, 9]}})
+    _write(root, "diamond", "from_layer1", "B", {"(1, 0)": {"red": [7, 7]}})
+
+    store.invalidate()
+
+    assert store.placements() is placements
+    assert placements["diamond"]["from_layer1"]["A"] == {"(0, 0)": {"blue": [9, 9]}}
+    assert placements["diamond"]["from_layer1"]["B"] == {"(1, 0)": {"red": [7, 7]}}
+    assert store.load_count == 2
+
+
+def test_dropped_stores_are_not_kept_for_flushing(root):
+    store = _store(root)
+    assert store in SpecialPlacementStore._stores
+
+    count = len(SpecialPlacementStore._stores)
+    del store
+    gc.collect()
+    assert len(SpecialPlacementStore._stores) == count - 1
+
+
+def test_failed_write_stays_pending_until_the_next_flush(root, monkeypatch):
+    store = _store(root)
+    nudged = {"(0, 0)": {"blue": [9, 9]}}
+    store.set_letter_data("diamond", "from_layer1", "A", nudged)
+    path = store.file_path("diamond", "from_layer1", "A")
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "replace", fail)
+        store.flush()
+
+    assert store.write_count == 0
+    assert sorted(os.listdir(os.path.dirname(path))) == [
+        "A_placements.json",
+        "B_placements.json",
+    ]
+
+    store.flush()
+    assert store.write_count == 1
+    with open(path, encoding="utf-8") as file:
+        assert json.load(file)["A"] == nudged
@@ -0,0 +1,169 @@
+import json
+import os
+import queue
+
+import pytest
+from PIL import Image, PngImagePlugin
+
+from main_window.main_widget.dictionary_image_regenerator import (
+    CANCELLED,
+    EXPORT_OPTIONS,
+    DictionaryImageRegenerator,
+    ExportJob,
+    ExportManifest,
+    build_export_jobs,
+    manifest_entry,
+)
+
+SEQUENCE = [{"word": "AB"}, {"sequence_start_position": "alpha"}, {"letter": "A"}]
+
+
+def _write_png(path, metadata=None):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pnginfo = PngImagePlugin.PngInfo()
+    if metadata is not None:
+        pnginfo.add_text("metadata", json.dumps(metadata))
+    Image.new("RGB", (8, 8), "white").save(path, pnginfo=pnginfo)
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    root = tmp_path / "dictionary"
+    _write_png(str(root / "AB" / "AB_ver1.png"), {"sequence": SEQUENCE})
+    _write_png(str(root / "AB" / "AB_ver2.png"), {"sequence": SEQUENCE})
+    _write_png(str(root / "C" / "C_ver1.png"), {"sequence": SEQUENCE})
+    _write_png(str(root / "C" / "__thumb.png"))
+    (root / "C" / "notes.txt").write_text("not an image")
+    _write_png(str(root / "__pycache__" / "skip.png"))
+    return str(root)
+
+
+def _export_current_images(jobs):
+    for job in jobs:
+        _write_png(
+            job.output_path,
+            {"sequence": SEQUENCE, "export_options": dict(EXPORT_OPTIONS)},
+        )
+
+
+def test_jobs_are_listed_once_in_stable_order(dictionary, tmp_path):
+    export_path = str(tmp_path / "export")
+
+    jobs = build_export_jobs(dictionary, export_path)
+
+    assert [(job.word, os.path.basename(job.source_path)) for job in jobs] == [
+        ("AB", "AB_ver1.png"),
+        ("AB", "AB_ver2.png"),
+        ("C", "C_ver1.png"),
+    ]
+    assert jobs[2] == ExportJob(
+        "C",
+        os.path.join(dictionary, "C", "C_ver1.png"),
+        os.path.join(export_path, "C", "C_ver1.png"),
+    )
+
+
+def test_existing_exports_are_adopted_into_the_manifest(dictionary, tmp_path):
+    export_path = str(tmp_path / "export")
+    job = build_export_jobs(dictionary, export_path)[0]
+    manifest = ExportManifest.load(export_path)
+    assert manifest.stale_reason(job) == "Output file does not exist"
+
+    _export_current_images([job])
+    assert manifest.stale_reason(job) is None
+    manifest.save()
+
+    reloaded = ExportManifest.load(export_path)
+    assert reloaded.entries == {
+        "AB/AB_ver1.png": manifest_entry(job.source_path, SEQUENCE)
+    }
+
+
+def test_manifest_reports_why_an_export_is_stale(dictionary, tmp_path):
+    export_path = str(tmp_path / "export")
+    job = build_export_jobs(dictionary, export_path)[0]
+    _export_current_images([job])
+    manifest = ExportManifest.load(export_path)
+    manifest.record(job, manifest_entry(job.source_path, SEQUENCE))
+
+    # Touching the source only costs a metadata read
+    stat = os.stat(job.source_path)
+    os.utime(job.source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert manifest.stale_reason(job) is None
+    assert manifest.entries["AB/AB_ver1.png"]["source_mtime_ns"] == (
+        stat.st_mtime_ns + 10**9
+    )
+
+    entry = dict(manifest.entries["AB/AB_ver1.png"])
+    manifest.record(job, {**entry, "options_hash": "old"})
+    assert manifest.stale_reason(job) == "Export options changed"
+    manifest.record(job, {**entry, "renderer_version": 0})
+    assert manifest.stale_reason(job) == "Renderer version changed"
+
+    manifest.record(job, entry)
+    _write_png(job.source_path, {"sequence": SEQUENCE + [{"letter": "B"}]})
+    assert manifest.stale_reason(job) == "Sequence data has changed"
+
+
+def test_dry_run_lists_stale_exports_with_reasons(dictionary, tmp_path):
+    export_path = str(tmp_path / "export")
+    _export_current_images(build_export_jobs(dictionary, export_path)[:2])
+
+    report = DictionaryImageRegenerator(dictionary, export_path).dry_run()
+
+    assert report.splitlines() == [
+        "1 of 3 sequence card images would be regenerated",
+        "       1  Output file does not exist",
+        "C/C_ver1.png: Output file does not exist",
+    ]
+    assert not os.path.exists(os.path.join(export_path, ExportManifest.FILENAME))
+
+
+def test_current_images_are_skipped_before_reaching_workers(dictionary, tmp_path):
+    export_path = str(tmp_path / "export")
+    _export_current_images(build_export_jobs(dictionary, export_path))
+    progress_queue = queue.Queue()
+
+    summary = DictionaryImageRegenerator(dictionary, export_path, max_workers=2).run(
+        progress_queue
+    )
+
+    assert (summary.total, summary.skipped, summary.regenerated) == (3, 3, 0)
+    assert progress_queue.empty()
+    manifest = ExportManifest.load(export_path)
+    assert sorted(manifest.entries) == [
+        "AB/AB_ver1.png",
+        "AB/AB_ver2.png",
+        "C/C_ver1.png",
+    ]
+
+
+def test_images_without_sequence_metadata_fail(tmp_path):
+    dictionary = tmp_path / "dictionary"
+    _write_png(str(dictionary / "A" / "A_ver1.png"))
+
+    summary = DictionaryImageRegenerator(
+        str(dictionary), str(tmp_path / "export"), max_workers=1
+    ).run()
+
+    assert (summary.total, summary.failed) == (1, 1)
+    assert not os.path.exists(tmp_path / "export" / "A" / "A_ver1.png")
+    assert ExportManifest.load(str(tmp_path / "export")).entries == {}
+
+
+def test_cancelled_run_starts_no_exports(dictionary, tmp_path):
+    regenerator = DictionaryImageRegenerator(
+        dictionary, str(tmp_path / "export"), max_workers=2
+    )
+    regenerator.cancel()
+    progress_queue = queue.Queue()
+
+    summary = regenerator.run(progress_queue)
+
+    assert summary.cancelled
+    assert summary.regenerated == summary.failed == summary.skipped == 0
+    updates = []
+    while not progress_queue.empty():
+        updates.append(progress_queue.get_nowait())
+    assert {update.status for update in updates} == {CANCELLED}
+    assert sorted(update.completed for update in updates) == [1, 2, 3]
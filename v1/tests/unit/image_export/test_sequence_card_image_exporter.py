@@ -0,0 +1,108 @@
+import os
+import threading
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtWidgets import QApplication, QLabel, QProgressBar, QPushButton, QWidget
+
+from main_window.main_widget.dictionary_image_regenerator import (
+    ExportProgress,
+    ExportSummary,
+)
+from main_window.main_widget.sequence_card_tab.export import image_exporter
+from main_window.main_widget.sequence_card_tab.export.image_exporter import (
+    SequenceCardImageExporter,
+)
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class FakeRegenerator:
+    """Reports two exports, then waits to be released or cancelled."""
+
+    instances = []
+
+    def __init__(self, dictionary_path, export_path):
+        self.release = threading.Event()
+        self.cancelled = False
+        FakeRegenerator.instances.append(self)
+
+    def run(self, progress_queue):
+        for completed in (1, 2):
+            progress_queue.put(ExportProgress(None, "regenerated", completed, 2))
+        self.release.wait(5)
+        return ExportSummary(total=2, regenerated=2, cancelled=self.cancelled)
+
+    def cancel(self):
+        self.cancelled = True
+        self.release.set()
+
+
+@pytest.fixture
+def tab(app, monkeypatch):
+    FakeRegenerator.instances = []
+    monkeypatch.setattr(image_exporter, "DictionaryImageRegenerator", FakeRegenerator)
+    monkeypatch.setattr(image_exporter, "get_dictionary_path", lambda: "dictionary")
+    monkeypatch.setattr(
+        image_exporter, "get_sequence_card_image_exporter_path", lambda: "export"
+    )
+    tab = QWidget()
+    tab.main_widget = None
+    tab.header = SimpleNamespace(
+        description_label=QLabel(),
+        progress_bar=QProgressBar(),
+        progress_container=QWidget(),
+        cancel_button=QPushButton(),
+        regenerate_button=QPushButton(),
+    )
+    yield tab
+    for regenerator in FakeRegenerator.instances:
+        regenerator.release.set()
+
+
+def _wait_for(app, condition):
+    for _ in range(500):
+        if condition():
+            return
+        app.processEvents()
+        threading.Event().wait(0.01)
+    raise AssertionError("timed out")
+
+
+def test_export_returns_before_the_images_are_done(app, tab):
+    exporter = SequenceCardImageExporter(tab)
+    summaries = []
+
+    assert exporter.export_all_images(summaries.append)
+    assert exporter.is_exporting
+    assert not exporter.export_all_images(summaries.append)
+
+    _wait_for(app, lambda: tab.header.progress_bar.value() == 2)
+    assert summaries == []
+    assert not tab.header.regenerate_button.isEnabled()
+
+    FakeRegenerator.instances[0].release.set()
+    _wait_for(app, lambda: summaries)
+
+    assert summaries[0].regenerated == 2
+    assert not exporter.is_exporting
+    assert tab.header.regenerate_button.isEnabled()
+
+
+def test_cancel_control_cancels_the_regenerator(app, tab):
+    exporter = SequenceCardImageExporter(tab)
+    summaries = []
+    exporter.export_all_images(summaries.append)
+
+    exporter._on_cancel_requested()
+    _wait_for(app, lambda: summaries)
+
+    assert exporter.cancel_requested
+    assert summaries[0].cancelled
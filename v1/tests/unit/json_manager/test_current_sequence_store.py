@@ -0,0 +1,68 @@
+import json
+import os
+
+import pytest
+
+from main_window.main_widget.json_manager.current_sequence_store import (
+    CurrentSequenceStore,
+)
+
+
+def _default_sequence():
+    return [{"word": "", "level": 0}]
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / "current_sequence.json")
+
+
+def test_reads_are_served_from_memory(store_path):
+    with open(store_path, "w", encoding="utf-8") as file:
+        json.dump([{"word": "A"}], file)
+
+    store = CurrentSequenceStore(store_path, _default_sequence)
+    assert store.peek()[0]["word"] == "A"
+
+    os.remove(store_path)
+    assert store.peek()[0]["word"] == "A"
+
+
+def test_get_returns_independent_copy(store_path):
+    store = CurrentSequenceStore(store_path, _default_sequence)
+    sequence = store.get()
+    sequence[0]["word"] = "mutated"
+    assert store.peek()[0]["word"] == ""
+
+
+def test_writes_are_debounced_and_flushed(store_path):
+    store = CurrentSequenceStore(store_path, _default_sequence, debounce_seconds=60)
+    store.peek()
+    writes_after_load = store.write_count
+
+    for i in range(50):
+        store.set([{"word": str(i)}])
+    assert store.write_count == writes_after_load
+
+    store.flush()
+    assert store.write_count == writes_after_load + 1
+    with open(store_path, encoding="utf-8") as file:
+        assert json.load(file) == [{"word": "49"}]
+    assert not os.path.exists(store_path + CurrentSequenceStore.TEMP_SUFFIX)
+
+
+def test_recovers_from_interrupted_write(store_path):
+    with open(store_path, "w", encoding="utf-8") as file:
+        file.write('[{"word": "trunc')
+    with open(store_path + CurrentSequenceStore.TEMP_SUFFIX, "w") as file:
+        json.dump([{"word": "recovered"}], file)
+
+    store = CurrentSequenceStore(store_path, _default_sequence)
+    assert store.peek() == [{"word": "recovered"}]
+    assert not os.path.exists(store_path + CurrentSequenceStore.TEMP_SUFFIX)
+
+
+def test_for_path_shares_one_store_per_file(store_path):
+    first = CurrentSequenceStore.for_path(store_path, _default_sequence)
+    second = CurrentSequenceStore.for_path(store_path, _default_sequence)
+    assert first is second
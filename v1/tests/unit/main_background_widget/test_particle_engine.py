@@ -0,0 +1,172 @@
+import os
+
+import numpy as np
+import pytest
+from PyQt6.QtCore import QPoint
+from PyQt6.QtGui import QColor, QPainter, QPixmap
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from main_window.main_widget.main_background_widget.particles import (
+    FrameRateGovernor,
+    ParticleField,
+    SpriteAtlas,
+    uniform,
+)
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def _field(count=100):
+    return ParticleField(
+        count,
+        {"y": uniform(0, 1), "speed": uniform(0.1, 0.2), "kind": uniform(5, 6)},
+        rng=np.random.default_rng(0),
+    )
+
+
+def test_columns_update_in_place():
+    field = _field()
+    speed = field.speed
+    before = field.y.copy()
+
+    field.y += field.speed
+
+    assert np.allclose(field.y, before + speed)
+    assert field.speed is speed
+    with pytest.raises(AttributeError):
+        field.missing
+
+
+def test_respawn_only_touches_masked_particles():
+    field = _field()
+    field.y += 1.0
+    kind = field.kind.copy()
+    off_screen = field.y > 1.5
+    on_screen_y = field.y[~off_screen].copy()
+
+    respawned = field.respawn(off_screen, keep=("kind",), y=0.0)
+
+    assert respawned == off_screen.sum() > 0
+    assert np.all(field.y[off_screen] == 0.0)
+    assert np.array_equal(field.y[~off_screen], on_screen_y)
+    assert np.array_equal(field.kind, kind)
+    assert field.respawn(np.zeros(field.count, dtype=bool)) == 0
+
+
+def test_bounce_reverses_velocity_outside_bounds():
+    field = ParticleField(
+        3, {"x": uniform(0, 1), "dx": uniform(1, 1)}, rng=np.random.default_rng(0)
+    )
+    field.x = np.array([-0.1, 0.5, 1.2])
+
+    field.bounce("x", "dx", 0, 1)
+
+    assert field.dx.tolist() == [-1, 1, -1]
+
+
+def test_atlas_draws_fragments_centred_and_scaled(app):
+    def red_square(painter, size):
+        painter.fillRect(0, 0, size, size, QColor("red"))
+
+    def blue_square(painter, size):
+        painter.fillRect(0, 0, size, size, QColor("blue"))
+
+    atlas = SpriteAtlas(8, [red_square, blue_square])
+    canvas = QPixmap(40, 20)
+    canvas.fill(QColor("black"))
+
+    painter = QPainter(canvas)
+    atlas.draw(
+        painter,
+        np.array([10.0, 30.0]),
+        np.array([10.0, 10.0]),
+        np.array([0, 1]),
+        size=np.array([4.0, 16.0]),
+    )
+    painter.end()
+
+    image = canvas.toImage()
+    assert image.pixelColor(10, 10) == QColor("red")
+    assert image.pixelColor(13, 10) == QColor("black")
+    assert image.pixelColor(23, 10) == QColor("blue")
+    assert len(atlas) == 2
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_governor_idles_without_input_and_pauses_when_hidden(app):
+    widget = QWidget()
+    clock = FakeClock()
+    cursor = QPoint(0, 0)
+    governor = FrameRateGovernor(
+        widget,
+        clock=clock,
+        cursor_position=lambda: cursor,
+        application_active=lambda: True,
+    )
+    ticks = []
+    governor.tick.connect(lambda: ticks.append(governor.mode))
+
+    governor.on_timeout()
+    assert governor.mode == FrameRateGovernor.PAUSED
+    assert governor.timer.interval() == FrameRateGovernor.PAUSED_POLL_MS
+    assert ticks == []
+
+    widget.show()
+    app.processEvents()
+    governor.start()
+    governor.on_timeout()
+    active_mode = governor.mode
+    assert active_mode == FrameRateGovernor.ACTIVE
+    clock.now += FrameRateGovernor.IDLE_AFTER_SECONDS + 1
+    governor.on_timeout()
+    assert governor.mode == FrameRateGovernor.IDLE
+    assert governor.timer.interval() == governor.interval_for(FrameRateGovernor.IDLE)
+
+    cursor = QPoint(5, 5)
+    governor.on_timeout()
+    assert governor.mode == active_mode
+    assert ticks == [active_mode, FrameRateGovernor.IDLE, active_mode]
+
+    governor.stop()
+    widget.hide()
+    assert not governor.is_running
+
+
+def test_governor_stops_while_application_is_inactive(app):
+    widget = QWidget()
+    widget.show()
+    app.processEvents()
+    active = True
+    governor = FrameRateGovernor(widget, application_active=lambda: active)
+    ticks = []
+    governor.tick.connect(lambda: ticks.append(governor.mode))
+    governor.start()
+
+    active = False
+    governor.on_timeout()
+    assert not governor.is_running
+    assert governor.mode == FrameRateGovernor.PAUSED
+    assert ticks == []
+
+    active = True
+    governor.on_application_state_changed()
+    assert governor.is_running
+
+    governor.stop()
+    governor.on_application_state_changed()
+    assert not governor.is_running
+    widget.hide()
@@ -0,0 +1,109 @@
+import os
+
+import pytest
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QPixmap
+from PyQt6.QtWidgets import QApplication, QGraphicsScene, QGraphicsView
+
+from base_widgets.pictograph.elements.views.pictograph_raster_cache import (
+    PictographRasterCache,
+    PictographRasterizer,
+    scene_fingerprint,
+)
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+class CachedView(QGraphicsView):
+    def __init__(self, scene, cache):
+        super().__init__(scene)
+        self.key_calls = 0
+        self.rasterizer = PictographRasterizer(self, self._content_key, cache)
+
+    def _content_key(self, scene):
+        self.key_calls += 1
+        return scene_fingerprint(scene)
+
+    def paintEvent(self, event):
+        if not self.rasterizer.paint():
+            super().paintEvent(event)
+
+
+def _scene():
+    scene = QGraphicsScene(0, 0, 100, 100)
+    item = scene.addRect(QRectF(0, 0, 50, 50), brush=QColor("red"))
+    return scene, item
+
+
+def test_cache_evicts_least_recently_used_over_budget(app):
+    pixmap = QPixmap(10, 10)
+    size = 10 * 10 * pixmap.depth() // 8
+    cache = PictographRasterCache(budget_bytes=2 * size)
+
+    cache.put("a", pixmap)
+    cache.put("b", pixmap)
+    cache.get("a")
+    cache.put("c", pixmap)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats()["evictions"] == 1
+    assert len(cache) == 2
+
+
+def test_repaints_reuse_raster_until_scene_changes(app):
+    cache = PictographRasterCache()
+    scene, item = _scene()
+    view = CachedView(scene, cache)
+    view.resize(100, 100)
+    app.processEvents()
+
+    first = view.viewport().grab().toImage()
+    view.viewport().grab()
+    assert (cache.misses, cache.hits, view.key_calls) == (1, 1, 1)
+    assert first.pixelColor(10, 10) == QColor("red")
+
+    item.setPos(50, 50)
+    app.processEvents()
+    moved = view.viewport().grab().toImage()
+
+    assert cache.misses == 2
+    assert view.key_calls == 2
+    assert moved.pixelColor(70, 70) == QColor("red")
+
+
+def test_identical_scenes_share_a_raster(app):
+    cache = PictographRasterCache()
+    views = [CachedView(_scene()[0], cache) for _ in range(2)]
+    for view in views:
+        view.resize(100, 100)
+    app.processEvents()
+
+    for view in views:
+        view.viewport().grab()
+
+    assert (cache.misses, cache.hits, len(cache)) == (1, 1, 1)
+
+
+def test_resize_stretches_last_raster_until_settled(app):
+    cache = PictographRasterCache()
+    view = CachedView(_scene()[0], cache)
+    view.resize(100, 100)
+    app.processEvents()
+    view.viewport().grab()
+
+    view.resize(120, 120)
+    view.rasterizer.begin_resize()
+    view.viewport().grab()
+    assert cache.misses == 1
+
+    view.rasterizer.settle_timer.stop()
+    view.viewport().grab()
+    assert cache.misses == 2
@@ -0,0 +1,247 @@
+import copy
+
+from data.constants import (
+    BEAT,
+    BLUE_ATTRS,
+    END_LOC,
+    END_ORI,
+    END_POS,
+    IN,
+    LETTER,
+    MOTION_TYPE,
+    OUT,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+    START_LOC,
+    START_ORI,
+    START_POS,
+    TURNS,
+)
+from main_window.main_widget.sequence_properties_manager.mirrored_swapped_CAP_checker import (
+    MirroredSwappedCAPChecker,
+)
+from main_window.main_widget.sequence_properties_manager.rotated_swapped_CAP_checker import (
+    RotatedSwappedCAPChecker,
+)
+from main_window.main_widget.sequence_properties_manager.strict_mirrored_CAP_checker import (
+    StrictMirroredCAPChecker,
+)
+from main_window.main_widget.sequence_properties_manager.strict_rotated_CAP_checker import (
+    StrictRotatedCAPChecker,
+)
+from main_window.main_widget.sequence_properties_manager.strict_swapped_CAP_checker import (
+    StrictSwappedCAPChecker,
+)
+
+
+class FakeManager:
+    def __init__(self, sequence):
+        self.sequence = sequence
+
+
+def _motion(motion_type, prop_rot_dir, start_loc, end_loc, start_ori=IN, end_ori=IN):
+    return {
+        MOTION_TYPE: motion_type,
+        PROP_ROT_DIR: prop_rot_dir,
+        START_LOC: start_loc,
+        END_LOC: end_loc,
+        TURNS: 0,
+        START_ORI: start_ori,
+        END_ORI: end_ori,
+    }
+
+
+def _pro(start_loc, end_loc, prop_rot_dir="cw", **oris):
+    return _motion("pro", prop_rot_dir, start_loc, end_loc, **oris)
+
+
+def _static(loc):
+    return _motion("static", "no_rot", loc, loc)
+
+
+def _dash(start_loc, end_loc):
+    return _motion("dash", "no_rot", start_loc, end_loc)
+
+
+def _sequence(start_pos, *beats):
+    """Start position entry followed by (letter, end_pos, blue, red) beats."""
+    sequence = [{BEAT: 0, LETTER: "α", START_POS: start_pos, END_POS: start_pos}]
+    for number, (letter, end_pos, blue, red) in enumerate(beats, 1):
+        sequence.append(
+            {
+                BEAT: number,
+                LETTER: letter,
+                START_POS: sequence[-1][END_POS],
+                END_POS: end_pos,
+                BLUE_ATTRS: blue,
+                RED_ATTRS: red,
+            }
+        )
+    return sequence
+
+
+def _check(checker_class, sequence):
+    # The manager's sequence starts with the start position entry
+    return checker_class(FakeManager(sequence)).check()
+
+
+def _with(sequence, index, **changes):
+    sequence = copy.deepcopy(sequence)
+    sequence[index].update(changes)
+    return sequence
+
+
+# Positions name (blue, red) hand locations, e.g. alpha1 is blue s, red n.
+
+STRICT_ROTATED = _sequence(
+    "alpha1",
+    ("A", "alpha3", _pro("s", "w"), _pro("n", "e")),
+    ("A", "alpha5", _pro("w", "n"), _pro("e", "s")),
+    ("A", "alpha7", _pro("n", "e"), _pro("s", "w")),
+    ("A", "alpha1", _pro("e", "s"), _pro("w", "n")),
+)
+
+STRICT_MIRRORED = _sequence(
+    "alpha1",
+    ("A", "alpha3", _pro("s", "w"), _pro("n", "e")),
+    ("G", "beta1", _pro("w", "n"), _pro("e", "n", "ccw")),
+    ("Φ", "alpha5", _static("n"), _dash("n", "s")),
+    ("A", "alpha7", _pro("n", "e", "ccw"), _pro("s", "w", "ccw")),
+    ("G", "beta5", _pro("e", "s", "ccw"), _pro("w", "s")),
+    ("Φ", "alpha1", _static("s"), _dash("s", "n")),
+)
+
+# The second half swaps the hands' motions; orientations carry over from
+# the beat before and differ from the first half
+STRICT_SWAPPED = _sequence(
+    "alpha1",
+    ("A", "alpha3", _pro("s", "w"), _pro("n", "e")),
+    ("A", "alpha5", _pro("w", "n"), _pro("e", "s")),
+    ("A", "alpha7", _pro("n", "e", start_ori=OUT), _pro("s", "w", end_ori=OUT)),
+    ("A", "alpha1", _pro("e", "s", start_ori=OUT), _pro("w", "n", start_ori=OUT)),
+)
+
+MIRRORED_SWAPPED = _sequence(
+    "alpha1",
+    ("J", "gamma1", _pro("s", "w"), _static("n")),
+    ("Ψ", "alpha5", _pro("w", "n"), _dash("n", "s")),
+    ("J", "gamma3", _static("n"), _pro("s", "e", "ccw")),
+    ("Ψ", "alpha1", _dash("n", "s"), _pro("e", "n", "ccw")),
+)
+
+# "Φ-" is one beat; the word ["A", "Φ-"] repeats twice. The second
+# repetition ends on gamma9, the 180° rotation of gamma7.
+ROTATED_SWAPPED_TWO_REPETITIONS = _sequence(
+    "alpha1",
+    ("A", "alpha3", _pro("s", "w"), _pro("n", "e")),
+    ("Φ-", "gamma7", _pro("w", "s", "ccw"), _dash("e", "w")),
+    ("A", "alpha3", _pro("s", "w"), _pro("w", "e")),
+    ("Φ-", "gamma9", _dash("w", "e"), _pro("e", "n", "ccw")),
+)
+
+# Each beat is the one before turned a quarter, so the fourth is the first
+# turned three quarters
+ROTATED_SWAPPED_FOUR_REPETITIONS = _sequence(
+    "alpha7",
+    ("A", "alpha1", _pro("e", "s"), _pro("w", "n")),
+    ("A", "alpha3", _pro("s", "w"), _pro("n", "e")),
+    ("A", "alpha5", _pro("w", "n"), _pro("e", "s")),
+    ("A", "alpha7", _pro("n", "e"), _pro("s", "w")),
+)
+
+# The word "A" repeats four times, but only the halves match as rotations
+ROTATED_SWAPPED_WORD_REPEATS_ITSELF = _sequence(
+    "alpha1",
+    ("A", "alpha3", _pro("s", "w"), _pro("n", "e")),
+    ("A", "beta1", _pro("w", "n"), _pro("e", "n", "ccw")),
+    ("A", "alpha3", _pro("n", "w", "ccw"), _pro("n", "e")),
+    ("A", "beta5", _pro("w", "s", "ccw"), _pro("e", "s")),
+)
+
+
+class TestStrictRotatedCAPChecker:
+    def test_second_half_rotated_half_a_turn(self):
+        assert _check(StrictRotatedCAPChecker, STRICT_ROTATED)
+
+    def test_second_half_must_repeat_the_letters(self):
+        sequence = _with(STRICT_ROTATED, 3, **{LETTER: "B"})
+        assert not _check(StrictRotatedCAPChecker, sequence)
+
+    def test_second_half_must_end_on_rotated_positions(self):
+        sequence = _with(STRICT_ROTATED, 3, **{END_POS: "alpha3"})
+        assert not _check(StrictRotatedCAPChecker, sequence)
+
+    def test_second_half_must_keep_rotation_directions(self):
+        sequence = _with(STRICT_ROTATED, 4, **{RED_ATTRS: _pro("w", "n", "ccw")})
+        assert not _check(StrictRotatedCAPChecker, sequence)
+
+    def test_odd_length_is_not_a_CAP(self):
+        assert not _check(StrictRotatedCAPChecker, STRICT_ROTATED[:4])
+
+
+class TestStrictMirroredCAPChecker:
+    def test_each_beat_mirrors_the_beat_half_a_sequence_earlier(self):
+        assert _check(StrictMirroredCAPChecker, STRICT_MIRRORED)
+
+    def test_second_half_must_end_on_mirrored_positions(self):
+        sequence = _with(STRICT_MIRRORED, 4, **{END_POS: "alpha5"})
+        assert not _check(StrictMirroredCAPChecker, sequence)
+
+    def test_too_short_to_be_a_CAP(self):
+        assert not _check(StrictMirroredCAPChecker, STRICT_MIRRORED[:3])
+
+
+class TestStrictSwappedCAPChecker:
+    def test_second_half_swaps_hands_despite_carried_orientations(self):
+        assert _check(StrictSwappedCAPChecker, STRICT_SWAPPED)
+
+    def test_swapped_motions_must_match(self):
+        sequence = _with(STRICT_SWAPPED, 4, **{RED_ATTRS: _pro("w", "n", "ccw")})
+        assert not _check(StrictSwappedCAPChecker, sequence)
+
+
+class TestMirroredSwappedCAPChecker:
+    def test_second_half_ends_on_mirrored_swapped_positions(self):
+        assert _check(MirroredSwappedCAPChecker, MIRRORED_SWAPPED)
+
+    def test_plain_mirror_is_not_mirrored_swapped(self):
+        # gamma9 is gamma1 mirrored about the vertical, without the swap
+        sequence = _with(MIRRORED_SWAPPED, 3, **{END_POS: "gamma9"})
+        assert not _check(MirroredSwappedCAPChecker, sequence)
+
+
+class TestRotatedSwappedCAPChecker:
+    def test_two_repetitions_with_dash_letters(self):
+        assert (
+            _check(RotatedSwappedCAPChecker, ROTATED_SWAPPED_TWO_REPETITIONS)
+            == "First-Second Match"
+        )
+
+    def test_gamma7_rotates_to_gamma9(self):
+        sequence = copy.deepcopy(ROTATED_SWAPPED_TWO_REPETITIONS)
+        for beat in sequence[2::2]:
+            beat[LETTER] = "B"
+        assert _check(RotatedSwappedCAPChecker, sequence) == "First-Second Match"
+
+        sequence = _with(sequence, 4, **{END_POS: "gamma11"})
+        assert not _check(RotatedSwappedCAPChecker, sequence)
+
+    def test_four_repetitions_prefer_first_fourth_match(self):
+        assert (
+            _check(RotatedSwappedCAPChecker, ROTATED_SWAPPED_FOUR_REPETITIONS)
+            == "First-Fourth Match"
+        )
+
+    def test_four_repetitions_fall_back_to_two(self):
+        assert (
+            _check(RotatedSwappedCAPChecker, ROTATED_SWAPPED_WORD_REPEATS_ITSELF)
+            == "First-Second Match"
+        )
+
+    def test_fallback_still_requires_rotated_halves(self):
+        sequence = _with(ROTATED_SWAPPED_WORD_REPEATS_ITSELF, 4, **{END_POS: "beta1"})
+        assert not _check(RotatedSwappedCAPChecker, sequence)
+
+    def test_word_must_repeat(self):
+        sequence = _with(ROTATED_SWAPPED_FOUR_REPETITIONS, 2, **{LETTER: "B"})
+        assert not _check(RotatedSwappedCAPChecker, sequence)
@@ -0,0 +1,206 @@
+import copy
+import random
+
+import pytest
+
+from data.constants import (
+    BLUE_ATTRS,
+    END_ORI,
+    END_POS,
+    LETTER,
+    MOTION_TYPE,
+    PROP_ROT_DIR,
+    RED_ATTRS,
+    START_ORI,
+    TURNS,
+    VERTICAL,
+)
+from data.positions_maps import (
+    half_position_map,
+    mirrored_positions,
+    mirrored_swapped_positions,
+)
+from main_window.main_widget.sequence_properties_manager.sequence_properties_manager import (
+    SequencePropertiesManager,
+)
+from main_window.main_widget.sequence_properties_manager.sequence_properties_tracker import (
+    SequencePropertiesTracker,
+)
+
+POSITIONS = sorted(half_position_map)
+
+
+def _attributes(rng):
+    return {
+        MOTION_TYPE: rng.choice(["pro", "anti", "static"]),
+        PROP_ROT_DIR: rng.choice(["cw", "ccw", "no_rot"]),
+        TURNS: rng.choice(["fl", 0, 0, 1]),
+        START_ORI: rng.choice(["in", "in", "out", "clock"]),
+        END_ORI: rng.choice(["in", "out"]),
+    }
+
+
+def _beat(rng):
+    return {
+        LETTER: rng.choice("ABC"),
+        END_POS: rng.choice(POSITIONS),
+        BLUE_ATTRS: _attributes(rng),
+        RED_ATTRS: _attributes(rng),
+    }
+
+
+def _start_position(rng):
+    return {"beat": 0, END_POS: rng.choice(POSITIONS)}
+
+
+def _second_half(first_half, transform):
+    second_half = []
+    for beat in first_half:
+        beat = copy.deepcopy(beat)
+        transform(beat)
+        second_half.append(beat)
+    return second_half
+
+
+def _rotate(beat):
+    beat[END_POS] = half_position_map[beat[END_POS]]
+
+
+def _mirror(beat):
+    beat[END_POS] = mirrored_positions[VERTICAL][beat[END_POS]]
+
+
+def _swap(beat):
+    beat[BLUE_ATTRS], beat[RED_ATTRS] = beat[RED_ATTRS], beat[BLUE_ATTRS]
+
+
+def _mirror_swap(beat):
+    beat[END_POS] = mirrored_swapped_positions[VERTICAL][beat[END_POS]]
+
+
+def _manager(sequence):
+    manager = SequencePropertiesManager(verify=True)
+    manager.instantiate_sequence([{"word": ""}] + sequence)
+    return manager
+
+
+def _assert_matches_checkers(manager):
+    properties = manager.check_all_properties()
+    assert manager.verification_failures == 0
+    return properties
+
+
+@pytest.mark.parametrize(
+    "transform, flag",
+    [
+        (_rotate, "is_strict_rotated_CAP"),
+        (_mirror, "is_strict_mirrored_CAP"),
+        (_swap, "is_strict_swapped_CAP"),
+        (_mirror_swap, "is_mirrored_swapped_CAP"),
+    ],
+)
+def test_cap_sequences_match_the_checkers(transform, flag):
+    rng = random.Random(flag)
+    for length in (2, 4, 8):
+        first_half = [_beat(rng) for _ in range(length)]
+        sequence = [_start_position(rng)] + first_half
+        sequence += _second_half(first_half, transform)
+
+        manager = _manager(sequence)
+        _assert_matches_checkers(manager)
+        # An earlier CAP in the cascade may also hold and be the one reported
+        assert getattr(manager.tracker, flag)()
+        assert manager.checkers[flag].check()
+
+
+def test_random_edits_match_a_full_recalculation():
+    rng = random.Random(7)
+    manager = SequencePropertiesManager(verify=True)
+    sequence = [_start_position(rng)]
+
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.5 or len(sequence) < 3:
+            sequence.append(_beat(rng))
+        elif action < 0.7:
+            sequence[rng.randrange(1, len(sequence))] = _beat(rng)
+        elif action < 0.85:
+            del sequence[rng.randrange(2, len(sequence)) :]
+        else:
+            half = (len(sequence) - 1) // 2
+            sequence = sequence[: half + 1] + _second_half(
+                sequence[1 : half + 1], rng.choice([_rotate, _swap, _mirror_swap])
+            )
+        manager.instantiate_sequence([{"word": ""}] + sequence)
+        _assert_matches_checkers(manager)
+
+
+def test_placeholders_are_skipped():
+    rng = random.Random(3)
+    first_half = [_beat(rng) for _ in range(2)]
+    sequence = [_start_position(rng)] + first_half + _second_half(first_half, _swap)
+    sequence.append({"is_placeholder": True, END_POS: "alpha1"})
+
+    properties = _assert_matches_checkers(_manager(sequence))
+    assert properties["is_strict_swapped_CAP"]
+    assert properties["word"] == "".join(beat[LETTER] for beat in sequence[1:5])
+
+
+def test_appending_processes_only_the_new_beat():
+    rng = random.Random(11)
+    tracker = SequencePropertiesTracker()
+    sequence = [_start_position(rng)]
+
+    for length in range(1, 33):
+        sequence.append(_beat(rng))
+        tracker.sync(sequence)
+        assert tracker.processed_beats == length
+
+    tracker.sync(sequence)
+    assert tracker.processed_beats == 32
+
+
+def test_editing_a_beat_reprocesses_only_that_beat():
+    rng = random.Random(13)
+    tracker = SequencePropertiesTracker()
+    sequence = [_start_position(rng)] + [_beat(rng) for _ in range(16)]
+    tracker.sync(sequence)
+
+    sequence[5] = dict(sequence[5], **{LETTER: "Z"})
+    tracker.sync(sequence)
+
+    assert tracker.processed_beats == 17
+    assert tracker.word[4] == "Z"
+
+
+def test_level_is_the_hardest_beat():
+    rng = random.Random(17)
+    tracker = SequencePropertiesTracker()
+    beat = _beat(rng)
+    for attributes in (beat[BLUE_ATTRS], beat[RED_ATTRS]):
+        attributes.update({TURNS: 0, START_ORI: "in", END_ORI: "in"})
+    turned = copy.deepcopy(beat)
+    turned[BLUE_ATTRS][TURNS] = 1
+
+    tracker.sync([_start_position(rng), beat])
+    assert tracker.level == ""
+    tracker.sync([_start_position(rng), beat, beat])
+    assert tracker.level == 1
+    tracker.sync([_start_position(rng), beat, beat, turned])
+    assert tracker.level == 2
+    tracker.truncate(2)
+    assert tracker.level == 1
+
+
+def test_syncing_a_shorter_sequence_drops_the_old_level():
+    rng = random.Random(19)
+    tracker = SequencePropertiesTracker()
+    start_position = _start_position(rng)
+    tracker.sync([start_position] + [_beat(rng) for _ in range(4)])
+    assert tracker.level != ""
+
+    tracker.sync([start_position])
+    assert tracker.level == ""
+    assert tracker.word == ""
+    tracker.sync([])
+    assert len(tracker) == 0
@@ -0,0 +1,116 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from main_window.main_widget.sequence_workbench.workbench_layout import (
+    WorkbenchLayout,
+    graph_editor_size,
+)
+from utils.layout_scheduler import LayoutCounters, LayoutScheduler
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+def test_requests_coalesce_into_one_pass_per_tick(app):
+    counters = LayoutCounters()
+    size = [100]
+    applied = []
+    scheduler = LayoutScheduler(
+        lambda: size[0], applied.append, counters=counters
+    )
+
+    for _ in range(5):
+        scheduler.schedule()
+    app.processEvents()
+    assert applied == [100]
+
+    # Applying a layout resizes widgets, which schedules a no-op pass
+    scheduler.schedule()
+    app.processEvents()
+    size[0] = 120
+    scheduler.schedule()
+    app.processEvents()
+
+    assert applied == [100, 120]
+    assert counters.snapshot() == {
+        "requests": 7,
+        "passes": 3,
+        "skipped_passes": 1,
+        "stylesheet_rebuilds": 0,
+    }
+
+
+def test_counts_are_reported_per_window_resize():
+    counters = LayoutCounters(passes=4, stylesheet_rebuilds=10)
+
+    counters.begin_window_resize()
+    counters.passes += 1
+    counters.stylesheet_rebuilds += 2
+
+    assert counters.since_window_resize()["passes"] == 1
+    assert counters.since_window_resize()["stylesheet_rebuilds"] == 2
+    assert counters.window_resizes == 1
+
+
+class Section:
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+
+
+class Workbench(QWidget):
+    def __init__(self, main_height, cols=4):
+        super().__init__()
+        self.resize(800, main_height - 100)
+        self.main_widget = SimpleNamespace(height=lambda: main_height)
+        self.main_widget.left_stack = SimpleNamespace(width=lambda: 800)
+        self.graph_editor = Section()
+        self.button_panel = Section()
+        self.beat_sizes = []
+        self.beat_frame = SimpleNamespace(
+            resizer=SimpleNamespace(
+                calculate_dimensions=lambda ge_height: (400, 600 - ge_height),
+                calculate_beat_size=lambda width, height: min(
+                    width // cols, int(height // 6)
+                ),
+                apply_beat_size=self.beat_sizes.append,
+            )
+        )
+
+
+def test_workbench_layout_pushes_only_changed_sections(app):
+    workbench = Workbench(main_height=800)
+    layout = WorkbenchLayout(workbench)
+
+    layout.apply(layout.compute_dimensions())
+    assert workbench.graph_editor.calls == [("apply_layout", (800, 200))]
+    assert workbench.button_panel.calls == [("apply_layout", (40, 6, 40))]
+    assert workbench.beat_sizes == [66]
+
+    workbench.main_widget.height = lambda: 840
+    layout.apply(layout.compute_dimensions())
+
+    assert workbench.button_panel.calls[-1] == ("apply_layout", (42, 7, 42))
+    assert len(workbench.graph_editor.calls) == 1
+    assert workbench.beat_sizes == [66]
+
+
+def test_graph_editor_size_matches_the_layout_pass(app):
+    workbench = Workbench(main_height=800)
+    workbench.main_widget.left_stack.width = lambda: 600
+    dimensions = WorkbenchLayout(workbench).compute_dimensions()
+
+    assert graph_editor_size(workbench.main_widget) == (600, 150)
+    assert dimensions.graph_editor_width == 600
+    assert dimensions.graph_editor_height == 150
@@ -0,0 +1,90 @@
+import os
+
+import pytest
+from PyQt6.QtWidgets import QApplication, QCheckBox, QLabel
+
+from main_window.main_widget.font_color_updater.base_font_color_updater import (
+    BaseFontColorUpdater,
+)
+from styles.button_state import ButtonState
+from styles.styled_button import ButtonContext, StyledButton
+from styles.stylesheet_compiler import StyleSheetCompiler
+
+
+@pytest.fixture(scope="module")
+def app():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture
+def compiler(monkeypatch):
+    compiler = StyleSheetCompiler()
+    monkeypatch.setattr(StyleSheetCompiler, "_instance", compiler)
+    return compiler
+
+
+def test_sheets_are_compiled_once_per_key(app, compiler):
+    builds = []
+    build = lambda: builds.append(1) or "QLabel { color: red; }"
+
+    first = compiler.compile(("label", "red"), build)
+    second = compiler.compile(("label", "red"), build)
+
+    assert first is second
+    assert len(builds) == 1
+    assert (compiler.compiled, compiler.reused) == (1, 1)
+
+
+def test_apply_skips_widgets_that_already_have_the_sheet(app, compiler):
+    label = QLabel()
+
+    assert compiler.apply(label, "color: red;")
+    assert not compiler.apply(label, "color: red;")
+    assert (compiler.applied, compiler.skipped) == (1, 1)
+
+
+def test_button_state_and_enable_toggles_do_not_reapply(app, compiler):
+    button = StyledButton("Go")
+    applied = compiler.applied
+
+    compiler.begin_action("toggle")
+    button.state = ButtonState.ACTIVE
+    button.setEnabled(False)
+    button.setEnabled(True)
+    button.state = ButtonState.NORMAL
+
+    assert compiler.applied == applied
+    assert compiler.action_counts("toggle")["applied"] == 0
+    assert button.property("active") is False
+
+
+def test_circular_buttons_share_a_sheet_per_size(app, compiler):
+    buttons = [StyledButton("", context=ButtonContext.WORKBENCH) for _ in range(3)]
+    for button in buttons:
+        button.show()
+    app.processEvents()
+
+    compiler.begin_action("resize")
+    for button in buttons:
+        button.resize(60, 60)
+    sheets = {button.styleSheet() for button in buttons}
+
+    assert len(sheets) == 1
+    assert compiler.action_counts("resize")["compiled"] == 1
+
+
+def test_font_color_updates_do_not_grow_widget_sheets(app, compiler):
+    label = QLabel()
+    label.setStyleSheet("font-weight: bold;")
+    checkbox = QCheckBox()
+
+    for color in ("black", "white", "black", "black"):
+        BaseFontColorUpdater(color)._apply_font_colors([label, checkbox])
+
+    assert label.styleSheet() == "font-weight: bold; color: black;"
+    assert "color: black" in checkbox.styleSheet()
+    assert compiler.skipped == 2
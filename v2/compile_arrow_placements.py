@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Kinetic Constructor v2 - Arrow Placement Compiler
+
+Compiles data/arrow_placement into the lookup table used by
+ArrowManagementService. Run after editing any placement JSON; a stale table
+is otherwise recompiled on first use.
+
+USAGE:
+    python compile_arrow_placements.py           # Compile the table
+    python compile_arrow_placements.py --verify  # Compile and diff against the live pipeline
+"""
+
+import sys
+from pathlib import Path
+
+v2_src_path = Path(__file__).parent / "src"
+sys.path.insert(0, str(v2_src_path))
+
+from application.services.positioning.arrow_placement_table import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,7 +22,11 @@ from PyQt6.QtGui import QFont, QIcon, QGuiApplication
 v2_src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(v2_src_path))
 
-from core.dependency_injection.di_container import get_container
+from core.dependency_injection.di_container import (
+    format_construction_report,
+    get_container,
+)
+from core.dependency_injection.service_registry import register_shared_services
 from src.core.interfaces.core_services import (
     ILayoutManagementService,
     IUIStateManagementService,
@@ -96,6 +100,15 @@ class KineticConstructorV2(QMainWindow):
 
         configure_workbench_services(self.container)
 
+        # Build the singleton graph now so startup cost is visible up front
+        # and nothing is constructed lazily in a hot path later
+        if self.splash:
+            self.splash.update_progress(30, "Warming up services...")
+        warm_up_report = self.container.warm_up()
+        print(f"🔥 Service warm-up:\n{warm_up_report.format()}")
+        if not warm_up_report.ok:
+            print(f"⚠️ {len(warm_up_report.failures)} services failed to construct")
+
         if self.splash:
             self.splash.update_progress(40, "Services configured")
 
@@ -189,16 +202,9 @@ class KineticConstructorV2(QMainWindow):
         # conversion_service = DataConversionService()
         # self.container.register_instance(IDataConversionService, conversion_service)
 
-        # Register pictograph management service directly
-        from src.application.services.core.pictograph_management_service import (
-            PictographManagementService,
-        )
-
-        pictograph_management_service = PictographManagementService()
-        # Note: PictographManagementService doesn't have an interface yet, so we register the concrete class
-        self.container.register_instance(
-            PictographManagementService, pictograph_management_service
-        )
+        # Dataset, placement and positioning services are shared singletons,
+        # built on first resolve rather than by each component that uses them
+        register_shared_services(self.container)
 
     def _set_v1_style_dimensions(self):
         """Set window dimensions to match v1: 90% of screen size"""
@@ -339,6 +345,16 @@ class KineticConstructorV2(QMainWindow):
             # This is where the heavy loading happens - break it down
             from src.presentation.tabs.construct_tab_widget import ConstructTabWidget
 
+            if self.splash:
+                self.splash.update_progress(80, "Preloading pictograph assets...")
+
+            # Must match the renderers' import path so they share one cache
+            from presentation.components.pictograph.svg_renderer_cache import (
+                SvgRendererCache,
+            )
+
+            SvgRendererCache.instance().warm_up()
+
             if self.splash:
                 self.splash.update_progress(81, "Initializing position matching...")
 
@@ -569,7 +585,9 @@ def main():
     fade_in_animation.finished.connect(start_initialization)
 
     print("✅ Application started successfully!")
-    return app.exec()
+    exit_code = app.exec()
+    print(f"📊 Service constructions this session:\n{format_construction_report()}")
+    return exit_code
 
 
 if __name__ == "__main__":
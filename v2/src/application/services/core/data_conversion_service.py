@@ -31,6 +31,7 @@ from domain.models.pictograph_models import (
     GridMode,
     ArrowData,
 )
+from infrastructure.pictograph_csv_ingestion import PictographCsvIngestion
 
 
 class IDataConversionService(ABC):
@@ -179,7 +180,7 @@ class DataConversionService(IDataConversionService):
 
         return [
             self._create_beat_data_from_csv_row(row)
-            for _, row in letter_data.iterrows()
+            for row in letter_data.to_dict(orient="records")
         ]
 
     def convert_csv_to_beat_data(self, csv_file_path: Path) -> List[BeatData]:
@@ -247,7 +248,7 @@ class DataConversionService(IDataConversionService):
     def _load_csv_data(self) -> pd.DataFrame:
         """Load CSV data if not already loaded."""
         if self._csv_data is None:
-            self._csv_data = pd.read_csv(self._data_path)
+            self._csv_data = PictographCsvIngestion.for_path(self._data_path).get_frame()
         return self._csv_data
 
     def _create_beat_data_from_csv_row(self, row) -> BeatData:
@@ -24,6 +24,7 @@ from pathlib import Path
 
 import pandas as pd
 
+from core.dependency_injection.di_container import record_construction
 from domain.models.core_models import (
     BeatData,
     MotionData,
@@ -42,6 +43,7 @@ from domain.models.pictograph_models import (
     ArrowData,
     PropData,
 )
+from infrastructure.pictograph_csv_ingestion import PictographCsvIngestion
 
 
 class IPictographManagementService(ABC):
@@ -99,6 +101,8 @@ class PictographManagementService(IPictographManagementService):
     """
 
     def __init__(self):
+        record_construction(self)
+
         # Dataset management
         self._pictograph_cache: Dict[str, PictographData] = {}
         self._dataset_index: Dict[str, List[str]] = {}
@@ -315,9 +319,13 @@ class PictographManagementService(IPictographManagementService):
     def _load_csv_data(self) -> pd.DataFrame:
         """Load CSV data if not already loaded."""
         if self._csv_data is None:
-            self._csv_data = pd.read_csv(self._data_path)
+            self._csv_data = PictographCsvIngestion.for_path(self._data_path).get_frame()
         return self._csv_data
 
+    def get_letter_records(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the CSV dataset as pictograph records grouped by letter."""
+        return PictographCsvIngestion.for_path(self._data_path).get_letter_records()
+
     def get_specific_pictograph(
         self, letter: str, index: int = 0
     ) -> Optional[BeatData]:
@@ -340,7 +348,7 @@ class PictographManagementService(IPictographManagementService):
 
         return [
             self._create_beat_data_from_csv_row(row)
-            for _, row in letter_data.iterrows()
+            for row in letter_data.to_dict(orient="records")
         ]
 
     def get_start_position_pictograph(
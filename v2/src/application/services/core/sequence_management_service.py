@@ -108,6 +108,9 @@ class SequenceManagementService(ISequenceManagementService):
         self._dictionary_cache = {}
         self._difficulty_cache = {}
 
+        # Built on first generation, it indexes the whole pictograph dataset
+        self._generation_engine = None
+
     def create_sequence(self, name: str, length: int = 16) -> SequenceData:
         """Create a new sequence with specified length."""
         beats = []
@@ -214,12 +217,87 @@ class SequenceManagementService(ISequenceManagementService):
 
     def _generate_freeform_sequence(self, length: int, **kwargs) -> SequenceData:
         """Generate freeform sequence with random valid motions."""
-        sequence = self.create_sequence("Freeform Sequence", length)
-        return sequence
+        return self._generate_with_engine(
+            "Freeform Sequence", "freeform", length, kwargs
+        )
 
     def _generate_circular_sequence(self, length: int, **kwargs) -> SequenceData:
         """Generate circular sequence where end connects to beginning."""
-        pass
+        return self._generate_with_engine(
+            "Circular Sequence", "circular", length, kwargs
+        )
+
+    def _generate_with_engine(
+        self, name: str, mode: str, length: int, options: Dict[str, Any]
+    ) -> SequenceData:
+        """
+        Build the whole sequence on the generation engine, then convert it.
+
+        Options are GenerationConfig fields (values may be enum members or
+        their string values) plus an optional seed.
+        """
+        from src.core.interfaces.generation_services import (
+            CAPType,
+            GenerationMode,
+            LetterType,
+            PropContinuity,
+            SliceSize,
+        )
+        from src.domain.models.generation_models import GenerationConfig
+
+        if self._generation_engine is None:
+            from application.services.generation.sequence_generation_engine import (
+                SequenceGenerationEngine,
+            )
+
+            self._generation_engine = SequenceGenerationEngine()
+
+        config = GenerationConfig(mode=GenerationMode(mode), length=length)
+        enum_fields = {
+            "prop_continuity": PropContinuity,
+            "slice_size": SliceSize,
+            "cap_type": CAPType,
+        }
+        updates = {}
+        for key in ("level", "turn_intensity", "start_position_key", *enum_fields):
+            if options.get(key) is not None:
+                value = options[key]
+                updates[key] = enum_fields[key](value) if key in enum_fields else value
+        if options.get("letter_types"):
+            updates["letter_types"] = {LetterType(t) for t in options["letter_types"]}
+
+        result = self._generation_engine.generate(
+            config.with_updates(**updates), options.get("seed")
+        )
+        if not result.success:
+            raise ValueError(result.error_message)
+
+        return SequenceData(
+            name=name,
+            word="".join(beat["letter"] for beat in result.sequence_data),
+            beats=[self._beat_from_generated(beat) for beat in result.sequence_data],
+            start_position=result.start_position_data["end_pos"],
+            metadata={
+                "created_by": "sequence_generation_engine",
+                "start_position_data": result.start_position_data,
+            },
+        )
+
+    @staticmethod
+    def _beat_from_generated(beat: Dict[str, Any]) -> BeatData:
+        motions = {}
+        for color in ("blue", "red"):
+            attributes = dict(beat[f"{color}_attributes"])
+            if attributes.get("turns") == "fl":
+                attributes["turns"] = 0.0
+            motions[color] = MotionData.from_dict(attributes)
+        return BeatData(
+            beat_number=beat["beat"],
+            letter=beat["letter"],
+            blue_motion=motions["blue"],
+            red_motion=motions["red"],
+            metadata={"start_pos": beat["start_pos"], "end_pos": beat["end_pos"]},
+        )
 
     def _generate_auto_complete_sequence(self, length: int, **kwargs) -> SequenceData:
         """Generate auto-completed sequence based on pattern recognition."""
@@ -0,0 +1,311 @@
+"""
+CAP Transforms - Pure-Data Circular Sequence Completion
+
+Ports the v1 CAP executors (generate_tab/circular/CAP_executors) to plain
+dictionary transforms. A CAP completes a word by appending transformed copies
+of it, each beat derived from the beat one word earlier: rotated, mirrored,
+color-swapped, complementary (pro and anti exchanged) or a combination.
+
+Every transform is expressed on hand locations. Positions are looked up from
+the (blue_loc, red_loc) pairs found in the dataset, so the same rules cover
+the diamond and box grids.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.core.interfaces.generation_services import CAPType, SliceSize
+
+COLORS = ("blue", "red")
+OTHER_COLOR = {"blue": "red", "red": "blue"}
+
+# Locations in clockwise order; a hand only ever moves within one cycle
+CARDINAL_CYCLE = ("n", "e", "s", "w")
+DIAGONAL_CYCLE = ("ne", "se", "sw", "nw")
+
+VERTICAL_MIRROR = {
+    "n": "n",
+    "s": "s",
+    "e": "w",
+    "w": "e",
+    "ne": "nw",
+    "nw": "ne",
+    "se": "sw",
+    "sw": "se",
+}
+
+OTHER_MOTION_TYPE = {"pro": "anti", "anti": "pro"}
+OTHER_PROP_ROT_DIR = {"cw": "ccw", "ccw": "cw"}
+
+COMPLEMENTARY_LETTERS = {
+    **{a: b for a, b in zip("ADGJMPSUWY", "BEHKNQTVXZ")},
+    **{b: a for a, b in zip("ADGJMPSUWY", "BEHKNQTVXZ")},
+    "Σ": "Δ",
+    "Δ": "Σ",
+    "θ": "Ω",
+    "Ω": "θ",
+    "W-": "X-",
+    "X-": "W-",
+    "Y-": "Z-",
+    "Z-": "Y-",
+    "Σ-": "Δ-",
+    "Δ-": "Σ-",
+    "θ-": "Ω-",
+    "Ω-": "θ-",
+}
+
+
+@dataclass(frozen=True)
+class CAPStage:
+    """
+    One pass that appends transformed copies of the beats before it.
+
+    end_mirrored ends the last copied beat on the vertical mirror of its
+    rotated position, bridging into a following mirrored stage.
+    """
+
+    rotated: bool = False
+    mirrored: bool = False
+    swapped: bool = False
+    complementary: bool = False
+    end_mirrored: bool = False
+
+
+# Mirrored-rotated CAPs rotate a quarter-length word by half a turn, ending
+# mirrored, then mirror the resulting half (as the v1 circular builder does)
+CAP_STAGES: Dict[CAPType, Tuple[CAPStage, ...]] = {
+    CAPType.STRICT_ROTATED: (CAPStage(rotated=True),),
+    CAPType.STRICT_MIRRORED: (CAPStage(mirrored=True),),
+    CAPType.STRICT_SWAPPED: (CAPStage(swapped=True),),
+    CAPType.STRICT_COMPLEMENTARY: (CAPStage(complementary=True),),
+    CAPType.SWAPPED_COMPLEMENTARY: (CAPStage(swapped=True, complementary=True),),
+    CAPType.ROTATED_COMPLEMENTARY: (CAPStage(rotated=True, complementary=True),),
+    CAPType.MIRRORED_SWAPPED: (CAPStage(mirrored=True, swapped=True),),
+    CAPType.MIRRORED_COMPLEMENTARY: (CAPStage(mirrored=True, complementary=True),),
+    CAPType.ROTATED_SWAPPED: (CAPStage(rotated=True, swapped=True),),
+    CAPType.MIRRORED_ROTATED: (
+        CAPStage(rotated=True, end_mirrored=True),
+        CAPStage(mirrored=True),
+    ),
+    CAPType.MIRRORED_COMPLEMENTARY_ROTATED: (
+        CAPStage(rotated=True, end_mirrored=True),
+        CAPStage(mirrored=True, complementary=True),
+    ),
+}
+
+# CAPs tried by auto-complete, first match wins
+AUTO_COMPLETE_CAPS: Tuple[Tuple[CAPType, SliceSize], ...] = (
+    (CAPType.STRICT_ROTATED, SliceSize.QUARTERED),
+    (CAPType.STRICT_ROTATED, SliceSize.HALVED),
+    (CAPType.STRICT_SWAPPED, SliceSize.HALVED),
+    (CAPType.STRICT_MIRRORED, SliceSize.HALVED),
+    (CAPType.STRICT_COMPLEMENTARY, SliceSize.HALVED),
+)
+
+
+def effective_slice_size(cap_type: CAPType, slice_size: SliceSize) -> SliceSize:
+    """Only strict rotated CAPs can be quartered."""
+    if cap_type == CAPType.STRICT_ROTATED:
+        return slice_size
+    return SliceSize.HALVED
+
+
+def length_divisor(cap_type: CAPType, slice_size: SliceSize) -> int:
+    """Number of word-length parts a sequence with this CAP is made of."""
+    if effective_slice_size(cap_type, slice_size) == SliceSize.QUARTERED:
+        return 4
+    if len(CAP_STAGES[cap_type]) > 1:
+        return 4
+    return 2
+
+
+def word_length(cap_type: CAPType, slice_size: SliceSize, length: int) -> int:
+    """Number of beats generated freely before the CAP fills in the rest."""
+    return length // length_divisor(cap_type, slice_size)
+
+
+def stage_copies(stage: CAPStage, slice_size: SliceSize) -> int:
+    """How many transformed copies of the beats so far a stage appends."""
+    if stage.rotated and slice_size == SliceSize.QUARTERED:
+        return 3
+    return 1
+
+
+def _cycle(location: str) -> Tuple[str, ...]:
+    if location in CARDINAL_CYCLE:
+        return CARDINAL_CYCLE
+    if location in DIAGONAL_CYCLE:
+        return DIAGONAL_CYCLE
+    raise ValueError(f"Unknown location: {location}")
+
+
+def rotate_location(location: str, quarter_turns: int) -> str:
+    """Rotate a location clockwise by a number of quarter turns."""
+    cycle = _cycle(location)
+    return cycle[(cycle.index(location) + quarter_turns) % 4]
+
+
+def hand_path_quarter_turns(start_loc: str, end_loc: str) -> int:
+    """
+    Clockwise quarter turns a hand travels: 0 static, 1 cw, 2 dash, 3 ccw.
+    """
+    cycle = _cycle(start_loc)
+    if end_loc not in cycle:
+        raise ValueError(f"No hand path from {start_loc} to {end_loc}")
+    return (cycle.index(end_loc) - cycle.index(start_loc)) % 4
+
+
+class PositionMap:
+    """Two-way map between positions and (blue_loc, red_loc) pairs."""
+
+    def __init__(self, letter_records: Mapping[str, Iterable[Dict[str, Any]]]):
+        self._positions: Dict[Tuple[str, str], str] = {}
+        self._locations: Dict[str, Tuple[str, str]] = {}
+        for group in letter_records.values():
+            for record in group:
+                blue = record.get("blue_attributes", {})
+                red = record.get("red_attributes", {})
+                for end in ("start", "end"):
+                    position = record.get(f"{end}_pos")
+                    blue_loc = blue.get(f"{end}_loc")
+                    red_loc = red.get(f"{end}_loc")
+                    if position and blue_loc and red_loc:
+                        self._positions[(blue_loc, red_loc)] = position
+                        self._locations[position] = (blue_loc, red_loc)
+
+    def position(self, blue_loc: str, red_loc: str) -> str:
+        position = self._positions.get((blue_loc, red_loc))
+        if position is None:
+            raise ValueError(f"No position for locations {(blue_loc, red_loc)}")
+        return position
+
+    def locations(self, position: str) -> Tuple[str, str]:
+        locations = self._locations.get(position)
+        if locations is None:
+            raise ValueError(f"Unknown position: {position}")
+        return locations
+
+
+def word_end_positions(
+    cap_type: CAPType,
+    slice_size: SliceSize,
+    start_pos: str,
+    positions: PositionMap,
+) -> List[str]:
+    """
+    Positions the freely generated word may end on for the CAP to close.
+
+    A quartered rotation can turn either way, so it has two candidates.
+    """
+    stage = CAP_STAGES[cap_type][0]
+    blue_loc, red_loc = positions.locations(start_pos)
+    if stage.swapped:
+        blue_loc, red_loc = red_loc, blue_loc
+    if stage.mirrored:
+        blue_loc, red_loc = VERTICAL_MIRROR[blue_loc], VERTICAL_MIRROR[red_loc]
+    if not stage.rotated:
+        return [positions.position(blue_loc, red_loc)]
+    if effective_slice_size(cap_type, slice_size) == SliceSize.QUARTERED:
+        quarter_turns = (1, 3)
+    else:
+        quarter_turns = (2,)
+    return [
+        positions.position(
+            rotate_location(blue_loc, turns), rotate_location(red_loc, turns)
+        )
+        for turns in quarter_turns
+    ]
+
+
+def mirrored_position(position: str, positions: PositionMap) -> str:
+    blue_loc, red_loc = positions.locations(position)
+    return positions.position(VERTICAL_MIRROR[blue_loc], VERTICAL_MIRROR[red_loc])
+
+
+def detect_cap(
+    start_pos: str, end_pos: str, positions: PositionMap
+) -> Optional[Tuple[CAPType, SliceSize]]:
+    """Find a CAP that closes a word from start_pos to end_pos."""
+    for cap_type, slice_size in AUTO_COMPLETE_CAPS:
+        if end_pos in word_end_positions(cap_type, slice_size, start_pos, positions):
+            return cap_type, slice_size
+    return None
+
+
+def transform_beat(
+    previous: Dict[str, Any],
+    matching: Dict[str, Any],
+    stage: CAPStage,
+    beat_number: int,
+    positions: PositionMap,
+) -> Dict[str, Any]:
+    """
+    Derive the next beat from the beat one word earlier.
+
+    The beat starts where previous ended; end orientations are left for the
+    caller to calculate.
+    """
+    letter = matching["letter"]
+    beat: Dict[str, Any] = {
+        "beat": beat_number,
+        "letter": (
+            COMPLEMENTARY_LETTERS.get(letter, letter) if stage.complementary else letter
+        ),
+        "start_pos": previous["end_pos"],
+    }
+    for key in ("timing", "direction"):
+        if key in matching:
+            beat[key] = matching[key]
+
+    for color in COLORS:
+        source_color = OTHER_COLOR[color] if stage.swapped else color
+        beat[f"{color}_attributes"] = _transform_attributes(
+            previous[f"{color}_attributes"],
+            matching[f"{source_color}_attributes"],
+            stage,
+        )
+    beat["end_pos"] = positions.position(
+        beat["blue_attributes"]["end_loc"], beat["red_attributes"]["end_loc"]
+    )
+    return beat
+
+
+def _transform_attributes(
+    previous: Dict[str, Any], source: Dict[str, Any], stage: CAPStage
+) -> Dict[str, Any]:
+    motion_type = source["motion_type"]
+    prop_rot_dir = source["prop_rot_dir"]
+    if stage.complementary:
+        motion_type = OTHER_MOTION_TYPE.get(motion_type, motion_type)
+    # Mirroring and complementing each reverse the rotation; together they cancel
+    if stage.mirrored != stage.complementary:
+        prop_rot_dir = OTHER_PROP_ROT_DIR.get(prop_rot_dir, prop_rot_dir)
+
+    start_loc = previous["end_loc"]
+    if stage.rotated:
+        end_loc = rotate_location(
+            start_loc,
+            hand_path_quarter_turns(source["start_loc"], source["end_loc"]),
+        )
+    elif stage.mirrored:
+        end_loc = VERTICAL_MIRROR[source["end_loc"]]
+    else:
+        end_loc = source["end_loc"]
+
+    attributes = {
+        "motion_type": motion_type,
+        "prop_rot_dir": prop_rot_dir,
+        "start_loc": start_loc,
+        "end_loc": end_loc,
+        "turns": source.get("turns", 0),
+        "start_ori": previous["end_ori"],
+    }
+    if source.get("prefloat_motion_type"):
+        attributes["prefloat_motion_type"] = source["prefloat_motion_type"]
+        prefloat_prop_rot_dir = source.get("prefloat_prop_rot_dir")
+        if stage.mirrored:
+            prefloat_prop_rot_dir = OTHER_PROP_ROT_DIR.get(
+                prefloat_prop_rot_dir, prefloat_prop_rot_dir
+            )
+        attributes["prefloat_prop_rot_dir"] = prefloat_prop_rot_dir
+    return attributes
@@ -0,0 +1,609 @@
+"""
+Sequence Generation Engine - Batch, Widget-Free Sequence Generation
+
+Implements IGenerationService on plain pictograph dictionaries. Options come
+from a PictographDatasetIndex, so picking each beat is a lookup by the previous
+end position rather than a query against a live option picker. Whole sequences
+are built before anything reaches the UI, which receives the finished beats in
+one update.
+
+Every sequence draws from its own random.Random, so a seed reproduces it
+exactly. generate_batch() derives one seed per sequence and spreads the work
+over a pool of worker processes, for bulk dictionary creation.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from application.services.core.pictograph_management_service import (
+    PictographManagementService,
+)
+from application.services.motion.motion_orientation_service import (
+    MotionOrientationService,
+)
+from application.services.positioning.pictograph_dataset_index import (
+    PictographDatasetIndex,
+)
+from core.dependency_injection.di_container import record_construction
+from core.dependency_injection.service_registry import resolve_shared_service
+from domain.models.core_models import (
+    Location,
+    MotionData,
+    MotionType,
+    Orientation,
+    RotationDirection,
+)
+from src.core.interfaces.generation_services import (
+    CAPType,
+    GenerationMetadata,
+    GenerationMode,
+    IGenerationService,
+    PropContinuity,
+    SliceSize,
+    ValidationResult,
+)
+from src.domain.models.generation_models import GenerationConfig, GenerationResult
+
+from .cap_transforms import (
+    CAP_STAGES,
+    COLORS,
+    PositionMap,
+    detect_cap,
+    effective_slice_size,
+    length_divisor,
+    mirrored_position,
+    stage_copies,
+    transform_beat,
+    word_end_positions,
+    word_length,
+)
+
+LetterRecords = Mapping[str, List[Dict[str, Any]]]
+
+# Start positions offered when the config does not name one, as in v1
+DIAMOND_START_POSITIONS = ("alpha1", "beta5", "gamma11")
+BOX_START_POSITIONS = ("alpha2", "beta4", "gamma12")
+
+ROTATION_DIRECTIONS = ("cw", "ccw")
+NO_ROTATION = "no_rot"
+
+# Turn values per level; "fl" turns a pro or anti motion into a float
+LEVEL_TURNS = {
+    2: (0, 1, 2, 3),
+    3: (0, 0.5, 1, 1.5, 2, 2.5, 3, "fl"),
+}
+# Level 1 has no turns; GenerationConfig allows up to 6, but only the levels
+# above have turn sets to generate from
+MAX_LEVEL = max(LEVEL_TURNS)
+
+# Whole-sequence retries before a word that cannot close is reported
+MAX_ATTEMPTS = 20
+
+
+class _DeadEnd(Exception):
+    """No option continues the sequence; the attempt is started over."""
+
+
+class SequenceGenerationEngine(IGenerationService):
+    """
+    Generates freeform and circular sequences as lists of beat dictionaries.
+
+    Beats use the v1 pictograph format (letter, start_pos, end_pos,
+    blue_attributes, red_attributes, beat). Circular sequences generate a
+    word and complete it with the CAP transforms in cap_transforms.
+    """
+
+    ALGORITHM = "dataset_index"
+
+    def __init__(
+        self,
+        letter_records: Optional[LetterRecords] = None,
+        seed: Optional[int] = None,
+    ):
+        """
+        Initialize the engine over a {letter: [pictograph_data]} dataset.
+
+        Args:
+            letter_records: Dataset to generate from; defaults to the shared
+                pictograph management service's records.
+            seed: Seed for sequences generated without an explicit seed.
+        """
+        record_construction(self)
+        if letter_records is None:
+            letter_records = resolve_shared_service(
+                PictographManagementService
+            ).get_letter_records()
+        self.letter_records = letter_records
+        self.dataset_index = PictographDatasetIndex(letter_records)
+        self.positions = PositionMap(letter_records)
+        self.orientation_service = MotionOrientationService()
+        self._rng = random.Random(seed)
+
+        self.generated_count = 0
+        self.failed_count = 0
+        self.retry_count = 0
+
+    # IGenerationService
+
+    def generate_freeform_sequence(self, config: GenerationConfig) -> GenerationResult:
+        return self.generate(config.with_updates(mode=GenerationMode.FREEFORM))
+
+    def generate_circular_sequence(self, config: GenerationConfig) -> GenerationResult:
+        return self.generate(config.with_updates(mode=GenerationMode.CIRCULAR))
+
+    def auto_complete_sequence(self, current_sequence: Any) -> GenerationResult:
+        """
+        Complete a sequence with the first CAP that closes it.
+
+        Args:
+            current_sequence: Beat dictionaries, optionally preceded by the
+                start position (beat 0)
+
+        Returns:
+            GenerationResult holding the completed beats
+        """
+        started = time.perf_counter()
+        if not isinstance(current_sequence, (list, tuple)) or not current_sequence:
+            return self._failure("Auto-complete needs a list of beat dictionaries")
+
+        entries = [self._copy_beat(entry) for entry in current_sequence]
+        start_position = None
+        if entries[0].get("beat") == 0 or "sequence_start_position" in entries[0]:
+            start_position = entries.pop(0)
+        if not entries:
+            return self._failure("Auto-complete needs at least one beat")
+
+        start_pos = entries[0]["start_pos"]
+        end_pos = entries[-1]["end_pos"]
+        try:
+            cap = detect_cap(start_pos, end_pos, self.positions)
+            if cap is None:
+                return self._failure(
+                    f"No CAP closes a sequence from {start_pos} to {end_pos}"
+                )
+            beats = self._apply_cap(entries, *cap, self._rng)
+        except (_DeadEnd, KeyError, ValueError) as e:
+            return self._failure(f"Auto-complete failed: {e}")
+
+        self.generated_count += 1
+        return GenerationResult(
+            success=True,
+            sequence_data=beats,
+            start_position_data=start_position,
+            metadata=self._metadata(
+                started, f"auto_complete:{cap[0].value}", repr(current_sequence)
+            ),
+        )
+
+    def validate_generation_parameters(
+        self, config: GenerationConfig
+    ) -> ValidationResult:
+        errors = []
+        if not 4 <= config.length <= 64:
+            errors.append("Length must be between 4 and 64 beats")
+        if not 1 <= config.level <= MAX_LEVEL:
+            errors.append(f"Level must be between 1 and {MAX_LEVEL}")
+        if not 0.5 <= config.turn_intensity <= 3.0:
+            errors.append("Turn intensity must be between 0.5 and 3.0")
+        if not config.letter_types:
+            errors.append("At least one letter type must be selected")
+
+        if config.mode == GenerationMode.CIRCULAR:
+            if config.cap_type is None:
+                errors.append("Circular sequences need a CAP type")
+            else:
+                divisor = length_divisor(config.cap_type, config.slice_size)
+                if config.length % divisor:
+                    errors.append(
+                        f"{config.cap_type.value} sequences need a length "
+                        f"divisible by {divisor}"
+                    )
+
+        return ValidationResult(is_valid=not errors, errors=errors or None)
+
+    # Generation
+
+    def generate(
+        self, config: GenerationConfig, seed: Optional[int] = None
+    ) -> GenerationResult:
+        """
+        Generate one sequence for the config's mode.
+
+        Args:
+            config: Generation settings
+            seed: Seed for this sequence; the engine's own generator is used
+                when omitted
+
+        Returns:
+            GenerationResult with the start position and every beat
+        """
+        started = time.perf_counter()
+        validation = self.validate_generation_parameters(config)
+        if not validation.is_valid:
+            return self._failure("; ".join(validation.errors))
+
+        rng = self._rng if seed is None else random.Random(seed)
+        if config.mode == GenerationMode.CIRCULAR:
+            build = self._build_circular
+        else:
+            build = self._build_freeform
+
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                start_position, beats = build(config, rng)
+                break
+            except _DeadEnd:
+                self.retry_count += 1
+        else:
+            return self._failure(
+                f"No sequence found for {config.mode.value} generation "
+                f"after {MAX_ATTEMPTS} attempts"
+            )
+
+        warnings = [f"Restarted {attempt} times"] if attempt else []
+        self.generated_count += 1
+        return GenerationResult(
+            success=True,
+            sequence_data=beats,
+            start_position_data=start_position,
+            metadata=self._metadata(
+                started, self.ALGORITHM, f"{_config_key(config)}:{seed}", warnings
+            ),
+            warnings=warnings,
+        )
+
+    def generate_batch(
+        self,
+        config: GenerationConfig,
+        count: int,
+        seed: int = 0,
+        max_workers: Optional[int] = None,
+    ) -> List[GenerationResult]:
+        """
+        Generate count sequences across a pool of worker processes.
+
+        The i-th sequence is generated from the i-th seed derived from seed,
+        so the results are in order and do not depend on the worker count.
+
+        Args:
+            config: Generation settings shared by every sequence
+            count: Number of sequences to generate
+            seed: Seed the per-sequence seeds are derived from
+            max_workers: Worker processes; one per core by default, and 1
+                generates in this process
+        """
+        seeds = batch_seeds(seed, count)
+        workers = min(max_workers or os.cpu_count() or 1, count)
+        if workers <= 1:
+            return [self.generate(config, item_seed) for item_seed in seeds]
+
+        # Spawned workers avoid forking a process that has a QApplication
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.letter_records,),
+        ) as executor:
+            results = list(
+                executor.map(
+                    _generate_in_worker,
+                    repeat(config),
+                    seeds,
+                    chunksize=max(1, count // (workers * 4)),
+                )
+            )
+        self.generated_count += sum(result.success for result in results)
+        self.failed_count += sum(not result.success for result in results)
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "pictographs": len(self.dataset_index),
+            "generated": self.generated_count,
+            "failed": self.failed_count,
+            "retries": self.retry_count,
+        }
+
+    # Sequence builders
+
+    def _build_freeform(
+        self, config: GenerationConfig, rng: random.Random
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        start_position = self._start_position(config, rng)
+        beats = self._build_word(start_position, config.length, config, rng)
+        return start_position, beats
+
+    def _build_circular(
+        self, config: GenerationConfig, rng: random.Random
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        cap_type = config.cap_type
+        slice_size = effective_slice_size(cap_type, config.slice_size)
+        start_position = self._start_position(config, rng)
+        end_positions = word_end_positions(
+            cap_type, slice_size, start_position["end_pos"], self.positions
+        )
+        beats = self._build_word(
+            start_position,
+            word_length(cap_type, slice_size, config.length),
+            config,
+            rng,
+            end_positions=[rng.choice(end_positions)],
+        )
+        return start_position, self._apply_cap(beats, cap_type, slice_size, rng)
+
+    def _build_word(
+        self,
+        previous: Dict[str, Any],
+        count: int,
+        config: GenerationConfig,
+        rng: random.Random,
+        end_positions: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Pick count beats; the last must end on one of end_positions."""
+        letter_types = sorted(config.letter_types, key=lambda t: t.value)
+        turns = self._allocate_turns(count, config, rng)
+        if config.prop_continuity == PropContinuity.CONTINUOUS:
+            rot_dirs = tuple(rng.choice(ROTATION_DIRECTIONS) for _ in COLORS)
+        else:
+            rot_dirs = None
+
+        beats = []
+        for i in range(count):
+            options = [
+                option
+                for letter_type in letter_types
+                for option in self.dataset_index.get_options(
+                    previous["end_pos"], letter_type=letter_type.value
+                )
+            ]
+            if rot_dirs is not None:
+                options = [
+                    option
+                    for option in options
+                    if option["blue_attributes"].get("prop_rot_dir")
+                    in (rot_dirs[0], NO_ROTATION)
+                    and option["red_attributes"].get("prop_rot_dir")
+                    in (rot_dirs[1], NO_ROTATION)
+                ] or options
+            if end_positions is not None and i == count - 1:
+                options = [o for o in options if o.get("end_pos") in end_positions]
+            if not options:
+                raise _DeadEnd(f"No option continues from {previous['end_pos']}")
+
+            beat = self._copy_beat(rng.choice(options))
+            beat["beat"] = len(beats) + 1
+            if config.level in LEVEL_TURNS:
+                self._set_turns(beat, *turns[i])
+            self._set_dash_static_prop_rot_dirs(beat, rot_dirs, rng)
+            self._orient(beat, previous)
+            beats.append(beat)
+            previous = beat
+        return beats
+
+    def _apply_cap(
+        self,
+        beats: List[Dict[str, Any]],
+        cap_type: CAPType,
+        slice_size: SliceSize,
+        rng: random.Random,
+    ) -> List[Dict[str, Any]]:
+        """Append the CAP's transformed copies of the word to beats."""
+        slice_size = effective_slice_size(cap_type, slice_size)
+        for stage in CAP_STAGES[cap_type]:
+            word = len(beats)
+            total = word * (stage_copies(stage, slice_size) + 1)
+            while len(beats) < total:
+                previous = beats[-1]
+                matching = beats[len(beats) - word]
+                beat_number = len(beats) + 1
+                if stage.end_mirrored and beat_number == total:
+                    beat = self._bridge_beat(
+                        previous, matching, stage, beat_number, rng
+                    )
+                else:
+                    beat = transform_beat(
+                        previous, matching, stage, beat_number, self.positions
+                    )
+                    for color in COLORS:
+                        attributes = beat[f"{color}_attributes"]
+                        attributes["end_ori"] = self._end_ori(attributes)
+                beats.append(beat)
+        return beats
+
+    def _bridge_beat(self, previous, matching, stage, beat_number, rng):
+        """
+        End a rotated stage on the mirror of its rotated position.
+
+        No transform reaches that position, so a dataset option that does is
+        picked and given the matching beat's turns.
+        """
+        rotated = transform_beat(
+            previous, matching, stage, beat_number, self.positions
+        )
+        target = mirrored_position(rotated["end_pos"], self.positions)
+        options = [
+            option
+            for option in self.dataset_index.get_options(previous["end_pos"])
+            if option.get("end_pos") == target
+        ]
+        if not options:
+            raise _DeadEnd(f"No option goes from {previous['end_pos']} to {target}")
+
+        beat = self._copy_beat(rng.choice(options))
+        beat["beat"] = beat_number
+        self._set_turns(
+            beat,
+            matching["blue_attributes"].get("turns", 0),
+            matching["red_attributes"].get("turns", 0),
+        )
+        for color in COLORS:
+            attributes = beat[f"{color}_attributes"]
+            turns = attributes["turns"]
+            if attributes["motion_type"] in ("dash", "static") and turns != "fl":
+                if turns > 0:
+                    rot_dir = matching[f"{color}_attributes"]["prop_rot_dir"]
+                    if rot_dir == NO_ROTATION:
+                        rot_dir = previous[f"{color}_attributes"]["prop_rot_dir"]
+                    attributes["prop_rot_dir"] = rot_dir
+        self._orient(beat, previous)
+        return beat
+
+    # Beat helpers
+
+    def _start_position(
+        self, config: GenerationConfig, rng: random.Random
+    ) -> Dict[str, Any]:
+        if config.start_position_key:
+            candidates = [config.start_position_key.split("_")[0]]
+        else:
+            available = set(self.dataset_index.start_positions())
+            candidates = [
+                position
+                for position in DIAMOND_START_POSITIONS
+                if position in available
+            ] or [position for position in BOX_START_POSITIONS if position in available]
+        if not candidates:
+            raise ValueError("The dataset has no start positions")
+
+        position = rng.choice(candidates)
+        for option in self.dataset_index.get_options(position):
+            if option.get("end_pos") == position and all(
+                option[f"{color}_attributes"].get("motion_type") == "static"
+                for color in COLORS
+            ):
+                start_position = self._copy_beat(option)
+                break
+        else:
+            raise ValueError(f"No start position pictograph for {position}")
+
+        start_position["beat"] = 0
+        start_position["sequence_start_position"] = position.rstrip("0123456789")
+        for color in COLORS:
+            attributes = start_position[f"{color}_attributes"]
+            attributes["start_ori"] = attributes["end_ori"] = Orientation.IN.value
+        return start_position
+
+    @staticmethod
+    def _allocate_turns(
+        count: int, config: GenerationConfig, rng: random.Random
+    ) -> List[Tuple[Any, Any]]:
+        """Draw (blue, red) turns per beat, capped by the turn intensity."""
+        choices = [
+            turns
+            for turns in LEVEL_TURNS.get(config.level, (0,))
+            if turns == "fl" or turns <= config.turn_intensity
+        ]
+        return [(rng.choice(choices), rng.choice(choices)) for _ in range(count)]
+
+    @staticmethod
+    def _set_turns(beat: Dict[str, Any], blue_turns: Any, red_turns: Any) -> None:
+        for color, turns in zip(COLORS, (blue_turns, red_turns)):
+            attributes = beat[f"{color}_attributes"]
+            if turns != "fl":
+                attributes["turns"] = turns
+            elif attributes["motion_type"] in ("pro", "anti"):
+                attributes["turns"] = "fl"
+                attributes["prefloat_motion_type"] = attributes["motion_type"]
+                attributes["prefloat_prop_rot_dir"] = attributes["prop_rot_dir"]
+                attributes["motion_type"] = "float"
+                attributes["prop_rot_dir"] = NO_ROTATION
+            else:
+                attributes["turns"] = 0
+
+    @staticmethod
+    def _set_dash_static_prop_rot_dirs(
+        beat: Dict[str, Any],
+        rot_dirs: Optional[Tuple[str, str]],
+        rng: random.Random,
+    ) -> None:
+        """Dash and static props only rotate when they turn."""
+        for i, color in enumerate(COLORS):
+            attributes = beat[f"{color}_attributes"]
+            if attributes["motion_type"] not in ("dash", "static"):
+                continue
+            if attributes["turns"] > 0:
+                attributes["prop_rot_dir"] = (
+                    rot_dirs[i] if rot_dirs else rng.choice(ROTATION_DIRECTIONS)
+                )
+            else:
+                attributes["prop_rot_dir"] = NO_ROTATION
+
+    def _orient(self, beat: Dict[str, Any], previous: Dict[str, Any]) -> None:
+        for color in COLORS:
+            attributes = beat[f"{color}_attributes"]
+            attributes["start_ori"] = previous[f"{color}_attributes"]["end_ori"]
+            attributes["end_ori"] = self._end_ori(attributes)
+
+    def _end_ori(self, attributes: Dict[str, Any]) -> str:
+        turns = attributes.get("turns", 0)
+        motion = MotionData(
+            motion_type=MotionType(attributes["motion_type"]),
+            prop_rot_dir=RotationDirection.NO_ROTATION,
+            start_loc=Location(attributes["start_loc"]),
+            end_loc=Location(attributes["end_loc"]),
+            turns=0 if turns == "fl" else turns,
+        )
+        return self.orientation_service.calculate_motion_orientation(
+            motion, Orientation(attributes["start_ori"])
+        ).value
+
+    @staticmethod
+    def _copy_beat(beat: Mapping[str, Any]) -> Dict[str, Any]:
+        """Copy a beat deep enough to edit its attributes."""
+        copied = dict(beat)
+        for color in COLORS:
+            attributes = dict(beat.get(f"{color}_attributes", {}))
+            attributes.setdefault("turns", 0)
+            copied[f"{color}_attributes"] = attributes
+        return copied
+
+    # Results
+
+    def _failure(self, message: str) -> GenerationResult:
+        self.failed_count += 1
+        return GenerationResult(success=False, error_message=message)
+
+    @staticmethod
+    def _metadata(
+        started: float,
+        algorithm: str,
+        parameters: str,
+        warnings: Optional[List[str]] = None,
+    ) -> GenerationMetadata:
+        return GenerationMetadata(
+            generation_time_ms=int((time.perf_counter() - started) * 1000),
+            algorithm_used=algorithm,
+            parameters_hash=hashlib.sha1(parameters.encode()).hexdigest(),
+            warnings=warnings or None,
+        )
+
+
+def _config_key(config: GenerationConfig) -> str:
+    """repr() of the config with its letter types in a stable order."""
+    letter_types = sorted(letter_type.value for letter_type in config.letter_types)
+    return f"{config.with_updates(letter_types=set())!r}:{letter_types}"
+
+
+def batch_seeds(seed: int, count: int) -> List[int]:
+    """Independent per-sequence seeds derived from one batch seed."""
+    seeder = random.Random(seed)
+    return [seeder.getrandbits(64) for _ in range(count)]
+
+
+# Worker processes build one engine from the dataset passed at startup
+_worker_engine: Optional[SequenceGenerationEngine] = None
+
+
+def _init_worker(letter_records: LetterRecords) -> None:
+    global _worker_engine
+    _worker_engine = SequenceGenerationEngine(letter_records)
+
+
+def _generate_in_worker(config: GenerationConfig, seed: int) -> GenerationResult:
+    return _worker_engine.generate(config, seed)
@@ -19,6 +19,7 @@ from typing import List, Dict, Any, Optional, Tuple, Set
 from abc import ABC, abstractmethod
 from enum import Enum
 
+from core.dependency_injection.di_container import record_construction
 from domain.models.core_models import (
     MotionData,
     MotionType,
@@ -90,6 +91,8 @@ class MotionManagementService(IMotionManagementService):
     """
 
     def __init__(self):
+        record_construction(self)
+
         # Motion validation rules
         self._invalid_location_combinations = self._load_invalid_location_combinations()
         self._invalid_motion_type_combinations = (
@@ -21,6 +21,7 @@ from typing import TYPE_CHECKING
 from PyQt6.QtGui import QTransform
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
 
+from core.dependency_injection.di_container import record_construction
 from domain.models.core_models import MotionType, RotationDirection
 
 if TYPE_CHECKING:
@@ -87,6 +88,8 @@ class ArrowPositioningService(IArrowPositioningService):
 
     def __init__(self):
         """Initialize the positioning service with precise coordinate system."""
+        record_construction(self)
+
         # Scene dimensions: 950x950 scene with center at (475, 475)
         self.SCENE_SIZE = 950
         self.CENTER_X = 475.0
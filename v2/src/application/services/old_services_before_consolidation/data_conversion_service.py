@@ -7,6 +7,8 @@ while preserving all motion information and ensuring compatibility.
 
 from typing import Dict, Any, Optional
 
+from core.dependency_injection.di_container import record_construction
+
 try:
     # Try relative imports first (for normal package usage)
     from domain.models.core_models import (
@@ -41,9 +43,17 @@ class DataConversionService:
     and V2's enum-based data structures while preserving all motion information.
     """
 
-    def __init__(self):
-        """Initialize the data conversion service with glyph data service."""
+    def __init__(self, pictograph_service=None):
+        """
+        Initialize the data conversion service with glyph data service.
+
+        Args:
+            pictograph_service: PictographManagementService used for glyph
+                generation. Built on first use when not provided.
+        """
+        record_construction(self)
         self.glyph_data_service = GlyphDataService()
+        self._pictograph_service = pictograph_service
 
     # V1 to V2 motion type mappings (for props)
     MOTION_TYPE_MAPPING = {
@@ -211,10 +221,13 @@ class DataConversionService:
         """
         try:
             # CRITICAL FIX: Use consolidated service that respects metadata positions
-            from ..core.pictograph_management_service import PictographManagementService
+            if self._pictograph_service is None:
+                from ..core.pictograph_management_service import (
+                    PictographManagementService,
+                )
 
-            pictograph_service = PictographManagementService()
-            return pictograph_service._generate_glyph_data(beat_data)
+                self._pictograph_service = PictographManagementService()
+            return self._pictograph_service._generate_glyph_data(beat_data)
         except Exception as e:
             print(f"⚠️ Failed to generate glyph data: {e}")
             # Fallback to old service if consolidated service fails
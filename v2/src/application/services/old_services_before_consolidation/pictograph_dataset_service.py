@@ -10,6 +10,7 @@ import pandas as pd
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+from core.dependency_injection.di_container import record_construction
 from domain.models.core_models import (
     BeatData,
     MotionData,
@@ -34,6 +35,8 @@ class PictographDatasetService:
     """
 
     def __init__(self):
+        record_construction(self)
+
         self._data_handler = DataPathHandler()
         self.glyph_service = GlyphDataService()
         self._diamond_dataset: Optional[pd.DataFrame] = None
@@ -25,6 +25,7 @@ except ImportError:
     QGraphicsSvgItem = None
 from enum import Enum
 
+from core.dependency_injection.di_container import record_construction
 from domain.models.core_models import (
     BeatData,
     MotionData,
@@ -41,6 +42,8 @@ from domain.models.pictograph_models import (
 )
 from ..default_placement_service import DefaultPlacementService
 from ..placement_key_service import PlacementKeyService
+from ..special_placement_service import SpecialPlacementService
+from .arrow_placement_table import ArrowPlacementTable
 
 
 class IArrowManagementService(ABC):
@@ -78,7 +81,9 @@ class ArrowManagementService(IArrowManagementService):
     Prop positioning has been moved to PropManagementService.
     """
 
-    def __init__(self):
+    def __init__(self, use_placement_table: bool = True):
+        record_construction(self)
+
         # CRITICAL FIX: Use correct scene coordinates matching PictographScene
         # Arrow positioning constants - must match PictographScene dimensions
         self.CENTER_X = 475
@@ -88,6 +93,12 @@ class ArrowManagementService(IArrowManagementService):
         # Initialize placement services
         self.default_placement_service = DefaultPlacementService()
         self.placement_key_service = PlacementKeyService()
+        self._special_placement_service: Optional[SpecialPlacementService] = None
+
+        # Precompiled placements; the pipeline below is the fallback and the
+        # source the table is compiled from
+        self.use_placement_table = use_placement_table
+        self._placement_table: Optional[ArrowPlacementTable] = None
 
         # CRITICAL FIX: Use correct coordinates from circle_coords.json (old working service)
         # Hand point coordinates (for STATIC/DASH arrows) - inner grid positions where props are placed
@@ -135,10 +146,30 @@ class ArrowManagementService(IArrowManagementService):
         3. Calculate rotation angle
         4. Apply adjustments (default placement + special rules)
         5. Return final position and rotation
+
+        Results come from the precompiled placement table when it has an
+        entry for the motion, and from the full pipeline otherwise.
         """
         if not arrow_data.motion_data:
             return self.CENTER_X, self.CENTER_Y, 0.0
 
+        if self.use_placement_table:
+            placement = self.placement_table.get_placement(arrow_data, pictograph_data)
+            if placement is not None:
+                return placement.x, placement.y, placement.rotation
+
+        return self.calculate_arrow_position_uncached(arrow_data, pictograph_data)
+
+    def calculate_arrow_position_uncached(
+        self,
+        arrow_data: ArrowData,
+        pictograph_data: PictographData,
+        grid_mode: str = "diamond",
+    ) -> Tuple[float, float, float]:
+        """Calculate arrow position and rotation with the full pipeline."""
+        if not arrow_data.motion_data:
+            return self.CENTER_X, self.CENTER_Y, 0.0
+
         motion = arrow_data.motion_data
 
         # Step 1: Calculate arrow location
@@ -151,7 +182,9 @@ class ArrowManagementService(IArrowManagementService):
         rotation = self._calculate_arrow_rotation(motion, arrow_location)
 
         # Step 4: Get adjustment
-        adjustment = self._calculate_adjustment(arrow_data, pictograph_data)
+        adjustment = self._calculate_adjustment(
+            arrow_data, pictograph_data, grid_mode
+        )
 
         # Step 5: Apply final positioning formula
         final_x = initial_position.x() + adjustment.x()
@@ -172,6 +205,52 @@ class ArrowManagementService(IArrowManagementService):
 
         return final_x, final_y, rotation
 
+    @property
+    def placement_table(self) -> ArrowPlacementTable:
+        """Placement table shared by every service, loaded on first use."""
+        if self._placement_table is None:
+            self._placement_table = ArrowPlacementTable.shared()
+        return self._placement_table
+
+    @property
+    def special_placement_service(self) -> SpecialPlacementService:
+        """Special placement data, loaded once per service."""
+        if self._special_placement_service is None:
+            self._special_placement_service = SpecialPlacementService()
+        return self._special_placement_service
+
+    def calculate_placement_components(
+        self, motion: MotionData, grid_mode: str = "diamond"
+    ) -> Tuple[QPointF, float, Tuple[int, int], Tuple[int, int, int, int]]:
+        """
+        Break the placement of a motion into the parts the placement table folds.
+
+        Returns:
+            (initial position, rotation, default adjustment before the quadrant
+            transform, quadrant transform as (a, b, c, d) mapping an adjustment
+            (x, y) to (a * x + b * y, c * x + d * y))
+        """
+        arrow_location = self._calculate_arrow_location(motion)
+        initial_position = self._compute_initial_position(motion, arrow_location)
+        rotation = self._calculate_arrow_rotation(motion, arrow_location)
+
+        default_adjustment = self._get_default_adjustment(
+            ArrowData(motion_data=motion), grid_mode
+        )
+        adjustment = (int(default_adjustment.x()), int(default_adjustment.y()))
+
+        # Every directional tuple is a signed permutation of (x, y), so probing
+        # with the unit vectors recovers it as a matrix
+        quadrant_index = self._get_quadrant_index(motion)
+        x_axis = self._generate_directional_tuples(motion, 1, 0, grid_mode)
+        y_axis = self._generate_directional_tuples(motion, 0, 1, grid_mode)
+        if 0 <= quadrant_index < len(x_axis):
+            (a, c), (b, d) = x_axis[quadrant_index], y_axis[quadrant_index]
+        else:
+            a, b, c, d = 1, 0, 0, 1
+
+        return initial_position, rotation, adjustment, (a, b, c, d)
+
     def should_mirror_arrow(self, arrow_data: ArrowData) -> bool:
         """Determine if arrow should be mirrored based on motion type and rotation."""
         if not arrow_data.motion_data:
@@ -411,7 +490,10 @@ class ArrowManagementService(IArrowManagementService):
         return self._calculate_pro_rotation(motion, location)
 
     def _calculate_adjustment(
-        self, arrow_data: ArrowData, pictograph_data: PictographData
+        self,
+        arrow_data: ArrowData,
+        pictograph_data: PictographData,
+        grid_mode: str = "diamond",
     ) -> QPointF:
         """
         Calculate adjustment using complete adjustment system from old service.
@@ -426,10 +508,12 @@ class ArrowManagementService(IArrowManagementService):
             return QPointF(0, 0)
 
         # Step 1: Get default adjustment using proper service integration
-        default_adjustment = self._get_default_adjustment(arrow_data)
+        default_adjustment = self._get_default_adjustment(arrow_data, grid_mode)
 
         # Step 2: Check for special adjustments (letter-specific overrides)
-        special_adjustment = self._get_special_adjustment(arrow_data, pictograph_data)
+        special_adjustment = self._get_special_adjustment(
+            arrow_data, pictograph_data, grid_mode
+        )
         if special_adjustment is not None:
             # Special adjustment overrides default
             adjustment = special_adjustment
@@ -438,11 +522,15 @@ class ArrowManagementService(IArrowManagementService):
             adjustment = default_adjustment
 
         # Step 3: Apply quadrant-based directional adjustments
-        final_adjustment = self._apply_quadrant_adjustments(arrow_data, adjustment)
+        final_adjustment = self._apply_quadrant_adjustments(
+            arrow_data, adjustment, grid_mode
+        )
 
         return final_adjustment
 
-    def _get_default_adjustment(self, arrow_data: ArrowData) -> QPointF:
+    def _get_default_adjustment(
+        self, arrow_data: ArrowData, grid_mode: str = "diamond"
+    ) -> QPointF:
         """Get default adjustment using data-driven placement system."""
         motion = arrow_data.motion_data
         if not motion:
@@ -453,13 +541,16 @@ class ArrowManagementService(IArrowManagementService):
 
         # Get adjustment from default placement service
         adjustment = self.default_placement_service.get_default_adjustment(
-            motion, grid_mode="diamond", placement_key=placement_key
+            motion, grid_mode=grid_mode, placement_key=placement_key
         )
 
         return adjustment
 
     def _get_special_adjustment(
-        self, arrow_data: ArrowData, pictograph_data: PictographData
+        self,
+        arrow_data: ArrowData,
+        pictograph_data: PictographData,
+        grid_mode: str = "diamond",
     ) -> QPointF | None:
         """Get special adjustment for specific letters and configurations."""
         # CRITICAL FIX: Implement special placement logic using V1's JSON configuration
@@ -471,10 +562,9 @@ class ArrowManagementService(IArrowManagementService):
             )
 
         try:
-            from ..special_placement_service import SpecialPlacementService
-
-            special_service = SpecialPlacementService()
-            result = special_service.get_special_adjustment(arrow_data, pictograph_data)
+            result = self.special_placement_service.get_special_adjustment(
+                arrow_data, pictograph_data, grid_mode
+            )
 
             # DEBUGGING: Log the result for letters G, H, I
             if pictograph_data.letter in ["G", "H", "I"]:
@@ -494,7 +584,10 @@ class ArrowManagementService(IArrowManagementService):
             return None
 
     def _apply_quadrant_adjustments(
-        self, arrow_data: ArrowData, base_adjustment: QPointF
+        self,
+        arrow_data: ArrowData,
+        base_adjustment: QPointF,
+        grid_mode: str = "diamond",
     ) -> QPointF:
         """Apply quadrant-based directional adjustments using positioning logic."""
         motion = arrow_data.motion_data
@@ -503,7 +596,7 @@ class ArrowManagementService(IArrowManagementService):
 
         # Step 1: Generate directional tuples for all 4 quadrants
         directional_tuples = self._generate_directional_tuples(
-            motion, int(base_adjustment.x()), int(base_adjustment.y())
+            motion, int(base_adjustment.x()), int(base_adjustment.y()), grid_mode
         )
 
         # Step 2: Get quadrant index for this arrow
@@ -517,15 +610,12 @@ class ArrowManagementService(IArrowManagementService):
         return base_adjustment
 
     def _generate_directional_tuples(
-        self, motion: MotionData, x: int, y: int
+        self, motion: MotionData, x: int, y: int, grid_mode: str = "diamond"
     ) -> list[tuple[int, int]]:
         """Generate directional tuples for all 4 quadrants using positioning logic."""
         motion_type = motion.motion_type
         prop_rot_dir = motion.prop_rot_dir
 
-        # Determine grid mode (simplified for now - always diamond)
-        grid_mode = "diamond"
-
         if motion_type == MotionType.PRO:
             return self._get_pro_directional_tuples(grid_mode, prop_rot_dir, x, y)
         elif motion_type == MotionType.ANTI:
@@ -0,0 +1,476 @@
+"""
+Arrow Placement Table - Precompiled Arrow Positions
+
+Folds the default and special arrow placement JSON in data/arrow_placement
+into one versioned lookup table, so positioning an arrow is a dictionary
+lookup instead of a run through the placement key, default placement,
+special placement and quadrant adjustment services.
+
+The table has two parts:
+- placements: (grid mode, motion type, prop rot dir, start loc, end loc,
+  turns) -> final (x, y, rotation, mirror) using the default adjustment,
+  plus the initial position and quadrant transform needed to apply a
+  special adjustment instead
+- special adjustments: (grid mode, orientation key, letter, turns tuple,
+  motion type) -> raw (x, y) adjustment from the special placement JSON
+
+The table is compiled from ArrowManagementService's own pipeline and
+stored next to the placement data together with a hash of the JSON it was
+built from. A stale or missing table is recompiled on first use.
+
+Usage (from v2/):
+    python compile_arrow_placements.py
+    python compile_arrow_placements.py --verify
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple
+
+from domain.models.core_models import (
+    Location,
+    MotionData,
+    MotionType,
+    RotationDirection,
+)
+from domain.models.pictograph_models import ArrowData, PictographData
+from ..special_placement_service import SpecialPlacementService
+
+if TYPE_CHECKING:
+    from .arrow_management_service import ArrowManagementService
+
+PlacementKey = Tuple[str, str, str, str, str, float]
+SpecialKey = Tuple[str, str, str, str, str]
+
+# Locations in compass order; opposite locations are 4 steps apart and
+# shift motions end 2 steps away from where they start
+COMPASS = [
+    Location.NORTH,
+    Location.NORTHEAST,
+    Location.EAST,
+    Location.SOUTHEAST,
+    Location.SOUTH,
+    Location.SOUTHWEST,
+    Location.WEST,
+    Location.NORTHWEST,
+]
+END_LOCATION_STEPS = {
+    MotionType.STATIC: (0,),
+    MotionType.DASH: (4,),
+    MotionType.PRO: (2, -2),
+    MotionType.ANTI: (2, -2),
+    MotionType.FLOAT: (2, -2),
+}
+TURNS = (0.0, 0.5, 1.0, 1.5, 2.0, 2.5, 3.0)
+GRID_MODES = ("diamond", "box")
+
+# Grid mode ArrowManagementService positions arrows with
+DEFAULT_GRID_MODE = "diamond"
+
+
+class ArrowPlacement(NamedTuple):
+    x: float
+    y: float
+    rotation: float
+    mirror: bool
+
+
+class ArrowPlacementTable:
+    """Precompiled arrow placements with O(1) lookup."""
+
+    VERSION = 1
+    TEMP_SUFFIX = ".tmp"
+
+    _shared: Optional["ArrowPlacementTable"] = None
+
+    def __init__(
+        self,
+        placements: Dict[PlacementKey, tuple],
+        special_adjustments: Dict[SpecialKey, Tuple[int, int]],
+        source_hash: str = "",
+    ):
+        # placements values: (x, y, rotation, mirror, initial_x, initial_y,
+        # a, b, c, d) where (a, b, c, d) is the quadrant transform
+        self.placements = placements
+        self.special_adjustments = special_adjustments
+        self.source_hash = source_hash
+        self._special_letters = {
+            (grid_mode, letter)
+            for grid_mode, _ori_key, letter, _turns, _motion in special_adjustments
+        }
+
+    @staticmethod
+    def default_placement_root() -> Path:
+        """Directory holding the default and special placement JSON."""
+        root_path = Path(__file__).parent.parent.parent.parent.parent.parent
+        return root_path / "data" / "arrow_placement"
+
+    @classmethod
+    def default_table_path(cls) -> Path:
+        return cls.default_placement_root() / "compiled_arrow_placements.json"
+
+    @classmethod
+    def shared(cls) -> "ArrowPlacementTable":
+        """Get the table shared by every ArrowManagementService."""
+        if cls._shared is None:
+            cls._shared = cls.load_or_compile()
+        return cls._shared
+
+    @classmethod
+    def load_or_compile(
+        cls, table_path: Optional[Path] = None
+    ) -> "ArrowPlacementTable":
+        """Load the compiled table, recompiling it if the placement JSON changed."""
+        table_path = Path(table_path or cls.default_table_path())
+
+        table = cls.load(table_path)
+        if table is not None and table.source_hash == cls.source_fingerprint():
+            return table
+
+        table = cls.compile()
+        try:
+            table.save(table_path)
+        except OSError as e:
+            print(f"Could not save arrow placement table to {table_path}: {e}")
+        return table
+
+    # Lookup
+
+    def get_placement(
+        self,
+        arrow_data: ArrowData,
+        pictograph_data: PictographData,
+        grid_mode: str = DEFAULT_GRID_MODE,
+    ) -> Optional[ArrowPlacement]:
+        """
+        Get the final placement of an arrow.
+
+        Returns:
+            ArrowPlacement, or None if the motion is not in the table
+        """
+        motion = arrow_data.motion_data
+        if motion is None:
+            return None
+
+        entry = self.placements.get(self.placement_key(motion, grid_mode))
+        if entry is None:
+            return None
+        x, y, rotation, mirror, initial_x, initial_y, a, b, c, d = entry
+
+        letter = pictograph_data.letter
+        if letter and (grid_mode, letter) in self._special_letters:
+            special = self.special_adjustments.get(
+                (
+                    grid_mode,
+                    SpecialPlacementService.generate_orientation_key(
+                        motion, pictograph_data
+                    ),
+                    letter,
+                    SpecialPlacementService.generate_turns_tuple(pictograph_data),
+                    motion.motion_type.value,
+                )
+            )
+            if special is not None:
+                special_x, special_y = special
+                x = initial_x + (a * special_x + b * special_y)
+                y = initial_y + (c * special_x + d * special_y)
+
+        return ArrowPlacement(x, y, rotation, mirror)
+
+    @staticmethod
+    def placement_key(motion: MotionData, grid_mode: str) -> PlacementKey:
+        return (
+            grid_mode,
+            motion.motion_type.value,
+            motion.prop_rot_dir.value,
+            motion.start_loc.value,
+            motion.end_loc.value,
+            float(motion.turns),
+        )
+
+    def __len__(self) -> int:
+        return len(self.placements) + len(self.special_adjustments)
+
+    # Compilation
+
+    @classmethod
+    def compile(
+        cls, service: Optional["ArrowManagementService"] = None
+    ) -> "ArrowPlacementTable":
+        """Compile the table from the placement JSON and the live pipeline."""
+        if service is None:
+            from .arrow_management_service import ArrowManagementService
+
+            service = ArrowManagementService(use_placement_table=False)
+
+        placements: Dict[PlacementKey, tuple] = {}
+        for grid_mode in GRID_MODES:
+            for motion in cls.iter_motions():
+                initial, rotation, (dx, dy), (a, b, c, d) = (
+                    service.calculate_placement_components(motion, grid_mode)
+                )
+                mirror = service.should_mirror_arrow(ArrowData(motion_data=motion))
+                placements[cls.placement_key(motion, grid_mode)] = (
+                    initial.x() + (a * dx + b * dy),
+                    initial.y() + (c * dx + d * dy),
+                    float(rotation),
+                    mirror,
+                    initial.x(),
+                    initial.y(),
+                    a,
+                    b,
+                    c,
+                    d,
+                )
+
+        special_placements = service.special_placement_service.special_placements
+        special_adjustments: Dict[SpecialKey, Tuple[int, int]] = {}
+        motion_types = {motion_type.value for motion_type in MotionType}
+        for grid_mode, by_ori_key in special_placements.items():
+            for ori_key, by_letter in by_ori_key.items():
+                for letter, by_turns in by_letter.items():
+                    for turns_tuple, turn_data in by_turns.items():
+                        if not isinstance(turn_data, dict):
+                            continue
+                        for motion_type, values in turn_data.items():
+                            if (
+                                motion_type in motion_types
+                                and isinstance(values, list)
+                                and len(values) == 2
+                            ):
+                                special_adjustments[
+                                    (grid_mode, ori_key, letter, turns_tuple, motion_type)
+                                ] = (int(values[0]), int(values[1]))
+
+        return cls(placements, special_adjustments, cls.source_fingerprint())
+
+    @staticmethod
+    def iter_motions():
+        """Every geometrically valid motion the table covers."""
+        for motion_type, steps in END_LOCATION_STEPS.items():
+            for prop_rot_dir in RotationDirection:
+                for index, start_loc in enumerate(COMPASS):
+                    for step in steps:
+                        end_loc = COMPASS[(index + step) % len(COMPASS)]
+                        for turns in TURNS:
+                            yield MotionData(
+                                motion_type=motion_type,
+                                prop_rot_dir=prop_rot_dir,
+                                start_loc=start_loc,
+                                end_loc=end_loc,
+                                turns=turns,
+                            )
+
+    @classmethod
+    def source_fingerprint(cls) -> str:
+        """Hash of the placement JSON the table is compiled from."""
+        placement_root = cls.default_placement_root()
+        digest = hashlib.sha256(f"version={cls.VERSION}".encode("utf-8"))
+        for grid_mode in GRID_MODES:
+            grid_root = placement_root / grid_mode
+            files = sorted(grid_root.glob("default/*.json")) + sorted(
+                grid_root.glob("special/*/*_placements.json")
+            )
+            for file_path in files:
+                digest.update(file_path.relative_to(placement_root).as_posix().encode())
+                digest.update(file_path.read_bytes())
+        return digest.hexdigest()
+
+    # Verification
+
+    def verify(
+        self, service: Optional["ArrowManagementService"] = None
+    ) -> List[str]:
+        """
+        Diff the table against the live pipeline.
+
+        Every default placement is checked, and every special adjustment is
+        checked once per prop rotation direction.
+
+        Returns:
+            A description of each mismatch; empty if the table is correct
+        """
+        if service is None:
+            from .arrow_management_service import ArrowManagementService
+
+            service = ArrowManagementService(use_placement_table=False)
+
+        mismatches = []
+        for key in self.placements:
+            grid_mode = key[0]
+            motion = self._motion_from_key(key)
+            arrow = ArrowData(motion_data=motion, color="blue", turns=motion.turns)
+            pictograph = PictographData(arrows={"blue": arrow})
+            mismatches.extend(
+                self._compare(service, arrow, pictograph, grid_mode, str(key))
+            )
+
+        for grid_mode, ori_key, letter, turns_tuple, motion_type in (
+            self.special_adjustments
+        ):
+            blue_turns = self._parse_turns_tuple(turns_tuple)
+            if blue_turns is None:
+                continue
+            blue_ori, red_ori = self._end_orientations(ori_key)
+            for prop_rot_dir in RotationDirection:
+                steps = END_LOCATION_STEPS[MotionType(motion_type)]
+                motion = MotionData(
+                    motion_type=MotionType(motion_type),
+                    prop_rot_dir=prop_rot_dir,
+                    start_loc=COMPASS[0],
+                    end_loc=COMPASS[steps[0] % len(COMPASS)],
+                    turns=blue_turns[0],
+                    end_ori=blue_ori,
+                )
+                other = MotionData(
+                    motion_type=MotionType.STATIC,
+                    prop_rot_dir=RotationDirection.NO_ROTATION,
+                    start_loc=COMPASS[0],
+                    end_loc=COMPASS[0],
+                    turns=blue_turns[1],
+                    end_ori=red_ori,
+                )
+                arrow = ArrowData(motion_data=motion, color="blue", turns=motion.turns)
+                pictograph = PictographData(
+                    arrows={
+                        "blue": arrow,
+                        "red": ArrowData(motion_data=other, color="red"),
+                    },
+                    letter=letter,
+                )
+                label = f"{(grid_mode, ori_key, letter, turns_tuple, motion_type)}"
+                mismatches.extend(
+                    self._compare(service, arrow, pictograph, grid_mode, label)
+                )
+        return mismatches
+
+    def _compare(
+        self,
+        service: "ArrowManagementService",
+        arrow: ArrowData,
+        pictograph: PictographData,
+        grid_mode: str,
+        label: str,
+    ) -> List[str]:
+        expected = ArrowPlacement(
+            *service.calculate_arrow_position_uncached(arrow, pictograph, grid_mode),
+            service.should_mirror_arrow(arrow),
+        )
+        actual = self.get_placement(arrow, pictograph, grid_mode)
+        if actual != expected:
+            return [f"{label}: table {actual} != live {expected}"]
+        return []
+
+    @staticmethod
+    def _motion_from_key(key: PlacementKey) -> MotionData:
+        _grid_mode, motion_type, prop_rot_dir, start_loc, end_loc, turns = key
+        return MotionData(
+            motion_type=MotionType(motion_type),
+            prop_rot_dir=RotationDirection(prop_rot_dir),
+            start_loc=Location(start_loc),
+            end_loc=Location(end_loc),
+            turns=turns,
+        )
+
+    @staticmethod
+    def _parse_turns_tuple(turns_tuple: str) -> Optional[Tuple[float, float]]:
+        try:
+            blue, red = turns_tuple.strip("()").split(",")
+            return float(blue), float(red)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _end_orientations(ori_key: str) -> Tuple[str, str]:
+        """End orientations that make generate_orientation_key return ori_key."""
+        return {
+            "from_layer1": ("in", "in"),
+            "from_layer2": ("clock", "clock"),
+            "from_layer3_blue1_red2": ("in", "clock"),
+            "from_layer3_blue2_red1": ("clock", "in"),
+        }.get(ori_key, ("in", "in"))
+
+    # Persistence
+
+    def save(self, table_path: Path) -> None:
+        """Write the table atomically as JSON."""
+        data = {
+            "version": self.VERSION,
+            "source_hash": self.source_hash,
+            "placements": {
+                "|".join(str(part) for part in key): list(value)
+                for key, value in self.placements.items()
+            },
+            "special_adjustments": {
+                "|".join(key): list(value)
+                for key, value in self.special_adjustments.items()
+            },
+        }
+        table_path = Path(table_path)
+        temp_path = str(table_path) + self.TEMP_SUFFIX
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, table_path)
+
+    @classmethod
+    def load(cls, table_path: Path) -> Optional["ArrowPlacementTable"]:
+        """Read a compiled table, or None if it is missing or another version."""
+        try:
+            with open(table_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return None
+
+        placements = {}
+        for key, value in data["placements"].items():
+            grid_mode, motion_type, prop_rot_dir, start_loc, end_loc, turns = (
+                key.split("|")
+            )
+            x, y, rotation, mirror, *transform = value
+            placements[
+                (grid_mode, motion_type, prop_rot_dir, start_loc, end_loc, float(turns))
+            ] = (x, y, rotation, bool(mirror), *transform)
+
+        special_adjustments = {
+            tuple(key.split("|")): tuple(value)
+            for key, value in data["special_adjustments"].items()
+        }
+        return cls(placements, special_adjustments, data.get("source_hash", ""))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Compile the arrow placement JSON into one lookup table."
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=ArrowPlacementTable.default_table_path(),
+        help="Where to write the compiled table",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Diff the compiled table against the live placement pipeline",
+    )
+    args = parser.parse_args()
+
+    table = ArrowPlacementTable.compile()
+    table.save(args.output)
+    print(
+        f"Compiled {len(table.placements)} placements and "
+        f"{len(table.special_adjustments)} special adjustments to {args.output}"
+    )
+
+    if args.verify:
+        mismatches = ArrowPlacementTable.load(args.output).verify()
+        for mismatch in mismatches:
+            print(mismatch)
+        print(f"{len(mismatches)} mismatches")
+        return 1 if mismatches else 0
+    return 0
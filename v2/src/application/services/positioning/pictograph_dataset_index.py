@@ -0,0 +1,121 @@
+"""
+Pictograph Dataset Index - Constant-Time Next-Option Lookup
+
+Builds read-only lookup tables over the grouped pictograph dataset so that
+finding every pictograph that can follow a position is a dictionary lookup
+instead of a scan over every letter.
+"""
+
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from domain.models.letter_type_classifier import LetterTypeClassifier
+from domain.models.pictograph_models import GridMode
+
+BOX_POSITIONS = frozenset(
+    [f"alpha{i}" for i in (2, 4, 6, 8)]
+    + [f"beta{i}" for i in (2, 4, 6, 8)]
+    + [f"gamma{i}" for i in (2, 4, 6, 8, 10, 12, 14, 16)]
+)
+
+
+class PictographDatasetIndex:
+    """
+    Immutable index over a {letter: [pictograph_data]} dataset.
+
+    The primary key is (grid_mode, start_pos). Secondary keys narrow the same
+    bucket by letter, letter type, or (blue, red) prop_rot_dir. Buckets are
+    tuples that keep the dataset's original order.
+    """
+
+    def __init__(self, pictograph_dataset: Mapping[str, List[Dict[str, Any]]]):
+        by_start: Dict[tuple, List[Dict[str, Any]]] = {}
+        by_letter: Dict[tuple, List[Dict[str, Any]]] = {}
+        by_letter_type: Dict[tuple, List[Dict[str, Any]]] = {}
+        by_rot_dirs: Dict[tuple, List[Dict[str, Any]]] = {}
+        grid_modes: Dict[str, GridMode] = {}
+
+        for letter, group in pictograph_dataset.items():
+            letter_type = LetterTypeClassifier.get_letter_type(letter)
+            for pictograph_data in group:
+                start_pos = pictograph_data.get("start_pos")
+                if not start_pos:
+                    continue
+                grid_mode = self.grid_mode_for_position(start_pos)
+                grid_modes[start_pos] = grid_mode
+                key = (grid_mode, start_pos)
+                rot_dirs = (
+                    pictograph_data.get("blue_attributes", {}).get("prop_rot_dir"),
+                    pictograph_data.get("red_attributes", {}).get("prop_rot_dir"),
+                )
+
+                by_start.setdefault(key, []).append(pictograph_data)
+                by_letter.setdefault(
+                    key + (pictograph_data.get("letter", letter),), []
+                ).append(pictograph_data)
+                by_letter_type.setdefault(key + (letter_type,), []).append(
+                    pictograph_data
+                )
+                by_rot_dirs.setdefault(key + rot_dirs, []).append(pictograph_data)
+
+        self._by_start = self._freeze(by_start)
+        self._by_letter = self._freeze(by_letter)
+        self._by_letter_type = self._freeze(by_letter_type)
+        self._by_rot_dirs = self._freeze(by_rot_dirs)
+        self._grid_modes = MappingProxyType(grid_modes)
+
+    @staticmethod
+    def grid_mode_for_position(position: str) -> GridMode:
+        """Return the grid a position belongs to."""
+        return GridMode.BOX if position in BOX_POSITIONS else GridMode.DIAMOND
+
+    def get_options(
+        self,
+        start_pos: str,
+        grid_mode: Optional[GridMode] = None,
+        letter: Optional[str] = None,
+        letter_type: Optional[str] = None,
+        prop_rot_dirs: Optional[Tuple[str, str]] = None,
+    ) -> Tuple[Dict[str, Any], ...]:
+        """
+        Get every pictograph that starts at a position.
+
+        Args:
+            start_pos: The position the options must start from
+            grid_mode: Grid to search; defaults to the grid of start_pos
+            letter: Only return options for this letter
+            letter_type: Only return options of this type (e.g. "Type1")
+            prop_rot_dirs: Only return options with this (blue, red) prop_rot_dir
+
+        Returns:
+            Tuple of raw pictograph dictionaries in dataset order
+        """
+        if grid_mode is None:
+            grid_mode = self._grid_modes.get(start_pos)
+            if grid_mode is None:
+                return ()
+        key = (grid_mode, start_pos)
+        if letter is not None:
+            return self._by_letter.get(key + (letter,), ())
+        if letter_type is not None:
+            return self._by_letter_type.get(key + (letter_type,), ())
+        if prop_rot_dirs is not None:
+            return self._by_rot_dirs.get(key + tuple(prop_rot_dirs), ())
+        return self._by_start.get(key, ())
+
+    def start_positions(self, grid_mode: Optional[GridMode] = None) -> List[str]:
+        """Get the sorted start positions present in the dataset."""
+        return sorted(
+            position
+            for position, mode in self._grid_modes.items()
+            if grid_mode is None or mode == grid_mode
+        )
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._by_start.values())
+
+    @staticmethod
+    def _freeze(
+        table: Dict[tuple, List[Dict[str, Any]]],
+    ) -> Mapping[tuple, Tuple[Dict[str, Any], ...]]:
+        return MappingProxyType({key: tuple(bucket) for key, bucket in table.items()})
@@ -3,14 +3,17 @@ Position Matching Service - Data-Driven Motion Generation
 
 This service implements a data-driven position matching algorithm for motion generation.
 The algorithm is simple: find all pictographs where start_pos matches the target position.
+Matches are served from a PictographDatasetIndex keyed by (grid_mode, start_pos), so a
+lookup does not depend on the size of the dataset.
 """
 
-import pandas as pd
 from typing import Dict, List, Any, Optional
 from ..core.pictograph_management_service import PictographManagementService
 from ..old_services_before_consolidation.data_conversion_service import (
     DataConversionService,
 )
+from .pictograph_dataset_index import PictographDatasetIndex
+from core.dependency_injection.di_container import record_construction
 from domain.models.core_models import BeatData
 
 
@@ -24,28 +27,49 @@ class PositionMatchingService:
     No complex validation or rule-based generation - just simple dataset lookups.
     """
 
-    def __init__(self):
-        """Initialize position matching service with V2's native dataset."""
-        self.pictograph_management_service = PictographManagementService()
-        self.data_conversion_service = DataConversionService()
+    def __init__(
+        self,
+        pictograph_management_service: Optional[PictographManagementService] = None,
+        data_conversion_service: Optional[DataConversionService] = None,
+    ):
+        """
+        Initialize position matching service with V2's native dataset.
+
+        Args:
+            pictograph_management_service: Shared dataset service; a new one
+                is built when not provided.
+            data_conversion_service: Shared conversion service; a new one is
+                built when not provided.
+        """
+        record_construction(self)
+        self.pictograph_management_service = (
+            pictograph_management_service or PictographManagementService()
+        )
+        self.data_conversion_service = (
+            data_conversion_service
+            or DataConversionService(
+                pictograph_service=self.pictograph_management_service
+            )
+        )
         self.pictograph_dataset: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self.dataset_index = PictographDatasetIndex({})
         self._load_dataset()
 
     def _load_dataset(self):
         """Load dataset using V2's native pictograph management service."""
         try:
-            # Get the raw CSV dataset from V2's service
-            raw_dataset = self.pictograph_management_service._load_csv_data()
+            # Grouped dictionary format: {letter: [pictograph_data_list]}, built
+            # in bulk when the CSV is ingested
+            self.pictograph_dataset = (
+                self.pictograph_management_service.get_letter_records()
+            )
 
-            if raw_dataset is None or raw_dataset.empty:
+            if not self.pictograph_dataset:
                 print("❌ Dataset is empty")
                 self.pictograph_dataset = {}
                 return
 
-            # Convert to grouped dictionary format: {letter: [pictograph_data_list]}
-            self.pictograph_dataset = self._convert_dataframe_to_grouped_dict(
-                raw_dataset
-            )
+            self.dataset_index = PictographDatasetIndex(self.pictograph_dataset)
 
             # Log statistics
             total_pictographs = sum(
@@ -59,64 +83,18 @@ class PositionMatchingService:
             print(f"❌ Failed to load dataset: {e}")
             self.pictograph_dataset = {}
 
-    def _convert_dataframe_to_grouped_dict(
-        self, df: pd.DataFrame
-    ) -> Dict[str, List[Dict[str, Any]]]:
-        """
-        Convert pandas DataFrame to grouped dictionary format for position matching.
-
-        Args:
-            df: Pandas DataFrame with pictograph data
-
-        Returns:
-            Dictionary in format: {letter: [pictograph_data_list]}
-        """
-        grouped_dict = {}
-
-        for _, row in df.iterrows():
-            letter = str(row.get("letter", "Unknown"))
-
-            # Convert row to pictograph data format
-            pictograph_data = {
-                "letter": letter,
-                "start_pos": str(row.get("start_pos", "unknown")),
-                "end_pos": str(row.get("end_pos", "unknown")),
-                "blue_attributes": {
-                    "motion_type": str(row.get("blue_motion_type", "static")),
-                    "prop_rot_dir": str(row.get("blue_prop_rot_dir", "no_rotation")),
-                    "start_loc": str(row.get("blue_start_loc", "n")),
-                    "end_loc": str(row.get("blue_end_loc", "n")),
-                    "start_ori": str(row.get("blue_start_ori", "in")),
-                    "end_ori": str(row.get("blue_end_ori", "in")),
-                },
-                "red_attributes": {
-                    "motion_type": str(row.get("red_motion_type", "static")),
-                    "prop_rot_dir": str(row.get("red_prop_rot_dir", "no_rotation")),
-                    "start_loc": str(row.get("red_start_loc", "s")),
-                    "end_loc": str(row.get("red_end_loc", "s")),
-                    "start_ori": str(row.get("red_start_ori", "out")),
-                    "end_ori": str(row.get("red_end_ori", "out")),
-                },
-            }
-
-            if letter not in grouped_dict:
-                grouped_dict[letter] = []
-
-            grouped_dict[letter].append(pictograph_data)
-
-        return grouped_dict
-
     def get_next_options(self, last_beat_end_pos: str) -> List[BeatData]:
         """
         V1's exact algorithm: find all pictographs where start_pos matches.
 
-        This is the complete algorithm from V1's option_getter.py lines 120-131:
+        This is the result of V1's option_getter.py scan:
         ```python
         for group in self.pictograph_dataset.values():
             for item in group:
                 if item.get("start_pos") == start:
                     next_opts.append(item)
         ```
+        served from the (grid_mode, start_pos) index instead of a full scan.
 
         Args:
             last_beat_end_pos: The end position of the last beat
@@ -131,46 +109,25 @@ class PositionMatchingService:
             print("❌ No dataset loaded")
             return []
 
+        matches = self.dataset_index.get_options(last_beat_end_pos)
         next_opts = []
-        dataset_groups_checked = 0
-        total_items_checked = 0
-        matches_found = 0
-
-        # V1's exact algorithm implementation
-        for group_key, group in self.pictograph_dataset.items():
-            dataset_groups_checked += 1
-            for item in group:
-                total_items_checked += 1
-                if item.get("start_pos") == last_beat_end_pos:  # ← THE ENTIRE ALGORITHM
-                    letter = item.get("letter", "Unknown")
-                    end_pos = item.get("end_pos", "N/A")
-                    matches_found += 1
-
-                    # Convert dictionary to BeatData object
-                    try:
-                        beat_data = self.data_conversion_service.convert_v1_pictograph_to_beat_data(
-                            item
-                        )
-                        next_opts.append(beat_data)  # ← ADD TO VALID OPTIONS
-                        print(
-                            f"   ✅ Match {matches_found}: {letter} ({last_beat_end_pos} → {end_pos})"
-                        )
-                    except Exception as e:
-                        print(f"   ❌ Failed to convert match {matches_found}: {e}")
-                        continue
+        for item in matches:
+            try:
+                next_opts.append(
+                    self.data_conversion_service.convert_v1_pictograph_to_beat_data(
+                        item
+                    )
+                )
+            except Exception as e:
+                print(f"   ❌ Failed to convert match {item.get('letter')}: {e}")
+                continue
 
         # Log analysis results
         print(f"\n📊 POSITION MATCHING RESULTS:")
-        print(f"   - Dataset groups checked: {dataset_groups_checked}")
-        print(f"   - Total items checked: {total_items_checked}")
-        print(f"   - Matches found: {matches_found}")
-        print(
-            f"   - Success rate: {(matches_found/total_items_checked*100):.1f}%"
-            if total_items_checked > 0
-            else "   - Success rate: 0%"
-        )
+        print(f"   - Indexed pictographs: {len(self.dataset_index)}")
+        print(f"   - Matches found: {len(matches)}")
 
-        if matches_found > 0:
+        if next_opts:
             letters = [opt.letter or "?" for opt in next_opts]
             print(f"   - Letters found: {', '.join(letters)}")
 
@@ -194,17 +151,7 @@ class PositionMatchingService:
         Returns:
             List of unique start position strings
         """
-        if not self.pictograph_dataset:
-            return []
-
-        start_positions = set()
-        for group in self.pictograph_dataset.values():
-            for item in group:
-                start_pos = item.get("start_pos")
-                if start_pos:
-                    start_positions.add(start_pos)
-
-        return sorted(list(start_positions))
+        return self.dataset_index.start_positions()
 
     def get_position_statistics(self, position: str) -> Dict[str, Any]:
         """
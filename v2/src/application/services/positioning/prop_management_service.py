@@ -18,6 +18,7 @@ import json
 from pathlib import Path
 from enum import Enum
 
+from core.dependency_injection.di_container import record_construction
 from domain.models.core_models import (
     BeatData,
     MotionData,
@@ -79,6 +80,8 @@ class PropManagementService(IPropManagementService):
     """
 
     def __init__(self):
+        record_construction(self)
+
         # Beta prop positioning constants (from v1)
         self._large_offset_divisor = 60
         self._medium_offset_divisor = 50
@@ -39,11 +39,15 @@ class SpecialPlacementService:
     """
 
     def __init__(self):
+        self.root_path = Path(__file__).parent.parent.parent.parent.parent
         self.special_placements: Dict[str, Dict[str, Dict[str, Any]]] = {}
         self._load_special_placements()
 
     def get_special_adjustment(
-        self, arrow_data: ArrowData, pictograph_data: PictographData
+        self,
+        arrow_data: ArrowData,
+        pictograph_data: PictographData,
+        grid_mode: Optional[str] = None,
     ) -> Optional[QPointF]:
         """
         Get special adjustment for arrow based on V1's special placement logic.
@@ -51,6 +55,7 @@ class SpecialPlacementService:
         Args:
             arrow_data: Arrow data containing motion information
             pictograph_data: Pictograph data containing letter and context
+            grid_mode: Grid mode to look up (defaults to the pictograph's)
 
         Returns:
             QPointF with special adjustment or None if no special placement found
@@ -66,13 +71,14 @@ class SpecialPlacementService:
             print(f"🔍 V2 SPECIAL PLACEMENT LOOKUP: Letter {letter}")
 
         # Generate orientation key using V1's logic
-        ori_key = self._generate_orientation_key(motion, pictograph_data)
+        ori_key = self.generate_orientation_key(motion, pictograph_data)
 
         # Get grid mode (default to diamond)
-        grid_mode = getattr(pictograph_data, "grid_mode", "diamond")
+        if grid_mode is None:
+            grid_mode = getattr(pictograph_data, "grid_mode", "diamond")
 
         # Generate turns tuple for lookup
-        turns_tuple = self._generate_turns_tuple(pictograph_data)
+        turns_tuple = self.generate_turns_tuple(pictograph_data)
 
         # DEBUGGING: Log lookup details for letters G, H, I
         if letter in ["G", "H", "I"]:
@@ -140,7 +146,12 @@ class SpecialPlacementService:
 
                     # Build path to special placement directory
                     directory = (
-                        Path("data") / "arrow_placement" / mode / "special" / subfolder
+                        self.root_path
+                        / "data"
+                        / "arrow_placement"
+                        / mode
+                        / "special"
+                        / subfolder
                     )
 
                     if not directory.exists():
@@ -161,8 +172,9 @@ class SpecialPlacementService:
             print(f"⚠️ Failed to load special placements: {e}")
             self.special_placements = {}
 
-    def _generate_orientation_key(
-        self, motion: MotionData, pictograph_data: PictographData
+    @staticmethod
+    def generate_orientation_key(
+        motion: MotionData, pictograph_data: PictographData
     ) -> str:
         """
         Generate orientation key matching V1's ori_key_generator logic.
@@ -210,7 +222,8 @@ class SpecialPlacementService:
         # Default orientation key
         return "from_layer1"
 
-    def _generate_turns_tuple(self, pictograph_data: PictographData) -> str:
+    @staticmethod
+    def generate_turns_tuple(pictograph_data: PictographData) -> str:
         """
         Generate turns tuple string matching V1's turns_tuple_generator logic.
 
@@ -13,14 +13,16 @@ This service provides a clean, unified interface for all UI state operations
 while maintaining the proven algorithms from the individual services.
 """
 
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Union
 from abc import ABC, abstractmethod
 from enum import Enum
 from dataclasses import dataclass, field
+import copy
 import json
 from pathlib import Path
 
 from core.events.event_bus import get_event_bus, UIEvent, EventPriority
+from infrastructure.debounced_json_writer import DebouncedJsonWriter
 
 
 class IUIStateManagementService(ABC):
@@ -117,14 +119,27 @@ class UIStateManagementService(IUIStateManagementService):
     - Graph editor state management
     - Option picker state management
     - Event-driven state synchronization
+
+    State changes are persisted write-behind: bursts of updates, such as a
+    splitter drag, are coalesced into one atomic write off the GUI thread.
+    Call flush_state() to persist pending changes immediately; pending
+    changes are also flushed when the interpreter exits.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        settings_file: Union[str, Path] = "user_settings.json",
+        save_debounce_seconds: float = DebouncedJsonWriter.DEFAULT_DEBOUNCE_SECONDS,
+    ):
         # Core state
         self._ui_state = UIState()
         
         # Settings file path
-        self._settings_file = Path("user_settings.json")
+        self._settings_file = Path(settings_file)
+        # Shared by every service instance persisting the same file
+        self._state_writer = DebouncedJsonWriter.for_path(
+            self._settings_file, debounce_seconds=save_debounce_seconds
+        )
         
         # Event bus for state synchronization
         self._event_bus = get_event_bus()
@@ -225,18 +240,25 @@ class UIStateManagementService(IUIStateManagementService):
         return self._ui_state.graph_editor_visible
     
     def set_graph_editor_height(self, height: int) -> None:
-        """Set graph editor height."""
+        """
+        Set graph editor height.
+
+        The height_changed event is coalesced and delivered at the next frame,
+        not before this returns, so a drag notifies subscribers once per frame.
+        Read the height from the event's state_data rather than assuming
+        get_graph_editor_state() was current when the event fired.
+        """
         self._ui_state.graph_editor_height = max(100, min(800, height))  # Clamp between 100-800
         self._save_state()
         
-        # Publish height change event
+        # Publish height change event, once per frame while dragging
         event = UIEvent(
             component="graph_editor",
             action="height_changed",
             state_data={"height": self._ui_state.graph_editor_height},
             source="ui_state_management_service",
         )
-        self._event_bus.publish(event)
+        self._event_bus.publish_coalesced(event)
     
     def get_option_picker_state(self) -> Dict[str, Any]:
         """Get option picker state."""
@@ -368,6 +390,15 @@ class UIStateManagementService(IUIStateManagementService):
         except Exception:
             return False
     
+    def flush_state(self) -> None:
+        """Write any pending state changes to disk before returning."""
+        self._state_writer.flush()
+    
+    @property
+    def state_write_count(self) -> int:
+        """Number of times the state has been written to disk."""
+        return self._state_writer.write_count
+    
     # Private methods
     
     def _load_state(self) -> None:
@@ -399,22 +430,20 @@ class UIStateManagementService(IUIStateManagementService):
                 print(f"Error loading UI state: {e}")
     
     def _save_state(self) -> None:
-        """Save state to file."""
+        """Schedule a write of the current state to file."""
+        data = {
+            "user_settings": self._ui_state.user_settings,
+            "window_geometry": self._ui_state.window_geometry,
+            "window_maximized": self._ui_state.window_maximized,
+            "active_tab": self._ui_state.active_tab,
+            "tab_states": self._ui_state.tab_states,
+            "graph_editor_visible": self._ui_state.graph_editor_visible,
+            "graph_editor_height": self._ui_state.graph_editor_height,
+            "component_visibility": self._ui_state.component_visibility,
+        }
+        # The writer serializes on its own thread, so it gets a private copy
         try:
-            data = {
-                "user_settings": self._ui_state.user_settings,
-                "window_geometry": self._ui_state.window_geometry,
-                "window_maximized": self._ui_state.window_maximized,
-                "active_tab": self._ui_state.active_tab,
-                "tab_states": self._ui_state.tab_states,
-                "graph_editor_visible": self._ui_state.graph_editor_visible,
-                "graph_editor_height": self._ui_state.graph_editor_height,
-                "component_visibility": self._ui_state.component_visibility,
-            }
-            
-            with open(self._settings_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
+            self._state_writer.submit(copy.deepcopy(data))
         except Exception as e:
             print(f"Error saving UI state: {e}")
     
@@ -10,15 +10,19 @@ from typing import (
     Type,
     Dict,
     Any,
+    List,
+    NamedTuple,
     Optional,
     Callable,
+    Tuple,
     Union,
     get_type_hints,
     Protocol,
 )
 import logging
 import inspect
-from dataclasses import is_dataclass
+import time
+from dataclasses import dataclass, field, is_dataclass
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
@@ -26,6 +30,90 @@ logger = logging.getLogger(__name__)
 # Global container instance
 _container: Optional["DIContainer"] = None
 
+# Instances built per service type this session, see record_construction()
+_construction_counts: Dict[str, int] = {}
+
+
+def record_construction(service: Any) -> None:
+    """
+    Count one construction of a service for this session.
+
+    Services that load datasets or placement data call this from __init__, so
+    any construction outside the shared registry shows up in the counts.
+    """
+    service_type = service if inspect.isclass(service) else type(service)
+    name = service_type.__name__
+    _construction_counts[name] = _construction_counts.get(name, 0) + 1
+    logger.debug(f"Constructed {name} (#{_construction_counts[name]})")
+
+
+def get_construction_counts() -> Dict[str, int]:
+    """Get the number of instances constructed per service type this session."""
+    return dict(_construction_counts)
+
+
+def reset_construction_counts() -> None:
+    """Reset the construction counts (useful for testing)."""
+    _construction_counts.clear()
+
+
+def format_construction_report() -> str:
+    """Format the construction counts as one line per service type."""
+    if not _construction_counts:
+        return "No tracked services constructed"
+    width = max(len(name) for name in _construction_counts)
+    return "\n".join(
+        f"{name:<{width}}  {count}"
+        for name, count in sorted(
+            _construction_counts.items(), key=lambda item: (-item[1], item[0])
+        )
+    )
+
+
+class ConstructionPlan(NamedTuple):
+    """Constructor dependencies of an implementation, worked out once."""
+
+    implementation: Type
+    # (parameter name, type to resolve) in signature order. Parameters with
+    # defaults, primitives and unannotated parameters are left to __init__.
+    dependencies: Tuple[Tuple[str, Type], ...]
+
+
+class ServiceTiming(NamedTuple):
+    name: str
+    seconds: float
+
+
+@dataclass(frozen=True)
+class WarmUpReport:
+    """Result of DIContainer.warm_up(), in construction order."""
+
+    timings: Tuple[ServiceTiming, ...] = ()
+    failures: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(timing.seconds for timing in self.timings)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    def format(self) -> str:
+        """Format one line per constructed service, then any failures."""
+        names = [timing.name for timing in self.timings] + list(self.failures)
+        width = max((len(name) for name in names), default=0)
+        lines = [
+            f"{timing.name:<{width}}  {timing.seconds * 1000:8.1f} ms"
+            for timing in self.timings
+        ]
+        lines.append(f"{'total':<{width}}  {self.total_seconds * 1000:8.1f} ms")
+        lines.extend(
+            f"{name:<{width}}  FAILED: {error}"
+            for name, error in self.failures.items()
+        )
+        return "\n".join(lines)
+
 
 class DIContainer:
     """
@@ -33,17 +121,29 @@ class DIContainer:
 
     Features:
     - Singleton and transient service lifetimes
+    - Singleton-scoped factories for services that need explicit wiring
     - Automatic constructor injection with type resolution
     - Protocol compliance validation
     - Circular dependency detection
     - Type safety validation
+    - Cached construction plans and a startup warm-up pass
+
+    Constructor signatures are inspected once per implementation and kept as
+    a ConstructionPlan, so resolving a transient is a dict lookup plus the
+    constructor call. warm_up() builds every singleton at startup and reports
+    how long each took to construct.
     """
 
     def __init__(self):
         self._services: Dict[Type, Type] = {}
         self._singletons: Dict[Type, Any] = {}
         self._factories: Dict[Type, Type] = {}
+        self._singleton_factories: Dict[Type, Callable[[], Any]] = {}
         self._resolution_stack: set = set()
+        self._plans: Dict[Type, ConstructionPlan] = {}
+        # Singleton construction times, excluding their dependencies
+        self._construction_times: Dict[Type, float] = {}
+        self._nested_construction_times: List[float] = []
 
     def register_singleton(self, interface: Type[T], implementation: Type[T]) -> None:
         """Register a service as singleton (one instance per container)."""
@@ -66,6 +166,20 @@ class DIContainer:
         self._singletons[interface] = instance
         logger.debug(f"Registered instance: {interface.__name__}")
 
+    def register_factory(self, interface: Type[T], factory: Callable[[], T]) -> None:
+        """Register a factory called once, on first resolve, for a singleton."""
+        self._singleton_factories[interface] = factory
+        logger.debug(f"Registered singleton factory: {interface.__name__}")
+
+    def is_registered(self, interface: Type) -> bool:
+        """Check whether a service can be resolved from this container."""
+        return (
+            interface in self._singletons
+            or interface in self._services
+            or interface in self._singleton_factories
+            or interface in self._factories
+        )
+
     def auto_register(self, interface: Type[T], implementation: Type[T]) -> None:
         """Register with automatic Protocol validation."""
         self._validate_protocol_implementation(interface, implementation)
@@ -93,16 +207,18 @@ class DIContainer:
         if interface in self._singletons:
             return self._singletons[interface]
 
+        # Check for singleton factory registration
+        if interface in self._singleton_factories:
+            return self._create_singleton(
+                interface, self._singleton_factories[interface]
+            )
+
         # Check for singleton registration
         if interface in self._services:
             implementation = self._services[interface]
-            self._resolution_stack.add(interface)
-            try:
-                instance = self._create_instance(implementation)
-                self._singletons[interface] = instance
-                return instance
-            finally:
-                self._resolution_stack.discard(interface)
+            return self._create_singleton(
+                interface, lambda: self._create_instance(implementation)
+            )
 
         # Check for transient registration
         if interface in self._factories:
@@ -115,32 +231,74 @@ class DIContainer:
 
         raise ValueError(f"Service {interface.__name__} is not registered")
 
-    def _create_instance(self, implementation_class: Type) -> Any:
-        """Create instance with automatic constructor injection."""
-        try:
-            signature = inspect.signature(implementation_class.__init__)
-            type_hints = get_type_hints(implementation_class.__init__)
-            dependencies = {}
-
-            for param_name, param in signature.parameters.items():
-                if param_name == "self":
-                    continue
-
-                param_type = type_hints.get(param_name, param.annotation)
+    def warm_up(self) -> WarmUpReport:
+        """
+        Construct every registered singleton now and report the cost.
 
-                # If parameter has a default value, use it and skip dependency resolution
-                if param.default != inspect.Parameter.empty:
-                    dependencies[param_name] = param.default
-                    continue
+        Dependencies are built before the services that need them, and each
+        service's time excludes its dependencies. Transient services are not
+        built, but their construction plans are compiled and checked against
+        the registrations. Failures are reported rather than raised, so one
+        broken registration does not hide the rest.
+        """
+        failures: Dict[str, str] = {}
+        already_built = set(self._construction_times)
+        for interface in [*self._singleton_factories, *self._services]:
+            try:
+                self.resolve(interface)
+            except Exception as e:
+                failures[getattr(interface, "__name__", str(interface))] = str(e)
 
-                # Skip if no type annotation or annotation is empty
-                if not param_type or param_type == inspect.Parameter.empty:
-                    continue
+        for interface, implementation in self._factories.items():
+            try:
+                plan = self.get_construction_plan(implementation)
+                for param_name, param_type in plan.dependencies:
+                    if not self.is_registered(param_type):
+                        raise ValueError(
+                            f"Cannot resolve dependency {param_type} for {param_name} in {implementation.__name__}"
+                        )
+            except Exception as e:
+                failures[getattr(interface, "__name__", str(interface))] = str(e)
+
+        timings = tuple(
+            ServiceTiming(getattr(interface, "__name__", str(interface)), seconds)
+            for interface, seconds in self._construction_times.items()
+            if interface not in already_built
+        )
+        return WarmUpReport(timings=timings, failures=failures)
+
+    def get_construction_plan(self, implementation_class: Type) -> ConstructionPlan:
+        """Get the cached construction plan for an implementation."""
+        plan = self._plans.get(implementation_class)
+        if plan is None:
+            plan = self._plans[implementation_class] = self._compile_plan(
+                implementation_class
+            )
+        return plan
 
-                # Skip primitive types - these should not be resolved as dependencies
-                if self._is_primitive_type(param_type):
-                    continue
+    def _create_singleton(self, interface: Type, build: Callable[[], Any]) -> Any:
+        """Build and store a singleton, timing it apart from its dependencies."""
+        self._resolution_stack.add(interface)
+        self._nested_construction_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            instance = build()
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested_construction_times.pop()
+            if self._nested_construction_times:
+                self._nested_construction_times[-1] += elapsed
+            self._resolution_stack.discard(interface)
+        self._singletons[interface] = instance
+        self._construction_times[interface] = elapsed - nested
+        return instance
 
+    def _create_instance(self, implementation_class: Type) -> Any:
+        """Create instance with automatic constructor injection."""
+        try:
+            plan = self.get_construction_plan(implementation_class)
+            dependencies = {}
+            for param_name, param_type in plan.dependencies:
                 try:
                     dependencies[param_name] = self.resolve(param_type)
                 except ValueError:
@@ -155,6 +313,37 @@ class DIContainer:
             )
             raise
 
+    def _compile_plan(self, implementation_class: Type) -> ConstructionPlan:
+        """Inspect a constructor once and record which arguments to resolve."""
+        signature = inspect.signature(implementation_class.__init__)
+        type_hints = get_type_hints(implementation_class.__init__)
+        dependencies = []
+
+        for param_name, param in signature.parameters.items():
+            if param_name == "self" or param.kind in (
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD,
+            ):
+                continue
+
+            # Parameters with a default value keep it; they are never resolved
+            if param.default != inspect.Parameter.empty:
+                continue
+
+            param_type = type_hints.get(param_name, param.annotation)
+
+            # Skip if no type annotation or annotation is empty
+            if not param_type or param_type == inspect.Parameter.empty:
+                continue
+
+            # Skip primitive types - these should not be resolved as dependencies
+            if self._is_primitive_type(param_type):
+                continue
+
+            dependencies.append((param_name, param_type))
+
+        return ConstructionPlan(implementation_class, tuple(dependencies))
+
     def _validate_registration(self, interface: Type, implementation: Type) -> None:
         """Validate that implementation can fulfill interface contract."""
         if not inspect.isclass(implementation):
@@ -200,9 +389,9 @@ class DIContainer:
                     f"{implementation.__name__} doesn't implement {method_name} from {protocol.__name__}"
                 )
 
-    def get_registrations(self) -> Dict[Type, Type]:
+    def get_registrations(self) -> Dict[Type, Any]:
         """Get all registered services for testing/debugging."""
-        return {**self._services, **self._factories}
+        return {**self._services, **self._factories, **self._singleton_factories}
 
     def _is_primitive_type(self, param_type: Type) -> bool:
         """Check if a type is a primitive type that should not be resolved as a dependency."""
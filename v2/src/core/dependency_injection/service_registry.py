@@ -0,0 +1,105 @@
+"""
+Shared service registry for Kinetic Constructor v2.
+
+Dataset, placement and positioning services read CSV datasets or placement
+JSON when they are constructed. They are registered as singletons on the
+global DIContainer and resolved from there, so each is built once per
+session no matter how many loaders, pickers and pictograph scenes use it.
+"""
+
+from typing import Optional, Type, TypeVar
+
+from .di_container import DIContainer, get_container
+
+T = TypeVar("T")
+
+# Services that must only be resolved through the registry. Constructing one
+# of these directly in presentation code re-reads its data files.
+SHARED_SERVICE_NAMES = frozenset(
+    {
+        "PictographManagementService",
+        "PictographDatasetService",
+        "DataConversionService",
+        "PositionMatchingService",
+        "ArrowManagementService",
+        "ArrowPositioningService",
+        "MotionManagementService",
+        "PropManagementService",
+    }
+)
+
+
+def register_shared_services(container: Optional[DIContainer] = None) -> DIContainer:
+    """
+    Register the shared dataset, placement and positioning services.
+
+    Services are registered lazily: nothing is loaded until the first resolve.
+    Services already registered on the container are left untouched.
+    """
+    from application.services.core.pictograph_management_service import (
+        PictographManagementService,
+    )
+    from application.services.old_services_before_consolidation.pictograph_dataset_service import (
+        PictographDatasetService,
+    )
+    from application.services.old_services_before_consolidation.data_conversion_service import (
+        DataConversionService,
+    )
+    from application.services.positioning.position_matching_service import (
+        PositionMatchingService,
+    )
+    from application.services.positioning.arrow_management_service import (
+        ArrowManagementService,
+    )
+    from application.services.old_services_before_consolidation.arrow_positioning_service import (
+        ArrowPositioningService,
+    )
+    from application.services.motion.motion_management_service import (
+        MotionManagementService,
+    )
+    from application.services.positioning.prop_management_service import (
+        PropManagementService,
+    )
+
+    container = container or get_container()
+
+    factories = {
+        # Dataset services
+        PictographManagementService: PictographManagementService,
+        PictographDatasetService: PictographDatasetService,
+        DataConversionService: lambda: DataConversionService(
+            pictograph_service=container.resolve(PictographManagementService)
+        ),
+        PositionMatchingService: lambda: PositionMatchingService(
+            pictograph_management_service=container.resolve(
+                PictographManagementService
+            ),
+            data_conversion_service=container.resolve(DataConversionService),
+        ),
+        # Placement and positioning services
+        ArrowManagementService: ArrowManagementService,
+        ArrowPositioningService: ArrowPositioningService,
+        MotionManagementService: MotionManagementService,
+        PropManagementService: PropManagementService,
+    }
+    for service_type, factory in factories.items():
+        if not container.is_registered(service_type):
+            container.register_factory(service_type, factory)
+
+    return container
+
+
+def resolve_shared_service(service_type: Type[T]) -> T:
+    """
+    Resolve a shared service from the global container.
+
+    The shared services are registered on first use, so callers do not depend
+    on the application having configured the container first.
+    """
+    container = get_container()
+    if not container.is_registered(service_type):
+        register_shared_services(container)
+    if not container.is_registered(service_type):
+        # Imported through a different module path than the registry uses
+        container.register_singleton(service_type, service_type)
+    return container.resolve(service_type)
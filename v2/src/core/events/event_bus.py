@@ -9,7 +9,18 @@ Provides a type-safe, high-performance event system for V2 architecture:
 - Memory-efficient subscription management
 """
 
-from typing import Dict, List, Callable, Any, TypeVar, Generic, Optional, Union
+from typing import (
+    Dict,
+    List,
+    Callable,
+    Any,
+    TypeVar,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    Union,
+)
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -17,6 +28,7 @@ import asyncio
 import weakref
 import logging
 from datetime import datetime
+import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor
 import threading
@@ -36,12 +48,56 @@ class EventPriority(Enum):
     BACKGROUND = 4  # Non-essential events
 
 
+class _LazyEventId:
+    """
+    Event id generated on first access.
+
+    Most events are delivered and dropped without anyone reading their id,
+    so the uuid4 is only created for events that are logged or compared.
+    """
+
+    def __set_name__(self, owner, name):
+        self._attr = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return None
+        value = instance.__dict__[self._attr]
+        if value is None:
+            value = instance.__dict__[self._attr] = str(uuid.uuid4())
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._attr] = value
+
+
+class _LazyTimestamp:
+    """
+    Creation time recorded as a float and converted to a datetime on first
+    access, which is several times cheaper than datetime.now() per event.
+    """
+
+    def __set_name__(self, owner, name):
+        self._attr = f"_{name}"
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return None
+        value = instance.__dict__[self._attr]
+        if not isinstance(value, datetime):
+            value = instance.__dict__[self._attr] = datetime.fromtimestamp(value)
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self._attr] = time.time() if value is None else value
+
+
 @dataclass(frozen=True)
 class BaseEvent(ABC):
     """Base class for all events in the system."""
 
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = field(default_factory=datetime.now)
+    event_id: str = _LazyEventId()
+    timestamp: datetime = _LazyTimestamp()
     source: Optional[str] = None
     priority: EventPriority = EventPriority.NORMAL
 
@@ -117,11 +173,17 @@ class EventSubscription:
     is_async: bool
     weak_ref: bool = True
     filter_func: Optional[Callable[[BaseEvent], bool]] = None
+    is_weak: bool = field(init=False, default=False)
 
     def __post_init__(self):
         if self.weak_ref and hasattr(self.handler, "__self__"):
             # Create weak reference for bound methods
             self.handler = weakref.WeakMethod(self.handler)
+            self.is_weak = True
+
+    def resolve(self) -> Optional[EventHandler]:
+        """Return the handler, or None if its weakly referenced owner is gone."""
+        return self.handler() if self.is_weak else self.handler
 
 
 class IEventBus(ABC):
@@ -165,81 +227,131 @@ class TypeSafeEventBus(IEventBus):
     - Weak reference management
     - Event filtering
     - Comprehensive logging
+    - Coalesced publishing for high-rate events
+
+    Subscribers are kept in a per-event-type dispatch table of tuples that
+    are already sorted by priority. Subscribing and unsubscribing build a
+    new table under the lock and swap it in, so publish only reads the
+    current table and never takes the lock. Event counts are kept per
+    thread and summed by get_event_stats(), so counting takes no lock
+    either.
     """
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        frame_scheduler: Optional[Callable[[Callable[[], None]], bool]] = None,
+    ):
         self._subscriptions: Dict[str, List[EventSubscription]] = {}
         self._subscription_lookup: Dict[str, EventSubscription] = {}
+        self._dispatch_table: Dict[str, Tuple[EventSubscription, ...]] = {}
         self._lock = threading.RLock()
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._logger = logging.getLogger(__name__)
-        self._event_stats: Dict[str, int] = {}
+        # Each publishing thread counts into its own dict; _stats_lock only
+        # guards the list of those dicts, taken once per thread
+        self._thread_stats = threading.local()
+        self._stats_by_thread: List[Dict[str, int]] = []
+        self._stats_lock = threading.Lock()
+        self._frame_scheduler = frame_scheduler or schedule_next_frame
+        self._coalesced: Dict[Hashable, BaseEvent] = {}
+        self._coalesce_lock = threading.Lock()
 
     def publish(self, event: BaseEvent) -> None:
         """Publish an event to all subscribers synchronously."""
-        with self._lock:
-            subscriptions = self._subscriptions.get(event.event_type, [])
-
-            # Sort by priority
-            subscriptions.sort(key=lambda s: s.priority.value)
+        event_type = event.event_type
+        subscriptions = self._dispatch_table.get(event_type, ())
 
-            # Track event statistics
-            self._event_stats[event.event_type] = (
-                self._event_stats.get(event.event_type, 0) + 1
-            )
+        # Track event statistics
+        self._count_event(event_type)
 
+        if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(
-                f"Publishing event {event.event_type} to {len(subscriptions)} subscribers"
+                f"Publishing event {event_type} to {len(subscriptions)} subscribers"
             )
 
-            for subscription in subscriptions:
-                try:
-                    self._handle_subscription(subscription, event)
-                except Exception as e:
-                    self._logger.error(f"Error handling event {event.event_type}: {e}")
+        found_dead_reference = False
+        for subscription in subscriptions:
+            handler = subscription.resolve()
+            if handler is None:
+                found_dead_reference = True
+                continue
+            try:
+                if subscription.filter_func and not subscription.filter_func(event):
+                    continue
+                if subscription.is_async:
+                    self._run_async_handler(handler, event)
+                else:
+                    handler(event)
+            except Exception as e:
+                self._logger.error(f"Error handling event {event_type}: {e}")
+
+        if found_dead_reference:
+            self.clear_dead_references()
+
+    def publish_coalesced(self, event: BaseEvent, key: Hashable = None) -> None:
+        """
+        Publish an event at the next frame, collapsing bursts.
+
+        Events with the same event type (and key, if given) published before
+        the next frame replace each other, so only the latest is delivered.
+        Use this for high-rate events such as drag or resize updates where
+        subscribers only need the final state. The first event of a burst
+        keeps its position in the delivery order.
+        """
+        coalesce_key = (event.event_type, key)
+        with self._coalesce_lock:
+            first_in_frame = not self._coalesced
+            self._coalesced[coalesce_key] = event
+        if first_in_frame and not self._frame_scheduler(self.flush_coalesced):
+            self.flush_coalesced()
+
+    def flush_coalesced(self) -> int:
+        """Deliver pending coalesced events now and return how many there were."""
+        with self._coalesce_lock:
+            events = list(self._coalesced.values())
+            self._coalesced.clear()
+        for event in events:
+            self.publish(event)
+        return len(events)
 
     async def publish_async(self, event: BaseEvent) -> None:
         """Publish an event to all subscribers asynchronously."""
-        with self._lock:
-            subscriptions = self._subscriptions.get(event.event_type, [])
+        event_type = event.event_type
+        subscriptions = self._dispatch_table.get(event_type, ())
 
-            # Sort by priority
-            subscriptions.sort(key=lambda s: s.priority.value)
-
-            # Track event statistics
-            self._event_stats[event.event_type] = (
-                self._event_stats.get(event.event_type, 0) + 1
-            )
+        # Track event statistics
+        self._count_event(event_type)
 
+        if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(
-                f"Publishing async event {event.event_type} to {len(subscriptions)} subscribers"
+                f"Publishing async event {event_type} "
+                f"to {len(subscriptions)} subscribers"
             )
 
-            # Handle async subscriptions
-            async_tasks = []
-            for subscription in subscriptions:
-                try:
-                    if subscription.is_async:
-                        task = self._handle_subscription_async(subscription, event)
-                        async_tasks.append(task)
-                    else:
-                        # Run sync handlers in executor
-                        loop = asyncio.get_event_loop()
-                        task = loop.run_in_executor(
-                            self._executor,
-                            self._handle_subscription,
-                            subscription,
-                            event,
-                        )
-                        async_tasks.append(task)
-                except Exception as e:
-                    self._logger.error(
-                        f"Error handling async event {event.event_type}: {e}"
+        # Handle async subscriptions
+        async_tasks = []
+        for subscription in subscriptions:
+            try:
+                if subscription.is_async:
+                    task = self._handle_subscription_async(subscription, event)
+                    async_tasks.append(task)
+                else:
+                    # Run sync handlers in executor
+                    loop = asyncio.get_event_loop()
+                    task = loop.run_in_executor(
+                        self._executor,
+                        self._handle_subscription,
+                        subscription,
+                        event,
                     )
+                    async_tasks.append(task)
+            except Exception as e:
+                self._logger.error(f"Error handling async event {event_type}: {e}")
 
-            # Wait for all handlers to complete
-            if async_tasks:
-                await asyncio.gather(*async_tasks, return_exceptions=True)
+        # Wait for all handlers to complete
+        if async_tasks:
+            await asyncio.gather(*async_tasks, return_exceptions=True)
 
     def subscribe(
         self,
@@ -269,6 +381,7 @@ class TypeSafeEventBus(IEventBus):
 
             self._subscriptions[event_type].append(subscription)
             self._subscription_lookup[subscription_id] = subscription
+            self._rebuild_dispatch_table(event_type)
 
         self._logger.debug(f"Subscribed to {event_type} with priority {priority.name}")
         return subscription_id
@@ -293,6 +406,7 @@ class TypeSafeEventBus(IEventBus):
                 # Clean up empty event type lists
                 if not self._subscriptions[event_type]:
                     del self._subscriptions[event_type]
+                self._rebuild_dispatch_table(event_type)
 
             # Remove from lookup
             del self._subscription_lookup[subscription_id]
@@ -302,8 +416,24 @@ class TypeSafeEventBus(IEventBus):
 
     def get_event_stats(self) -> Dict[str, int]:
         """Get event publishing statistics."""
-        with self._lock:
-            return self._event_stats.copy()
+        with self._stats_lock:
+            # copy() does not release the GIL, so it never sees a dict its
+            # owning thread is halfway through updating
+            snapshots = [counts.copy() for counts in self._stats_by_thread]
+        stats: Dict[str, int] = {}
+        for counts in snapshots:
+            for event_type, count in counts.items():
+                stats[event_type] = stats.get(event_type, 0) + count
+        return stats
+
+    def _count_event(self, event_type: str) -> None:
+        # publish() may run on executor threads as well as the GUI thread
+        counts = getattr(self._thread_stats, "counts", None)
+        if counts is None:
+            counts = self._thread_stats.counts = {}
+            with self._stats_lock:
+                self._stats_by_thread.append(counts)
+        counts[event_type] = counts.get(event_type, 0) + 1
 
     def get_subscription_count(self, event_type: Optional[str] = None) -> int:
         """Get number of active subscriptions."""
@@ -328,11 +458,14 @@ class TypeSafeEventBus(IEventBus):
                     if not self._is_dead_reference(s)
                 ]
 
-                removed_count += original_count - len(self._subscriptions[event_type])
+                removed = original_count - len(self._subscriptions[event_type])
+                removed_count += removed
 
                 # Clean up empty lists
                 if not self._subscriptions[event_type]:
                     del self._subscriptions[event_type]
+                if removed:
+                    self._rebuild_dispatch_table(event_type)
 
             # Update lookup table
             self._subscription_lookup = {
@@ -346,52 +479,60 @@ class TypeSafeEventBus(IEventBus):
 
         return removed_count
 
+    def _rebuild_dispatch_table(self, event_type: str) -> None:
+        """Swap in a new dispatch table with event_type's subscribers re-sorted."""
+        dispatch_table = dict(self._dispatch_table)
+        subscriptions = self._subscriptions.get(event_type)
+        if subscriptions:
+            dispatch_table[event_type] = tuple(
+                sorted(subscriptions, key=lambda s: s.priority.value)
+            )
+        else:
+            dispatch_table.pop(event_type, None)
+        self._dispatch_table = dispatch_table
+
     def _handle_subscription(
         self, subscription: EventSubscription, event: BaseEvent
     ) -> None:
         """Handle a single subscription synchronously."""
-        # Check if reference is dead
-        if self._is_dead_reference(subscription):
+        # Get actual handler (resolve weak reference if needed)
+        handler = subscription.resolve()
+        if handler is None:
             return
 
         # Apply filter if present
         if subscription.filter_func and not subscription.filter_func(event):
             return
 
-        # Get actual handler (resolve weak reference if needed)
-        handler = self._resolve_handler(subscription)
-        if handler is None:
-            return
-
         # Call handler
         if subscription.is_async:
-            # For async handlers in sync context, schedule them
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(handler(event))
-            finally:
-                loop.close()
+            self._run_async_handler(handler, event)
         else:
             handler(event)
 
+    @staticmethod
+    def _run_async_handler(handler: EventHandler, event: BaseEvent) -> None:
+        """Run an async handler to completion from a sync context."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(handler(event))
+        finally:
+            loop.close()
+
     async def _handle_subscription_async(
         self, subscription: EventSubscription, event: BaseEvent
     ) -> None:
         """Handle a single subscription asynchronously."""
-        # Check if reference is dead
-        if self._is_dead_reference(subscription):
+        # Get actual handler (resolve weak reference if needed)
+        handler = subscription.resolve()
+        if handler is None:
             return
 
         # Apply filter if present
         if subscription.filter_func and not subscription.filter_func(event):
             return
 
-        # Get actual handler (resolve weak reference if needed)
-        handler = self._resolve_handler(subscription)
-        if handler is None:
-            return
-
         # Call handler
         if subscription.is_async:
             await handler(event)
@@ -400,28 +541,80 @@ class TypeSafeEventBus(IEventBus):
 
     def _is_dead_reference(self, subscription: EventSubscription) -> bool:
         """Check if subscription has a dead weak reference."""
-        if isinstance(subscription.handler, weakref.WeakMethod):
-            return subscription.handler() is None
-        return False
+        return subscription.is_weak and subscription.handler() is None
 
     def _resolve_handler(
         self, subscription: EventSubscription
     ) -> Optional[EventHandler]:
         """Resolve handler from subscription (handle weak references)."""
-        if isinstance(subscription.handler, weakref.WeakMethod):
-            return subscription.handler()
-        return subscription.handler
+        return subscription.resolve()
 
     def shutdown(self) -> None:
         """Shutdown the event bus and cleanup resources."""
         with self._lock:
             self._subscriptions.clear()
             self._subscription_lookup.clear()
+            self._dispatch_table = {}
             self._executor.shutdown(wait=True)
+        with self._coalesce_lock:
+            self._coalesced.clear()
 
         self._logger.info("Event bus shutdown complete")
 
 
+def schedule_next_frame(callback: Callable[[], None]) -> bool:
+    """
+    Run callback on the Qt application thread once its event loop regains
+    control, whichever thread schedules it.
+
+    Returns False when there is no Qt application to schedule on, in which
+    case the caller should run the callback itself.
+    """
+    try:
+        from PyQt6.QtCore import QCoreApplication
+    except ImportError:
+        return False
+    app = QCoreApplication.instance()
+    if app is None:
+        return False
+    _frame_dispatcher(app).scheduled.emit(callback)
+    return True
+
+
+_frame_dispatchers: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+_frame_dispatchers_lock = threading.Lock()
+
+
+def _frame_dispatcher(app: Any) -> Any:
+    """
+    Get the object that runs scheduled callbacks on the thread of app.
+
+    QTimer.singleShot would run the callback on the scheduling thread, which
+    never happens on a worker thread without an event loop.
+    """
+    with _frame_dispatchers_lock:
+        dispatcher = _frame_dispatchers.get(app)
+        if dispatcher is None:
+            from PyQt6.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+
+            class FrameDispatcher(QObject):
+                scheduled = pyqtSignal(object)
+
+                @pyqtSlot(object)
+                def run(self, callback: Callable[[], None]) -> None:
+                    callback()
+
+            dispatcher = FrameDispatcher()
+            dispatcher.moveToThread(app.thread())
+            # Queued even when emitted on the application thread, so the
+            # callback always waits for the event loop
+            dispatcher.scheduled.connect(
+                dispatcher.run, Qt.ConnectionType.QueuedConnection
+            )
+            _frame_dispatchers[app] = dispatcher
+        return dispatcher
+
+
 # Global event bus instance
 _global_event_bus: Optional[TypeSafeEventBus] = None
 
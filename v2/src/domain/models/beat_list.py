@@ -0,0 +1,232 @@
+"""
+Persistent beat container for SequenceData.
+
+BeatList is an immutable, structurally shared vector of beats: a 32-way trie
+of tuples plus a tail tuple, the layout used by persistent vectors in
+functional languages. "Modifying" a BeatList returns a new BeatList that
+shares every untouched node with the original, so sequences keep their
+immutability semantics without copying the whole beat list on each edit.
+
+- Lookup and replace are O(log32 n), which is at most 3 levels below 32768
+  beats.
+- Append is amortized O(1).
+- Insert and remove are O(n), because every later beat is renumbered.
+
+Beat numbers are derived from position: the beat at index i always has
+beat_number i + 1. Beats are renumbered as they are placed, so the numbering
+never needs to be re-validated.
+"""
+
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+_BITS = 5
+_WIDTH = 1 << _BITS
+_MASK = _WIDTH - 1
+
+Node = Tuple[Any, ...]
+
+
+def _numbered(beat, beat_number: int):
+    """Return the beat with the given beat number, reusing it if it matches."""
+    if beat.beat_number == beat_number:
+        return beat
+    return beat.update(beat_number=beat_number)
+
+
+class BeatList(Sequence):
+    """Immutable, structurally shared list of beats numbered from 1."""
+
+    __slots__ = ("_count", "_shift", "_root", "_tail")
+
+    def __init__(self, beats: Iterable = ()):
+        numbered = [_numbered(beat, i + 1) for i, beat in enumerate(beats)]
+        self._count, self._shift, self._root, self._tail = self._build(numbered)
+
+    @classmethod
+    def from_numbered(cls, beats: Sequence) -> "BeatList":
+        """Build from beats already numbered 1..n, without renumbering them."""
+        beat_list = cls.__new__(cls)
+        beat_list._count, beat_list._shift, beat_list._root, beat_list._tail = (
+            cls._build(list(beats))
+        )
+        return beat_list
+
+    @staticmethod
+    def _build(beats: List) -> Tuple[int, int, Node, Node]:
+        count = len(beats)
+        tail_offset = ((count - 1) >> _BITS) << _BITS if count else 0
+        nodes = [
+            tuple(beats[i : i + _WIDTH]) for i in range(0, tail_offset, _WIDTH)
+        ]
+        shift = _BITS
+        while len(nodes) > _WIDTH:
+            nodes = [
+                tuple(nodes[i : i + _WIDTH]) for i in range(0, len(nodes), _WIDTH)
+            ]
+            shift += _BITS
+        return count, shift, tuple(nodes), tuple(beats[tail_offset:])
+
+    @classmethod
+    def _make(cls, count: int, shift: int, root: Node, tail: Node) -> "BeatList":
+        beat_list = cls.__new__(cls)
+        beat_list._count = count
+        beat_list._shift = shift
+        beat_list._root = root
+        beat_list._tail = tail
+        return beat_list
+
+    # Sequence protocol
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]):
+        """Get a beat by index; slices return a plain list."""
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(self._count))]
+        return self._get(self._check_index(index))
+
+    def __iter__(self) -> Iterator:
+        for leaf in self._leaves(self._root, self._shift):
+            yield from leaf
+        yield from self._tail
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, BeatList):
+            if self._count != other._count:
+                return False
+            if self._root is other._root and self._tail is other._tail:
+                return True
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def __add__(self, other: Iterable) -> "BeatList":
+        result = self
+        for beat in other:
+            result = result.appended(beat)
+        return result
+
+    def __radd__(self, other: Iterable) -> "BeatList":
+        return BeatList(list(other) + list(self))
+
+    def __repr__(self) -> str:
+        return f"BeatList({list(self)!r})"
+
+    def __reduce__(self):
+        return (BeatList.from_numbered, (list(self),))
+
+    def copy(self) -> List:
+        """Return the beats as a new, mutable list."""
+        return list(self)
+
+    # Lookups
+
+    def get_beat(self, beat_number: int) -> Optional[Any]:
+        """Get a beat by its number, or None if there is no such beat."""
+        if 1 <= beat_number <= self._count:
+            return self._get(beat_number - 1)
+        return None
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("BeatList index out of range")
+        return index
+
+    def _tail_offset(self) -> int:
+        return self._count - len(self._tail)
+
+    def _get(self, index: int):
+        tail_offset = self._tail_offset()
+        if index >= tail_offset:
+            return self._tail[index - tail_offset]
+        node = self._root
+        for level in range(self._shift, 0, -_BITS):
+            node = node[(index >> level) & _MASK]
+        return node[index & _MASK]
+
+    @classmethod
+    def _leaves(cls, node: Node, level: int) -> Iterator[Node]:
+        if level == _BITS:
+            yield from node
+            return
+        for child in node:
+            yield from cls._leaves(child, level - _BITS)
+
+    # Persistent updates
+
+    def appended(self, beat) -> "BeatList":
+        """Return a new list with the beat added at the end."""
+        beat = _numbered(beat, self._count + 1)
+        if len(self._tail) < _WIDTH:
+            return self._make(
+                self._count + 1, self._shift, self._root, self._tail + (beat,)
+            )
+
+        # Tail is full: push it into the trie and start a new tail
+        shift = self._shift
+        if (self._count >> _BITS) > (1 << shift):
+            root = (self._root, self._new_path(shift, self._tail))
+            shift += _BITS
+        else:
+            root = self._push_tail(self._count, shift, self._root, self._tail)
+        return self._make(self._count + 1, shift, root, (beat,))
+
+    def replaced(self, index: int, beat) -> "BeatList":
+        """Return a new list with the beat at index replaced."""
+        index = self._check_index(index)
+        beat = _numbered(beat, index + 1)
+        tail_offset = self._tail_offset()
+        if index >= tail_offset:
+            tail = list(self._tail)
+            tail[index - tail_offset] = beat
+            return self._make(self._count, self._shift, self._root, tuple(tail))
+        root = self._assoc(self._shift, self._root, index, beat)
+        return self._make(self._count, self._shift, root, self._tail)
+
+    def inserted(self, index: int, beat) -> "BeatList":
+        """Return a new list with the beat inserted before index."""
+        beats = list(self)
+        beats.insert(index, beat)
+        return BeatList(beats)
+
+    def removed(self, index: int) -> "BeatList":
+        """Return a new list without the beat at index."""
+        index = self._check_index(index)
+        if index == self._count - 1:
+            return BeatList.from_numbered(self[:index])
+        return BeatList(self[:index] + self[index + 1 :])
+
+    @classmethod
+    def _new_path(cls, level: int, node: Node) -> Node:
+        if level == 0:
+            return node
+        return (cls._new_path(level - _BITS, node),)
+
+    @classmethod
+    def _push_tail(cls, count: int, level: int, parent: Node, tail: Node) -> Node:
+        sub_index = ((count - 1) >> level) & _MASK
+        if level == _BITS:
+            child = tail
+        elif sub_index < len(parent):
+            child = cls._push_tail(count, level - _BITS, parent[sub_index], tail)
+        else:
+            child = cls._new_path(level - _BITS, tail)
+        if sub_index < len(parent):
+            return parent[:sub_index] + (child,) + parent[sub_index + 1 :]
+        return parent + (child,)
+
+    @classmethod
+    def _assoc(cls, level: int, node: Node, index: int, beat) -> Node:
+        if level == 0:
+            sub_index = index & _MASK
+            return node[:sub_index] + (beat,) + node[sub_index + 1 :]
+        sub_index = (index >> level) & _MASK
+        child = cls._assoc(level - _BITS, node[sub_index], index, beat)
+        return node[:sub_index] + (child,) + node[sub_index + 1 :]
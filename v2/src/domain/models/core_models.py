@@ -17,10 +17,12 @@ ELIMINATES:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence
 from enum import Enum
 import uuid
 
+from .beat_list import BeatList
+
 
 class MotionType(Enum):
     """Types of motion for props and arrows."""
@@ -388,6 +390,10 @@ class SequenceData:
 
     Pure business data for a complete kinetic sequence.
     No UI dependencies, completely immutable.
+
+    Beats are held in a BeatList, a persistent vector that shares structure
+    between versions of a sequence: appending or updating a beat does not copy
+    the other beats, and beat numbers follow from position.
     """
 
     # Core identity
@@ -396,7 +402,7 @@ class SequenceData:
     word: str = ""  # Generated word from sequence
 
     # Business data
-    beats: List[BeatData] = field(default_factory=list)
+    beats: Sequence[BeatData] = field(default_factory=BeatList)
     start_position: Optional[str] = None  # Simplified for now
 
     # Metadata
@@ -404,6 +410,10 @@ class SequenceData:
 
     def __post_init__(self):
         """Validate sequence data."""
+        if isinstance(self.beats, BeatList):
+            # A BeatList numbers its beats by position
+            return
+
         # Validate beat numbers are sequential
         for i, beat in enumerate(self.beats):
             expected_beat_number = i + 1
@@ -411,6 +421,7 @@ class SequenceData:
                 raise ValueError(
                     f"Beat {i} has number {beat.beat_number}, expected {expected_beat_number}"
                 )
+        object.__setattr__(self, "beats", BeatList.from_numbered(self.beats))
 
     @property
     def length(self) -> int:
@@ -436,45 +447,33 @@ class SequenceData:
 
     def get_beat(self, beat_number: int) -> Optional[BeatData]:
         """Get a beat by its number."""
-        for beat in self.beats:
-            if beat.beat_number == beat_number:
-                return beat
-        return None
+        return self.beats.get_beat(beat_number)
 
     def add_beat(self, beat_data: BeatData) -> "SequenceData":
         """Create a new sequence with an additional beat."""
-        new_beat = beat_data.update(beat_number=len(self.beats) + 1)
-        new_beats = list(self.beats) + [new_beat]
-
         from dataclasses import replace
 
-        return replace(self, beats=new_beats)
+        return replace(self, beats=self.beats.appended(beat_data))
 
     def remove_beat(self, beat_number: int) -> "SequenceData":
         """Create a new sequence with a beat removed."""
-        new_beats = []
-        for beat in self.beats:
-            if beat.beat_number != beat_number:
-                # Renumber remaining beats
-                new_beat_number = len(new_beats) + 1
-                new_beats.append(beat.update(beat_number=new_beat_number))
-
         from dataclasses import replace
 
-        return replace(self, beats=new_beats)
+        if self.beats.get_beat(beat_number) is None:
+            return replace(self)
+        # Later beats are renumbered
+        return replace(self, beats=self.beats.removed(beat_number - 1))
 
     def update_beat(self, beat_number: int, **kwargs) -> "SequenceData":
         """Create a new sequence with an updated beat."""
-        new_beats = []
-        for beat in self.beats:
-            if beat.beat_number == beat_number:
-                new_beats.append(beat.update(**kwargs))
-            else:
-                new_beats.append(beat)
-
         from dataclasses import replace
 
-        return replace(self, beats=new_beats)
+        beat = self.beats.get_beat(beat_number)
+        if beat is None:
+            return replace(self)
+        return replace(
+            self, beats=self.beats.replaced(beat_number - 1, beat.update(**kwargs))
+        )
 
     def update(self, **kwargs) -> "SequenceData":
         """Create a new sequence with updated fields."""
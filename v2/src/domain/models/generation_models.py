@@ -55,7 +55,7 @@ class GenerationConfig:
     def is_valid(self) -> bool:
         """Check if configuration is valid"""
         return (
-            4 <= self.length <= 32
+            4 <= self.length <= 64
             and 1 <= self.level <= 6
             and 0.5 <= self.turn_intensity <= 3.0
             and self.letter_types is not None
@@ -3,6 +3,8 @@ from pathlib import Path
 from typing import Optional
 import pandas as pd
 
+from .pictograph_csv_ingestion import PictographCsvIngestion
+
 
 class DataPathHandler:
     """Centralized handler for data file paths and loading operations."""
@@ -42,13 +44,13 @@ class DataPathHandler:
     def load_diamond_dataset(self) -> Optional[pd.DataFrame]:
         """Load diamond pictograph dataset."""
         if self.diamond_csv_path.exists():
-            return pd.read_csv(self.diamond_csv_path)
+            return PictographCsvIngestion.for_path(self.diamond_csv_path).get_frame()
         return None
 
     def load_box_dataset(self) -> Optional[pd.DataFrame]:
         """Load box pictograph dataset."""
         if self.box_csv_path.exists():
-            return pd.read_csv(self.box_csv_path)
+            return PictographCsvIngestion.for_path(self.box_csv_path).get_frame()
         return None
 
     def load_combined_dataset(self) -> pd.DataFrame:
@@ -0,0 +1,193 @@
+"""
+Debounced, atomic write-behind for JSON documents that change in bursts.
+
+Continuous interactions such as splitter drags and window moves update the
+same document many times a second. Writing each update synchronously from
+the GUI thread stalls the drag and rewrites the file over and over; this
+writer keeps only the latest snapshot and writes it once the burst ends.
+"""
+
+import atexit
+import json
+import logging
+import os
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class DebouncedJsonWriter:
+    """
+    Coalesces snapshots of a JSON document into as few disk writes as possible.
+
+    submit() stores the latest snapshot and returns immediately. Once
+    debounce_seconds pass without another submit, a timer thread serializes
+    the snapshot and writes it through a temp file and an atomic rename, so
+    a crash mid-write never leaves a truncated file. A snapshot that
+    serializes to the text already on disk is not written at all.
+
+    flush() writes any pending snapshot synchronously, and every live writer
+    is flushed when the interpreter exits.
+
+    Use for_path() rather than the constructor so that everything persisting
+    one file shares a writer: separate writers would each skip writes by
+    comparing against their own idea of what is on disk.
+    """
+
+    DEFAULT_DEBOUNCE_SECONDS = 0.5
+    TEMP_SUFFIX = ".tmp"
+
+    _writers: "weakref.WeakValueDictionary[Path, DebouncedJsonWriter]" = (
+        weakref.WeakValueDictionary()
+    )
+    _writers_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        indent: Optional[int] = 2,
+    ) -> None:
+        self.path = Path(path)
+        self.debounce_seconds = debounce_seconds
+        self.indent = indent
+
+        self.write_count = 0
+        self.skipped_write_count = 0
+
+        self._pending: Any = None
+        self._has_pending = False
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._last_written = self._read_existing()
+
+    @classmethod
+    def for_path(
+        cls,
+        path: Union[str, Path],
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+    ) -> "DebouncedJsonWriter":
+        """
+        Return the writer for path, creating it on first use.
+
+        The debounce window of the first caller applies to every later one.
+        """
+        key = Path(path).resolve()
+        with cls._writers_lock:
+            writer = cls._writers.get(key)
+            if writer is None:
+                writer = cls(key, debounce_seconds)
+                cls._writers[key] = writer
+            return writer
+
+    @classmethod
+    def flush_all(cls) -> None:
+        """Write the pending snapshot of every live writer."""
+        with cls._writers_lock:
+            writers = list(cls._writers.values())
+        for writer in writers:
+            writer.flush()
+
+    @property
+    def has_pending(self) -> bool:
+        return self._has_pending
+
+    def submit(self, data: Any) -> None:
+        """
+        Replace the pending snapshot and restart the debounce window.
+
+        The writer serializes data on another thread, so callers must hand
+        over a snapshot they will not mutate afterwards.
+        """
+        with self._lock:
+            self._pending = data
+            self._has_pending = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self.debounce_seconds > 0:
+                self._timer = threading.Timer(self.debounce_seconds, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+        self._write_pending()
+
+    def flush(self) -> None:
+        """Write the pending snapshot, if any, before returning."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        self._write_pending()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        self._write_pending()
+
+    def _write_pending(self) -> None:
+        # Held across serialization and the write so a flush waits for a
+        # timer write in progress instead of racing it to the rename
+        with self._write_lock:
+            with self._lock:
+                if not self._has_pending:
+                    return
+                data = self._pending
+                self._pending = None
+                self._has_pending = False
+
+            try:
+                text = json.dumps(data, indent=self.indent)
+            except (TypeError, ValueError) as e:
+                logger.error(f"Cannot serialize state for {self.path}: {e}")
+                return
+            if text == self._last_written:
+                self.skipped_write_count += 1
+                return
+
+            try:
+                self._atomic_write(text)
+            except OSError as e:
+                logger.error(f"Failed to write {self.path}: {e}")
+                # Keep the snapshot for the next flush unless it was replaced
+                with self._lock:
+                    if not self._has_pending:
+                        self._pending = data
+                        self._has_pending = True
+                return
+            self._last_written = text
+            self.write_count += 1
+
+    def _atomic_write(self, text: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique name, so another process writing the same file cannot
+        # rename our temp file out from under us
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=self.path.name + ".", suffix=self.TEMP_SUFFIX
+        )
+        try:
+            with open(descriptor, "w", encoding="utf-8") as file:
+                file.write(text)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def _read_existing(self) -> Optional[str]:
+        try:
+            return self.path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+
+atexit.register(DebouncedJsonWriter.flush_all)
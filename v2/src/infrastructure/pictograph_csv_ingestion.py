@@ -0,0 +1,232 @@
+"""
+Vectorized ingestion of the pictograph CSV datasets.
+
+Reads DiamondPictographDataframe.csv / BoxPictographDataframe.csv with explicit
+categorical dtypes and builds the nested per-letter pictograph records in bulk,
+column by column, instead of row by row. The frame and the records are pickled
+next to the CSV together with a hash of its contents, so later startups load
+the pickle and skip CSV parsing entirely.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+LetterRecords = Dict[str, List[Dict[str, Any]]]
+
+# Categories are listed in lexical order so sorting a categorical column
+# orders rows exactly as sorting the raw strings would.
+POSITIONS = sorted(
+    [f"alpha{i}" for i in range(1, 9)]
+    + [f"beta{i}" for i in range(1, 9)]
+    + [f"gamma{i}" for i in range(1, 17)]
+)
+LOCATIONS = sorted(["n", "e", "s", "w", "ne", "se", "sw", "nw"])
+MOTION_TYPES = sorted(["pro", "anti", "float", "dash", "static"])
+PROP_ROT_DIRS = sorted(["cw", "ccw", "no_rot"])
+
+CSV_DTYPES: Dict[str, Any] = {
+    "letter": "category",
+    "start_pos": pd.CategoricalDtype(POSITIONS),
+    "end_pos": pd.CategoricalDtype(POSITIONS),
+    "timing": pd.CategoricalDtype(sorted(["none", "quarter", "split", "tog"])),
+    "direction": pd.CategoricalDtype(sorted(["none", "opp", "same"])),
+    **{
+        f"{color}_{column}": pd.CategoricalDtype(categories)
+        for color in ("blue", "red")
+        for column, categories in (
+            ("motion_type", MOTION_TYPES),
+            ("prop_rot_dir", PROP_ROT_DIRS),
+            ("start_loc", LOCATIONS),
+            ("end_loc", LOCATIONS),
+        )
+    },
+}
+
+# Values used for attributes a CSV does not provide (the datasets carry no
+# orientations; pictographs start from these)
+ATTRIBUTE_DEFAULTS: Dict[str, Dict[str, str]] = {
+    "blue": {
+        "motion_type": "static",
+        "prop_rot_dir": "no_rotation",
+        "start_loc": "n",
+        "end_loc": "n",
+        "start_ori": "in",
+        "end_ori": "in",
+    },
+    "red": {
+        "motion_type": "static",
+        "prop_rot_dir": "no_rotation",
+        "start_loc": "s",
+        "end_loc": "s",
+        "start_ori": "out",
+        "end_ori": "out",
+    },
+}
+
+
+def read_pictograph_csv(csv_path: Path) -> pd.DataFrame:
+    """
+    Read a pictograph CSV with explicit categorical dtypes.
+
+    A value outside a column's known categories would silently become NaN, so
+    it is reported as a ValueError instead.
+    """
+    raw = pd.read_csv(csv_path, dtype=str)
+    dtypes = {c: t for c, t in CSV_DTYPES.items() if c in raw.columns}
+    for column, dtype in dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            unknown = raw[column].notna() & ~raw[column].isin(dtype.categories)
+            if unknown.any():
+                values = sorted(raw.loc[unknown, column].unique())
+                raise ValueError(f"Unknown {column} values in {csv_path}: {values}")
+    return raw.astype(dtypes)
+
+
+def _column_values(df: pd.DataFrame, column: str, default: str) -> List[str]:
+    if column not in df.columns:
+        return [default] * len(df)
+    return df[column].astype(str).tolist()
+
+
+def build_letter_records(df: pd.DataFrame) -> LetterRecords:
+    """
+    Build per-letter pictograph records from a dataset frame, in row order.
+
+    Each record holds letter, start_pos and end_pos plus blue_attributes and
+    red_attributes dicts; attributes missing from the frame take the values
+    in ATTRIBUTE_DEFAULTS.
+    """
+    letters = _column_values(df, "letter", "Unknown")
+    start_positions = _column_values(df, "start_pos", "unknown")
+    end_positions = _column_values(df, "end_pos", "unknown")
+
+    attributes = {}
+    for color, defaults in ATTRIBUTE_DEFAULTS.items():
+        columns = {
+            name: _column_values(df, f"{color}_{name}", default)
+            for name, default in defaults.items()
+        }
+        attributes[color] = [
+            dict(zip(columns, values)) for values in zip(*columns.values())
+        ]
+
+    grouped: LetterRecords = {}
+    for letter, start_pos, end_pos, blue_attrs, red_attrs in zip(
+        letters, start_positions, end_positions, attributes["blue"], attributes["red"]
+    ):
+        grouped.setdefault(letter, []).append(
+            {
+                "letter": letter,
+                "start_pos": start_pos,
+                "end_pos": end_pos,
+                "blue_attributes": blue_attrs,
+                "red_attributes": red_attrs,
+            }
+        )
+    return grouped
+
+
+class PictographCsvIngestion:
+    """
+    Loads one pictograph CSV as a categorical frame plus per-letter records.
+
+    The result is cached in memory per CSV path and on disk in a pickle keyed
+    by a hash of the CSV contents; the pickle is rebuilt when the CSV changes.
+    """
+
+    VERSION = 1
+    CACHE_SUFFIX = ".pkl"
+    TEMP_SUFFIX = ".tmp"
+
+    _instances: Dict[Path, "PictographCsvIngestion"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, csv_path: Path, cache_path: Optional[Path] = None):
+        self.csv_path = Path(csv_path)
+        self.cache_path = cache_path
+        self._frame: Optional[pd.DataFrame] = None
+        self._letter_records: Optional[LetterRecords] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_path(cls, csv_path: Path) -> "PictographCsvIngestion":
+        """Get the shared ingestion for a CSV, cached beside it on disk."""
+        csv_path = Path(csv_path).resolve()
+        with cls._instances_lock:
+            ingestion = cls._instances.get(csv_path)
+            if ingestion is None:
+                ingestion = cls(csv_path, csv_path.with_suffix(cls.CACHE_SUFFIX))
+                cls._instances[csv_path] = ingestion
+            return ingestion
+
+    def get_frame(self) -> pd.DataFrame:
+        """Get the dataset as a DataFrame with categorical columns."""
+        self._ensure_loaded()
+        return self._frame
+
+    def get_letter_records(self) -> LetterRecords:
+        """Get the pictograph records grouped by letter."""
+        self._ensure_loaded()
+        return self._letter_records
+
+    def source_fingerprint(self) -> str:
+        digest = hashlib.sha256(str(self.VERSION).encode())
+        digest.update(self.csv_path.read_bytes())
+        return digest.hexdigest()
+
+    def _ensure_loaded(self) -> None:
+        with self._lock:
+            if self._frame is not None:
+                return
+            source_hash = self.source_fingerprint()
+            cached = self._load_cache(source_hash)
+            if cached is None:
+                frame = read_pictograph_csv(self.csv_path)
+                cached = (frame, build_letter_records(frame))
+                self._save_cache(source_hash, *cached)
+            self._frame, self._letter_records = cached
+
+    def _load_cache(self, source_hash: str):
+        if self.cache_path is None or not self.cache_path.exists():
+            return None
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable dataset cache {self.cache_path}: {e}")
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get("version") != self.VERSION
+            or cached.get("source_hash") != source_hash
+        ):
+            return None
+        return cached["frame"], cached["letter_records"]
+
+    def _save_cache(
+        self, source_hash: str, frame: pd.DataFrame, letter_records: LetterRecords
+    ) -> None:
+        if self.cache_path is None:
+            return
+        temp_path = self.cache_path.with_name(self.cache_path.name + self.TEMP_SUFFIX)
+        try:
+            with open(temp_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "version": self.VERSION,
+                        "source_hash": source_hash,
+                        "frame": frame,
+                        "letter_records": letter_records,
+                    },
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not write dataset cache {self.cache_path}: {e}")
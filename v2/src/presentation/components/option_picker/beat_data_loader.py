@@ -2,6 +2,7 @@ from typing import List, Optional, Dict, Any, Callable
 from PyQt6.QtCore import QObject
 
 from ....domain.models.core_models import BeatData
+from core.dependency_injection.service_registry import resolve_shared_service
 
 
 class BeatDataLoader(QObject):
@@ -11,17 +12,17 @@ class BeatDataLoader(QObject):
         super().__init__()
         self._beat_options: List[BeatData] = []
 
-        # Initialize services for dynamic refresh
+        # Resolve shared services for dynamic refresh
         try:
-            from ....application.services.positioning.position_matching_service import (
+            from application.services.positioning.position_matching_service import (
                 PositionMatchingService,
             )
-            from ....application.services.core.data_conversion_service import (
+            from application.services.core.data_conversion_service import (
                 DataConversionService,
             )
 
-            self.position_service = PositionMatchingService()
-            self.conversion_service = DataConversionService()
+            self.position_service = resolve_shared_service(PositionMatchingService)
+            self.conversion_service = resolve_shared_service(DataConversionService)
         except Exception as e:
             print(f"⚠️ Failed to initialize services for BeatDataLoader: {e}")
             self.position_service = None
@@ -37,15 +38,13 @@ class BeatDataLoader(QObject):
             print(f"   Sequence Data: {sequence_data}")
 
         try:
-            from ....application.services.positioning.position_matching_service import (
-                PositionMatchingService,
-            )
-            from ....application.services.core.data_conversion_service import (
-                DataConversionService,
-            )
-
-            position_service = PositionMatchingService()
-            conversion_service = DataConversionService()
+            # Shared services, so the dataset and its (grid_mode, start_pos)
+            # index are only built once per session.
+            position_service = self.position_service
+            conversion_service = self.conversion_service
+            if not position_service or not conversion_service:
+                print("⚠️ Services not available - FALLING BACK TO ALPHA-1")
+                return self._load_sample_beat_options()
 
             if not sequence_data or len(sequence_data) < 2:
                 print(
@@ -204,11 +203,11 @@ class BeatDataLoader(QObject):
         """Load sample beat options as fallback"""
         print("🔄 FALLBACK: Loading sample beat options (hardcoded data)")
         try:
-            from ....application.services.old_services_before_consolidation.pictograph_dataset_service import (
+            from application.services.old_services_before_consolidation.pictograph_dataset_service import (
                 PictographDatasetService,
             )
 
-            dataset_service = PictographDatasetService()
+            dataset_service = resolve_shared_service(PictographDatasetService)
 
             if (
                 hasattr(dataset_service, "_diamond_dataset")
@@ -231,11 +230,13 @@ class BeatDataLoader(QObject):
                         self._beat_options = beat_options
                         return beat_options
 
-            from ....application.services.positioning.position_matching_service import (
-                PositionMatchingService,
-            )
+            position_service = self.position_service
+            if position_service is None:
+                from application.services.positioning.position_matching_service import (
+                    PositionMatchingService,
+                )
 
-            position_service = PositionMatchingService()
+                position_service = resolve_shared_service(PositionMatchingService)
             alpha1_options = position_service.get_alpha1_options()
 
             if alpha1_options:
@@ -45,11 +45,14 @@ class PictographPoolManager(QObject):
             if progress_callback:
                 progress_callback("Loading pictograph dataset service", 0.4)
 
-            from ....application.services.old_services_before_consolidation.pictograph_dataset_service import (
+            from application.services.old_services_before_consolidation.pictograph_dataset_service import (
                 PictographDatasetService,
             )
+            from core.dependency_injection.service_registry import (
+                resolve_shared_service,
+            )
 
-            dataset_service = PictographDatasetService()
+            dataset_service = resolve_shared_service(PictographDatasetService)
 
             if progress_callback:
                 progress_callback("Preparing start position data", 0.5)
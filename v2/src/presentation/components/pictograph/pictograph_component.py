@@ -12,6 +12,7 @@ from domain.models.core_models import BeatData
 
 from .pictograph_scene import PictographScene
 from .border_manager import BorderedPictographMixin
+from .pictograph_raster_cache import PictographRasterizer
 
 
 class PictographComponent(QGraphicsView, BorderedPictographMixin):
@@ -34,6 +35,7 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
         self.debug_timer = QTimer()
         self.debug_timer.timeout.connect(self._print_debug_dimensions)
         self.debug_timer.setSingleShot(True)
+        self.rasterizer: Optional[PictographRasterizer] = None
 
         self._setup_ui()
 
@@ -41,6 +43,7 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
         try:
             self.scene = PictographScene(parent=self)
             self.setScene(self.scene)
+            self.rasterizer = PictographRasterizer(self)
 
             self.setRenderHint(QPainter.RenderHint.Antialiasing)
             self.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
@@ -102,14 +105,17 @@ class PictographComponent(QGraphicsView, BorderedPictographMixin):
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
         self._fit_view()
+        if self.rasterizer:
+            self.rasterizer.begin_resize()
 
     def showEvent(self, event) -> None:
         super().showEvent(event)
         self._fit_view()
 
     def paintEvent(self, event) -> None:
-        """Handle paint events and draw borders if enabled."""
-        super().paintEvent(event)
+        """Paint the cached pictograph raster and draw borders if enabled."""
+        if self.rasterizer is None or not self.rasterizer.paint():
+            super().paintEvent(event)
 
         # Draw borders using the border manager
         painter = QPainter(self.viewport())
@@ -0,0 +1,263 @@
+"""
+Raster cache for pictograph views.
+
+Option picker and beat frame pictographs are repainted far more often than
+they change: hover borders, overlapping widgets and resizes all repaint the
+whole QGraphicsScene of SVG items. Views instead render their scene once per
+(pictograph, size, device pixel ratio) into a QPixmap and blit that pixmap,
+re-rendering only after the scene reports a change. The cache is shared by
+every view, so identical pictographs at the same size render once.
+
+Mirrors v1/src/base_widgets/pictograph/elements/views/pictograph_raster_cache.py;
+the two apps share no importable package and key content on different models
+(BeatData here, Pictograph state in v1).
+"""
+
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Callable, Dict, Hashable, Optional
+
+from PyQt6.QtCore import QRectF, QTimer, Qt
+from PyQt6.QtGui import QPainter, QPixmap
+from PyQt6.QtWidgets import QGraphicsScene, QGraphicsTextItem, QGraphicsView
+
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+# While a view is being resized it shows its last raster scaled, and only
+# renders the scene again once no resize has arrived for this long
+RESIZE_SETTLE_MS = 150
+
+
+def scene_fingerprint(scene: QGraphicsScene) -> tuple:
+    """
+    Describe what every item in the scene currently looks like.
+
+    Visibility and placement changes act on the items (hidden glyphs, moved
+    arrows), so two scenes with the same beat and the same fingerprint
+    render the same pixels.
+    """
+    items = []
+    for item in scene.items(Qt.SortOrder.AscendingOrder):
+        transform = item.transform()
+        items.append(
+            (
+                type(item).__name__,
+                item.isVisible(),
+                round(item.opacity(), 3),
+                round(item.x(), 2),
+                round(item.y(), 2),
+                round(item.rotation(), 2),
+                round(item.scale(), 3),
+                item.zValue(),
+                (transform.m11(), transform.m12(), transform.m21(), transform.m22()),
+                item.toPlainText() if isinstance(item, QGraphicsTextItem) else None,
+            )
+        )
+    return tuple(items)
+
+
+def pictograph_content_key(scene: QGraphicsScene) -> Hashable:
+    """
+    Key for what a pictograph scene shows, independent of the view.
+
+    The beat id is left out so that equal beats in different views share a
+    raster.
+    """
+    beat_data = getattr(scene, "beat_data", None)
+    beat_key = repr(replace(beat_data, id="")) if beat_data is not None else None
+    return beat_key, scene_fingerprint(scene)
+
+
+class PictographRasterCache:
+    """
+    Process-wide LRU cache of rendered pictographs.
+
+    Keys are (content key, viewport size, device pixel ratio, scene source
+    rect), so a pixmap is only reused for exactly the pixels it was rendered
+    for. Entries are evicted least-recently-used first once the cached
+    pixmaps exceed the byte budget.
+    """
+
+    _instance: Optional["PictographRasterCache"] = None
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self._pixmaps: "OrderedDict[Hashable, QPixmap]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def instance(cls) -> "PictographRasterCache":
+        """Get the cache shared by every pictograph view."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    def get(self, key: Hashable) -> Optional[QPixmap]:
+        """Get the raster for key, marking it most recently used."""
+        pixmap = self._pixmaps.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self._pixmaps.move_to_end(key)
+        self.hits += 1
+        return pixmap
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        """Store a raster, evicting old ones once over the byte budget."""
+        previous = self._pixmaps.pop(key, None)
+        if previous is not None:
+            self._bytes -= self._size_of(previous)
+        self._pixmaps[key] = pixmap
+        self._bytes += self._size_of(pixmap)
+        while self._bytes > self.budget_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._bytes -= self._size_of(evicted)
+            self.evictions += 1
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit, miss and eviction counters and the current size."""
+        return {
+            "entries": len(self._pixmaps),
+            "bytes": self._bytes,
+            "budget_bytes": self.budget_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached raster and reset the counters."""
+        self._pixmaps.clear()
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def _size_of(pixmap: QPixmap) -> int:
+        return pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+
+
+class PictographRasterizer:
+    """
+    Paints a view's scene from the raster cache instead of its vector items.
+
+    The view calls paint() from its paintEvent, begin_resize() from its
+    resizeEvent and track() whenever it is given a new scene. The content key
+    is recomputed only after the scene emits changed, so repaints for hover
+    borders are a single pixmap blit.
+    """
+
+    def __init__(
+        self,
+        view: QGraphicsView,
+        content_key: Callable[[QGraphicsScene], Hashable] = pictograph_content_key,
+        cache: Optional[PictographRasterCache] = None,
+    ):
+        self.view = view
+        self.content_key = content_key
+        if cache is None:
+            cache = PictographRasterCache.instance()
+        self.cache = cache
+        self._scene: Optional[QGraphicsScene] = None
+        self._content_key: Optional[Hashable] = None
+        self._last_pixmap: Optional[QPixmap] = None
+        self._last_source = QRectF()
+
+        self.settle_timer = QTimer(view)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.setInterval(RESIZE_SETTLE_MS)
+        self.settle_timer.timeout.connect(view.viewport().update)
+        self.track(QGraphicsView.scene(view))
+
+    def invalidate(self, *_) -> None:
+        """Forget the content key; the next paint fingerprints the scene."""
+        # The last raster is stale too, so a resize must not stretch it
+        self._content_key = None
+        self._last_pixmap = None
+
+    def begin_resize(self) -> None:
+        """Hold off re-rendering until the resize has settled."""
+        self.settle_timer.start()
+
+    def paint(self) -> bool:
+        """
+        Paint the viewport from the cache.
+
+        Returns:
+            False if the view has no scene and should paint normally
+        """
+        # Called unbound because PictographComponent shadows scene()
+        scene = QGraphicsView.scene(self.view)
+        if scene is None:
+            return False
+        self.track(scene)
+
+        viewport = self.view.viewport()
+        painter = QPainter(viewport)
+        if self.settle_timer.isActive() and self._last_pixmap is not None:
+            # Mid-resize: stretch the last raster to where its scene rect is now
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            target = self.view.mapFromScene(self._last_source).boundingRect()
+            painter.drawPixmap(target, self._last_pixmap)
+        else:
+            source = self.view.mapToScene(viewport.rect()).boundingRect()
+            painter.drawPixmap(0, 0, self._raster(scene, source))
+        painter.end()
+        return True
+
+    def track(self, scene: Optional[QGraphicsScene]) -> None:
+        """Listen for changes to the scene the view now shows."""
+        # Must be connected as soon as the scene is set: a scene whose views
+        # only ever paint from the cache keeps ignoring item updates unless
+        # something listens to changed
+        if scene is None or scene is self._scene:
+            return
+        if self._scene is not None:
+            try:
+                self._scene.changed.disconnect(self.invalidate)
+            except (TypeError, RuntimeError):
+                pass
+        scene.changed.connect(self.invalidate)
+        self._scene = scene
+        self.invalidate()
+
+    def _raster(self, scene: QGraphicsScene, source: QRectF) -> QPixmap:
+        if self._content_key is None:
+            self._content_key = self.content_key(scene)
+        size = self.view.viewport().size()
+        dpr = self.view.devicePixelRatioF()
+        key = (
+            self._content_key,
+            size.width(),
+            size.height(),
+            dpr,
+            tuple(round(v, 2) for v in source.getRect()),
+        )
+        pixmap = self.cache.get(key)
+        if pixmap is None:
+            pixmap = self._render(scene, source, size.width(), size.height(), dpr)
+            self.cache.put(key, pixmap)
+        self._last_pixmap = pixmap
+        self._last_source = source
+        return pixmap
+
+    def _render(
+        self, scene: QGraphicsScene, source: QRectF, width: int, height: int, dpr
+    ) -> QPixmap:
+        pixmap = QPixmap(max(1, round(width * dpr)), max(1, round(height * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHints(self.view.renderHints())
+        scene.render(
+            painter,
+            QRectF(0, 0, width, height),
+            source,
+            Qt.AspectRatioMode.IgnoreAspectRatio,
+        )
+        painter.end()
+        return pixmap
@@ -5,16 +5,16 @@ Handles rendering of arrow elements with positioning, rotation, and mirroring.
 """
 
 import os
-import re
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 from domain.models.core_models import MotionData, Location, MotionType
 from domain.models.pictograph_models import ArrowData, PictographData
 from application.services.old_services_before_consolidation.arrow_positioning_service import (
     ArrowPositioningService,
 )
+from core.dependency_injection.service_registry import resolve_shared_service
 
 
 class ArrowRenderer:
@@ -26,7 +26,9 @@ class ArrowRenderer:
         self.CENTER_Y = 475
         self.HAND_RADIUS = 143.1
 
-        self.arrow_service = ArrowPositioningService()
+        # Loading placement JSON is expensive; every scene shares one service
+        self.arrow_service = resolve_shared_service(ArrowPositioningService)
+        self.renderer_cache = SvgRendererCache.instance()
 
         self.location_coordinates = {
             Location.NORTH.value: (0, -self.HAND_RADIUS),
@@ -67,15 +69,9 @@ class ArrowRenderer:
         if os.path.exists(arrow_svg_path):
             arrow_item = QGraphicsSvgItem()
 
-            # Apply color transformation to SVG data
-            svg_data = self._load_svg_file(arrow_svg_path)
-            colored_svg_data = self._apply_color_transformation(svg_data, color)
-
-            renderer = QSvgRenderer(bytearray(colored_svg_data, encoding="utf-8"))
-            if renderer.isValid():
-                arrow_item.setSharedRenderer(
-                    renderer
-                )  # NO INDIVIDUAL SCALING - positioning service assumes full-size scene
+            # Colored renderers are shared across every scene via the cache
+            if self.renderer_cache.attach(arrow_item, arrow_svg_path, color):
+                # NO INDIVIDUAL SCALING - positioning service assumes full-size scene
                 # All scaling will be applied to the entire scene as final step
 
                 position_x, position_y, rotation = (
@@ -180,56 +176,3 @@ class ArrowRenderer:
     def _get_location_position(self, location: Location) -> tuple[float, float]:
         """Get the coordinate position for a location."""
         return self.location_coordinates.get(location.value, (0, 0))
-
-    def _load_svg_file(self, file_path: str) -> str:
-        """Load SVG file content as string."""
-        try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                content = file.read()
-
-                # Extract dimensions from SVG content for debugging
-                import re
-
-                width_match = re.search(r'width="([^"]*)"', content)
-                height_match = re.search(r'height="([^"]*)"', content)
-                viewbox_match = re.search(r'viewBox="([^"]*)"', content)
-
-                width = width_match.group(1) if width_match else "not found"
-                height = height_match.group(1) if height_match else "not found"
-                viewbox = viewbox_match.group(1) if viewbox_match else "not found"
-
-                return content
-        except Exception as e:
-            return ""
-
-    def _apply_color_transformation(self, svg_data: str, color: str) -> str:
-        """Apply color transformation to SVG data based on arrow color."""
-        if not svg_data:
-            return svg_data
-
-        # Color mapping based on reference implementation
-        COLOR_MAP = {
-            "blue": "#2E3192",  # Reference blue color
-            "red": "#ED1C24",  # Reference red color
-        }
-
-        target_color = COLOR_MAP.get(color.lower(), "#2E3192")  # Default to blue
-
-        # Pattern to match CSS fill properties in SVG
-        # This matches both fill attributes and CSS style properties
-        patterns = [
-            # CSS fill property: fill="#color"
-            re.compile(r'(fill=")([^"]*)(")'),
-            # CSS style attribute: fill: #color;
-            re.compile(r"(fill:\s*)([^;]*)(;)"),
-            # Class definition: .st0 { fill: #color; }
-            re.compile(r"(\.(st0|cls-1)\s*\{[^}]*?fill:\s*)([^;}]*)([^}]*?\})"),
-        ]
-
-        # Apply color transformation using all patterns
-        for pattern in patterns:
-            svg_data = pattern.sub(
-                lambda m: m.group(1) + target_color + m.group(len(m.groups())), svg_data
-            )
-
-        return svg_data
@@ -8,10 +8,10 @@ based on VTG mode classification.
 import os
 from typing import Optional
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from domain.models.core_models import VTGMode, ElementalType
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class ElementalGlyphRenderer:
@@ -29,6 +29,7 @@ class ElementalGlyphRenderer:
 
     def __init__(self, scene):
         self.scene = scene
+        self.renderer_cache = SvgRendererCache.instance()
         self.SCENE_SIZE = 950
         self.CENTER_X = 475
         self.CENTER_Y = 475
@@ -62,10 +63,7 @@ class ElementalGlyphRenderer:
 
         # Create and configure the SVG item
         glyph_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
-
-        if renderer.isValid():
-            glyph_item.setSharedRenderer(renderer)
+        if self.renderer_cache.attach(glyph_item, svg_path):
             self._position_elemental_glyph(glyph_item)
             self.scene.addItem(glyph_item)
         else:
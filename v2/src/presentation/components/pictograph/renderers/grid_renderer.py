@@ -6,9 +6,9 @@ Handles rendering of grid elements using SVG assets.
 
 import os
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class GridRenderer:
@@ -16,6 +16,7 @@ class GridRenderer:
 
     def __init__(self, scene):
         self.scene = scene
+        self.renderer_cache = SvgRendererCache.instance()
 
     def render_grid(self) -> None:
         """Render the grid using SVG assets."""
@@ -23,10 +24,7 @@ class GridRenderer:
 
         if os.path.exists(grid_svg_path):
             grid_item = QGraphicsSvgItem()
-            renderer = QSvgRenderer(grid_svg_path)
-
-            if renderer.isValid():
-                grid_item.setSharedRenderer(renderer)
+            if self.renderer_cache.attach(grid_item, grid_svg_path):
                 grid_item.setScale(1.0)
                 grid_item.setPos(0, 0)
                 self.scene.addItem(grid_item)
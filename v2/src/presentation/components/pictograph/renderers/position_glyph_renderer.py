@@ -9,9 +9,9 @@ import os
 from typing import Optional
 from PyQt6.QtWidgets import QGraphicsItemGroup
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class PositionGlyphRenderer:
@@ -26,6 +26,7 @@ class PositionGlyphRenderer:
 
     def __init__(self, scene):
         self.scene = scene
+        self.renderer_cache = SvgRendererCache.instance()
         self.SCENE_SIZE = 950
         self.CENTER_X = 475
         self.CENTER_Y = 475
@@ -95,10 +96,7 @@ class PositionGlyphRenderer:
             return None
 
         symbol_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
-
-        if renderer.isValid():
-            symbol_item.setSharedRenderer(renderer)
+        if self.renderer_cache.attach(symbol_item, svg_path):
             # Apply scaling to match v1 behavior
             scale_factor = 0.75
             symbol_item.setScale(scale_factor)
@@ -116,10 +114,7 @@ class PositionGlyphRenderer:
             return None
 
         arrow_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
-
-        if renderer.isValid():
-            arrow_item.setSharedRenderer(renderer)
+        if self.renderer_cache.attach(arrow_item, svg_path):
             # Apply scaling to match v1 behavior
             scale_factor = 0.75
             arrow_item.setScale(scale_factor)
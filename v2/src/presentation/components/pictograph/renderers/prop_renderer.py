@@ -5,20 +5,20 @@ Handles rendering of prop elements with positioning and rotation.
 """
 
 import os
-import re
 from PyQt6.QtCore import QPointF
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from domain.models.core_models import MotionData, Location
 
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 from application.services.motion.motion_management_service import (
     MotionManagementService,
 )
 from domain.models.core_models import Orientation
 from application.services.positioning.prop_management_service import PropManagementService
+from core.dependency_injection.service_registry import resolve_shared_service
 
 
 class PropRenderer:
@@ -29,8 +29,9 @@ class PropRenderer:
         self.CENTER_X = 475
         self.CENTER_Y = 475
         self.HAND_RADIUS = 143.1
-        self.motion_service = MotionManagementService()
-        self.prop_management_service = PropManagementService()
+        self.motion_service = resolve_shared_service(MotionManagementService)
+        self.prop_management_service = resolve_shared_service(PropManagementService)
+        self.renderer_cache = SvgRendererCache.instance()
 
         # Store rendered props for overlap detection
         self.rendered_props = {}
@@ -67,16 +68,10 @@ class PropRenderer:
             return
 
         prop_item = QGraphicsSvgItem()
-        svg_data = self._load_svg_file(prop_svg_path)
-        colored_svg_data = self._apply_color_transformation(svg_data, color)
-
-        renderer = QSvgRenderer(bytearray(colored_svg_data, encoding="utf-8"))
-        if not renderer.isValid():
+        if not self.renderer_cache.attach(prop_item, prop_svg_path, color):
             print(f"Warning: Invalid SVG renderer for {prop_svg_path}")
             return
 
-        prop_item.setSharedRenderer(renderer)
-
         # Get position with validation
         end_pos = self._get_location_position(motion_data.end_loc)
         if end_pos == (0, 0) and motion_data.end_loc != Location.NORTH:
@@ -131,47 +126,6 @@ class PropRenderer:
             motion_data, Orientation.IN
         )
 
-    def _load_svg_file(self, file_path: str) -> str:
-        """Load SVG file content as string."""
-        try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                return file.read()
-        except Exception as e:
-            print(f"Error loading SVG file {file_path}: {e}")
-            return ""
-
-    def _apply_color_transformation(self, svg_data: str, color: str) -> str:
-        """Apply color transformation to SVG data based on prop color."""
-        if not svg_data:
-            return svg_data
-
-        # Color mapping based on reference implementation
-        COLOR_MAP = {
-            "blue": "#2E3192",  # Reference blue color
-            "red": "#ED1C24",  # Reference red color
-        }
-
-        target_color = COLOR_MAP.get(color.lower(), "#2E3192")  # Default to blue
-
-        # Pattern to match CSS fill properties in SVG
-        # This matches both fill attributes and CSS style properties
-        patterns = [
-            # CSS fill property: fill="#color"
-            re.compile(r'(fill=")([^"]*)(")'),
-            # CSS style attribute: fill: #color;
-            re.compile(r"(fill:\s*)([^;]*)(;)"),
-            # Class definition: .st0 { fill: #color; }
-            re.compile(r"(\.(st0|cls-1)\s*\{[^}]*?fill:\s*)([^;}]*)([^}]*?\})"),
-        ]
-
-        # Apply color transformation using all patterns
-        for pattern in patterns:
-            svg_data = pattern.sub(
-                lambda m: m.group(1) + target_color + m.group(len(m.groups())), svg_data
-            )
-
-        return svg_data
-
     def apply_beta_positioning(self, beat_data) -> None:
         """
         Apply beta prop positioning if conditions are met.
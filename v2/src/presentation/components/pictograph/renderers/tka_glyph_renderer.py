@@ -9,10 +9,10 @@ import os
 from typing import Optional
 from PyQt6.QtWidgets import QGraphicsItemGroup
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from domain.models.core_models import LetterType
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class TKAGlyphRenderer:
@@ -20,6 +20,7 @@ class TKAGlyphRenderer:
 
     def __init__(self, scene):
         self.scene = scene
+        self.renderer_cache = SvgRendererCache.instance()
         self.SCENE_SIZE = 950
         self.CENTER_X = 475
         self.CENTER_Y = 475
@@ -81,11 +82,8 @@ class TKAGlyphRenderer:
         if not os.path.exists(svg_path):
             return None
 
-        renderer = QSvgRenderer(svg_path)
-
-        if renderer.isValid():
-            letter_item = QGraphicsSvgItem()
-            letter_item.setSharedRenderer(renderer)
+        letter_item = QGraphicsSvgItem()
+        if self.renderer_cache.attach(letter_item, svg_path):
             return letter_item
         return None
 
@@ -97,10 +95,7 @@ class TKAGlyphRenderer:
             return None
 
         dash_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
-
-        if renderer.isValid():
-            dash_item.setSharedRenderer(renderer)
+        if self.renderer_cache.attach(dash_item, svg_path):
             return dash_item
         else:
             return None
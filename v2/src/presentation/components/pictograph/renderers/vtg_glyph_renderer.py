@@ -8,10 +8,10 @@ classification of pictographs (SS, SO, TS, TO, QS, QO).
 import os
 from typing import Optional
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from domain.models.core_models import VTGMode
 from presentation.components.pictograph.asset_utils import get_image_path
+from presentation.components.pictograph.svg_renderer_cache import SvgRendererCache
 
 
 class VTGGlyphRenderer:
@@ -19,6 +19,7 @@ class VTGGlyphRenderer:
 
     def __init__(self, scene):
         self.scene = scene
+        self.renderer_cache = SvgRendererCache.instance()
         self.SCENE_SIZE = 950
         self.CENTER_X = 475
         self.CENTER_Y = 475
@@ -48,10 +49,7 @@ class VTGGlyphRenderer:
 
         # Create and configure the SVG item
         glyph_item = QGraphicsSvgItem()
-        renderer = QSvgRenderer(svg_path)
-
-        if renderer.isValid():
-            glyph_item.setSharedRenderer(renderer)
+        if self.renderer_cache.attach(glyph_item, svg_path):
             self._position_vtg_glyph(glyph_item)
             self.scene.addItem(glyph_item)
         else:
@@ -0,0 +1,195 @@
+"""
+Shared SVG renderer cache for pictograph rendering.
+
+Every pictograph scene draws the same small set of assets (grid, staffs,
+arrows, glyphs) in one of two colors. Reading, recoloring and parsing those
+SVGs for every item is the dominant cost of repainting the option picker, so
+renderers are built once per (svg path, color) and shared between items via
+QGraphicsSvgItem.setSharedRenderer.
+
+Prop type and turns are part of the asset path (props/staff.svg,
+arrows/pro/from_radial/pro_1.0.svg), so the path and color fully identify a
+renderer.
+"""
+
+import os
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from PyQt6.QtSvg import QSvgRenderer
+from PyQt6.QtSvgWidgets import QGraphicsSvgItem
+
+from presentation.components.pictograph.asset_utils import get_image_path
+
+COLOR_MAP = {
+    "blue": "#2E3192",  # Reference blue color
+    "red": "#ED1C24",  # Reference red color
+}
+
+# Patterns matching fill colors in the SVG assets
+_FILL_PATTERNS = [
+    # CSS fill property: fill="#color"
+    re.compile(r'(fill=")([^"]*)(")'),
+    # CSS style attribute: fill: #color;
+    re.compile(r"(fill:\s*)([^;]*)(;)"),
+    # Class definition: .st0 { fill: #color; }
+    re.compile(r"(\.(st0|cls-1)\s*\{[^}]*?fill:\s*)([^;}]*)([^}]*?\})"),
+]
+
+RendererKey = Tuple[str, Optional[str]]
+
+
+def apply_color_transformation(svg_data: str, color: str) -> str:
+    """Replace the fill colors in SVG data with the reference color for color."""
+    if not svg_data:
+        return svg_data
+
+    target_color = COLOR_MAP.get(color.lower(), COLOR_MAP["blue"])
+    for pattern in _FILL_PATTERNS:
+        svg_data = pattern.sub(
+            lambda m: m.group(1) + target_color + m.group(len(m.groups())), svg_data
+        )
+    return svg_data
+
+
+class SvgRendererCache:
+    """
+    Process-wide LRU cache of QSvgRenderer objects keyed by (svg path, color).
+
+    Items that use a cached renderer keep a reference to it (see attach), so
+    evicting an entry never deletes a renderer that a scene is still drawing.
+    """
+
+    DEFAULT_MAX_SIZE = 256
+    TURNS_VARIANTS = ("0.0", "0.5", "1.0", "1.5", "2.0", "2.5", "3.0")
+    ARROW_MOTION_TYPES = ("pro", "anti", "static", "dash")
+
+    _instance: Optional["SvgRendererCache"] = None
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self._renderers: "OrderedDict[RendererKey, QSvgRenderer]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def instance(cls) -> "SvgRendererCache":
+        """Get the cache shared by every pictograph scene."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def get_renderer(
+        self, svg_path: str, color: Optional[str] = None
+    ) -> Optional[QSvgRenderer]:
+        """
+        Get a renderer for an SVG file, recolored if color is given.
+
+        Args:
+            svg_path: Path to the SVG file
+            color: "blue" or "red" to recolor fills, None to use the file as is
+
+        Returns:
+            A shared, valid QSvgRenderer, or None if the file is missing or invalid
+        """
+        key = (os.path.normpath(svg_path), color.lower() if color else None)
+        renderer = self._renderers.get(key)
+        if renderer is not None:
+            self._renderers.move_to_end(key)
+            self.hits += 1
+            return renderer
+
+        self.misses += 1
+        renderer = self._create_renderer(*key)
+        if renderer is None:
+            return None
+
+        self._renderers[key] = renderer
+        while len(self._renderers) > self.max_size:
+            self._renderers.popitem(last=False)
+            self.evictions += 1
+        return renderer
+
+    def attach(
+        self, item: QGraphicsSvgItem, svg_path: str, color: Optional[str] = None
+    ) -> bool:
+        """
+        Point item at the shared renderer for svg_path and color.
+
+        Returns:
+            True if the renderer was valid and attached
+        """
+        renderer = self.get_renderer(svg_path, color)
+        if renderer is None:
+            return False
+        item.setSharedRenderer(renderer)
+        # setSharedRenderer does not take ownership; keep the renderer alive
+        # for as long as the item exists, even after eviction.
+        item._shared_svg_renderer = renderer
+        return True
+
+    def warm_up(
+        self, entries: Optional[Iterable[Tuple[str, Optional[str]]]] = None
+    ) -> int:
+        """
+        Preload renderers so the first paint does no file I/O.
+
+        Args:
+            entries: (svg path, color) pairs; defaults to the grid, staffs and
+                every arrow turns variant in both colors
+
+        Returns:
+            Number of renderers that were loaded
+        """
+        if entries is None:
+            entries = self.default_warm_up_entries()
+        loaded = 0
+        for svg_path, color in entries:
+            if os.path.exists(svg_path) and self.get_renderer(svg_path, color):
+                loaded += 1
+        return loaded
+
+    def default_warm_up_entries(self) -> Iterable[Tuple[str, Optional[str]]]:
+        """The assets drawn by nearly every pictograph."""
+        yield get_image_path("grid/diamond_grid.svg"), None
+        for color in COLOR_MAP:
+            yield get_image_path("props/staff.svg"), color
+            yield get_image_path("arrows/float.svg"), color
+            for motion_type in self.ARROW_MOTION_TYPES:
+                for turns in self.TURNS_VARIANTS:
+                    yield get_image_path(
+                        f"arrows/{motion_type}/from_radial/{motion_type}_{turns}.svg"
+                    ), color
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get hit, miss and eviction counters and the current size."""
+        return {
+            "size": len(self._renderers),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        """Drop every cached renderer and reset the counters."""
+        self._renderers.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def _create_renderer(
+        self, svg_path: str, color: Optional[str]
+    ) -> Optional[QSvgRenderer]:
+        if color is None:
+            renderer = QSvgRenderer(svg_path)
+        else:
+            try:
+                with open(svg_path, "r", encoding="utf-8") as file:
+                    svg_data = file.read()
+            except OSError as e:
+                print(f"Error loading SVG file {svg_path}: {e}")
+                return None
+            colored_svg_data = apply_color_transformation(svg_data, color)
+            renderer = QSvgRenderer(bytearray(colored_svg_data, encoding="utf-8"))
+        return renderer if renderer.isValid() else None
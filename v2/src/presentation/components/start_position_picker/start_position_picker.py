@@ -21,9 +21,10 @@ from PyQt6.QtGui import QFont
 from ..pictograph.pictograph_component import PictographComponent
 
 from ....domain.models.core_models import BeatData
-from ....application.services.old_services_before_consolidation.pictograph_dataset_service import (
+from application.services.old_services_before_consolidation.pictograph_dataset_service import (
     PictographDatasetService,
 )
+from core.dependency_injection.service_registry import resolve_shared_service
 
 
 class StartPositionOption(QWidget):
@@ -35,7 +36,7 @@ class StartPositionOption(QWidget):
         super().__init__()
         self.position_key = position_key
         self.grid_mode = grid_mode
-        self.dataset_service = PictographDatasetService()
+        self.dataset_service = resolve_shared_service(PictographDatasetService)
         self._setup_ui()
 
     def _setup_ui(self):
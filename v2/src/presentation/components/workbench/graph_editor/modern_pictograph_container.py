@@ -9,6 +9,7 @@ from application.services.core.pictograph_management_service import (
     PictographManagementService,
 )
 from presentation.components.pictograph.pictograph_scene import PictographScene
+from core.dependency_injection.service_registry import resolve_shared_service
 
 
 class ModernPictographContainer(QWidget):
@@ -24,7 +25,9 @@ class ModernPictographContainer(QWidget):
         # Get layout service from parent's container
         container = getattr(parent, "container", None)
         if container:
-            self._pictograph_service = PictographManagementService()
+            self._pictograph_service = resolve_shared_service(
+                PictographManagementService
+            )
         else:
             self._pictograph_service = None
 
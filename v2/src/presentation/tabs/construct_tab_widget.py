@@ -380,11 +380,14 @@ class ConstructTabWidget(QWidget):
     def _create_start_position_data(self, position_key: str) -> BeatData:
         """Create start position data from position key using real dataset (separate from sequence beats)"""
         try:
-            from ...application.services.old_services_before_consolidation.pictograph_dataset_service import (
+            from application.services.old_services_before_consolidation.pictograph_dataset_service import (
                 PictographDatasetService,
             )
+            from core.dependency_injection.service_registry import (
+                resolve_shared_service,
+            )
 
-            dataset_service = PictographDatasetService()
+            dataset_service = resolve_shared_service(PictographDatasetService)
             # Get real start position data from dataset
             real_start_position = dataset_service.get_start_position_pictograph(
                 position_key, "diamond"
@@ -140,7 +140,7 @@ def debug_arrow_positioning():
             test_pictograph_case = MockPictographData(letter, blue_turns, red_turns)
             
             adjustment = special_service.get_special_adjustment(test_arrow_case, test_pictograph_case)
-            turns_tuple = special_service._generate_turns_tuple(test_pictograph_case)
+            turns_tuple = special_service.generate_turns_tuple(test_pictograph_case)
             
             status = "✅ FOUND" if adjustment else "❌ NONE"
             adjustment_str = f"({adjustment.x()}, {adjustment.y()})" if adjustment else "None"
@@ -111,13 +111,13 @@ def debug_special_placement_service():
             print("❌ No special adjustment found")
 
         # Test orientation key generation
-        ori_key = special_service._generate_orientation_key(
+        ori_key = special_service.generate_orientation_key(
             mock_motion, mock_pictograph
         )
         print(f"Generated orientation key: {ori_key}")
 
         # Test turns tuple generation
-        turns_tuple = special_service._generate_turns_tuple(mock_pictograph)
+        turns_tuple = special_service.generate_turns_tuple(mock_pictograph)
         print(f"Generated turns tuple: {turns_tuple}")
 
         # Test with different letters and configurations
@@ -146,7 +146,7 @@ def debug_special_placement_service():
             adjustment = special_service.get_special_adjustment(
                 test_arrow, test_pictograph
             )
-            turns_tuple = special_service._generate_turns_tuple(test_pictograph)
+            turns_tuple = special_service.generate_turns_tuple(test_pictograph)
 
             print(
                 f"Letter {letter}, turns {turns_tuple}, {motion_type.value}: {adjustment}"
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Generation Benchmark
+====================
+
+Throughput and determinism harness for the sequence generation engine.
+
+Runs every CAP type over a matrix of slice sizes, lengths, levels and turn
+intensities with fixed seeds. For each case it reports sequences per second,
+p50/p99 latency and peak memory, and verifies every generated sequence: it
+must chain beat to beat, close on its start position and pass the v1
+sequence_properties_manager checker for its CAP type, where one exists.
+
+Results are written as JSON to --output, or to the system temp directory
+when it is not given, so runs never dirty the tree. Keep reports to track
+generator speed across releases; a case's digest only changes when the
+sequences generated from its seeds do.
+
+Usage:
+    python tests/scripts/generation_benchmark.py
+    python tests/scripts/generation_benchmark.py --quick --output bench.json
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+V2_DIR = Path(__file__).resolve().parents[2]
+REPO_DIR = V2_DIR.parent
+
+# v2 goes first: v1/src has a top-level core package of its own
+for path in (V2_DIR / "src", V2_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+for path in (REPO_DIR, REPO_DIR / "v1" / "src"):
+    if str(path) not in sys.path:
+        sys.path.append(str(path))
+
+from application.services.generation.cap_transforms import (  # noqa: E402
+    effective_slice_size,
+    length_divisor,
+)
+from application.services.generation.sequence_generation_engine import (  # noqa: E402
+    LEVEL_TURNS,
+    SequenceGenerationEngine,
+    batch_seeds,
+)
+from main_window.main_widget.sequence_properties_manager.mirrored_swapped_CAP_checker import (  # noqa: E402
+    MirroredSwappedCAPChecker,
+)
+from main_window.main_widget.sequence_properties_manager.rotated_swapped_CAP_checker import (  # noqa: E402
+    RotatedSwappedCAPChecker,
+)
+from main_window.main_widget.sequence_properties_manager.strict_mirrored_CAP_checker import (  # noqa: E402
+    StrictMirroredCAPChecker,
+)
+from main_window.main_widget.sequence_properties_manager.strict_rotated_CAP_checker import (  # noqa: E402
+    StrictRotatedCAPChecker,
+)
+from main_window.main_widget.sequence_properties_manager.strict_swapped_CAP_checker import (  # noqa: E402
+    StrictSwappedCAPChecker,
+)
+from src.core.interfaces.generation_services import (  # noqa: E402
+    CAPType,
+    GenerationMode,
+    SliceSize,
+)
+from src.domain.models.generation_models import (  # noqa: E402
+    GenerationConfig,
+    GenerationResult,
+)
+
+# The CAP types sequence_properties_manager can recognise
+CAP_CHECKERS: Dict[CAPType, Callable] = {
+    CAPType.STRICT_ROTATED: StrictRotatedCAPChecker,
+    CAPType.STRICT_MIRRORED: StrictMirroredCAPChecker,
+    CAPType.STRICT_SWAPPED: StrictSwappedCAPChecker,
+    CAPType.MIRRORED_SWAPPED: MirroredSwappedCAPChecker,
+    CAPType.ROTATED_SWAPPED: RotatedSwappedCAPChecker,
+}
+
+DEFAULT_LENGTHS = tuple(range(4, 65, 4))
+DEFAULT_LEVELS = (1, 2, 3)
+DEFAULT_TURN_INTENSITIES = (0.5, 1.0, 2.0, 3.0)
+DEFAULT_SEQUENCES = 20
+
+QUICK_LENGTHS = (8, 16, 64)
+QUICK_TURN_INTENSITIES = (2.0,)
+QUICK_SEQUENCES = 5
+
+# Failure messages kept per case; the rest are only counted
+MAX_ERRORS = 5
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    cap_type: CAPType
+    slice_size: SliceSize
+    length: int
+    level: int
+    turn_intensity: float
+
+    def config(self) -> GenerationConfig:
+        return GenerationConfig(
+            mode=GenerationMode.CIRCULAR,
+            cap_type=self.cap_type,
+            slice_size=self.slice_size,
+            length=self.length,
+            level=self.level,
+            turn_intensity=self.turn_intensity,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "cap_type": self.cap_type.value,
+            "slice_size": self.slice_size.value,
+            "length": self.length,
+            "level": self.level,
+            "turn_intensity": self.turn_intensity,
+        }
+
+
+def benchmark_cases(
+    cap_types: Sequence[CAPType] = tuple(CAPType),
+    lengths: Sequence[int] = DEFAULT_LENGTHS,
+    levels: Sequence[int] = DEFAULT_LEVELS,
+    turn_intensities: Sequence[float] = DEFAULT_TURN_INTENSITIES,
+) -> List[BenchmarkCase]:
+    """
+    Every distinct combination the engine accepts.
+
+    Slice sizes a CAP ignores and turn intensities at levels without turns
+    generate identical sequences, so each is run once. Lengths the CAP
+    cannot divide evenly are skipped.
+    """
+    cases = []
+    for cap_type in cap_types:
+        for slice_size in SliceSize:
+            if effective_slice_size(cap_type, slice_size) != slice_size:
+                continue
+            for length in lengths:
+                if length % length_divisor(cap_type, slice_size):
+                    continue
+                for level in levels:
+                    intensities = turn_intensities
+                    if level not in LEVEL_TURNS:
+                        intensities = turn_intensities[:1]
+                    cases.extend(
+                        BenchmarkCase(cap_type, slice_size, length, level, intensity)
+                        for intensity in intensities
+                    )
+    return cases
+
+
+def verify_sequence(
+    result: GenerationResult, case: BenchmarkCase, checker: Optional[Callable]
+) -> List[str]:
+    """Problems with one generated sequence; empty when it is valid."""
+    if not result.success:
+        return [result.error_message or "generation failed"]
+
+    problems = []
+    start_position = result.start_position_data
+    beats = result.sequence_data
+    if len(beats) != case.length:
+        problems.append(f"{len(beats)} beats instead of {case.length}")
+    if beats[-1]["end_pos"] != start_position["end_pos"]:
+        problems.append("does not end on its start position")
+
+    previous = start_position
+    for beat in beats:
+        if not _continues(previous, beat):
+            problems.append(f"beat {beat['beat']} does not continue the beat before")
+            break
+        previous = beat
+
+    # The properties manager checks the sequence without its metadata entry
+    manager = SimpleNamespace(sequence=[start_position] + beats)
+    if checker is not None and not checker(manager).check():
+        problems.append(f"rejected by {checker.__name__}")
+    return problems
+
+
+def _continues(previous: Dict[str, Any], beat: Dict[str, Any]) -> bool:
+    if beat["start_pos"] != previous["end_pos"]:
+        return False
+    for color in ("blue", "red"):
+        attributes = beat[f"{color}_attributes"]
+        previous_attributes = previous[f"{color}_attributes"]
+        if attributes["start_loc"] != previous_attributes["end_loc"]:
+            return False
+        if attributes["start_ori"] != previous_attributes["end_ori"]:
+            return False
+    return True
+
+
+def _digest_update(digest: Any, result: GenerationResult) -> None:
+    payload = [result.start_position_data, result.sequence_data]
+    digest.update(json.dumps(payload, sort_keys=True, default=str).encode())
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def run_case(
+    engine: SequenceGenerationEngine, case: BenchmarkCase, seeds: Sequence[int]
+) -> Dict[str, Any]:
+    """
+    Time, verify and replay one case.
+
+    The timed pass generates every seed; the replay pass generates them again
+    under tracemalloc, measuring peak memory and checking that each seed
+    reproduces the same sequence.
+    """
+    config = case.config()
+    checker = CAP_CHECKERS.get(case.cap_type)
+    latencies = []
+    errors = []
+    failures = 0
+    digest = hashlib.sha1()
+
+    for seed in seeds:
+        started = time.perf_counter()
+        result = engine.generate(config, seed)
+        latencies.append(time.perf_counter() - started)
+
+        problems = verify_sequence(result, case, checker)
+        if problems:
+            failures += 1
+            errors.extend(f"seed {seed}: {problem}" for problem in problems)
+        _digest_update(digest, result)
+
+    replay = hashlib.sha1()
+    tracemalloc.start()
+    try:
+        for seed in seeds:
+            _digest_update(replay, engine.generate(config, seed))
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    reproducible = replay.digest() == digest.digest()
+    if not reproducible:
+        errors.append("replaying the seeds generated different sequences")
+
+    total = sum(latencies)
+    latencies.sort()
+    return {
+        **case.to_dict(),
+        "checker": checker.__name__ if checker else None,
+        "sequences": len(seeds),
+        "failures": failures,
+        "reproducible": reproducible,
+        "sequences_per_second": len(seeds) / total if total else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_memory_kb": peak_memory / 1024,
+        "digest": digest.hexdigest(),
+        "errors": errors[:MAX_ERRORS],
+        "_latencies": latencies,
+    }
+
+
+def run_benchmark(
+    cases: Sequence[BenchmarkCase],
+    sequences: int = DEFAULT_SEQUENCES,
+    seed: int = 0,
+    engine: Optional[SequenceGenerationEngine] = None,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Run every case with the same fixed seeds and collect a JSON-ready report.
+
+    Args:
+        cases: Cases to run, usually from benchmark_cases()
+        sequences: Sequences generated per case
+        seed: Seed the per-sequence seeds are derived from
+        engine: Engine to benchmark; one over the shared dataset by default
+        progress: Called with each case's result as it finishes
+    """
+    setup_started = time.perf_counter()
+    engine = engine or SequenceGenerationEngine()
+    setup_seconds = time.perf_counter() - setup_started
+
+    seeds = batch_seeds(seed, sequences)
+    results = []
+    all_latencies: List[float] = []
+    started = time.perf_counter()
+    for case in cases:
+        result = run_case(engine, case, seeds)
+        all_latencies.extend(result.pop("_latencies"))
+        results.append(result)
+        if progress:
+            progress(result)
+    elapsed = time.perf_counter() - started
+
+    all_latencies.sort()
+    generated = len(all_latencies)
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "parameters": {
+            "seed": seed,
+            "sequences_per_case": sequences,
+            "algorithm": engine.ALGORITHM,
+        },
+        "summary": {
+            "cases": len(results),
+            "sequences": generated,
+            "failed_cases": sum(
+                bool(r["failures"]) or not r["reproducible"] for r in results
+            ),
+            "failed_sequences": sum(r["failures"] for r in results),
+            "setup_seconds": setup_seconds,
+            "elapsed_seconds": elapsed,
+            "sequences_per_second": (
+                generated / sum(all_latencies) if all_latencies else 0.0
+            ),
+            "p50_ms": percentile(all_latencies, 0.50) * 1000,
+            "p99_ms": percentile(all_latencies, 0.99) * 1000,
+            "peak_memory_kb": max(
+                (r["peak_memory_kb"] for r in results), default=0.0
+            ),
+        },
+        "cases": results,
+    }
+
+
+def _print_case(result: Dict[str, Any]) -> None:
+    status = "ok" if not result["errors"] else "FAILED"
+    print(
+        f"{result['cap_type']:<32} {result['slice_size']:<9} "
+        f"len {result['length']:>2} lvl {result['level']} "
+        f"ti {result['turn_intensity']:<3} "
+        f"{result['sequences_per_second']:>8.0f} seq/s "
+        f"p50 {result['p50_ms']:6.2f}ms p99 {result['p99_ms']:6.2f}ms "
+        f"peak {result['peak_memory_kb']:7.1f}KB {status}"
+    )
+    for error in result["errors"]:
+        print(f"    {error}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark and verify circular sequence generation"
+    )
+    parser.add_argument("--cap-types", nargs="+", choices=[c.value for c in CAPType])
+    parser.add_argument("--lengths", nargs="+", type=int)
+    parser.add_argument("--levels", nargs="+", type=int)
+    parser.add_argument("--turn-intensities", nargs="+", type=float)
+    parser.add_argument("--sequences", type=int, help="Sequences per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--quick", action="store_true", help="Run a reduced matrix for a smoke test"
+    )
+    parser.add_argument("--output", type=Path, help="JSON report path")
+    parser.add_argument("--verbose", action="store_true", help="Print every case")
+    args = parser.parse_args(argv)
+
+    cases = benchmark_cases(
+        cap_types=[CAPType(value) for value in args.cap_types or []] or tuple(CAPType),
+        lengths=args.lengths or (QUICK_LENGTHS if args.quick else DEFAULT_LENGTHS),
+        levels=args.levels or DEFAULT_LEVELS,
+        turn_intensities=args.turn_intensities
+        or (QUICK_TURN_INTENSITIES if args.quick else DEFAULT_TURN_INTENSITIES),
+    )
+    sequences = args.sequences or (QUICK_SEQUENCES if args.quick else DEFAULT_SEQUENCES)
+
+    def progress(result: Dict[str, Any]) -> None:
+        if args.verbose or result["errors"]:
+            _print_case(result)
+
+    print(f"Running {len(cases)} cases x {sequences} sequences")
+    report = run_benchmark(cases, sequences, args.seed, progress=progress)
+
+    output = args.output or (
+        Path(tempfile.gettempdir())
+        / f"generation_benchmark_{datetime.now().isoformat().replace(':', '-')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    summary = report["summary"]
+    print(
+        f"{summary['sequences']} sequences in {summary['elapsed_seconds']:.1f}s: "
+        f"{summary['sequences_per_second']:.0f} seq/s, "
+        f"p50 {summary['p50_ms']:.2f}ms, p99 {summary['p99_ms']:.2f}ms, "
+        f"peak {summary['peak_memory_kb']:.1f}KB"
+    )
+    print(f"{summary['failed_cases']} failed cases; report written to {output}")
+    return 1 if summary["failed_cases"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
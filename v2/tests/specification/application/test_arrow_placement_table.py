@@ -0,0 +1,143 @@
+"""
+Tests for ArrowPlacementTable.
+
+Tests that the compiled table reproduces the live arrow placement pipeline,
+including special placements, survives a save/load round trip, and is
+recompiled when the placement JSON it was built from changes.
+"""
+
+import time
+
+import pytest
+
+from application.services.positioning.arrow_management_service import (
+    ArrowManagementService,
+)
+from application.services.positioning.arrow_placement_table import (
+    ArrowPlacementTable,
+)
+from domain.models.core_models import (
+    Location,
+    MotionData,
+    MotionType,
+    RotationDirection,
+)
+from domain.models.pictograph_models import ArrowData, PictographData
+
+
+@pytest.fixture(scope="module")
+def live_service():
+    return ArrowManagementService(use_placement_table=False)
+
+
+@pytest.fixture(scope="module")
+def table(live_service):
+    return ArrowPlacementTable.compile(live_service)
+
+
+def make_arrow(motion_type, start_loc, end_loc, turns=1.0):
+    motion = MotionData(
+        motion_type=motion_type,
+        prop_rot_dir=RotationDirection.CLOCKWISE,
+        start_loc=start_loc,
+        end_loc=end_loc,
+        turns=turns,
+    )
+    return ArrowData(motion_data=motion, color="blue", turns=turns)
+
+
+class TestArrowPlacementTable:
+    """Compiled placements match the live pipeline."""
+
+    def test_table_matches_live_pipeline(self, table, live_service):
+        assert table.special_adjustments
+        assert table.verify(live_service) == []
+
+    def test_special_adjustment_overrides_default(self, table, live_service):
+        assert table.special_adjustments[
+            ("diamond", "from_layer1", "I", "(0, 0)", "pro")
+        ] == (70, -90)
+        arrow = make_arrow(MotionType.PRO, Location.NORTH, Location.EAST, 0.0)
+        red = make_arrow(MotionType.STATIC, Location.SOUTH, Location.SOUTH, 0.0)
+        pictograph = PictographData(arrows={"blue": arrow, "red": red}, letter="I")
+
+        placement = table.get_placement(arrow, pictograph)
+        default = table.get_placement(arrow, PictographData(arrows={"blue": arrow}))
+        expected = live_service.calculate_arrow_position_uncached(arrow, pictograph)
+        assert (placement.x, placement.y, placement.rotation) == expected
+        assert placement != default
+
+    def test_service_reads_from_table(self, table):
+        service = ArrowManagementService()
+        service._placement_table = table
+        arrow = make_arrow(MotionType.ANTI, Location.EAST, Location.SOUTH)
+        pictograph = PictographData(arrows={"blue": arrow})
+
+        assert service.calculate_arrow_position(
+            arrow, pictograph
+        ) == service.calculate_arrow_position_uncached(arrow, pictograph)
+
+    def test_motion_outside_table_falls_back_to_pipeline(self, table):
+        service = ArrowManagementService()
+        service._placement_table = table
+        # A pro motion cannot end where it started
+        arrow = make_arrow(MotionType.PRO, Location.NORTH, Location.NORTH)
+        pictograph = PictographData(arrows={"blue": arrow})
+
+        assert table.get_placement(arrow, pictograph) is None
+        assert service.calculate_arrow_position(
+            arrow, pictograph
+        ) == service.calculate_arrow_position_uncached(arrow, pictograph)
+
+    def test_save_load_round_trip(self, table, tmp_path):
+        table_path = tmp_path / "compiled_arrow_placements.json"
+        table.save(table_path)
+
+        loaded = ArrowPlacementTable.load(table_path)
+        assert loaded.placements == table.placements
+        assert loaded.special_adjustments == table.special_adjustments
+        assert loaded.source_hash == table.source_hash
+
+    def test_stale_table_is_recompiled(self, table, tmp_path):
+        table_path = tmp_path / "compiled_arrow_placements.json"
+        ArrowPlacementTable({}, {}, source_hash="stale").save(table_path)
+
+        reloaded = ArrowPlacementTable.load_or_compile(table_path)
+        assert reloaded.source_hash == ArrowPlacementTable.source_fingerprint()
+        assert reloaded.placements == table.placements
+        assert ArrowPlacementTable.load(table_path).source_hash == (
+            reloaded.source_hash
+        )
+
+    def test_unknown_version_is_ignored(self, tmp_path):
+        table_path = tmp_path / "compiled_arrow_placements.json"
+        table_path.write_text('{"version": 0}', encoding="utf-8")
+
+        assert ArrowPlacementTable.load(table_path) is None
+
+
+@pytest.mark.slow
+class TestArrowPlacementTablePerformance:
+    """Micro-benchmark: table lookups against the live pipeline."""
+
+    LOOKUPS = 2000
+
+    def test_table_lookup_faster_than_pipeline(self, table, live_service):
+        arrow = make_arrow(MotionType.PRO, Location.NORTH, Location.EAST)
+        pictograph = PictographData(arrows={"blue": arrow}, letter="A")
+
+        start = time.perf_counter()
+        for _ in range(self.LOOKUPS):
+            table.get_placement(arrow, pictograph)
+        table_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(self.LOOKUPS):
+            live_service.calculate_arrow_position_uncached(arrow, pictograph)
+        live_time = time.perf_counter() - start
+
+        print(
+            f"\n{self.LOOKUPS} placements: table {table_time * 1000:.2f}ms, "
+            f"live {live_time * 1000:.2f}ms"
+        )
+        assert table_time * 10 < live_time
@@ -0,0 +1,119 @@
+"""
+Tests for the generation benchmark harness.
+
+Tests that the benchmark matrix covers every CAP type without duplicate
+cases, that generated sequences pass the v1 CAP checkers, and that the
+report is deterministic JSON.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from application.services.generation.sequence_generation_engine import (
+    SequenceGenerationEngine,
+)
+from infrastructure.pictograph_csv_ingestion import (
+    build_letter_records,
+    read_pictograph_csv,
+)
+from src.core.interfaces.generation_services import CAPType, SliceSize
+from tests.scripts.generation_benchmark import (
+    CAP_CHECKERS,
+    benchmark_cases,
+    main,
+    run_benchmark,
+)
+
+DATASET_PATH = Path(__file__).parents[4] / "data" / "DiamondPictographDataframe.csv"
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return SequenceGenerationEngine(
+        build_letter_records(read_pictograph_csv(DATASET_PATH))
+    )
+
+
+class TestBenchmarkCases:
+    def test_only_strict_rotated_runs_both_slice_sizes(self):
+        cases = benchmark_cases(lengths=(16,), levels=(1,))
+
+        assert len(cases) == len(CAPType) + 1
+        assert {case.slice_size for case in cases} == set(SliceSize)
+        quartered = [c for c in cases if c.slice_size == SliceSize.QUARTERED]
+        assert [c.cap_type for c in quartered] == [CAPType.STRICT_ROTATED]
+
+    def test_lengths_the_cap_cannot_divide_are_skipped(self):
+        cases = benchmark_cases(
+            cap_types=(CAPType.STRICT_MIRRORED, CAPType.MIRRORED_ROTATED),
+            lengths=(6, 8),
+            levels=(1,),
+        )
+
+        assert [(c.cap_type, c.length) for c in cases] == [
+            (CAPType.STRICT_MIRRORED, 6),
+            (CAPType.STRICT_MIRRORED, 8),
+            (CAPType.MIRRORED_ROTATED, 8),
+        ]
+
+    def test_turn_intensity_only_varies_at_levels_with_turns(self):
+        cases = benchmark_cases(
+            cap_types=(CAPType.STRICT_SWAPPED,),
+            lengths=(8,),
+            levels=(1, 2),
+            turn_intensities=(1.0, 2.0),
+        )
+
+        assert [(c.level, c.turn_intensity) for c in cases] == [
+            (1, 1.0),
+            (2, 1.0),
+            (2, 2.0),
+        ]
+
+
+class TestRunBenchmark:
+    def test_every_cap_passes_verification(self, engine):
+        cases = benchmark_cases(
+            lengths=(4, 16, 64), levels=(3,), turn_intensities=(3.0,)
+        )
+        report = run_benchmark(cases, sequences=3, engine=engine)
+
+        failed = [case for case in report["cases"] if case["errors"]]
+        assert not failed
+        assert report["summary"]["sequences"] == 3 * len(cases)
+        checked = {case["cap_type"] for case in report["cases"] if case["checker"]}
+        assert checked == {cap_type.value for cap_type in CAP_CHECKERS}
+
+    def test_digests_are_reproducible(self, engine):
+        cases = benchmark_cases(lengths=(16,), levels=(2,), turn_intensities=(2.0,))
+        first = run_benchmark(cases, sequences=2, seed=5, engine=engine)
+        second = run_benchmark(cases, sequences=2, seed=5, engine=engine)
+
+        assert [c["digest"] for c in first["cases"]] == [
+            c["digest"] for c in second["cases"]
+        ]
+
+    def test_main_writes_json_report(self, tmp_path):
+        output = tmp_path / "benchmark.json"
+        exit_code = main(
+            [
+                "--cap-types",
+                "strict_rotated",
+                "--lengths",
+                "8",
+                "--levels",
+                "2",
+                "--sequences",
+                "2",
+                "--output",
+                str(output),
+            ]
+        )
+
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert exit_code == 0
+        assert report["summary"]["cases"] == 8
+        for key in ("sequences_per_second", "p50_ms", "p99_ms", "peak_memory_kb"):
+            assert report["summary"][key] > 0
@@ -0,0 +1,124 @@
+"""
+Tests for PictographCsvIngestion.
+
+Tests that CSVs are read with categorical dtypes, that the per-letter records
+match the row-by-row conversion they replace, and that the pickled result is
+reused until the CSV changes.
+"""
+
+import pandas as pd
+import pytest
+
+from application.services.core.pictograph_management_service import (
+    PictographManagementService,
+)
+from infrastructure.pictograph_csv_ingestion import (
+    PictographCsvIngestion,
+    build_letter_records,
+    read_pictograph_csv,
+)
+
+HEADER = (
+    "letter,start_pos,end_pos,timing,direction,"
+    "blue_motion_type,blue_prop_rot_dir,blue_start_loc,blue_end_loc,"
+    "red_motion_type,red_prop_rot_dir,red_start_loc,red_end_loc\n"
+)
+ROWS = (
+    "B,alpha3,alpha5,split,same,anti,cw,w,n,anti,cw,e,s\n"
+    "A,beta5,alpha3,split,same,pro,cw,w,n,pro,cw,e,s\n"
+    "A,alpha5,alpha7,split,same,pro,ccw,n,e,static,no_rot,s,s\n"
+)
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "DiamondPictographDataframe.csv"
+    path.write_text(HEADER + ROWS, encoding="utf-8")
+    return path
+
+
+def convert_row_by_row(df):
+    """The iterrows conversion PositionMatchingService used to run."""
+    grouped = {}
+    for _, row in df.iterrows():
+        letter = str(row.get("letter", "Unknown"))
+        attributes = {}
+        for color, loc, ori in (("blue", "n", "in"), ("red", "s", "out")):
+            attributes[color] = {
+                "motion_type": str(row.get(f"{color}_motion_type", "static")),
+                "prop_rot_dir": str(row.get(f"{color}_prop_rot_dir", "no_rotation")),
+                "start_loc": str(row.get(f"{color}_start_loc", loc)),
+                "end_loc": str(row.get(f"{color}_end_loc", loc)),
+                "start_ori": str(row.get(f"{color}_start_ori", ori)),
+                "end_ori": str(row.get(f"{color}_end_ori", ori)),
+            }
+        grouped.setdefault(letter, []).append(
+            {
+                "letter": letter,
+                "start_pos": str(row.get("start_pos", "unknown")),
+                "end_pos": str(row.get("end_pos", "unknown")),
+                "blue_attributes": attributes["blue"],
+                "red_attributes": attributes["red"],
+            }
+        )
+    return grouped
+
+
+class TestPictographCsvIngestion:
+    """Bulk ingestion of the pictograph CSVs."""
+
+    def test_columns_are_categorical(self, csv_path):
+        df = read_pictograph_csv(csv_path)
+
+        assert isinstance(df["letter"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["red_prop_rot_dir"].dtype, pd.CategoricalDtype)
+        assert list(df["start_pos"]) == ["alpha3", "beta5", "alpha5"]
+
+    def test_unknown_category_value_is_an_error(self, tmp_path):
+        path = tmp_path / "bad.csv"
+        path.write_text(
+            HEADER + "A,alpha3,alpha5,split,same,pro,cw,w,up,pro,cw,e,s\n",
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ValueError, match="blue_end_loc"):
+            read_pictograph_csv(path)
+
+    def test_records_match_row_by_row_conversion(self, csv_path):
+        expected = convert_row_by_row(pd.read_csv(csv_path))
+
+        records = build_letter_records(read_pictograph_csv(csv_path))
+        assert records == expected
+        assert list(records) == list(expected)
+        assert type(records["A"][0]["letter"]) is str
+
+    def test_cache_skips_csv_parsing_until_the_csv_changes(
+        self, csv_path, tmp_path, monkeypatch
+    ):
+        cache_path = tmp_path / "DiamondPictographDataframe.pkl"
+        records = PictographCsvIngestion(csv_path, cache_path).get_letter_records()
+        assert cache_path.exists()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("CSV parsed despite a current cache")
+
+        monkeypatch.setattr(pd, "read_csv", fail)
+        cached = PictographCsvIngestion(csv_path, cache_path)
+        assert cached.get_letter_records() == records
+        assert isinstance(cached.get_frame()["letter"].dtype, pd.CategoricalDtype)
+        monkeypatch.undo()
+
+        with open(csv_path, "a", encoding="utf-8") as f:
+            f.write("C,gamma1,gamma3,quarter,opp,dash,no_rot,n,s,pro,cw,e,s\n")
+        reloaded = PictographCsvIngestion(csv_path, cache_path).get_letter_records()
+        assert list(reloaded) == ["B", "A", "C"]
+
+    def test_management_service_reads_ingested_dataset(self, csv_path):
+        service = PictographManagementService()
+        service._data_path = csv_path
+
+        pictographs = service.get_pictographs_by_letter("A")
+        assert [p.blue_motion.start_loc.value for p in pictographs] == ["w", "n"]
+        assert service.get_letter_records() == build_letter_records(
+            read_pictograph_csv(csv_path)
+        )
@@ -0,0 +1,126 @@
+"""
+Tests for PictographDatasetIndex.
+
+Tests that indexed next-option lookups match a full dataset scan and that
+lookup cost does not grow with the size of the dataset.
+"""
+
+import time
+
+import pytest
+
+from application.services.positioning.pictograph_dataset_index import (
+    PictographDatasetIndex,
+)
+from domain.models.pictograph_models import GridMode
+
+POSITIONS = [f"alpha{i}" for i in range(1, 9)] + [f"beta{i}" for i in range(1, 9)]
+LETTERS = ["A", "B", "C", "W", "W-", "Φ", "α"]
+ROT_DIRS = ["cw", "ccw", "no_rotation"]
+
+
+def build_dataset(copies: int = 1):
+    """Build a synthetic {letter: [pictograph_data]} dataset."""
+    dataset = {letter: [] for letter in LETTERS}
+    for copy in range(copies):
+        for i, start_pos in enumerate(POSITIONS):
+            for j, letter in enumerate(LETTERS):
+                dataset[letter].append(
+                    {
+                        "letter": letter,
+                        "start_pos": start_pos,
+                        "end_pos": POSITIONS[(i + j + copy) % len(POSITIONS)],
+                        "blue_attributes": {"prop_rot_dir": ROT_DIRS[j % 3]},
+                        "red_attributes": {"prop_rot_dir": ROT_DIRS[i % 3]},
+                    }
+                )
+    return dataset
+
+
+def scan(dataset, start_pos):
+    return [
+        item
+        for group in dataset.values()
+        for item in group
+        if item.get("start_pos") == start_pos
+    ]
+
+
+class TestPictographDatasetIndex:
+    """Lookup behaviour of the index."""
+
+    def test_options_match_full_scan(self):
+        dataset = build_dataset()
+        index = PictographDatasetIndex(dataset)
+
+        for start_pos in POSITIONS:
+            assert list(index.get_options(start_pos)) == scan(dataset, start_pos)
+        assert len(index) == sum(len(group) for group in dataset.values())
+
+    def test_secondary_keys_narrow_primary_bucket(self):
+        dataset = build_dataset()
+        index = PictographDatasetIndex(dataset)
+
+        by_letter = index.get_options("alpha1", letter="W-")
+        assert [item["letter"] for item in by_letter] == ["W-"]
+
+        by_type = index.get_options("alpha1", letter_type="Type1")
+        assert {item["letter"] for item in by_type} == {"A", "B", "C"}
+
+        by_rot = index.get_options("alpha1", prop_rot_dirs=("cw", "cw"))
+        assert by_rot
+        assert all(
+            item["blue_attributes"]["prop_rot_dir"] == "cw"
+            and item["red_attributes"]["prop_rot_dir"] == "cw"
+            for item in by_rot
+        )
+
+    def test_grid_mode_is_part_of_the_key(self):
+        index = PictographDatasetIndex(build_dataset())
+
+        assert index.grid_mode_for_position("alpha2") == GridMode.BOX
+        assert index.get_options("alpha2")
+        assert index.get_options("alpha2", grid_mode=GridMode.DIAMOND) == ()
+        assert "alpha2" in index.start_positions(GridMode.BOX)
+        assert "alpha2" not in index.start_positions(GridMode.DIAMOND)
+
+    def test_unknown_position_returns_empty_tuple(self):
+        index = PictographDatasetIndex(build_dataset())
+
+        assert index.get_options("gamma3") == ()
+
+    def test_index_is_read_only(self):
+        index = PictographDatasetIndex(build_dataset())
+
+        with pytest.raises(TypeError):
+            index._by_start[(GridMode.DIAMOND, "alpha1")] = ()
+        with pytest.raises(AttributeError):
+            index.get_options("alpha1").append({})
+
+
+@pytest.mark.slow
+class TestPictographDatasetIndexPerformance:
+    """Micro-benchmark: lookup cost is independent of dataset size."""
+
+    LOOKUPS = 20000
+
+    def _time_lookups(self, index: PictographDatasetIndex) -> float:
+        start = time.perf_counter()
+        for i in range(self.LOOKUPS):
+            index.get_options(POSITIONS[i % len(POSITIONS)], letter="A")
+        return time.perf_counter() - start
+
+    def test_lookup_cost_independent_of_dataset_size(self):
+        small = PictographDatasetIndex(build_dataset(copies=1))
+        large = PictographDatasetIndex(build_dataset(copies=200))
+        assert len(large) == 200 * len(small)
+
+        small_time = min(self._time_lookups(small) for _ in range(3))
+        large_time = min(self._time_lookups(large) for _ in range(3))
+
+        print(
+            f"\n{self.LOOKUPS} lookups: {len(small)} records {small_time * 1000:.2f}ms, "
+            f"{len(large)} records {large_time * 1000:.2f}ms"
+        )
+        # A linear scan would be ~200x slower on the large dataset.
+        assert large_time < small_time * 5
@@ -0,0 +1,184 @@
+"""
+Tests for SequenceGenerationEngine.
+
+Tests that generated sequences chain beat to beat, that every CAP closes the
+sequence on its start position with pictographs from the dataset, and that
+seeded and batch generation are reproducible.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from application.services.generation.sequence_generation_engine import (
+    SequenceGenerationEngine,
+    batch_seeds,
+)
+from infrastructure.pictograph_csv_ingestion import (
+    build_letter_records,
+    read_pictograph_csv,
+)
+from src.core.interfaces.generation_services import (
+    CAPType,
+    GenerationMode,
+    LetterType,
+    SliceSize,
+)
+from src.domain.models.generation_models import GenerationConfig
+
+DATASET_PATH = Path(__file__).parents[4] / "data" / "DiamondPictographDataframe.csv"
+
+
+@pytest.fixture(scope="module")
+def letter_records():
+    return build_letter_records(read_pictograph_csv(DATASET_PATH))
+
+
+@pytest.fixture
+def engine(letter_records):
+    return SequenceGenerationEngine(letter_records, seed=0)
+
+
+def circular_config(cap_type, **kwargs):
+    return GenerationConfig(mode=GenerationMode.CIRCULAR, cap_type=cap_type, **kwargs)
+
+
+def pictograph_key(beat):
+    return (
+        beat["letter"],
+        beat["start_pos"],
+        beat["end_pos"],
+        *(
+            beat[f"{color}_attributes"][name]
+            for color in ("blue", "red")
+            for name in ("motion_type", "start_loc", "end_loc")
+        ),
+    )
+
+
+def assert_chained(result):
+    previous = result.start_position_data
+    for number, beat in enumerate(result.sequence_data, 1):
+        assert beat["beat"] == number
+        assert beat["start_pos"] == previous["end_pos"]
+        for color in ("blue", "red"):
+            attributes = beat[f"{color}_attributes"]
+            previous_attributes = previous[f"{color}_attributes"]
+            assert attributes["start_loc"] == previous_attributes["end_loc"]
+            assert attributes["start_ori"] == previous_attributes["end_ori"]
+        previous = beat
+
+
+class TestFreeformGeneration:
+    def test_sequence_chains_from_start_position(self, engine):
+        config = GenerationConfig(length=16, level=2)
+        result = engine.generate_freeform_sequence(config)
+
+        assert result.success
+        assert len(result.sequence_data) == 16
+        assert result.start_position_data["beat"] == 0
+        assert_chained(result)
+
+    def test_only_selected_letter_types_are_used(self, engine):
+        config = GenerationConfig(length=16, letter_types={LetterType.TYPE1})
+        result = engine.generate_freeform_sequence(config)
+
+        assert result.success
+        letters = {beat["letter"] for beat in result.sequence_data}
+        assert letters <= set("ABCDEFGHIJKLMNOPQRSTUV")
+
+    def test_turns_respect_turn_intensity(self, engine):
+        config = GenerationConfig(length=32, level=3, turn_intensity=1.0)
+        result = engine.generate_freeform_sequence(config)
+
+        for beat in result.sequence_data:
+            for color in ("blue", "red"):
+                turns = beat[f"{color}_attributes"]["turns"]
+                assert turns == "fl" or turns <= 1.0
+
+    @pytest.mark.parametrize("level", [4, 6])
+    def test_levels_without_turn_sets_are_rejected(self, engine, level):
+        config = GenerationConfig(length=8, level=level)
+        assert config.is_valid()
+
+        result = engine.generate(config, seed=1)
+
+        assert not result.success
+        assert "Level must be between 1 and 3" in result.error_message
+
+
+class TestCircularGeneration:
+    @pytest.mark.parametrize("cap_type", list(CAPType))
+    @pytest.mark.parametrize("slice_size", list(SliceSize))
+    def test_cap_closes_on_start_position(self, engine, cap_type, slice_size):
+        config = circular_config(cap_type, length=16, level=2, slice_size=slice_size)
+        result = engine.generate_circular_sequence(config)
+
+        assert result.success, result.error_message
+        assert len(result.sequence_data) == 16
+        start_pos = result.start_position_data["end_pos"]
+        assert result.sequence_data[-1]["end_pos"] == start_pos
+        assert_chained(result)
+
+    @pytest.mark.parametrize("cap_type", list(CAPType))
+    def test_cap_beats_are_dataset_pictographs(
+        self, letter_records, engine, cap_type
+    ):
+        known = {
+            pictograph_key(record)
+            for group in letter_records.values()
+            for record in group
+        }
+        for seed in range(5):
+            result = engine.generate(circular_config(cap_type, length=16), seed)
+            for beat in result.sequence_data:
+                assert pictograph_key(beat) in known
+
+    def test_quartered_length_must_divide_by_four(self, engine):
+        config = circular_config(
+            CAPType.STRICT_ROTATED, length=6, slice_size=SliceSize.QUARTERED
+        )
+        result = engine.generate_circular_sequence(config)
+
+        assert not result.success
+        assert "divisible by 4" in result.error_message
+
+    def test_auto_complete_closes_a_word(self, engine):
+        config = circular_config(CAPType.STRICT_MIRRORED, length=16)
+        full = engine.generate(config, seed=3)
+        word = [full.start_position_data] + full.sequence_data[:8]
+
+        result = engine.auto_complete_sequence(word)
+
+        assert result.success
+        assert len(result.sequence_data) == 16
+        start_pos = full.start_position_data["end_pos"]
+        assert result.sequence_data[-1]["end_pos"] == start_pos
+        assert_chained(result)
+
+
+class TestSeededGeneration:
+    def test_same_seed_reproduces_sequence(self, letter_records):
+        config = circular_config(CAPType.ROTATED_SWAPPED, length=16, level=3)
+        first = SequenceGenerationEngine(letter_records).generate(config, seed=42)
+        second = SequenceGenerationEngine(letter_records).generate(config, seed=42)
+
+        assert first.sequence_data == second.sequence_data
+
+    def test_batch_matches_individual_generation(self, engine):
+        config = GenerationConfig(length=8, level=2)
+        results = engine.generate_batch(config, 5, seed=9, max_workers=1)
+
+        assert [r.sequence_data for r in results] == [
+            engine.generate(config, seed).sequence_data for seed in batch_seeds(9, 5)
+        ]
+
+    def test_batch_is_independent_of_worker_count(self, engine):
+        config = circular_config(CAPType.STRICT_ROTATED, length=8)
+        in_process = engine.generate_batch(config, 4, seed=1, max_workers=1)
+        pooled = engine.generate_batch(config, 4, seed=1, max_workers=2)
+
+        assert all(result.success for result in pooled)
+        assert [r.sequence_data for r in pooled] == [
+            r.sequence_data for r in in_process
+        ]
@@ -0,0 +1,171 @@
+"""
+Tests for UIStateManagementService persistence.
+
+Tests that bursts of state changes are coalesced into a single atomic write,
+that writes happen off the calling thread, that unchanged state is never
+rewritten, and that pending changes are flushed on shutdown.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from application.services.ui.ui_state_management_service import (
+    UIStateManagementService,
+)
+from infrastructure.debounced_json_writer import DebouncedJsonWriter
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    return tmp_path / "user_settings.json"
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestUIStatePersistence:
+    def test_drag_is_written_once(self, settings_file):
+        service = UIStateManagementService(settings_file, save_debounce_seconds=60)
+
+        for height in range(100, 400):
+            service.set_graph_editor_height(height)
+            service.set_window_geometry({"x": height, "y": height})
+
+        assert service.state_write_count == 0
+        assert not settings_file.exists()
+
+        service.flush_state()
+
+        assert service.state_write_count == 1
+        data = json.loads(settings_file.read_text(encoding="utf-8"))
+        assert data["graph_editor_height"] == 399
+        assert data["window_geometry"] == {"x": 399, "y": 399}
+
+    def test_write_happens_off_the_calling_thread(self, settings_file, monkeypatch):
+        writer_threads = []
+        atomic_write = DebouncedJsonWriter._atomic_write
+
+        def record_thread(writer, text):
+            writer_threads.append(threading.current_thread())
+            atomic_write(writer, text)
+
+        monkeypatch.setattr(DebouncedJsonWriter, "_atomic_write", record_thread)
+        service = UIStateManagementService(settings_file, save_debounce_seconds=0.05)
+        service.set_setting("theme", "light")
+
+        wait_for(lambda: service.state_write_count == 1)
+        assert writer_threads[0] is not threading.current_thread()
+        assert [path.name for path in settings_file.parent.iterdir()] == [
+            settings_file.name
+        ]
+
+    def test_unchanged_state_is_not_rewritten(self, settings_file):
+        service = UIStateManagementService(settings_file, save_debounce_seconds=60)
+        service.set_setting("theme", "light")
+        service.flush_state()
+
+        service.set_setting("theme", "light")
+        service.set_graph_editor_height(250)
+        service.set_graph_editor_height(300)
+        service.flush_state()
+
+        assert service.state_write_count == 1
+
+    def test_state_already_on_disk_is_not_rewritten(self, settings_file):
+        first = UIStateManagementService(settings_file, save_debounce_seconds=60)
+        first.set_active_tab("dictionary")
+        first.flush_state()
+        del first
+
+        second = UIStateManagementService(settings_file, save_debounce_seconds=60)
+        second.set_active_tab("dictionary")
+        second.flush_state()
+
+        assert second.get_active_tab() == "dictionary"
+        assert second.state_write_count == 0
+
+    def test_services_on_one_file_share_a_writer(self, settings_file):
+        first = UIStateManagementService(settings_file, save_debounce_seconds=60)
+        second = UIStateManagementService(settings_file, save_debounce_seconds=60)
+
+        first.set_setting("theme", "light")
+        first.flush_state()
+        second.set_setting("theme", "dark")
+        second.flush_state()
+        first.set_setting("theme", "light")
+        first.flush_state()
+
+        data = json.loads(settings_file.read_text(encoding="utf-8"))
+        assert data["user_settings"]["theme"] == "light"
+        assert first.state_write_count == second.state_write_count == 3
+
+    def test_concurrent_writes_to_one_file_all_succeed(self, settings_file):
+        # Separate writers on one file, as two processes would have
+        writers = [DebouncedJsonWriter(settings_file, debounce_seconds=0)]
+        writers.append(DebouncedJsonWriter(settings_file, debounce_seconds=0))
+
+        def write_many(writer, offset):
+            for value in range(200):
+                writer.submit({"value": offset + value})
+
+        threads = [
+            threading.Thread(target=write_many, args=(writer, 1000 * number))
+            for number, writer in enumerate(writers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert [writer.write_count for writer in writers] == [200, 200]
+        assert json.loads(settings_file.read_text(encoding="utf-8"))["value"] in (
+            199,
+            1199,
+        )
+
+    def test_failed_write_is_retried_on_the_next_flush(
+        self, settings_file, monkeypatch
+    ):
+        writer = DebouncedJsonWriter(settings_file, debounce_seconds=60)
+        atomic_write = DebouncedJsonWriter._atomic_write
+
+        def fail(writer, text):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(DebouncedJsonWriter, "_atomic_write", fail)
+        writer.submit({"value": 1})
+        writer.flush()
+        assert writer.has_pending
+
+        monkeypatch.setattr(DebouncedJsonWriter, "_atomic_write", atomic_write)
+        writer.flush()
+
+        assert writer.write_count == 1
+        assert json.loads(settings_file.read_text(encoding="utf-8")) == {"value": 1}
+
+    def test_pending_state_is_flushed_on_shutdown(self, settings_file):
+        service = UIStateManagementService(settings_file, save_debounce_seconds=60)
+        service.update_tab_state("learn", {"lesson": 3})
+
+        DebouncedJsonWriter.flush_all()
+
+        data = json.loads(settings_file.read_text(encoding="utf-8"))
+        assert data["tab_states"] == {"learn": {"lesson": 3}}
+
+    def test_later_changes_do_not_leak_into_a_pending_snapshot(self, settings_file):
+        service = UIStateManagementService(settings_file, save_debounce_seconds=60)
+        state = {"lesson": 1}
+        service.update_tab_state("learn", state)
+        service._ui_state.tab_states["learn"]["lesson"] = 2
+
+        service.flush_state()
+
+        data = json.loads(settings_file.read_text(encoding="utf-8"))
+        assert data["tab_states"]["learn"]["lesson"] == 1
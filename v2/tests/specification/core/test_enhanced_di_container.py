@@ -243,6 +243,64 @@ class TestContainerUtilities:
         assert container3 is not container1
 
 
+class TestConstructionPlans:
+    """Test cached construction plans and the warm-up pass."""
+
+    def test_plan_is_compiled_once_per_implementation(self, container, monkeypatch):
+        """Test that transient resolution does not re-inspect the constructor."""
+        import core.dependency_injection.di_container as di_module
+
+        container.register_singleton(ITestRepository, TestRepository)
+        container.register_transient(ITestService, TestService)
+        calls = []
+        real_signature = di_module.inspect.signature
+        monkeypatch.setattr(
+            di_module.inspect,
+            "signature",
+            lambda obj: calls.append(obj) or real_signature(obj),
+        )
+
+        first = container.resolve(ITestService)
+        second = container.resolve(ITestService)
+
+        assert first is not second
+        assert first.repository is second.repository
+        assert calls.count(TestService.__init__) == 1
+        plan = container.get_construction_plan(TestService)
+        assert plan.dependencies == (("repository", ITestRepository),)
+
+    def test_warm_up_builds_singletons_in_dependency_order(self, container):
+        """Test that warm_up constructs every singleton and times each one."""
+        container.register_singleton(ITestService, TestService)
+        container.register_singleton(ITestRepository, TestRepository)
+        container.register_factory(TestConfig, lambda: TestConfig("factory", 1))
+
+        report = container.warm_up()
+
+        assert report.ok
+        assert [timing.name for timing in report.timings] == [
+            "TestConfig",
+            "ITestRepository",
+            "ITestService",
+        ]
+        assert all(timing.seconds >= 0 for timing in report.timings)
+        assert isinstance(container.resolve(ITestService).repository, TestRepository)
+        assert "total" in report.format()
+        assert container.warm_up().timings == ()
+
+    def test_warm_up_reports_failures(self, container):
+        """Test that broken registrations are reported, not raised."""
+        container.register_singleton(ITestService, TestService)
+        container.register_transient(TestConfig, TestService)
+
+        report = container.warm_up()
+
+        assert not report.ok
+        assert set(report.failures) == {"ITestService", "TestConfig"}
+        assert "Cannot resolve dependency" in report.failures["ITestService"]
+        assert "FAILED" in report.format()
+
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
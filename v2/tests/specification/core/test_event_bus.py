@@ -8,6 +8,7 @@ EXPECTED_DURATION: permanent
 
 import pytest
 import asyncio
+import threading
 from typing import List
 from unittest.mock import Mock
 
@@ -321,6 +322,25 @@ class TestEventBusUtilities:
         stats = event_bus.get_event_stats()
         assert stats["sequence.created"] == 3
     
+    def test_event_stats_count_publishes_from_every_thread(
+        self, event_bus, sample_sequence_event
+    ):
+        """Test that publishes from worker threads are all counted."""
+        threads = [
+            threading.Thread(
+                target=lambda: [
+                    event_bus.publish(sample_sequence_event) for _ in range(500)
+                ]
+            )
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert event_bus.get_event_stats()["sequence.created"] == 4000
+    
     def test_subscription_count(self, event_bus):
         """Test subscription counting."""
         handler1 = Mock()
@@ -344,6 +364,165 @@ class TestEventBusUtilities:
         assert removed_count >= 0
 
 
+class TestDispatchTables:
+    """Test pre-sorted dispatch and lazily created event fields."""
+
+    def test_priority_order_survives_unsubscribe(
+        self, event_bus, sample_sequence_event
+    ):
+        """Test dispatch order after subscribers are added and removed."""
+        call_order = []
+        event_bus.subscribe(
+            "sequence.created", lambda e: call_order.append("low"), EventPriority.LOW
+        )
+        removed_id = event_bus.subscribe(
+            "sequence.created", lambda e: call_order.append("removed")
+        )
+        event_bus.subscribe(
+            "sequence.created", lambda e: call_order.append("high"), EventPriority.HIGH
+        )
+
+        assert event_bus.unsubscribe(removed_id)
+        event_bus.publish(sample_sequence_event)
+
+        assert call_order == ["high", "low"]
+
+    def test_handler_may_unsubscribe_during_publish(
+        self, event_bus, sample_sequence_event
+    ):
+        """Test that a publish in progress still reaches every subscriber."""
+        call_order = []
+
+        def unsubscribing_handler(event):
+            call_order.append("first")
+            event_bus.unsubscribe(subscription_id)
+
+        subscription_id = event_bus.subscribe(
+            "sequence.created", unsubscribing_handler, EventPriority.HIGH
+        )
+        event_bus.subscribe("sequence.created", lambda e: call_order.append("second"))
+
+        event_bus.publish(sample_sequence_event)
+        event_bus.publish(sample_sequence_event)
+
+        assert call_order == ["first", "second", "second"]
+
+    def test_event_fields_are_created_lazily(self):
+        """Test that event ids and timestamps are stable once read."""
+        event = UIEvent(component="button", action="clicked")
+
+        assert event.__dict__["_event_id"] is None
+        event_id = event.event_id
+        assert event_id and event.event_id == event_id
+        assert event.timestamp == event.timestamp
+        assert UIEvent(event_id="fixed").event_id == "fixed"
+
+
+class TestCoalescedPublishing:
+    """Test collapsing bursts of high-rate events."""
+
+    @pytest.fixture
+    def frames(self):
+        """Collect frame callbacks instead of running them."""
+        return []
+
+    @pytest.fixture
+    def coalescing_bus(self, frames):
+        bus = TypeSafeEventBus(frame_scheduler=lambda cb: frames.append(cb) or True)
+        yield bus
+        bus.shutdown()
+
+    def test_burst_delivers_latest_event_once(self, coalescing_bus, frames):
+        """Test that only the last event of a burst is delivered."""
+        handler = Mock()
+        coalescing_bus.subscribe("ui.graph_editor.resized", handler)
+
+        for height in range(10):
+            coalescing_bus.publish_coalesced(
+                UIEvent(
+                    component="graph_editor",
+                    action="resized",
+                    state_data={"height": height},
+                )
+            )
+
+        assert handler.call_count == 0
+        assert len(frames) == 1
+        frames[0]()
+
+        handler.assert_called_once()
+        assert handler.call_args[0][0].state_data == {"height": 9}
+        assert coalescing_bus.get_event_stats() == {"ui.graph_editor.resized": 1}
+
+    def test_keys_and_event_types_are_coalesced_separately(
+        self, coalescing_bus, frames
+    ):
+        """Test that distinct keys keep their own latest event, in order."""
+        received = []
+        for event_type in ("ui.panel.updated", "ui.panel.shown"):
+            coalescing_bus.subscribe(event_type, lambda event: received.append(event))
+
+        for panel, action in [("a", "updated"), ("b", "updated"), ("a", "shown")]:
+            coalescing_bus.publish_coalesced(
+                UIEvent(component="panel", action=action, source=panel), key=panel
+            )
+        coalescing_bus.publish_coalesced(
+            UIEvent(component="panel", action="updated", source="a2"), key="a"
+        )
+
+        assert coalescing_bus.flush_coalesced() == 3
+        assert [(e.action, e.source) for e in received] == [
+            ("updated", "a2"),
+            ("updated", "b"),
+            ("shown", "a"),
+        ]
+        assert coalescing_bus.flush_coalesced() == 0
+
+    def test_publishes_immediately_without_a_frame_scheduler(self):
+        """Test the fallback when no event loop is available."""
+        bus = TypeSafeEventBus(frame_scheduler=lambda cb: False)
+        handler = Mock()
+        bus.subscribe("ui.button.clicked", handler)
+
+        bus.publish_coalesced(UIEvent(component="button", action="clicked"))
+
+        handler.assert_called_once()
+        bus.shutdown()
+
+    def test_worker_thread_bursts_are_delivered_on_the_gui_thread(self):
+        """Test that a frame scheduled from a thread without a loop still runs."""
+        QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+        app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+        bus = TypeSafeEventBus()
+        delivered = []
+        bus.subscribe(
+            "ui.graph_editor.resized",
+            lambda event: delivered.append(
+                (event.state_data["height"], threading.current_thread())
+            ),
+        )
+
+        def publish_burst(first_height):
+            for height in range(first_height, first_height + 5):
+                bus.publish_coalesced(
+                    UIEvent(
+                        component="graph_editor",
+                        action="resized",
+                        state_data={"height": height},
+                    )
+                )
+
+        for first_height in (0, 10):
+            worker = threading.Thread(target=publish_burst, args=(first_height,))
+            worker.start()
+            worker.join()
+            assert not delivered
+            app.processEvents()
+            assert delivered == [(first_height + 4, threading.main_thread())]
+            delivered.clear()
+        bus.shutdown()
+
+
 class TestGlobalEventBus:
     """Test global event bus functionality."""
     
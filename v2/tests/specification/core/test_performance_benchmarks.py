@@ -19,7 +19,7 @@ import os
 from unittest.mock import Mock
 from typing import List, Dict, Any
 
-from src.core.events.event_bus import TypeSafeEventBus
+from src.core.events.event_bus import TypeSafeEventBus, UIEvent, EventPriority
 from src.core.dependency_injection.di_container import DIContainer
 from src.domain.models.core_models import (
     BeatData,
@@ -148,6 +148,80 @@ class TestEventBusPerformance:
         ), f"Event bus memory usage too high: {profiler.memory_delta} bytes"
 
 
+@pytest.mark.slow
+class TestEventBusDispatchPerformance:
+    """Performance tests for the compiled dispatch path of TypeSafeEventBus."""
+
+    def test_publish_throughput_with_many_subscribers(self):
+        """Test publishing typed events to a full, mixed-priority subscriber list."""
+        event_bus = TypeSafeEventBus()
+        received = []
+        priorities = list(EventPriority)
+        for i in range(20):
+            event_bus.subscribe(
+                "ui.graph_editor.resized",
+                lambda event: received.append(event),
+                priorities[i % len(priorities)],
+            )
+
+        events = [
+            UIEvent(component="graph_editor", action="resized", state_data={"h": i})
+            for i in range(1000)
+        ]
+
+        # Benchmark: 1000 events x 20 subscribers
+        with PerformanceTimer() as timer:
+            for event in events:
+                event_bus.publish(event)
+
+        assert (
+            timer.duration < 0.1
+        ), f"Event dispatch too slow: {timer.duration:.3f}s for 20000 deliveries"
+        assert len(received) == 20000
+        event_bus.shutdown()
+
+    def test_event_creation_performance(self):
+        """Test that creating events does not pay for unused ids and timestamps."""
+        with PerformanceTimer() as timer:
+            for i in range(10000):
+                UIEvent(component="graph_editor", action="resized")
+
+        assert (
+            timer.duration < 0.05
+        ), f"Event creation too slow: {timer.duration:.3f}s for 10000 events"
+
+    def test_coalesced_burst_performance(self):
+        """Test that a burst of same-type events is delivered once per frame."""
+        frames = []
+        event_bus = TypeSafeEventBus(
+            frame_scheduler=lambda callback: frames.append(callback) or True
+        )
+        received = []
+        event_bus.subscribe(
+            "ui.graph_editor.resized", lambda event: received.append(event)
+        )
+
+        # Benchmark: one frame worth of 1000 resize events
+        with PerformanceTimer() as timer:
+            for i in range(1000):
+                event_bus.publish_coalesced(
+                    UIEvent(
+                        component="graph_editor",
+                        action="resized",
+                        state_data={"h": i},
+                    )
+                )
+            for callback in frames:
+                callback()
+
+        assert (
+            timer.duration < 0.02
+        ), f"Coalesced publishing too slow: {timer.duration:.3f}s for 1000 events"
+        assert len(frames) == 1
+        assert [event.state_data for event in received] == [{"h": 999}]
+        event_bus.shutdown()
+
+
 @pytest.mark.slow
 class TestDIContainerPerformance:
     """Performance tests for DIContainer."""
@@ -212,6 +286,32 @@ class TestDIContainerPerformance:
             timer.duration < 0.02
         ), f"Complex DI too slow: {timer.duration:.3f}s for {resolution_count} resolutions"
 
+    def test_transient_resolution_performance(self):
+        """Test that transients resolve from a cached plan, not reflection."""
+        container = DIContainer()
+
+        class Repository:
+            pass
+
+        class Handler:
+            def __init__(self, repository: Repository, retries: int = 3):
+                self.repository = repository
+                self.retries = retries
+
+        container.register_singleton(Repository, Repository)
+        container.register_transient(Handler, Handler)
+
+        # Benchmark: Resolve transient service 10000 times
+        resolution_count = 10000
+        with PerformanceTimer() as timer:
+            for _ in range(resolution_count):
+                handler = container.resolve(Handler)
+
+        assert handler.retries == 3
+        assert (
+            timer.duration < 0.05
+        ), f"Transient resolution too slow: {timer.duration:.3f}s for {resolution_count} resolutions"
+
     def test_container_memory_usage(self):
         """Test DI container memory usage."""
         container = DIContainer()
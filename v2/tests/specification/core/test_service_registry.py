@@ -0,0 +1,155 @@
+"""
+TEST LIFECYCLE: specification
+PURPOSE: Contract testing for the shared service registry
+SCOPE: Singleton factories, construction counts, hot-path construction guard
+EXPECTED_DURATION: permanent
+"""
+
+import ast
+from pathlib import Path
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from core.dependency_injection.di_container import (
+    DIContainer,
+    format_construction_report,
+    get_construction_counts,
+    record_construction,
+    reset_construction_counts,
+    reset_container,
+)
+from core.dependency_injection.service_registry import (
+    SHARED_SERVICE_NAMES,
+    resolve_shared_service,
+)
+
+SRC_ROOT = Path(__file__).resolve().parents[3] / "src"
+
+# Presentation code runs per widget, per scene and per refresh; shared
+# services must be resolved from the registry there, never constructed.
+HOT_PATH_ROOTS = [SRC_ROOT / "presentation"]
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def fresh_session():
+    reset_container()
+    reset_construction_counts()
+    yield
+    reset_container()
+    reset_construction_counts()
+
+
+class CountedService:
+    def __init__(self):
+        record_construction(self)
+
+
+def find_shared_service_constructions(root: Path):
+    """Yield (path, line, name) for direct constructions of shared services."""
+    for path in sorted(root.rglob("*.py")):
+        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call):
+                continue
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else None
+            if isinstance(func, ast.Name):
+                name = func.id
+            if name in SHARED_SERVICE_NAMES:
+                yield path.relative_to(root), node.lineno, name
+
+
+class TestSingletonFactories:
+    """Factories registered on the container run once, on first resolve."""
+
+    def test_factory_is_called_once_on_first_resolve(self, fresh_session):
+        container = DIContainer()
+        container.register_factory(CountedService, CountedService)
+
+        assert container.is_registered(CountedService)
+        assert get_construction_counts() == {}
+
+        first = container.resolve(CountedService)
+        assert container.resolve(CountedService) is first
+        assert get_construction_counts() == {"CountedService": 1}
+
+    def test_construction_report(self, fresh_session):
+        assert format_construction_report() == "No tracked services constructed"
+
+        CountedService()
+        CountedService()
+        record_construction(DIContainer)
+
+        assert get_construction_counts() == {"CountedService": 2, "DIContainer": 1}
+        assert format_construction_report().splitlines() == [
+            "CountedService  2",
+            "DIContainer     1",
+        ]
+
+
+class TestSharedServices:
+    """Dataset, placement and positioning services are built once per session."""
+
+    def test_position_matching_shares_dataset_service(self, fresh_session):
+        from application.services.core.pictograph_management_service import (
+            PictographManagementService,
+        )
+        from application.services.positioning.position_matching_service import (
+            PositionMatchingService,
+        )
+
+        position_service = resolve_shared_service(PositionMatchingService)
+
+        assert resolve_shared_service(PositionMatchingService) is position_service
+        assert position_service.pictograph_management_service is (
+            resolve_shared_service(PictographManagementService)
+        )
+        counts = get_construction_counts()
+        assert counts["PositionMatchingService"] == 1
+        assert counts["PictographManagementService"] == 1
+        assert counts["DataConversionService"] == 1
+
+    def test_pictograph_scenes_share_positioning_services(self, app, fresh_session):
+        from presentation.components.pictograph.pictograph_scene import (
+            PictographScene,
+        )
+
+        scenes = [PictographScene() for _ in range(3)]
+
+        assert scenes[0].arrow_renderer.arrow_service is (
+            scenes[2].arrow_renderer.arrow_service
+        )
+        counts = get_construction_counts()
+        assert counts["ArrowPositioningService"] == 1
+        assert counts["MotionManagementService"] == 1
+        assert counts["PropManagementService"] == 1
+
+
+class TestHotPathConstructionGuard:
+    """Presentation code resolves shared services instead of constructing them."""
+
+    def test_no_shared_service_constructed_in_hot_paths(self):
+        offenders = [
+            f"{root.name}/{path}:{line} constructs {name}()"
+            for root in HOT_PATH_ROOTS
+            for path, line, name in find_shared_service_constructions(root)
+        ]
+        assert offenders == [], "\n".join(offenders)
+
+    def test_guard_detects_direct_construction(self, tmp_path):
+        module = tmp_path / "widget.py"
+        module.write_text(
+            "from services import PictographDatasetService\n"
+            "service = PictographDatasetService()\n",
+            encoding="utf-8",
+        )
+
+        assert list(find_shared_service_constructions(tmp_path)) == [
+            (Path("widget.py"), 2, "PictographDatasetService")
+        ]
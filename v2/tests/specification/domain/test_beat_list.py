@@ -0,0 +1,192 @@
+"""
+Tests for BeatList, the persistent beat container behind SequenceData.
+
+Tests that BeatList behaves like the list it replaces across trie level
+boundaries, that edits share structure with the original, and that beats are
+numbered by position.
+"""
+
+import time
+
+import pytest
+
+from domain.models.beat_list import BeatList
+from domain.models.core_models import BeatData, SequenceData
+
+SIZES = [0, 1, 31, 32, 33, 64, 1023, 1024, 1025, 1056, 1057, 2100]
+
+
+def make_beats(count):
+    return [BeatData(beat_number=i + 1, letter=f"L{i}") for i in range(count)]
+
+
+class TestBeatList:
+    """BeatList matches a plain list of beats."""
+
+    @pytest.mark.parametrize("count", SIZES)
+    def test_appended_matches_list(self, count):
+        beats = make_beats(count)
+        beat_list = BeatList()
+        for beat in beats:
+            beat_list = beat_list.appended(beat)
+
+        assert len(beat_list) == count
+        assert list(beat_list) == beats
+        assert beat_list == BeatList(beats)
+        assert [beat_list[i] for i in range(count)] == beats
+        if count:
+            assert beat_list[-1] == beats[-1]
+
+    @pytest.mark.parametrize("count", SIZES[1:])
+    def test_replaced_matches_list(self, count):
+        beats = make_beats(count)
+        beat_list = BeatList(beats)
+
+        for index in {0, count // 2, count - 1}:
+            beat = beats[index].update(letter="X")
+            beats[index] = beat
+            beat_list = beat_list.replaced(index, beat)
+
+        assert list(beat_list) == beats
+
+    @pytest.mark.parametrize("count", [1, 33, 1025])
+    def test_inserted_and_removed_renumber(self, count):
+        beat_list = BeatList(make_beats(count))
+
+        inserted = beat_list.inserted(0, BeatData(letter="X"))
+        assert [b.beat_number for b in inserted] == list(range(1, count + 2))
+        assert inserted[0].letter == "X"
+        assert inserted[1].letter == "L0"
+
+        removed = inserted.removed(0)
+        assert removed == beat_list
+        assert beat_list.removed(count - 1) == beat_list[: count - 1]
+
+    def test_beats_are_numbered_by_position(self):
+        beat_list = BeatList([BeatData(beat_number=7), BeatData(beat_number=3)])
+        assert [b.beat_number for b in beat_list] == [1, 2]
+
+        beat_list = beat_list.appended(BeatData(beat_number=9))
+        assert beat_list.get_beat(3).beat_number == 3
+        assert beat_list.get_beat(4) is None
+        assert beat_list.get_beat(0) is None
+
+    def test_edits_share_structure_with_the_original(self):
+        beat_list = BeatList(make_beats(1100))
+
+        replaced = beat_list.replaced(5, beat_list[5].update(letter="X"))
+        assert replaced._tail is beat_list._tail
+        assert replaced._root[1] is beat_list._root[1]
+        assert beat_list[5].letter == "L5"
+
+        appended = beat_list.appended(BeatData(letter="Y"))
+        assert appended._root is beat_list._root
+        assert len(beat_list) == 1100
+
+    def test_list_operations_used_by_callers(self):
+        beats = make_beats(3)
+        beat_list = BeatList(beats)
+
+        extended = beat_list + [BeatData(letter="Z")]
+        assert isinstance(extended, BeatList)
+        assert extended[3].beat_number == 4
+
+        copied = beat_list.copy()
+        copied.pop()
+        assert isinstance(copied, list)
+        assert len(beat_list) == 3
+        assert beat_list[1:] == beats[1:]
+
+        with pytest.raises(IndexError):
+            beat_list[3]
+
+
+class TestSequenceDataBeats:
+    """SequenceData stores its beats in a BeatList."""
+
+    def test_list_input_is_validated_and_wrapped(self):
+        beats = make_beats(3)
+        sequence = SequenceData(beats=beats)
+        assert isinstance(sequence.beats, BeatList)
+        assert sequence.beats == beats
+
+        with pytest.raises(ValueError):
+            SequenceData(beats=[BeatData(beat_number=2)])
+
+    def test_edits_return_new_sequences(self):
+        sequence = SequenceData(beats=make_beats(40))
+
+        updated = sequence.update_beat(3, letter="X")
+        assert updated.get_beat(3).letter == "X"
+        assert sequence.get_beat(3).letter == "L2"
+
+        removed = sequence.remove_beat(1)
+        assert removed.length == 39
+        assert removed.get_beat(1).letter == "L1"
+        assert sequence.remove_beat(99).beats == sequence.beats
+
+        added = sequence.add_beat(BeatData(letter="Y"))
+        assert added.get_beat(41).letter == "Y"
+        assert sequence.length == 40
+
+
+def validated_copy(beats):
+    """Copy and re-validate a beat list, as each SequenceData edit used to."""
+    beats = list(beats)
+    for i, beat in enumerate(beats):
+        if beat.beat_number != i + 1:
+            raise ValueError(f"Beat {i} has number {beat.beat_number}")
+    return beats
+
+
+@pytest.mark.slow
+class TestBeatListPerformance:
+    """Building and editing long sequences without copying the beat list."""
+
+    @pytest.mark.parametrize("count", [256, 1024])
+    def test_building_a_sequence(self, count):
+        beats = make_beats(count)
+
+        start = time.perf_counter()
+        copied = []
+        for beat in beats:
+            copied = validated_copy(copied + [beat])
+        copy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sequence = SequenceData.empty()
+        for beat in beats:
+            sequence = sequence.add_beat(beat)
+        persistent_time = time.perf_counter() - start
+
+        print(
+            f"\n{count} appends: copy {copy_time:.4f}s, "
+            f"persistent {persistent_time:.4f}s"
+        )
+        assert list(sequence.beats) == copied
+        if count >= 1024:
+            assert persistent_time < copy_time
+
+    @pytest.mark.parametrize("count", [256, 1024])
+    def test_editing_a_long_sequence(self, count):
+        sequence = SequenceData(beats=make_beats(count))
+        beats = list(sequence.beats)
+
+        start = time.perf_counter()
+        for i in range(count):
+            beats = validated_copy(beats)
+            beats[i] = beats[i].update(letter="X")
+        copy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(1, count + 1):
+            sequence = sequence.update_beat(i, letter="X")
+        persistent_time = time.perf_counter() - start
+
+        print(
+            f"\n{count} edits: copy {copy_time:.4f}s, "
+            f"persistent {persistent_time:.4f}s"
+        )
+        assert list(sequence.beats) == beats
+        if count >= 1024:
+            assert persistent_time < copy_time
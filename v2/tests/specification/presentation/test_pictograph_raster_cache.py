@@ -0,0 +1,100 @@
+"""
+Tests for PictographRasterCache and PictographRasterizer.
+
+Tests that views blit a cached raster until their scene changes, that equal
+beats share a raster regardless of beat id, and that resizes stretch the
+last raster instead of re-rendering until they settle.
+"""
+
+import pytest
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QColor, QPixmap
+from PyQt6.QtWidgets import QApplication, QGraphicsScene, QGraphicsView
+
+from domain.models.core_models import BeatData
+from presentation.components.pictograph.pictograph_raster_cache import (
+    PictographRasterCache,
+    PictographRasterizer,
+    pictograph_content_key,
+)
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+class CachedView(QGraphicsView):
+    def __init__(self, scene, cache):
+        super().__init__(scene)
+        self.rasterizer = PictographRasterizer(self, cache=cache)
+        self.resize(100, 100)
+
+    def paintEvent(self, event):
+        if not self.rasterizer.paint():
+            super().paintEvent(event)
+
+
+def make_scene(letter="A"):
+    scene = QGraphicsScene(0, 0, 100, 100)
+    scene.beat_data = BeatData(letter=letter)
+    item = scene.addRect(QRectF(0, 0, 50, 50), brush=QColor("red"))
+    return scene, item
+
+
+class TestPictographRasterCache:
+    """Caching behaviour of the raster cache."""
+
+    def test_equal_beats_share_a_content_key(self, app):
+        assert pictograph_content_key(make_scene()[0]) == pictograph_content_key(
+            make_scene()[0]
+        )
+        assert pictograph_content_key(make_scene()[0]) != pictograph_content_key(
+            make_scene("B")[0]
+        )
+
+    def test_lru_eviction_over_byte_budget(self, app):
+        pixmap = QPixmap(10, 10)
+        cache = PictographRasterCache(budget_bytes=2 * 10 * 10 * pixmap.depth() // 8)
+
+        cache.put("a", pixmap)
+        cache.put("b", pixmap)
+        cache.get("a")
+        cache.put("c", pixmap)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_repaints_reuse_raster_until_scene_changes(self, app):
+        cache = PictographRasterCache()
+        scene, item = make_scene()
+        view = CachedView(scene, cache)
+        other = CachedView(make_scene()[0], cache)
+        app.processEvents()
+
+        assert view.viewport().grab().toImage().pixelColor(10, 10) == QColor("red")
+        view.viewport().grab()
+        other.viewport().grab()
+        assert (cache.misses, cache.hits) == (1, 2)
+
+        item.setPos(50, 50)
+        app.processEvents()
+        image = view.viewport().grab().toImage()
+        assert cache.misses == 2
+        assert image.pixelColor(70, 70) == QColor("red")
+
+    def test_resize_stretches_last_raster_until_settled(self, app):
+        cache = PictographRasterCache()
+        view = CachedView(make_scene()[0], cache)
+        app.processEvents()
+        view.viewport().grab()
+
+        view.resize(120, 120)
+        view.rasterizer.begin_resize()
+        view.viewport().grab()
+        assert cache.misses == 1
+
+        view.rasterizer.settle_timer.stop()
+        view.viewport().grab()
+        assert cache.misses == 2
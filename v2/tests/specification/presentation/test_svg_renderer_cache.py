@@ -0,0 +1,102 @@
+"""
+Tests for SvgRendererCache.
+
+Tests that renderers are built once per (svg path, color), shared between
+items, recolored per color, and evicted least-recently-used first without
+invalidating items that still use them.
+"""
+
+import pytest
+from PyQt6.QtSvgWidgets import QGraphicsSvgItem
+from PyQt6.QtWidgets import QApplication
+
+from presentation.components.pictograph.svg_renderer_cache import (
+    COLOR_MAP,
+    SvgRendererCache,
+    apply_color_transformation,
+)
+
+SVG_TEMPLATE = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+    '<rect width="10" height="10" fill="#000000"/></svg>'
+)
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def svg_files(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"asset_{i}.svg"
+        path.write_text(SVG_TEMPLATE, encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+class TestSvgRendererCache:
+    """Caching behaviour of the renderer cache."""
+
+    def test_renderer_is_built_once_per_path_and_color(self, app, svg_files):
+        cache = SvgRendererCache()
+
+        blue = cache.get_renderer(svg_files[0], "blue")
+        assert blue is not None and blue.isValid()
+        assert cache.get_renderer(svg_files[0], "blue") is blue
+        assert cache.get_renderer(svg_files[0], "red") is not blue
+        assert cache.get_renderer(svg_files[0]) is not blue
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["size"]) == (1, 3, 3)
+
+    def test_color_transformation(self):
+        assert COLOR_MAP["red"] in apply_color_transformation(SVG_TEMPLATE, "red")
+        assert COLOR_MAP["blue"] in apply_color_transformation(SVG_TEMPLATE, "blue")
+        assert "#000000" not in apply_color_transformation(SVG_TEMPLATE, "red")
+
+    def test_missing_or_invalid_file_is_not_cached(self, app, tmp_path):
+        cache = SvgRendererCache()
+        invalid = tmp_path / "invalid.svg"
+        invalid.write_text("not svg", encoding="utf-8")
+
+        assert cache.get_renderer(str(tmp_path / "missing.svg"), "blue") is None
+        assert cache.get_renderer(str(invalid)) is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_items_share_one_renderer(self, app, svg_files):
+        cache = SvgRendererCache()
+        first, second = QGraphicsSvgItem(), QGraphicsSvgItem()
+
+        assert cache.attach(first, svg_files[0], "red")
+        assert cache.attach(second, svg_files[0], "red")
+        assert first.renderer() is second.renderer()
+        assert cache.get_stats()["misses"] == 1
+
+    def test_lru_eviction_keeps_attached_renderers_alive(self, app, svg_files):
+        cache = SvgRendererCache(max_size=2)
+        item = QGraphicsSvgItem()
+        cache.attach(item, svg_files[0], "blue")
+
+        cache.get_renderer(svg_files[1], "blue")
+        cache.get_renderer(svg_files[0], "blue")  # most recently used again
+        cache.get_renderer(svg_files[2], "blue")  # evicts svg_files[1]
+
+        stats = cache.get_stats()
+        assert (stats["size"], stats["evictions"]) == (2, 1)
+        assert cache.get_renderer(svg_files[0], "blue") is item.renderer()
+
+        cache.clear()
+        assert item.renderer().isValid()
+        assert not item.boundingRect().isEmpty()
+
+    def test_warm_up_skips_missing_files(self, app, svg_files, tmp_path):
+        cache = SvgRendererCache()
+        entries = [(path, "blue") for path in svg_files]
+        entries.append((str(tmp_path / "missing.svg"), "red"))
+
+        assert cache.warm_up(entries) == len(svg_files)
+        cache.get_renderer(svg_files[0], "blue")
+        assert cache.get_stats()["hits"] == 1